@@ -1,3 +1,7 @@
+import base64
+import os
+from functools import lru_cache
+
 Gemini_System_Instruction: str = """
 You are UniwareBot, a structured assistant for e-commerce sellers using Uniware. Your job is to help sellers validate and process their orders or picklists.
 
@@ -95,5 +99,19 @@ Gemini_Model_Name : str = "gemini-2.0-flash"
 
 Play_Mode : bool = True
 
+# Stages a shipment can be in before printing, derived from the pre-flight status lookup in process_order
+SHIPMENT_NEEDS_INVOICE : str = "NEEDS_INVOICE"
+SHIPMENT_NEEDS_LABEL : str = "NEEDS_LABEL"
+SHIPMENT_READY_TO_PRINT : str = "READY_TO_PRINT"
+SHIPMENT_CANCELLED : str = "CANCELLED"
+
+
+# Sample invoice returned in Play_Mode. Kept as a file so the ~190 KB payload is not paid on import.
+SAMPLE_PDF_PATH : str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "sample_invoice.pdf")
+
 
-sampleBase64Pdf = "JVBERi0xLjQKJfbk/N8KMSAwIG9iago8PAovVHlwZSAvQ2F0YWxvZwovVmVyc2lvbiAvMS43Ci9QYWdlcyAyIDAgUgovTmFtZXMgMyAwIFIKPj4KZW5kb2JqCjQgMCBvYmoKPDwKL01vZERhdGUgKEQ6MjAyNTA2MjYxMzMxMzkrMDUnMzAnKQovQ3JlYXRpb25EYXRlIChEOjIwMjUwNjI2MTMzMTM5KzA1JzMwJykKPj4KZW5kb2JqCjIgMCBvYmoKPDwKL1R5cGUgL1BhZ2VzCi9LaWRzIFs1IDAgUiA2IDAgUiA3IDAgUiA4IDAgUiA5IDAgUiAxMCAwIFIgMTEgMCBSIDEyIDAgUiAxMyAwIFIgMTQgMCBSCjE1IDAgUiAxNiAwIFIgMTcgMCBSIDE4IDAgUl0KL0NvdW50IDE0Cj4+CmVuZG9iagozIDAgb2JqCjw8Ci9KYXZhU2NyaXB0IDE5IDAgUgo+PgplbmRvYmoKNSAwIG9iago8PAovQ29udGVudHMgMjAgMCBSCi9UeXBlIC9QYWdlCi9SZXNvdXJjZXMgMjEgMCBSCi9QYXJlbnQgMiAwIFIKL1JvdGF0ZSA5MAovTWVkaWFCb3ggWzAuMCAwLjAgODQyLjAgNTk1LjBdCi9Dcm9wQm94IFswLjAgMC4wIDg0Mi4wIDU5NS4wXQo+PgplbmRvYmoKNiAwIG9iago8PAovQ29udGVudHMgMjIgMCBSCi9NZWRpYUJveCBbMC4wIDAuMCA1OTUuMCA4NDIuMF0KL1BhcmVudCAyIDAgUgovUmVzb3VyY2VzIDIzIDAgUgovVHJpbUJveCBbMCAwIDU5NSA4NDJdCi9UeXBlIC9QYWdlCi9Dcm9wQm94IFswLjAgMC4wIDU5NS4wIDg0Mi4wXQovUm90YXRlIDAKPj4KZW5kb2JqCjcgMCBvYmoKPDwKL0NvbnRlbnRzIDI0IDAgUgovVHlwZSAvUGFnZQovUmVzb3VyY2VzIDI1IDAgUgovUGFyZW50IDIgMCBSCi9Sb3RhdGUgOTAKL01lZGlhQm94IFswLjAgMC4wIDg0Mi4wIDU5NS4wXQovQ3JvcEJveCBbMC4wIDAuMCA4NDIuMCA1OTUuMF0KPj4KZW5kb2JqCjggMCBvYmoKPDwKL0NvbnRlbnRzIDI2IDAgUgovTWVkaWFCb3ggWzAuMCAwLjAgNTk1LjAgODQyLjBdCi9QYXJlbnQgMiAwIFIKL1Jlc291cmNlcyAyNyAwIFIKL1RyaW1Cb3ggWzAgMCA1OTUgODQyXQovVHlwZSAvUGFnZQovQ3JvcEJveCBbMC4wIDAuMCA1OTUuMCA4NDIuMF0KL1JvdGF0ZSAwCj4+CmVuZG9iago5IDAgb2JqCjw8Ci9Db250ZW50cyAyOCAwIFIKL1R5cGUgL1BhZ2UKL1Jlc291cmNlcyAyOSAwIFIKL1BhcmVudCAyIDAgUgovUm90YXRlIDkwCi9NZWRpYUJveCBbMC4wIDAuMCA4NDIuMCA1OTUuMF0KL0Nyb3BCb3ggWzAuMCAwLjAgODQyLjAgNTk1LjBdCj4+CmVuZG9iagoxMCAwIG9iago8PAovQ29udGVudHMgMzAgMCBSCi9NZWRpYUJveCBbMC4wIDAuMCA1OTUuMCA4NDIuMF0KL1BhcmVudCAyIDAgUgovUmVzb3VyY2VzIDMxIDAgUgovVHJpbUJveCBbMCAwIDU5NSA4NDJdCi9UeXBlIC9QYWdlCi9Dcm9wQm94IFswLjAgMC4wIDU5NS4wIDg0Mi4wXQovUm90YXRlIDAKPj4KZW5kb2JqCjExIDAgb2JqCjw8Ci9Db250ZW50cyAzMiAwIFIKL1R5cGUgL1BhZ2UKL1Jlc291cmNlcyAzMyAwIFIKL1BhcmVudCAyIDAgUgovUm90YXRlIDkwCi9NZWRpYUJveCBbMC4wIDAuMCA4NDIuMCA1OTUuMF0KL0Nyb3BCb3ggWzAuMCAwLjAgODQyLjAgNTk1LjBdCj4+CmVuZG9iagoxMiAwIG9iago8PAovQ29udGVudHMgMzQgMCBSCi9NZWRpYUJveCBbMC4wIDAuMCA1OTUuMCA4NDIuMF0KL1BhcmVudCAyIDAgUgovUmVzb3VyY2VzIDM1IDAgUgovVHJpbUJveCBbMCAwIDU5NSA4NDJdCi9UeXBlIC9QYWdlCi9Dcm9wQm94IFswLjAgMC4wIDU5NS4wIDg0Mi4wXQovUm90YXRlIDAKPj4KZW5kb2JqCjEzIDAgb2JqCjw8Ci9Db250ZW50cyAzNiAwIFIKL1R5cGUgL1BhZ2UKL1Jlc291cmNlcyAzNyAwIFIKL1BhcmVudCAyIDAgUgovUm90YXRlIDkwCi9NZWRpYUJveCBbMC4wIDAuMCA4NDIuMCA1OTUuMF0KL0Nyb3BCb3ggWzAuMCAwLjAgODQyLjAgNTk1LjBdCj4+CmVuZG9iagoxNCAwIG9iago8PAovQ29udGVudHMgMzggMCBSCi9NZWRpYUJveCBbMC4wIDAuMCA1OTUuMCA4NDIuMF0KL1BhcmVudCAyIDAgUgovUmVzb3VyY2VzIDM5IDAgUgovVHJpbUJveCBbMCAwIDU5NSA4NDJdCi9UeXBlIC9QYWdlCi9Dcm9wQm94IFswLjAgMC4wIDU5NS4wIDg0Mi4wXQovUm90YXRlIDAKPj4KZW5kb2JqCjE1IDAgb2JqCjw8Ci9Db250ZW50cyA0MCAwIFIKL1R5cGUgL1BhZ2UKL1Jlc291cmNlcyA0MSAwIFIKL1BhcmVudCAyIDAgUgovUm90YXRlIDkwCi9NZWRpYUJveCBbMC4wIDAuMCA4NDIuMCA1OTUuMF0KL0Nyb3BCb3ggWzAuMCAwLjAgODQyLjAgNTk1LjBdCj4+CmVuZG9iagoxNiAwIG9iago8PAovQ29udGVudHMgNDIgMCBSCi9NZWRpYUJveCBbMC4wIDAuMCA1OTUuMCA4NDIuMF0KL1BhcmVudCAyIDAgUgovUmVzb3VyY2VzIDQzIDAgUgovVHJpbUJveCBbMCAwIDU5NSA4NDJdCi9UeXBlIC9QYWdlCi9Dcm9wQm94IFswLjAgMC4wIDU5NS4wIDg0Mi4wXQovUm90YXRlIDAKPj4KZW5kb2JqCjE3IDAgb2JqCjw8Ci9Db250ZW50cyA0NCAwIFIKL1R5cGUgL1BhZ2UKL1Jlc291cmNlcyA0NSAwIFIKL1BhcmVudCAyIDAgUgovUm90YXRlIDkwCi9NZWRpYUJveCBbMC4wIDAuMCA4NDIuMCA1OTUuMF0KL0Nyb3BCb3ggWzAuMCAwLjAgODQyLjAgNTk1LjBdCj4+CmVuZG9iagoxOCAwIG9iago8PAovQ29udGVudHMgNDYgMCBSCi9NZWRpYUJveCBbMC4wIDAuMCA1OTUuMCA4NDIuMF0KL1BhcmVudCAyIDAgUgovUmVzb3VyY2VzIDQ3IDAgUgovVHJpbUJveCBbMCAwIDU5NSA4NDJdCi9UeXBlIC9QYWdlCi9Dcm9wQm94IFswLjAgMC4wIDU5NS4wIDg0Mi4wXQovUm90YXRlIDAKPj4KZW5kb2JqCjE5IDAgb2JqCjw8Ci9OYW1lcyBbKDAwMDAwMDAwMDAwMDAwMDApIDQ4IDAgUiAoMDAwMDAwMDAwMDAwMDAwMCkgNDkgMCBSICgwMDAwMDAwMDAwMDAwMDAwKSA1MCAwIFIgKDAwMDAwMDAwMDAwMDAwMDApIDUxIDAgUiAoMDAwMDAwMDAwMDAwMDAwMCkgNTIgMCBSCigwMDAwMDAwMDAwMDAwMDAwKSA1MyAwIFIgKDAwMDAwMDAwMDAwMDAwMDApIDU0IDAgUl0KPj4KZW5kb2JqCjIwIDAgb2JqCjw8Ci9MZW5ndGggMjAyOAovRmlsdGVyIC9GbGF0ZURlY29kZQo+PgpzdHJlYW0NCniclVlZb9s4EH73rxhggYULxIx46cib3aRpus1pY3ex6Itqq7aytpRKdrv+9zsUSVkHHadFm1DSN9fH4XDIekBhRMGDUDD8Od8Mvg8mswHFF5zBbDHwYMQo8YJ6HJHQjMOIyMiMeUQYN2PpEWExETvI0oYezkjo67Gnfl3NBo9oWv1j8AnfXuNYOQIKQIELTkIKIZUw2wzOP1BAF2ffBsNZ/B/cZD/ydJ68mz0rPW0tHpHwU8UTeCFhQAOGL6jHSMChSAZTCwjV+yDkyi3GPWCBcraBELSB0Gp6GKOlsqSUBJL4vkNJw5UeBF2VESWUW1+p24oBKTN9iLZzVE+LWiog9DwS8Q6z0yRbJIUitYEMQlkjmUVSiV+m27xIRrSLDxyaP6fZv2m2hKc8XsAfq7g4Uz+6ktJaGl7vimWcZzACyjyP9mwIa2P4MS72cRbDl6Hnf3kHZzfZIo27cFYrfljBXX6BWrmQfhBGXhdKa83X09nN3YVJsSZ7oY/kOgk0aQnv80Vy0dJcyTipvL7/fMnEOQ1oeK5CDfoWBT1p8TLeJk2DWsRpkPmjT7tsxDwm+6aYoERwnMQq6du27gvMjoq+357e399KjwcebxpluGQjhvMYGmEjopy7AK+2K1pCUaQ8Fdbg0C5qOKjFKMwSmm/g/O9vFC5zeGz7fcCgEuoFhOk6M2qMXbQ6Q33Ii228vgDlS4O626ur6cd7B891xE0d8X6TZFu4xWRwiIiD2Vr/w9PVw/jm0pFzAvzIxNYwMUnXa5jlF50k9rFksY7qWVJuuzC/r5EF5/QMbu/+gKfxPTzdjy/P4OMEpuPb8adxV14aM0ONm8Rl/APX4nK3SM9gGmfbvFx1ZbixObxL1/E+Put+Z1bn+P1kRBmufg5/oe8wSbJlvMZ1TqMv77pSdt6HzvUvI6t0BhcQhbj0QYZCiGOL28X1dJW+9LjW6LfQrZG/yrh+diiqqXeSDi5ytWDN/9v51YL1xDgo1oh6Ek6yrJeAi+XLtHyJt/MVzFZFvluu+gvHxfb06vMHB9LB9vivCVYwB7Ym9Prp9tPDLf3swNTc9UqUkJRIRQFTv3SRYr0i1UahIiRAmCp1GB5vaHDHIiwAjl1ViG2Aqh+tDkC9NhgaCcL8PohxSbioUbjjCtpH8cgjgThlD7vEkFmQ8InPHCCcAyEtSArCoz5IMuwNa3M+I9ThuYqfC+Wu9kf3k/34NcbE3wPZ+A1Kx99D2fhft2fi1yAdfx9k4tcgHX8PZOPXIB1/D6Ti96r8eT1+jTkVv0GdiP91eyZ+DToRvwadiF+DevF3elcSRFhXGPHrXijSRUD1JsRR0vEUolxwiDwU+WI338JdvEkcvRCWNRa+KqgaPYdJgZEckXzc7h14HiigC/9kGruOQEiJL5wCeDyKv67bHUcgiNoG/UgdDlQB+zNe7xKs9Td3T7rYt9VLFlbp6lA/3uQ7bGqOilLMCCxzQdAWo66gq3x1gLf5i2M2kCOVuQ58+dw6IFikKteBPiRM72CuenLwqccFbnquOeMkcPvjdD5Ura4TTTzPaQC7EP5rIhLPUiI6JuImn6JjtI1lR8l3gJ+TOCuP0++QKJ+Zi36vqi2/Sv9b3df0O9Cn6HcZOEG/W+T1yweBR3A/tHtn6KzVBmP36i7I1GqLMnt1F2Vq9Ql7ulYbkNmreyBdqw3I7NVdkKnVBmT26i5IxY+fkG7tDx6quSt+jTHx90A2foPS8fdQNv7X7Zn4NUjH3weZ+DVIx98D2fg1SMffALX7PSRJKUQPpWznT7s8axhWaQ0bOrJXasKwkIedep+rk6prQUm1oFwi3LU6pGbGgT66OphaHUdEnKvjO/5Uo2dDpnqH5LGa9I19xD075LCuGHVJ4cGCBA0x+9yU6955CekpsD0QsOZ+9n4VF8tEbZy4taUZ/MyLRdk7ZwrOag3MasCNUJ1WkgSedi9JUkKcLeCfpMjhIU7LBO6z9b6rB7sYbs5K8X+QlvCCxzVlPM8wj34kBcrNK5fga1ym5YU5tHRmgPuEU3dcVwR+h3ty9eZ5YFGAY8484tFqHuxYkak+HqZlY585jUjgV4jWvNlpbHx/tItam9EfWKge9I2xWT4e8fFPoIqIAI41W6I2TDEZmKfKGH5uzy2PfGW4c5hM5uu4iLdpnnUmgIfUwHG/mK1wAvBvjJvU5mW3TQpYJlmCgsnC3jSTyzwpMU+K5PsuLZKuOt9aH5bpMou3uwKnsoByG29eCDAC4/UavqVLfI928GO5yn+qC1FMNZU/nHQ1ytpBdfFw/hGTaq0EdKKiv9l8vSvTH2jnG1xPZyC0EXWAxhAqK12d/ODl7utzgv3rNofOBerzrkjLRTpXpGE2rvc9z1jtWT8juSrlvOp/Q95ZJx+QkGP3xgI3BJUv6q6ddzL5cNj2vArO8W+k8SIiXJ+3082S9w7cbVh1L2j+92FUjzoBhJJIPH3gPsJlt1Tstqsc2cGsmFaznBf7Ny8vU6CqxA8OBYt7IQkaC6j+bh7rz91yhhwgxHaFrHUjONlfvL38Sq78YIGvNphq3Ztxw6nKC+sTC+TrtdlM5kFly8RrNb0h1FaihFqM1QS2vEG9eDSqKFIXCbgNYZsTIKM2RUQvRahFNDcwnWfFUl0E/0wKnPDJvroL9mA5iCKl1tzaHMaddplhzKw6Qgp5RPdb6o412pvLx8H/IdsARQ0KZW5kc3RyZWFtCmVuZG9iagoyMSAwIG9iago8PAovUHJvY1NldCBbL1BERiAvVGV4dCAvSW1hZ2VCIC9JbWFnZUMgL0ltYWdlSV0KL0ZvbnQgNTUgMCBSCi9YT2JqZWN0IDw8Ci9YZjEgNTYgMCBSCi9YZjIgNTcgMCBSCi9pbWc0IDU4IDAgUgovaW1nMyA1OSAwIFIKL2ltZzIgNjAgMCBSCj4+Cj4+CmVuZG9iagoyMiAwIG9iago8PAovTGVuZ3RoIDI0MTQKL0ZpbHRlciAvRmxhdGVEZWNvZGUKPj4Kc3RyZWFtDQp4nJ1ZbXPaSBL+zq/oL3flVBFZ8yZp8umwcWJiG1ggye5Vqq4UIYx2hUSESOL99dujkSwNQmCf7SprUD89Pf3ew/fe1aJ3+Z4AsWGx6hEJHqEW57BY9i6u97s83YQZDJbLLNzt3iz+7N0ser/1vmsUBUJLlCuFxTRqlq6jHOZR8rg+BDAgpAK4nsVpARjvs+0+U7QXcArhEEvyBgKSyP/7RUguLC4KZBytQoiS3T7zkyCEbRpHwRME6WbrJ0/nGVHPkm7BKClE6MNttPGDtR/DNPOX4W7dB+I61LYPufBaw65NLKEPMlrBPlmGcfQjzMJlH7Iw32cJ5Om7s7I4nrD0meaDxR+DB7ibDd4vYPp5AfeL4SmgIy1ba34apzkkqQXc7QPMrTsLRskSrZ5Fftzvw93tYDEZzgb989IIagmmxZk8DO4G448jGI/gy2A4Og9mjmXrs0ymUwuuZos5zCaD4XkkkZbQBlEmzfvwYf+nXzwwKWybNrA2qN/Zhx6Fnz3CwSWeRWDTo8K1aLWMe/MGcfaIb6V669lMKY1RarkOUG5JD43VW9VSCUCeKBVFN1UAgv8KLWNs4S+yurieDN/B9ToM/oJ8jc7nP/nf4hD8TbpPckiT4lN/uz08sAPE06y1pK5TGfCzH2/S1hlxLyaE5SlSYdkcOFUA4raldssQZsIr6D3bYsKUehoFf+1bMnnPMolCJu6pjZRMg9Ht25l93HSHKEosW5vvHKkjOZpHUX4hl/NP8xfxd1BhpEwy5PL+pShuW0S7I7v8+OmqQe4U+nWAo7ujLh2XK8UGG2SyITBMDXdwtGKl5Qp0VGpRqXiiOFnPxmDBH3TEi8/3to3O4nAmHMlYY7PCgdR+xQP1CuEEHsll5Za02tLwbYq2VB5IvcK7i4VAf0BY5d6FiLKMI2qDUEfW6p1m6XIf5DAMcz+KWzlf1MEn0HoOa5yJOahwdab53acuHLXZKWD0d9iJlC4mvG7sb/lTF5RxrozQjb1O4zTrQnOGKeAUepItsUiOU+uUsmxhER0gcv6WcikhmJxUUg14n4UhvEA1NYKc00RNOguX5w7e4CscyrgjscZJ5nJHOP8jnSmWgcdsdEGiDmNb6I5mdi3phEcr99zoxQlijGYP40gTqqcuKiF4xZFVi2da7CMIhnzjv2O7nsp2eE7uShWqGGhA8Y08yJhYxnUlV9lCCOAYl67OMYvB7zAaf56Mrm8OVYoKLVIMxz4J2x7uORbT5XKSRY9Rgg3E+zSDWRhE2yhM8hN1C13HKkKbKKWJan1cEQbJprLoKYhJovRHDun1iag+EeqPO1wVD3Waq9H9PSwmcAnz29EUn45nXOUbFRhTqeccdo7wFsomrw9mt9cHs4c7vwHmNk8XGbPdQ9av7eJQ/V4ZoEroBuuOFqkCKDmwefS8su/ysflMVzDfb7fx07vW/i02otyXupYjUeFOpfB5Gi/h2xO8A7MNnI0+DxY3cD96GC1uOhoprFAGV4yS0hLHWso+mnQyfUvg3/qBwtVgfvNwM17A4nZwN5kNvwxmcD15mN7f/A4Pk8XgZbtic1Lq8GEwHo5maJb5sV6OdbBzTXZUVFr+MF+MxuhIlA+uPl7PhSu9MflvqzVG0xgMsHHzpDbTPkOj7ELoTPBqXmpgGcaJ7EiUreHJ1lCG7adDmtuOkh9phP5xZD9KDFC935Y+/cqo45gtr8aUgcoZtmisuZE+1tDPW4WFMgNT74MZEasBtaloQUpPFzZ2p/LYeY5uJAzUmY3MNgd7cWUv17WKilCumVSVuSMdcnxN1GtFzjQ56SSnquLLGqJS4QG9mj+we8SduSJwRb2McYntp1OtBU686iVTNaVaCPUm6Okl84oAjJ+XjiWwkmkuzHPVS71FuQj0/uUq7mGHj2mhXBKn5lE+8xLk1HvH1aoQSzMoBW6eLegsmqgrTIKorfO1FQ/honFcrK2smEYOaystUwOGFcMhR+qyOgx3QRZt8yhNWu5TBj9haKkm5nY+btGWcY4hqU7UID7SOVJZSSIL5dfEH7J0t4NBMbO1JtMypjEQVU/QPEO0C44iqoBmXFXYBmLh/yqmQxzx9q2wYVVMc0dlOxMWtpp2VoazwEFbGqdZpLkft8h5bQYcH6RuVCTM16o4AYNpgBrI8mgVBZHqXPz9r45RvcEJRS2vb6Y+1t8dfMh81KRqe27TTUcdbzJAFUlRekSQYmFAh+jDdeavVK2IVjk2Dl03FQ02mCakrnJfwuUSMdBgdx5ObDX5FeXKz7LIfwybeHgf7vLoh9bpSUZUeioADo8zWaFSwz5chcssTTfnBaJl8bzy4yBNnvpwH/1Qh5opdKGWF/BQ1wSk9B/ldE2J5uv0J/akXZ1Wk43D6pslP8l3feUl4CdLbSUYjv44z0SQ6ibhqxpOsDkLo8d1jhUFp96vb7Cgq3noPB/sY8tLpWp0OkIvmvmjYRLHtSlptX/MMVJIg741cDHXSCAN0tkO6xWesc3dM7KHCbGPAaSRPA72wHhzWmJx20wcNq+8eYTtEvyHYL3/13FdHUCppI3dcKxksoUgRtp5iQ44rQ1I8FTatyf5GhuV67WfPbaTG2eGDWvUcRtybtqwph8PWrTCNGJN22ER7pgmNAEtate033n2nmkCbJKo80LrHUBt79xe0jTeKeHO9gZKeYyqKyYcW3EOel6eG8lrDk0UMnFZYb3XcjFgyEY6Fvk/hDFg2Eti4lPmfiUbE7ZBPyCFH7ySjQnDIZ+zwsSvZGPCsJllrDD8K9mYMNUTy0Me+pLJfo504kmLe939iCCG7zbIuzKPoIbzmohW5nmR+9pE3djU2tXrV2u3YlOp6ZVsTFip3VfyKEcSwevTlOvXnuaZTSnWa9mYMH2aAx7anFWKV1ONa7lVpwvRDpI0f/4mJU1woPgRZjiyB0WxgG/+LtpZsFgjJf75xd3PPsdq8hgmIbY44RKicj5VfcoyDTXLLPy+j7IQdtFj4uf7LLRAVyHNGFll4fNzvvZz9cHx1NuUXt3H6UbL327jKCjEzlN4SvcZpMU8rsSIkiDeL+sNVtgkx+ljhL0ltt6rMISvFz9RmuLropLN1zfq27sCt4NlOW9oaME9iPInxfwSP1AfpkkcJcW3UJtQEX69wJ68ye7ExW55RVvc7RLuWcQ9cbdb0arFKWJCcZj3rPJ6l1WLLlriSnUtrWnLRSctl2rbklYvNO0/Cp0V3A0KZW5kc3RyZWFtCmVuZG9iagoyMyAwIG9iago8PAovRm9udCA2MSAwIFIKL1hPYmplY3QgPDwKL0ZtMSA2MiAwIFIKL0ZtMiA2MyAwIFIKPj4KPj4KZW5kb2JqCjI0IDAgb2JqCjw8Ci9MZW5ndGggMjAyNAovRmlsdGVyIC9GbGF0ZURlY29kZQo+PgpzdHJlYW0NCniclVlbU9s4FH7PrzhPO+kMEdbNF95CoZRuIUAyuzs7fXETNzGb2NRO2ubf75ElOb4ohHZakO3v3D4dHR2pHlAYUfAgFAx/zjeD74PL2YDiC85gthh4MGKUeEE9jkhoxmFEZGTGPCKMm7H0iLCYiB1kaUMPZyT09dhTv65ng0c0rf4x+IRvb3CsHAEFoMAFJyGFkEqYbQbnHyigi7Nvg+Es/gW32Y88nSfvZs9KT1uLRyT8VPEEXkgY0IDhC+oxEnAoksHUAkL1Pgi5cotxD1ignG0gBG0gtJoexmipLCklgSS+71DScKUHQVdlRAnl1lfqtmJAykwfou0c1dOilgoIPY9EvMPsNMkWSaFIbSCDUNZIZpFU4pfpNi+SEe3iA4fmz2n2X5ot4SmPF/DnKi7O1I+upLSWhje7YhnnGYyAMs+jPRvC2hh+jIt9nMXwZej5X97B2W22SOMunNWKH1Zwn1+gVi6kH4SR14XSWvPNdHZ7f2FSrMle6CO5TgJNWsL7fJFctDRXMk4qbyafr5g4pwENz1WoYd+ioCctXsXbpGlQizgNMn/0aZeNmMdk3xSTggQBTmKV9G1bkwKzo6LvbnY9nY1Y0yDD5RoxnMPQCBq4cgz5jqxN0RKKIuWlsMaGdkFDyx+zfOYbOP/nG4WrHB57PhsMKsEi5esSMzoMXYQ6g3zIi228vgDlSYO0u+vr6ceJg+E63qaOeL9Jsi3cYRo4RMTBbK3/4en6YXx75cg2AX5kImuYuEzXa5jlF5309bFYsY7qWVJuuzC/r5EF5/QM7u7/hKfxBJ4m46sz+HgJ0/Hd+NO4Ky+NmaHGXcZl/ANX4XK3SM9gGmfbvFx1ZbixObxP1/E+Put+Z1bn+P3liDJc9xz+Rt/hMsmW8RpXOI2+vOtK2VkfOle+jKzSGVxAFOKiBxkKIY4taxfX01X60uNao99Ct0b+LuP62aGopt5JOrjI1YI1/2/nVwvWE+OgWCPqSTjJsl4CLpav0vIl3s5XMFsV+W656i8cF9vT688fHEgH2+O/L7F2ObA1oZO/Zg8fJsKxyg/c9QqUkJRIRQFTv3SJYr0S1UahIiRAmCJ1GB5vZXCvIiwAjv1UiA2Aqh+tvV+9NhgaCcL8PohxSbioUbjXCtpH8cgjgThlD/vDkFmQ8InPHCCcAyEtCEs0j/ogybArrM35jFCH5yp+LpS72h/dSfbj1xgTfw9k4zcoHX8PZeN/3Z6JX4N0/H2QiV+DdPw9kI1fg3T8PZCK36vy5/X4NeZU/AZ1Iv7X7Zn4NehE/Bp0In4N6sXf6VpJEGFdYcSvu6BIFwHVlRBHScfzh3LBIfJQ5IvdfAv38SZxdEFY1lj4qqBq8RwmBUZyRPJxu3fgeaCALvyTaek6AiElvnAK4MEo/rpudxyBIGob9CN1LFAF7K94vUuw1t/eP+li31YvWVilq0P9eJPvsKk5KkoxI7DMYffYEqOuoKt8dYC3+YtjNpAjlbkOfPncOhpYpCrXgT4eTO9hrrpx8KnHBW56rjnjJHD743Q+VI2uE008z2kAuxD+eyIST1EiOibiJp+iY7SNZUfJd4Cfkzgrj9PvkCifmYt+r6otv0v/W93X9DvQp+h3GThBv1vk9WsHgYdvP7R7Z+is1QZj9+ouyNRqizJ7dRdlavUJe7pWG5DZq3sgXasNyOzVXZCp1QZk9uouSMWPn5Bu7Q8ep7krfo0x8fdANn6D0vH3UDb+1+2Z+DVIx98Hmfg1SMffA9n4NUjH3wC1+z0kSSlED6Vs50+7PGsYVmkNGzqyV2rCsJCHnXqfq5Oqa0FJtaBcIty1OqRmxoE+ujqYWh1HRJyr4zv+VKNnQ6Z6h+SxmvSNfcQ9O+Swrhh1SeHBggQNMfvclOvedgnpKbA9ELDmfvZ+FRfLRG2cuLWlGfzMi0XZO2cKzmoNzGrAjVCdVpIEnnYvSVJCnC3g36TI4SFOywQm2Xrf1YNdDDdnpfgXpCW84HFNGc8zzKMfSYFy88ol+BqXaXlhDi2dGeA+4dQd1zWBP2BCrt88DywKcMyZRzxazYMdKzLVx8O0bOwzpxEJ/ArRmjc7jY3vj3ZRazP6AwvVg74rNsvHIz7+CVQREcCxZkvUhikmA/NUGcPP7bnlka8Mdw6TyXwdF/E2zbPOBPCQGjjuF7MVTgD+jXGT2rzstkkByyRLUDBZ2DtmcpUnJeZJkXzfpUXSVedb68MyXWbxdlfgVBZQbuPNCwFGYLxew7d0ie/RDn4sV/lPdRWKqabyh5OuRlk7qC4ezj9iUq2VgE5U9Debr3dl+gPtfIOb6QyENqIO0BhCZaWrkx+83H19TrB/3ebQuTp93hVpuUjnijTMxvW+5xmrPetnJFelnFf9b8g76+QDEnLsxljghqDyRd2y804mHw7bnlfBOf6NNF5EhOvzdrpZ8t6Buw2bqbQ0/+8wqkedAEJJJJ4+cB/hslsqdttVjuxgVkyrWc6L/ZuXlylQVeIHh4LFvZAEjQVUfzeP9eduOUMOEGK7Qta6EbzcX7y9/Equ/GCBrzaYat2bccOpygvrEwvk67XZTOZBZcvEazW9IdRWooRajNUEtrxBvXg0qihSFwm4DWGbEyCjNkVEL0WoRTQ3MJ1nxVJdBP9MCpzwy311F+zBchBFSq25tTmMO+0yw5hZdYQU8ojut9Qda7Q3l4+D/wHGzv95DQplbmRzdHJlYW0KZW5kb2JqCjI1IDAgb2JqCjw8Ci9Qcm9jU2V0IFsvUERGIC9UZXh0IC9JbWFnZUIgL0ltYWdlQyAvSW1hZ2VJXQovRm9udCA2NCAwIFIKL1hPYmplY3QgPDwKL1hmMSA2NSAwIFIKL1hmMiA2NiAwIFIKL2ltZzQgNjcgMCBSCi9pbWczIDY4IDAgUgovaW1nMiA2OSAwIFIKPj4KPj4KZW5kb2JqCjI2IDAgb2JqCjw8Ci9MZW5ndGggMjQxNAovRmlsdGVyIC9GbGF0ZURlY29kZQo+PgpzdHJlYW0NCnicnVltc9pIEv7Or+gvd+VUEVnzJmny6bBxYmIbWCDJ7lWqrhQhjHaFRIRI4v3126ORLA1CYJ/tKmtQPz09/d7D997Vonf5ngCxYbHqEQkeoRbnsFj2Lq73uzzdhBkMlsss3O3eLP7s3Sx6v/W+axQFQkuUK4XFNGqWrqMc5lHyuD4EMCCkAriexWkBGO+z7T5TtBdwCuEQS/IGApLI//tFSC4sLgpkHK1CiJLdPvOTIIRtGkfBEwTpZusnT+cZUc+SbsEoKUTow2208YO1H8M085fhbt0H4jrUtg+58FrDrk0soQ8yWsE+WYZx9CPMwmUfsjDfZwnk6buzsjiesPSZ5oPFH4MHuJsN3i9g+nkB94vhKaAjLVtrfhqnOSSpBdztA8ytOwtGyRKtnkV+3O/D3e1gMRnOBv3z0ghqCabFmTwM7gbjjyMYj+DLYDg6D2aOZeuzTKZTC65miznMJoPheSSRltAGUSbN+/Bh/6dfPDApbJs2sDao39mHHoWfPcLBJZ5FYNOjwrVotYx78wZx9ohvpXrr2UwpjVFquQ5QbkkPjdVb1VIJQJ4oFUU3VQCC/wotY2zhL7K6uJ4M38H1Ogz+gnyNzuc/+d/iEPxNuk9ySJPiU3+7PTywA8TTrLWkrlMZ8LMfb9LWGXEvJoTlKVJh2Rw4VQDitqV2yxBmwivoPdtiwpR6GgV/7Vsyec8yiUIm7qmNlEyD0e3bmX3cdIcoSixbm+8cqSM5mkdRfiGX80/zF/F3UGGkTDLk8v6lKG5bRLsju/z46apB7hT6dYCju6MuHZcrxQYbZLIhMEwNd3C0YqXlCnRUalGpeKI4Wc/GYMEfdMSLz/e2jc7icCYcyVhjs8KB1H7FA/UK4QQeyWXllrTa0vBtirZUHki9wruLhUB/QFjl3oWIsowjaoNQR9bqnWbpch/kMAxzP4pbOV/UwSfQeg5rnIk5qHB1pvndpy4ctdkpYPR32ImULia8buxv+VMXlHGujNCNvU7jNOtCc4Yp4BR6ki2xSI5T65SybGERHSBy/pZyKSGYnFRSDXifhSG8QDU1gpzTRE06C5fnDt7gKxzKuCOxxknmckc4/yOdKZaBx2x0QaIOY1vojmZ2LemERyv33OjFCWKMZg/jSBOqpy4qIXjFkVWLZ1rsIwiGfOO/Y7ueynZ4Tu5KFaoYaEDxjTzImFjGdSVX2UII4BiXrs4xi8HvMBp/noyubw5VigotUgzHPgnbHu45FtPlcpJFj1GCDcT7NINZGETbKEzyE3ULXccqQpsopYlqfVwRBsmmsugpiEmi9EcO6fWJqD4R6o87XBUPdZqr0f09LCZwCfPb0RSfjmdc5RsVGFOp5xx2jvAWyiavD2a31wezhzu/AeY2TxcZs91D1q/t4lD9XhmgSugG644WqQIoObB59Lyy7/Kx+UxXMN9vt/HTu9b+LTai3Je6liNR4U6l8HkaL+HbE7wDsw2cjT4PFjdwP3oYLW46GimsUAZXjJLSEsdayj6adDJ9S+Df+oHC1WB+83AzXsDidnA3mQ2/DGZwPXmY3t/8Dg+TxeBlu2JzUurwYTAejmZolvmxXo51sHNNdlRUWv4wX4zG6EiUD64+Xs+FK70x+W+rNUbTGAywcfOkNtM+Q6PsQuhM8GpeamAZxonsSJSt4cnWUIbtp0Oa246SH2mE/nFkP0oMUL3flj79yqjjmC2vxpSByhm2aKy5kT7W0M9bhYUyA1PvgxkRqwG1qWhBSk8XNnan8th5jm4kDNSZjcw2B3txZS/XtYqKUK6ZVJW5Ix1yfE3Ua0XONDnpJKeq4ssaolLhAb2aP7B7xJ25InBFvYxxie2nU60FTrzqJVM1pVoI9Sbo6SXzigCMn5eOJbCSaS7Mc9VLvUW5CPT+5SruYYePaaFcEqfmUT7zEuTUe8fVqhBLMygFbp4t6CyaqCtMgqit87UVD+GicVysrayYRg5rKy1TA4YVwyFH6rI6DHdBFm3zKE1a7lMGP2FoqSbmdj5u0ZZxjiGpTtQgPtI5UllJIgvl18QfsnS3g0Exs7Um0zKmMRBVT9A8Q7QLjiKqgGZcVdgGYuH/KqZDHPH2rbBhVUxzR2U7Exa2mnZWhrPAQVsap1mkuR+3yHltBhwfpG5UJMzXqjgBg2mAGsjyaBUFkepc/P2vjlG9wQlFLa9vpj7W3x18yHzUpGp7btNNRx1vMkAVSVF6RJBiYUCH6MN15q9UrYhWOTYOXTcVDTaYJqSucl/C5RIx0GB3Hk5sNfkV5crPssh/DJt4eB/u8uiH1ulJRlR6KgAOjzNZoVLDPlyFyyxNN+cFomXxvPLjIE2e+nAf/VCHmil0oZYX8FDXBKT0H+V0TYnm6/Qn9qRdnVaTjcPqmyU/yXd95SXgJ0ttJRiO/jjPRJDqJuGrGk6wOQujx3WOFQWn3q9vsKCreeg8H+xjy0ulanQ6Qi+a+aNhEse1KWm1f8wxUkiDvjVwMddIIA3S2Q7rFZ6xzd0zsocJsY8BpJE8DvbAeHNaYnHbTBw2r7x5hO0S/Idgvf/XcV0dQKmkjd1wrGSyhSBG2nmJDjitDUjwVNq3J/kaG5XrtZ89tpMbZ4YNa9RxG3Ju2rCmHw9atMI0Yk3bYRHumCY0AS1q17TfefaeaQJskqjzQusdQG3v3F7SNN4p4c72Bkp5jKorJhxbcQ56Xp4byWsOTRQycVlhvddyMWDIRjoW+T+EMWDYS2LiU+Z+JRsTtkE/IIUfvJKNCcMhn7PCxK9kY8KwmWWsMPwr2Zgw1RPLQx76ksl+jnTiSYt73f2IIIbvNsi7Mo+ghvOaiFbmeZH72kTd2NTa1etXa7diU6nplWxMWKndV/IoRxLB69OU69ee5plNKdZr2ZgwfZoDHtqcVYpXU41ruVWnC9EOkjR//iYlTXCg+BFmOLIHRbGAb/4u2lmwWCMl/vnF3c8+x2ryGCYhtjjhEqJyPlV9yjINNcss/L6PshB20WPi5/sstEBXIc0YWWXh83O+9nP1wfHU25Re3cfpRsvfbuMoKMTOU3hK9xmkxTyuxIiSIN4v6w1W2CTH6WOEvSW23qswhK8XP1Ga4uuiks3XN+rbuwK3g2U5b2howT2I8ifF/BI/UB+mSRwlxbdQm1ARfr3AnrzJ7sTFbnlFW9ztEu5ZxD1xt1vRqsUpYkJxmPes8nqXVYsuWuJKdS2tactFJy2XatuSVi807T8KnRXcDQplbmRzdHJlYW0KZW5kb2JqCjI3IDAgb2JqCjw8Ci9Gb250IDcwIDAgUgovWE9iamVjdCA8PAovRm0xIDcxIDAgUgovRm0yIDcyIDAgUgo+Pgo+PgplbmRvYmoKMjggMCBvYmoKPDwKL0xlbmd0aCAyMDIzCi9GaWx0ZXIgL0ZsYXRlRGVjb2RlCj4+CnN0cmVhbQ0KeJyVWdly27gSfddX9NMtpcqCiY2L36TYsZ2JV6lmbt3KCyMxEn0l0iGlJPr7aRAAxQWynFRig+Tp7aDRaCAeUBhR8CAUDH/ON4Mfg8lsQPEFZzBbDDwYMUq8oB5HJDTjMCIyMmMeEcbNWHpEWEzEDrK0oYczEvp67KlfV7PBE5pW/xh8xrfXOFaOgAJQ4IKTkEJIJcw2g/NPFNDF2ffBcBb/htvsZ57Okw+zF6WnrcUjEn6peAIvJAxowPAF9RgJOBTJYGoBoXofhFy5xbgHLFDONhCCNhBaTQ9jtFSWlJJAEt93KGm40oOgqzKihHLrK3VbMSBlpg/Rdo7qaVFLBYSeRyLeYXaaZIukUKQ2kEEoaySzSCrxy3SbF8mIdvGBQ/OXNPt/mi3hOY8X8NcqLs7Uj66ktJaG17tiGecZjIAyz6M9G8LaGN7ExT7OYvg69PyvH+DsNlukcRfOasWPK7jPL1ArF9IPwsjrQmmt+Xo6u72/MCnWZC/0kVwngSYt4WO+SC5amisZJ5XXD18umTinAQ3PVahR36KgJy1extukaVCLOA0yf/R5l42Yx2TfFJOCBAFOYpX0bVsPBWZHRd/d7Go6G7GmQYbLNWI4h6ERNHDlGPIdWZuiJRRFykthjQ3tgoaWP2b5zDdw/t/vFC5zeOr5bDCoBIuUr0vM6DB0EeoM8jEvtvH6ApQnDdLurq6mNw8Ohut4mzri/SbJtnCHaeAQEQeztf7H56vH8e2lI9sE+JGJrGFikq7XMMsvOunrY7FiHdWzpNx2YX5fIwvO6Rnc3f8Fz+MHeH4YX57BzQSm47vx53FXXhozQ42bxGX8E1fhcrdIz2AaZ9u8XHVluLE5vE/X8T4+635nVuf442REGa57Dv+g7zBJsmW8xhVOo68fulJ21ofOlS8jq3QGFxCFuOhBhkKIY8vaxfV0lb72uNbo99CtkX/KuH52KKqpd5IOLnK1YM3/+/nVgvXEOCjWiHoSTrKsl4CL5cu0fI238xXMVkW+W676C8fF9vTqyycH0sH2+J8J1i4Htib0c+RfXU5ubhyYmrtegRKSEqkoYOqXLlGsV6LaKFSEBAhTpA7D460M7lWEBcCxnwqxAVD1o7X3q9cGQyNBmN8HMS4JFzUK91pB+ygeeSQQp+xhfxgyCxI+8ZkDhHMgpAVhieZRHyQZdoW1OZ8R6vBcxc+Fclf7ozvJfvwaY+LvgWz8BqXj76Fs/G/bM/FrkI6/DzLxa5COvwey8WuQjr8HUvF7Vf68Hb/GnIrfoE7E/7Y9E78GnYhfg07Er0G9+DtdKwkirCuM+HUXFOkioLoS4ijpeP5QLjhEHot8sZtv4T7eJI4uCMsaC98UVC2ew6TASI5IPm33DjwPFNCFfzYtXUcgpMQXTgE8GMXf1u2OIxBEbYN+pI4FqoD9Ha93Cdb62/tnXezb6iULq3R1qB9v8h02NUdFKWYEljnsHlti1BV0la8O8DZ/dcwGcqQy14EvX1pHA4tU5TrQx4PpPcxVNw4+9bjATc81Z5wEbn+czoeq0XWiiec5DWAXwv9MROIpSkTHRNzkU3SMtrHsKPkO8EsSZ+Vx+h0S5Qtz0e9VteVP6X+v+5p+B/oU/S4DJ+h3i7x97SDw8O2Hdu8MnbXaYOxe3QWZWm1RZq/uokytPmFP12oDMnt1D6RrtQGZvboLMrXagMxe3QWp+PET0q39weM0d8WvMSb+HsjGb1A6/h7Kxv+2PRO/Bun4+yATvwbp+HsgG78G6fgboHa/hyQpheihlO38aZdnDcMqrWFDR/ZKTRgW8rBT73N1UnUtKKkWlEuEu1aH1Mw40EdXB1Or44iIc3X8wJ9q9GLIVO+QPFaTvrGPuGeHHNYVoy4pPFiQoCFmn5ty3dsuIT0FtgcC1tzPPq7iYpmojRO3tjSDX3mxKHvnTMFZrYFZDbgRqtNKksDz7jVJSoizBfwvKXJ4jNMygYdsve/qwS6Gm7NS/BvSEl7xuKaM5xnm0c+kQLl55RJ8i8u0vDCHls4McJ9w6o7risB/4IFcvXseWBTgmDOPeLSaBztWZKqPh2nZ2GdOIxL4FaI1b3YaG9+f7KLWZvQHFqoHfVdslo9HfPwTqCIigGPNlqgNU0wG5qkyhp/bc8sjXxnuHCaT+Tou4m2aZ50J4CE1cNwvZiucAPwb4ya1ed1tkwKWSZagYLKwd8zkMk9KzJMi+bFLi6SrzrfWh2W6zOLtrsCpLKDcxptXAozAeL2G7+kS36Md/Fiu8l/qKhRTTeUPJ12NsnZQXTyc32BSrZWATlT0N5uvd2X6E+18h+vpDIQ2og7QGEJlpauTH7zcfXtJsH/d5tC5On3ZFWm5SOeKNMzG9b7nGas962ckV6WcV/1vyDvr5BMScuzGWOCGoPJF3bLzTiYfDtueV8E5/o00XkSE6/N2ulny3oG7DZuptDT/7zCqR50AQkkknj5wH+GyWyp221WO7GBWTKtZzov9u5eXKVBV4geHgsW9kASNBVR/N4/15245Qw4QYrtC1roRnOwv3l9+JVd+sMBXG0y17s244VTlhfWJBfLt2mwm86CyZeKtmt4QaitRQi3GagJb3qBePBpVFKmLBNyGsM0JkFGbIqKXItQimhuYzrNiqS6CfyUFTvhkX90Fe7AcRJFSa25tDuNOu8wwZlYdIYU8ovs9dcca7c3l0+BfQk3/LQ0KZW5kc3RyZWFtCmVuZG9iagoyOSAwIG9iago8PAovUHJvY1NldCBbL1BERiAvVGV4dCAvSW1hZ2VCIC9JbWFnZUMgL0ltYWdlSV0KL0ZvbnQgNzMgMCBSCi9YT2JqZWN0IDw8Ci9YZjEgNzQgMCBSCi9YZjIgNzUgMCBSCi9pbWc0IDc2IDAgUgovaW1nMyA3NyAwIFIKL2ltZzIgNzggMCBSCj4+Cj4+CmVuZG9iagozMCAwIG9iago8PAovTGVuZ3RoIDI0MTQKL0ZpbHRlciAvRmxhdGVEZWNvZGUKPj4Kc3RyZWFtDQp4nJ1ZbXPaSBL+zq/oL3flVBFZ8yZp8umwcWJiG1ggye5Vqq4UIYx2hUSESOL99dujkSwNQmCf7SprUD89Pf3ew/fe1aJ3+Z4AsWGx6hEJHqEW57BY9i6u97s83YQZDJbLLNzt3iz+7N0ser/1vmsUBUJLlCuFxTRqlq6jHOZR8rg+BDAgpAK4nsVpARjvs+0+U7QXcArhEEvyBgKSyP/7RUguLC4KZBytQoiS3T7zkyCEbRpHwRME6WbrJ0/nGVHPkm7BKClE6MNttPGDtR/DNPOX4W7dB+I61LYPufBaw65NLKEPMlrBPlmGcfQjzMJlH7Iw32cJ5Om7s7I4nrD0meaDxR+DB7ibDd4vYPp5AfeL4SmgIy1ba34apzkkqQXc7QPMrTsLRskSrZ5Fftzvw93tYDEZzgb989IIagmmxZk8DO4G448jGI/gy2A4Og9mjmXrs0ymUwuuZos5zCaD4XkkkZbQBlEmzfvwYf+nXzwwKWybNrA2qN/Zhx6Fnz3CwSWeRWDTo8K1aLWMe/MGcfaIb6V669lMKY1RarkOUG5JD43VW9VSCUCeKBVFN1UAgv8KLWNs4S+yurieDN/B9ToM/oJ8jc7nP/nf4hD8TbpPckiT4lN/uz08sAPE06y1pK5TGfCzH2/S1hlxLyaE5SlSYdkcOFUA4raldssQZsIr6D3bYsKUehoFf+1bMnnPMolCJu6pjZRMg9Ht25l93HSHKEosW5vvHKkjOZpHUX4hl/NP8xfxd1BhpEwy5PL+pShuW0S7I7v8+OmqQe4U+nWAo7ujLh2XK8UGG2SyITBMDXdwtGKl5Qp0VGpRqXiiOFnPxmDBH3TEi8/3to3O4nAmHMlYY7PCgdR+xQP1CuEEHsll5Za02tLwbYq2VB5IvcK7i4VAf0BY5d6FiLKMI2qDUEfW6p1m6XIf5DAMcz+KWzlf1MEn0HoOa5yJOahwdab53acuHLXZKWD0d9iJlC4mvG7sb/lTF5RxrozQjb1O4zTrQnOGKeAUepItsUiOU+uUsmxhER0gcv6WcikhmJxUUg14n4UhvEA1NYKc00RNOguX5w7e4CscyrgjscZJ5nJHOP8jnSmWgcdsdEGiDmNb6I5mdi3phEcr99zoxQlijGYP40gTqqcuKiF4xZFVi2da7CMIhnzjv2O7nsp2eE7uShWqGGhA8Y08yJhYxnUlV9lCCOAYl67OMYvB7zAaf56Mrm8OVYoKLVIMxz4J2x7uORbT5XKSRY9Rgg3E+zSDWRhE2yhM8hN1C13HKkKbKKWJan1cEQbJprLoKYhJovRHDun1iag+EeqPO1wVD3Waq9H9PSwmcAnz29EUn45nXOUbFRhTqeccdo7wFsomrw9mt9cHs4c7vwHmNk8XGbPdQ9av7eJQ/V4ZoEroBuuOFqkCKDmwefS8su/ysflMVzDfb7fx07vW/i02otyXupYjUeFOpfB5Gi/h2xO8A7MNnI0+DxY3cD96GC1uOhoprFAGV4yS0hLHWso+mnQyfUvg3/qBwtVgfvNwM17A4nZwN5kNvwxmcD15mN7f/A4Pk8XgZbtic1Lq8GEwHo5maJb5sV6OdbBzTXZUVFr+MF+MxuhIlA+uPl7PhSu9MflvqzVG0xgMsHHzpDbTPkOj7ELoTPBqXmpgGcaJ7EiUreHJ1lCG7adDmtuOkh9phP5xZD9KDFC935Y+/cqo45gtr8aUgcoZtmisuZE+1tDPW4WFMgNT74MZEasBtaloQUpPFzZ2p/LYeY5uJAzUmY3MNgd7cWUv17WKilCumVSVuSMdcnxN1GtFzjQ56SSnquLLGqJS4QG9mj+we8SduSJwRb2McYntp1OtBU686iVTNaVaCPUm6Okl84oAjJ+XjiWwkmkuzHPVS71FuQj0/uUq7mGHj2mhXBKn5lE+8xLk1HvH1aoQSzMoBW6eLegsmqgrTIKorfO1FQ/honFcrK2smEYOaystUwOGFcMhR+qyOgx3QRZt8yhNWu5TBj9haKkm5nY+btGWcY4hqU7UID7SOVJZSSIL5dfEH7J0t4NBMbO1JtMypjEQVU/QPEO0C44iqoBmXFXYBmLh/yqmQxzx9q2wYVVMc0dlOxMWtpp2VoazwEFbGqdZpLkft8h5bQYcH6RuVCTM16o4AYNpgBrI8mgVBZHqXPz9r45RvcEJRS2vb6Y+1t8dfMh81KRqe27TTUcdbzJAFUlRekSQYmFAh+jDdeavVK2IVjk2Dl03FQ02mCakrnJfwuUSMdBgdx5ObDX5FeXKz7LIfwybeHgf7vLoh9bpSUZUeioADo8zWaFSwz5chcssTTfnBaJl8bzy4yBNnvpwH/1Qh5opdKGWF/BQ1wSk9B/ldE2J5uv0J/akXZ1Wk43D6pslP8l3feUl4CdLbSUYjv44z0SQ6ibhqxpOsDkLo8d1jhUFp96vb7Cgq3noPB/sY8tLpWp0OkIvmvmjYRLHtSlptX/MMVJIg741cDHXSCAN0tkO6xWesc3dM7KHCbGPAaSRPA72wHhzWmJx20wcNq+8eYTtEvyHYL3/13FdHUCppI3dcKxksoUgRtp5iQ44rQ1I8FTatyf5GhuV67WfPbaTG2eGDWvUcRtybtqwph8PWrTCNGJN22ER7pgmNAEtate033n2nmkCbJKo80LrHUBt79xe0jTeKeHO9gZKeYyqKyYcW3EOel6eG8lrDk0UMnFZYb3XcjFgyEY6Fvk/hDFg2Eti4lPmfiUbE7ZBPyCFH7ySjQnDIZ+zwsSvZGPCsJllrDD8K9mYMNUTy0Me+pLJfo504kmLe939iCCG7zbIuzKPoIbzmohW5nmR+9pE3djU2tXrV2u3YlOp6ZVsTFip3VfyKEcSwevTlOvXnuaZTSnWa9mYMH2aAx7anFWKV1ONa7lVpwvRDpI0f/4mJU1woPgRZjiyB0WxgG/+LtpZsFgjJf75xd3PPsdq8hgmIbY44RKicj5VfcoyDTXLLPy+j7IQdtFj4uf7LLRAVyHNGFll4fNzvvZz9cHx1NuUXt3H6UbL327jKCjEzlN4SvcZpMU8rsSIkiDeL+sNVtgkx+ljhL0ltt6rMISvFz9RmuLropLN1zfq27sCt4NlOW9oaME9iPInxfwSP1AfpkkcJcW3UJtQEX69wJ68ye7ExW55RVvc7RLuWcQ9cbdb0arFKWJCcZj3rPJ6l1WLLlriSnUtrWnLRSctl2rbklYvNO0/Cp0V3A0KZW5kc3RyZWFtCmVuZG9iagozMSAwIG9iago8PAovRm9udCA3OSAwIFIKL1hPYmplY3QgPDwKL0ZtMSA4MCAwIFIKL0ZtMiA4MSAwIFIKPj4KPj4KZW5kb2JqCjMyIDAgb2JqCjw8Ci9MZW5ndGggMjAyMgovRmlsdGVyIC9GbGF0ZURlY29kZQo+PgpzdHJlYW0NCniclVnJcts4EL3rK/o0pVRZMLFx8U2KHceZeJVqMjWVCyMxEj0S6ZBSMvr7aRAAxQWynFRig+Tr7aHRaCAeUBhR8CAUDH/ON4Mfg8lsQPEFZzBbDDwYMUq8oB5HJDTjMCIyMmMeEcbNWHpEWEzEDrK0oYczEvp67KlfV7PBI5pW/xh8wrfXOFaOgAJQ4IKTkEJIJcw2g/MPFNDF2ffBcBb/BzfZzzydJ+9mz0pPW4tHJPxS8QReSBjQgOEL6jEScCiSwdQCQvU+CLlyi3EPWKCcbSAEbSC0mh7GaKksKSWBJL7vUNJwpQdBV2VECeXWV+q2YkDKTB+i7RzV06KWCgg9j0S8w+w0yRZJoUhtIINQ1khmkVTil+k2L5IR7eIDh+bPafZvmi3hKY8X8OcqLs7Uj66ktJaG17tiGecZjIAyz6M9G8LaGH6Mi32cxfB16Plf38HZTbZI4y6c1YofVnCXX6BWLqQfhJHXhdJa8/V0dnN3YVKsyV7oI7lOAk1awvt8kVy0NFcyTiqv7z9fMnFOAxqeY6jM61sU9KTFy3ibNA1qEadB5o8+7bIR85jsm2JSkCDASaySvm3rvsDsqOi7nV1NZyPWNMhwuUYM5zA0ggauHEO+I2tTtISiSHkprLGhXdDQ8scsn/kGzv/+TuEyh8eezwaDSrBI+brEjA5DF6HOIB/yYhuvL0B50iDt9upq+vHewXAdb1NHvN8k2RZuMQ0cIuJgttb/8HT1ML65dGSbAD8ykTVMTNL1Gmb5RSd9fSxWrKN6lpTbLszva2TBOT2D27s/4Wl8D0/348sz+DiB6fh2/GnclZfGzFDjJnEZ/8RVuNwt0jOYxtk2L1ddGW5sDu/SdbyPz7rfmdU5fj8ZUYbrnsMX9B0mSbaM17jCafT1XVfKzvrQufJlZJXO4AKiEBc9yFAIcWxZu7iertKXHtca/Ra6NfJ3GdfPDkU19U7SwUWuFqz5fzu/WrCeGAfFGlFPwkmW9RJwsXyZli/xdr6C2arId8tVf+G42J5eff7gQDrYHn+ZYO1yYGtC/5p+Cf6+m9w4MDV3vQIlJCVSUcDUL12iWK9EtVGoCAkQpkgdhsdbGdyrCAuAYz8VYgOg6kdr71evDYZGgjC/D2JcEi5qFO61gvZRPPJIIE7Zw/4wZBYkfOIzBwjnQEgLwhLNoz5IMuwKa3M+I9ThuYqfC+Wu9kd3kv34NcbE3wPZ+A1Kx99D2fhft2fi1yAdfx9k4tcgHX8PZOPXIB1/D6Ti96r8eT1+jTkVv0GdiP91eyZ+DToRvwadiF+DevF3ulYSRFhXGPHrLijSRUB1JcRR0vH8oVxwiDwU+WI338JdvEkcXRCWNRa+KqhaPIdJgZEckXzc7h14HiigC/9kWrqOQEiJL5wCeDCKv63bHUcgiNoG/UgdC6oiF693Cdb6m7snXezb6iULq3R1qB9v8h02NUdFKWYEljnsHlti1BV0la8O8DZ/ccwGcqQy14Evn1tHA4tU5TrQx4PpHcxVNw4+9bjATc81Z5wEbn+czoeq0XWiiec5DWAXwn9PROIpSkTHRNzkU3SMtrHsKPkO8HMSZ+Vx+h0S5TNz0e9VteV36X+r+5p+B/oU/S4DJ+h3i7x+7SDw8O2Hdu8MnbXaYOxe3QWZWm1RZq/uokytPmFP12oDMnt1D6RrtQGZvboLMrXagMxe3QWp+PET0q39weM0d8WvMSb+HsjGb1A6/h7Kxv+6PRO/Bun4+yATvwbp+HsgG78G6fgboHa/hyQpheihlO38aZdnDcMqrWFDR/ZKTRgW8rBT73N1UnUtKKkWlEuEu1aH1Mw40EdXB1Or44iIc3X8wJ9q9GzIVO+QPFaTvrGPuGeHHNYVoy4pPFiQoCFmn5ty3dsuIT0FtgcC1tzP3q/iYpmojRO3tjSDX3mxKHvnTMFZrYFZDbgRqtNKksDT7iVJSoizBfyTFDk8xGmZwH223nf1YBfDzVkp/g/SEl7wuKaM5xnm0c+kQLl55RJ8i8u0vDCHls4McJ9w6o7risAfcE+u3jwPLApwzJlHPFrNgx0rMtXHw7Rs7DOnEQn8CtGaNzuNje+PdlFrM/oDC9WDvis2y8cjPv4JVBERwLFmS9SGKSYD81QZw8/tueWRrwx3DpPJfB0X8TbNs84E8JAaOO4XsxVOAP6NcZPavOy2SQHLJEtQMFnYO2ZymScl5kmR/NilRdJV51vrwzJdZvF2V+BUFlBu480LAUZgvF7D93SJ79EOfixX+S91FYqppvKHk65GWTuoLh7OP2JSrZWATlT0N5uvd2X6E+18h+vpDIQ2og7QGEJlpauTH7zcfXtOsH/d5tC5On3eFWm5SOeKNMzG9b7nGas962ckV6WcV/1vyDvr5AMScuzGWOCGoPJF3bLzTiYfDtueV8E5/o00XkSE6/N2ulny3oG7DZuptDT/7zCqR50AQkkknj5wH+GyWyp221WO7GBWTKtZzov9m5eXKVBV4geHgsW9kASNBVR/N4/15245Qw4QYrtC1roRnOwv3l5+JVd+sMBXG0y17s244VTlhfWJBfL12mwm86CyZeK1mt4QaitRQi3GagJb3qBePBpVFKmLBNyGsM0JkFGbIqKXItQimhuYzrNiqS6CfyUFTvhkX90Fe7AcRJFSa25tDuNOu8wwZlYdIYU8ovstdcca7c3l4+B/oFT/eQ0KZW5kc3RyZWFtCmVuZG9iagozMyAwIG9iago8PAovUHJvY1NldCBbL1BERiAvVGV4dCAvSW1hZ2VCIC9JbWFnZUMgL0ltYWdlSV0KL0ZvbnQgODIgMCBSCi9YT2JqZWN0IDw8Ci9YZjEgODMgMCBSCi9YZjIgODQgMCBSCi9pbWc0IDg1IDAgUgovaW1nMyA4NiAwIFIKL2ltZzIgODcgMCBSCj4+Cj4+CmVuZG9iagozNCAwIG9iago8PAovTGVuZ3RoIDI0MTQKL0ZpbHRlciAvRmxhdGVEZWNvZGUKPj4Kc3RyZWFtDQp4nJ1ZbXPaSBL+zq/oL3flVBFZ8yZp8umwcWJiG1ggye5Vqq4UIYx2hUSESOL99dujkSwNQmCf7SprUD89Pf3ew/fe1aJ3+Z4AsWGx6hEJHqEW57BY9i6u97s83YQZDJbLLNzt3iz+7N0ser/1vmsUBUJLlCuFxTRqlq6jHOZR8rg+BDAgpAK4nsVpARjvs+0+U7QXcArhEEvyBgKSyP/7RUguLC4KZBytQoiS3T7zkyCEbRpHwRME6WbrJ0/nGVHPkm7BKClE6MNttPGDtR/DNPOX4W7dB+I61LYPufBaw65NLKEPMlrBPlmGcfQjzMJlH7Iw32cJ5Om7s7I4nrD0meaDxR+DB7ibDd4vYPp5AfeL4SmgIy1ba34apzkkqQXc7QPMrTsLRskSrZ5Fftzvw93tYDEZzgb989IIagmmxZk8DO4G448jGI/gy2A4Og9mjmXrs0ymUwuuZos5zCaD4XkkkZbQBlEmzfvwYf+nXzwwKWybNrA2qN/Zhx6Fnz3CwSWeRWDTo8K1aLWMe/MGcfaIb6V669lMKY1RarkOUG5JD43VW9VSCUCeKBVFN1UAgv8KLWNs4S+yurieDN/B9ToM/oJ8jc7nP/nf4hD8TbpPckiT4lN/uz08sAPE06y1pK5TGfCzH2/S1hlxLyaE5SlSYdkcOFUA4raldssQZsIr6D3bYsKUehoFf+1bMnnPMolCJu6pjZRMg9Ht25l93HSHKEosW5vvHKkjOZpHUX4hl/NP8xfxd1BhpEwy5PL+pShuW0S7I7v8+OmqQe4U+nWAo7ujLh2XK8UGG2SyITBMDXdwtGKl5Qp0VGpRqXiiOFnPxmDBH3TEi8/3to3O4nAmHMlYY7PCgdR+xQP1CuEEHsll5Za02tLwbYq2VB5IvcK7i4VAf0BY5d6FiLKMI2qDUEfW6p1m6XIf5DAMcz+KWzlf1MEn0HoOa5yJOahwdab53acuHLXZKWD0d9iJlC4mvG7sb/lTF5RxrozQjb1O4zTrQnOGKeAUepItsUiOU+uUsmxhER0gcv6WcikhmJxUUg14n4UhvEA1NYKc00RNOguX5w7e4CscyrgjscZJ5nJHOP8jnSmWgcdsdEGiDmNb6I5mdi3phEcr99zoxQlijGYP40gTqqcuKiF4xZFVi2da7CMIhnzjv2O7nsp2eE7uShWqGGhA8Y08yJhYxnUlV9lCCOAYl67OMYvB7zAaf56Mrm8OVYoKLVIMxz4J2x7uORbT5XKSRY9Rgg3E+zSDWRhE2yhM8hN1C13HKkKbKKWJan1cEQbJprLoKYhJovRHDun1iag+EeqPO1wVD3Waq9H9PSwmcAnz29EUn45nXOUbFRhTqeccdo7wFsomrw9mt9cHs4c7vwHmNk8XGbPdQ9av7eJQ/V4ZoEroBuuOFqkCKDmwefS8su/ysflMVzDfb7fx07vW/i02otyXupYjUeFOpfB5Gi/h2xO8A7MNnI0+DxY3cD96GC1uOhoprFAGV4yS0hLHWso+mnQyfUvg3/qBwtVgfvNwM17A4nZwN5kNvwxmcD15mN7f/A4Pk8XgZbtic1Lq8GEwHo5maJb5sV6OdbBzTXZUVFr+MF+MxuhIlA+uPl7PhSu9MflvqzVG0xgMsHHzpDbTPkOj7ELoTPBqXmpgGcaJ7EiUreHJ1lCG7adDmtuOkh9phP5xZD9KDFC935Y+/cqo45gtr8aUgcoZtmisuZE+1tDPW4WFMgNT74MZEasBtaloQUpPFzZ2p/LYeY5uJAzUmY3MNgd7cWUv17WKilCumVSVuSMdcnxN1GtFzjQ56SSnquLLGqJS4QG9mj+we8SduSJwRb2McYntp1OtBU686iVTNaVaCPUm6Okl84oAjJ+XjiWwkmkuzHPVS71FuQj0/uUq7mGHj2mhXBKn5lE+8xLk1HvH1aoQSzMoBW6eLegsmqgrTIKorfO1FQ/honFcrK2smEYOaystUwOGFcMhR+qyOgx3QRZt8yhNWu5TBj9haKkm5nY+btGWcY4hqU7UID7SOVJZSSIL5dfEH7J0t4NBMbO1JtMypjEQVU/QPEO0C44iqoBmXFXYBmLh/yqmQxzx9q2wYVVMc0dlOxMWtpp2VoazwEFbGqdZpLkft8h5bQYcH6RuVCTM16o4AYNpgBrI8mgVBZHqXPz9r45RvcEJRS2vb6Y+1t8dfMh81KRqe27TTUcdbzJAFUlRekSQYmFAh+jDdeavVK2IVjk2Dl03FQ02mCakrnJfwuUSMdBgdx5ObDX5FeXKz7LIfwybeHgf7vLoh9bpSUZUeioADo8zWaFSwz5chcssTTfnBaJl8bzy4yBNnvpwH/1Qh5opdKGWF/BQ1wSk9B/ldE2J5uv0J/akXZ1Wk43D6pslP8l3feUl4CdLbSUYjv44z0SQ6ibhqxpOsDkLo8d1jhUFp96vb7Cgq3noPB/sY8tLpWp0OkIvmvmjYRLHtSlptX/MMVJIg741cDHXSCAN0tkO6xWesc3dM7KHCbGPAaSRPA72wHhzWmJx20wcNq+8eYTtEvyHYL3/13FdHUCppI3dcKxksoUgRtp5iQ44rQ1I8FTatyf5GhuV67WfPbaTG2eGDWvUcRtybtqwph8PWrTCNGJN22ER7pgmNAEtate033n2nmkCbJKo80LrHUBt79xe0jTeKeHO9gZKeYyqKyYcW3EOel6eG8lrDk0UMnFZYb3XcjFgyEY6Fvk/hDFg2Eti4lPmfiUbE7ZBPyCFH7ySjQnDIZ+zwsSvZGPCsJllrDD8K9mYMNUTy0Me+pLJfo504kmLe939iCCG7zbIuzKPoIbzmohW5nmR+9pE3djU2tXrV2u3YlOp6ZVsTFip3VfyKEcSwevTlOvXnuaZTSnWa9mYMH2aAx7anFWKV1ONa7lVpwvRDpI0f/4mJU1woPgRZjiyB0WxgG/+LtpZsFgjJf75xd3PPsdq8hgmIbY44RKicj5VfcoyDTXLLPy+j7IQdtFj4uf7LLRAVyHNGFll4fNzvvZz9cHx1NuUXt3H6UbL327jKCjEzlN4SvcZpMU8rsSIkiDeL+sNVtgkx+ljhL0ltt6rMISvFz9RmuLropLN1zfq27sCt4NlOW9oaME9iPInxfwSP1AfpkkcJcW3UJtQEX69wJ68ye7ExW55RVvc7RLuWcQ9cbdb0arFKWJCcZj3rPJ6l1WLLlriSnUtrWnLRSctl2rbklYvNO0/Cp0V3A0KZW5kc3RyZWFtCmVuZG9iagozNSAwIG9iago8PAovRm9udCA4OCAwIFIKL1hPYmplY3QgPDwKL0ZtMSA4OSAwIFIKL0ZtMiA5MCAwIFIKPj4KPj4KZW5kb2JqCjM2IDAgb2JqCjw8Ci9MZW5ndGggMTg4NQovRmlsdGVyIC9GbGF0ZURlY29kZQo+PgpzdHJlYW0NCnicnVhbb9s2FH73r+DT4AINw7skvyVNmqRrc7OxFUOBQbUVW5ktpbLdzP9+hyIpSxTtBjNyoaXv3C/kIUEUnVBEUCwY/J2uBj8G55MBhQecoclsQNAJo5hEbk1izGP7RSoccbvmCWZurWIsHCZhe2LaYsQZjpVZE/3vcjJ4ANn6l6FP8PQK1loTpAEUccFxTFFMJZqsBqcfKQIdJ0+D4ST9F90UP8t8mr2bPGs+XS4ES/SqDYpAdYZoxOABJUyrXmWDsQPE+nkUc60W4wSxSCvbQgjaQhg2PYzlUkvSTCKJlQowaanSg4CqCtSTstG1h6ilWJAW04cYOQf5dFxLBYoJwQn3PDvOillWaae2kFEsGyRzSCrhzXhTVtkJ9fFRgPPnvPgnL+bosUxn6PdFWr3Xf3xK6SQNr7bVPC0LdIIoI4T2ZAgnY3idVru0SNG3IVHf3qH3N8UsT304axjfL9BtOQKuXEgVxQnxobThfDWe3NyObIq1vRcrcG7QgTYt0Ydylo06nGuaoCuv7j5fMHFKIxqfgqmM9iUK+kuJF+kmaws0JEGBTJ182hZQ2Ez2RTEG6aQgiHXSd2XdVZAd1n1xJBKuiKQkSaKYsr87IWJQuwmDgMaWi6XVWo4Q6SrQECWJVlk4yUNX3ahBQA+JbC1NV+j06xNFFyXq5HYbA0wo51iZhnPSWof8G7T5vqw26XKEtC4tH365vBxf3wUc3ljc5pHuVlmxQV8gKwIkYi+24f/h7iKQeAKpxNrVYn+eL5doUo68TFbQt5jH9it8fJjqc9Sw9yGstCxrxAmkLINueJ2v0ukiXaL7Kp1l64UuRfbtnU/LrZxhsEQVc6wnaISS5nOo/EKOGC/yl54jDPotvjDIN7vDwP+3Rwz5MacYxJv9YrIp5JeLfP2SbqYLNFlU5Xa+6OdgyD/jy88fA8iAf87+PIeuEMA2zjm7ur2asN+/BjCNB3rVLiTVe5nd0ky9s169d1HACBwgbMHvl4cPCTKKsYoRh5NKDM1Dl2JnV9WPLYYmAjPVBzEuMRcNCnYxQfsonhAciV/Jg6NXzBxIKKxYAKSPW9KBpMA86YMkg/NWI04xTAOaa/uF1BKNPuaM1rffYKz9PZCz36KM/T2Us/+4PGu/ARn7+yBrvwEZ+3sgZ78BGftbIO88hKMESTCPNIfNxBSB3u9woAnByVarECC5r8rZdrpBt+kqC+yvUNUsPkqoDw8BkYLQQ5QPm10AzyOseBD/aA8LHkFMsRJBAjhyp9+X3c0rEhj6toyJrbvhH+lym0Gru7l9NL2uy16yWOdFiP3ZqtzC/niQlEKUFcc07pKFTkq8ztcAeHI5ngTCAU7SqXuEwIeKRBdUffQc36KpO+n5weI4CivCQlrXx6UQOpGYwCcULY45DfsFKi1MJBXRg9pBouPzlISOnSjXuuJwqzAY1yp9kGsVFmVbpY9yreK4PNsqDMi2yh7ItgoDsq3SB7lWYUC2VfogbT8BIVYdGBN4yPwaYq3vYZz1BmSM74Gc8UeFWdtrjDG9j7Gm1xhjeQ/jLK8xxvAWprvPwkip2XGhJXdSp9sWDIzGFjYMpK40rgL9lFdzpT5sh8pJ1uUUIAmVE0w9ujQC6GOlwerSOEQULI0f8Fevnq0/9TNwIHNuX9lvAk45lKJl7dQQkYxhC9pT2a8dMn+CF5Bk+0mDtRvpB5it55nu2NBT8wK9ltVs3TuRi0jh/dxhGEADRndFhq63xazKZigtZug2L7LNDj1uX7JsXT/5K6tKnxkMPmZqu0/zdQZMljsfAkO7gegbnHyNXtJdrSPM+VX2M6uAbFprjr6n63w9sodKL05c6eCGrL/E6Dd0hy/fHCqWRLDmUEAsqWPl1trj+uU+dCv3XSOIqBGd2LpQt94/uLJvxMALmJzhi7kks1UGboFPpJsMeIkmOtVXAyWwjNzXWhwAvBSAAx2I9k772XSZVukmLws/ACS28CHFkwVEAH5S2MJWL9sNTOfzrMiAEMJubxXwRZmtIZ+q7Mc2rzKPHU+c9OE6nxfpZltBLCu03qSrF4wYRmcwmD7lc3gOcuDlelG+6lsgSEmdaBz7HKNGQT3LnV5Dsi01gUlo0LeYLrfr/CfIeUJX4wkSRoiecMCEWorPU+213H5/zuCAtSmRd2v0vK3y9SyfaqdBOi53Pc1Eo1k/Jblu9xyiETfRaArqIzjk0GWZgD1DJxAkTiuKrOmpZhoipIZz+ElqPNcXiLweiPLVnPcmoi5M34EQ4m5A3MozABqmhM1GRpai3VK2m0UJ3oGsGNdRLqvdmwvM9jGb+k1f47CJJFGrhhqA/bp/7/c98AKcwwDbHVbrO5Dz3ejtXRpmU60JjI1c2do365ZWRo1GK3h/tInbeO55dmQca/4toi4TTdR12t6JbXWAMWx7tZNYBEM1JjA3waYJBDZPRC9PaANp73Ym26q5vvp6zfQecL6rb78Img+SRDO2w/V+7V8hgtl6wmP6X5j3W7qPE9qL58PgP9DiX50NCmVuZHN0cmVhbQplbmRvYmoKMzcgMCBvYmoKPDwKL1Byb2NTZXQgWy9QREYgL1RleHQgL0ltYWdlQiAvSW1hZ2VDIC9JbWFnZUldCi9Gb250IDkxIDAgUgovWE9iamVjdCA8PAovWGYxIDkyIDAgUgovWGYyIDkzIDAgUgovaW1nNCA5NCAwIFIKL2ltZzMgOTUgMCBSCi9pbWcyIDk2IDAgUgo+Pgo+PgplbmRvYmoKMzggMCBvYmoKPDwKL0xlbmd0aCAyNDE0Ci9GaWx0ZXIgL0ZsYXRlRGVjb2RlCj4+CnN0cmVhbQ0KeJydWW1z2kgS/s6v6C935VQRWfMmafLpsHFiYhtYIMnuVaquFCGMdoVEhEji/fXbo5EsDUJgn+0qa1A/PT393sP33tWid/meALFhseoRCR6hFuewWPYurve7PN2EGQyWyyzc7d4s/uzdLHq/9b5rFAVCS5QrhcU0apauoxzmUfK4PgQwIKQCuJ7FaQEY77PtPlO0F3AK4RBL8gYCksj/+0VILiwuCmQcrUKIkt0+85MghG0aR8ETBOlm6ydP5xlRz5JuwSgpROjDbbTxg7UfwzTzl+Fu3QfiOtS2D7nwWsOuTSyhDzJawT5ZhnH0I8zCZR+yMN9nCeTpu7OyOJ6w9Jnmg8Ufgwe4mw3eL2D6eQH3i+EpoCMtW2t+Gqc5JKkF3O0DzK07C0bJEq2eRX7c78Pd7WAxGc4G/fPSCGoJpsWZPAzuBuOPIxiP4MtgODoPZo5l67NMplMLrmaLOcwmg+F5JJGW0AZRJs378GH/p188MClsmzawNqjf2YcehZ89wsElnkVg06PCtWi1jHvzBnH2iG+leuvZTCmNUWq5DlBuSQ+N1VvVUglAnigVRTdVAIL/Ci1jbOEvsrq4ngzfwfU6DP6CfI3O5z/53+IQ/E26T3JIk+JTf7s9PLADxNOstaSuUxnwsx9v0tYZcS8mhOUpUmHZHDhVAOK2pXbLEGbCK+g922LClHoaBX/tWzJ5zzKJQibuqY2UTIPR7duZfdx0hyhKLFub7xypIzmaR1F+IZfzT/MX8XdQYaRMMuTy/qUobltEuyO7/PjpqkHuFPp1gKO7oy4dlyvFBhtksiEwTA13cLRipeUKdFRqUal4ojhZz8ZgwR90xIvP97aNzuJwJhzJWGOzwoHUfsUD9QrhBB7JZeWWtNrS8G2KtlQeSL3Cu4uFQH9AWOXehYiyjCNqg1BH1uqdZulyH+QwDHM/ils5X9TBJ9B6DmuciTmocHWm+d2nLhy12Slg9HfYiZQuJrxu7G/5UxeUca6M0I29TuM060JzhingFHqSLbFIjlPrlLJsYREdIHL+lnIpIZicVFINeJ+FIbxANTWCnNNETToLl+cO3uArHMq4I7HGSeZyRzj/I50ploHHbHRBog5jW+iOZnYt6YRHK/fc6MUJYoxmD+NIE6qnLioheMWRVYtnWuwjCIZ8479ju57KdnhO7koVqhhoQPGNPMiYWMZ1JVfZQgjgGJeuzjGLwe8wGn+ejK5vDlWKCi1SDMc+Cdse7jkW0+VykkWPUYINxPs0g1kYRNsoTPITdQtdxypCmyiliWp9XBEGyaay6CmISaL0Rw7p9YmoPhHqjztcFQ91mqvR/T0sJnAJ89vRFJ+OZ1zlGxUYU6nnHHaO8BbKJq8PZrfXB7OHO78B5jZPFxmz3UPWr+3iUP1eGaBK6AbrjhapAig5sHn0vLLv8rH5TFcw32+38dO71v4tNqLcl7qWI1HhTqXweRov4dsTvAOzDZyNPg8WN3A/ehgtbjoaKaxQBleMktISx1rKPpp0Mn1L4N/6gcLVYH7zcDNewOJ2cDeZDb8MZnA9eZje3/wOD5PF4GW7YnNS6vBhMB6OZmiW+bFejnWwc012VFRa/jBfjMboSJQPrj5ez4UrvTH5b6s1RtMYDLBx86Q20z5Do+xC6Ezwal5qYBnGiexIlK3hydZQhu2nQ5rbjpIfaYT+cWQ/SgxQvd+WPv3KqOOYLa/GlIHKGbZorLmRPtbQz1uFhTIDU++DGRGrAbWpaEFKTxc2dqfy2HmObiQM1JmNzDYHe3FlL9e1iopQrplUlbkjHXJ8TdRrRc40Oekkp6riyxqiUuEBvZo/sHvEnbkicEW9jHGJ7adTrQVOvOolUzWlWgj1JujpJfOKAIyfl44lsJJpLsxz1Uu9RbkI9P7lKu5hh49poVwSp+ZRPvMS5NR7x9WqEEszKAVuni3oLJqoK0yCqK3ztRUP4aJxXKytrJhGDmsrLVMDhhXDIUfqsjoMd0EWbfMoTVruUwY/YWipJuZ2Pm7RlnGOIalO1CA+0jlSWUkiC+XXxB+ydLeDQTGztSbTMqYxEFVP0DxDtAuOIqqAZlxV2AZi4f8qpkMc8fatsGFVTHNHZTsTFraadlaGs8BBWxqnWaS5H7fIeW0GHB+kblQkzNeqOAGDaYAayPJoFQWR6lz8/a+OUb3BCUUtr2+mPtbfHXzIfNSkantu001HHW8yQBVJUXpEkGJhQIfow3Xmr1StiFY5Ng5dNxUNNpgmpK5yX8LlEjHQYHceTmw1+RXlys+yyH8Mm3h4H+7y6IfW6UlGVHoqAA6PM1mhUsM+XIXLLE035wWiZfG88uMgTZ76cB/9UIeaKXShlhfwUNcEpPQf5XRNiebr9Cf2pF2dVpONw+qbJT/Jd33lJeAnS20lGI7+OM9EkOom4asaTrA5C6PHdY4VBafer2+woKt56Dwf7GPLS6VqdDpCL5r5o2ESx7UpabV/zDFSSIO+NXAx10ggDdLZDusVnrHN3TOyhwmxjwGkkTwO9sB4c1picdtMHDavvHmE7RL8h2C9/9dxXR1AqaSN3XCsZLKFIEbaeYkOOK0NSPBU2rcn+Robleu1nz22kxtnhg1r1HEbcm7asKYfD1q0wjRiTdthEe6YJjQBLWrXtN959p5pAmySqPNC6x1Abe/cXtI03inhzvYGSnmMqismHFtxDnpenhvJaw5NFDJxWWG913IxYMhGOhb5P4QxYNhLYuJT5n4lGxO2QT8ghR+8ko0JwyGfs8LEr2RjwrCZZaww/CvZmDDVE8tDHvqSyX6OdOJJi3vd/Ygghu82yLsyj6CG85qIVuZ5kfvaRN3Y1NrV61drt2JTqemVbExYqd1X8ihHEsHr05Tr157mmU0p1mvZmDB9mgMe2pxVildTjWu5VacL0Q6SNH/+JiVNcKD4EWY4sgdFsYBv/i7aWbBYIyX++cXdzz7HavIYJiG2OOESonI+VX3KMg01yyz8vo+yEHbRY+Ln+yy0QFchzRhZZeHzc772c/XB8dTblF7dx+lGy99u4ygoxM5TeEr3GaTFPK7EiJIg3i/rDVbYJMfpY4S9JbbeqzCErxc/UZri66KSzdc36tu7AreDZTlvaGjBPYjyJ8X8Ej9QH6ZJHCXFt1CbUBF+vcCevMnuxMVueUVb3O0S7lnEPXG3W9GqxSliQnGY96zyepdViy5a4kp1La1py0UnLZdq25JWLzTtPwqdFdwNCmVuZHN0cmVhbQplbmRvYmoKMzkgMCBvYmoKPDwKL0ZvbnQgOTcgMCBSCi9YT2JqZWN0IDw8Ci9GbTEgOTggMCBSCi9GbTIgOTkgMCBSCj4+Cj4+CmVuZG9iago0MCAwIG9iago8PAovTGVuZ3RoIDE4ODgKL0ZpbHRlciAvRmxhdGVEZWNvZGUKPj4Kc3RyZWFtDQp4nJ1YbW/bNhD+7l/BT4MLNAzfJflb06RJuzZvFrZiKDCotmIrs6VUtpv53+8okrJEMW4wI7Ep6blX3h3vRBBFJxQRFAsG37P16MfoLB1RuMEZSucjgk4YxSRyaxJjHtsLqXDE7ZonmLm1irFwmIQdiGmHEWc4VmZN9M9FOroD2fqfoU9w9xLWWhOkARRxwXFMUUwlStej0w8UgY7pw2icZv+ij+XPqpjlb9JHzafPhWCJnrVBEajOEI0Y3KCEadXrfDR1gFjfj2Ku1WKcIBZpZTsIQTsIw2aAsVwaSZpJJLFSASYdVQYQUFWBelK2ug4QjRQL0mKGECPnRT4911KBYkJwwj3PTvNyntfaqR1kFMsWyRySSngy3VZ1fkJ9fBTg/Lko/ynKBbqvsjn6fZnVb/WXTymdpPHlrl5kVYlOEGWE0IEM4WSMr7J6n5UZ+jYm6tsb9PZjOS8yH85axrdLdF1NgCsXUkVxQnwobTlfTtOP1xMbYl3vxQqcG3SgDUv0vprnkx7nhiboysubz+dMnNKIxqdgKmNDiYL+UuJ5ts27Ag1JUCBTJ592JSQ2k0NRDMKIMdjEJuj7sm5qiA7rvjgSCVdEUpIkUZRwcOjfvV1ikL4JMJKxZWTJtaITxGRPh5YoSbTWwgkfuwRHLYIBW5tOszU6/fpA0XmFeuHdxQATiFXMTM056axDLg6afVvV22w1QVqXjhu/XFxMr24CPm8t7vLI9uu83KIvEBgBEnEQ2/J/f3MeiD2BVGLt6rA/K1YrlFYTL5gVlC7msf0KHx+mhhw17G0IKy3LBnECUcugIF4V62y2zFbots7m+Waps5F9e+PTcitnHMxSxRzrFE1Q0n5eysCQI6bL4mngCIN+jS8M8tXuMPD/7RFDfswpBvFqv5hoCvnlvNg8ZdvZEqXLutotlsMYDPlnevH5QwAZ8M+7P8+gMASwrXPOJPl0/yUlAUzrgUG2C0hX2Z5qJt/ZIN/7KGAEDhA24Q/Ll/sEGcVYxYhDsxLD6apTsXew6tsWQxOBmRqCGJeYixYFB5mgQxRPCI7Er+RB9xUzBxIKKxYA6Y5LOpAUmCdDkGTQcrXiFMM0oLm2X0gt0ehj2rSh/QZj7R+AnP0WZewfoJz9x+VZ+w3I2D8EWfsNyNg/ADn7DcjY3wF5LRGOEiTBPNL2m4lJAn3k4UARguZWqxAgua2r+W62RdfZOg8csZDVLD5KqPuHgEhB6EuUd9t9AM8jrHgQf2/7BY8gpliJIAF03dn3Vf/wigSGui1jYvNu/Ee22uVQ6j5e35ta12cvWazjIsT+3brawfn4IimFXVYc07hPRkNGN/EaAKcX0zSwHeAkHbpHCHyoSHRCNd3n9BrNXLPnbxbHUViRUIvHm3YphE4kJvAJ7RbHnIb9ApkWJpKK6FntRaLjI5WEip0oV7ricKkwGFcqfZArFRZlS6WPcqXiuDxbKgzIlsoByJYKA7Kl0ge5UmFAtlT6IG0/ASFWHZgUeMj8BmKtH2Cc9QZkjB+AnPFHhVnbG4wxfYixpjcYY/kA4yxvMMbwDqZ/zsJUqdlxoSX3QqdfFgyMxhY2DoSuNK4C/ZSXc5VutkPpJJt0CpCE0gkGH50aAfSx1GBNarxEFEyNH/CtV4/Wn/oeOJA5t6/tlYAuh1K0apwaIpIxHEEHKnvZI/OHeAFBdpg0WLeQvofxepHrig01tSjRc1XPN4OOXEQKH+YOwwAKMLopc3S1K+d1PkdZOUfXRZlv9+h+95Tnm+bOX3ld+cxg8DFT221WbHJgstr7EJjbDUS/xCk26CnbNzrCqF/nP/MayGaN5uh7tik2E9tUevvEld7ckPUXGP2GbvDFq7eKJRGsOSQQS5q9cmvtcf3wsHVrd60RRDSI3t66re48v3Np34qBBzA8w4V5T2azDNwCn0gXGfASTXSor0dKYBm5y0YcALwQgIYORHvdfj5bZXW2LarS3wASW/iY4nQJOwB/GRxh66fdFqbzRV7mQAjbbl8s4PMq30A81fmPXVHnHjueOOnjTbEos+2uhr2s0WabrZ8wYhi9g8H0oVjAfZADDzfL6lm/CIKQ1IHGsc8xahXUs9zpFQTbShOYgAZ9y9lqtyl+gpwHdDlNkTBC9IQDJjRSfJ7qoOXu+2MODda2Qt6Lo8ddXWzmxUw7DcJxtR9oJlrNhiHJdbnnsBtxuxttQn0Ah7z0vkzAmaEDCAKns4usralmGiKkgXP4Sxo81+8QeTMQFesFH0xEfZh+B0KIewPiVp4BUDAlHDYyshTdkrLbLivwDkTFtNnlqt6/OsFsHbOh39Y1DodIEnVyqAXYy8Nzv+6BF6APA2x/WG3egZztJ6+v0jCbak1gbOTK5r5Zd7QyarRawfOjRdzu54FnT8ax4t8h6jPRRH2nHZzYVQcYw7HXOIlFMFRjAnMTHJpAYONEDOKEtpDuaWeirV7oV1/PuT4DzvbN2y+CFqMk0YztcH1Yez01VKVIT3hM/4R5v6b6OKGD/bwb/QdlXGABDQplbmRzdHJlYW0KZW5kb2JqCjQxIDAgb2JqCjw8Ci9Qcm9jU2V0IFsvUERGIC9UZXh0IC9JbWFnZUIgL0ltYWdlQyAvSW1hZ2VJXQovRm9udCAxMDAgMCBSCi9YT2JqZWN0IDw8Ci9YZjEgMTAxIDAgUgovWGYyIDEwMiAwIFIKL2ltZzQgMTAzIDAgUgovaW1nMyAxMDQgMCBSCi9pbWcyIDEwNSAwIFIKPj4KPj4KZW5kb2JqCjQyIDAgb2JqCjw8Ci9MZW5ndGggMjQxNAovRmlsdGVyIC9GbGF0ZURlY29kZQo+PgpzdHJlYW0NCnicnVltc9pIEv7Or+gvd+VUEVnzJmny6bBxYmIbWCDJ7lWqrhQhjHaFRIRI4v3126ORLA1CYJ/tKmtQPz09/d7D997Vonf5ngCxYbHqEQkeoRbnsFj2Lq73uzzdhBkMlsss3O3eLP7s3Sx6v/W+axQFQkuUK4XFNGqWrqMc5lHyuD4EMCCkAriexWkBGO+z7T5TtBdwCuEQS/IGApLI//tFSC4sLgpkHK1CiJLdPvOTIIRtGkfBEwTpZusnT+cZUc+SbsEoKUTow2208YO1H8M085fhbt0H4jrUtg+58FrDrk0soQ8yWsE+WYZx9CPMwmUfsjDfZwnk6buzsjiesPSZ5oPFH4MHuJsN3i9g+nkB94vhKaAjLVtrfhqnOSSpBdztA8ytOwtGyRKtnkV+3O/D3e1gMRnOBv3z0ghqCabFmTwM7gbjjyMYj+DLYDg6D2aOZeuzTKZTC65miznMJoPheSSRltAGUSbN+/Bh/6dfPDApbJs2sDao39mHHoWfPcLBJZ5FYNOjwrVotYx78wZx9ohvpXrr2UwpjVFquQ5QbkkPjdVb1VIJQJ4oFUU3VQCC/wotY2zhL7K6uJ4M38H1Ogz+gnyNzuc/+d/iEPxNuk9ySJPiU3+7PTywA8TTrLWkrlMZ8LMfb9LWGXEvJoTlKVJh2Rw4VQDitqV2yxBmwivoPdtiwpR6GgV/7Vsyec8yiUIm7qmNlEyD0e3bmX3cdIcoSixbm+8cqSM5mkdRfiGX80/zF/F3UGGkTDLk8v6lKG5bRLsju/z46apB7hT6dYCju6MuHZcrxQYbZLIhMEwNd3C0YqXlCnRUalGpeKI4Wc/GYMEfdMSLz/e2jc7icCYcyVhjs8KB1H7FA/UK4QQeyWXllrTa0vBtirZUHki9wruLhUB/QFjl3oWIsowjaoNQR9bqnWbpch/kMAxzP4pbOV/UwSfQeg5rnIk5qHB1pvndpy4ctdkpYPR32ImULia8buxv+VMXlHGujNCNvU7jNOtCc4Yp4BR6ki2xSI5T65SybGERHSBy/pZyKSGYnFRSDXifhSG8QDU1gpzTRE06C5fnDt7gKxzKuCOxxknmckc4/yOdKZaBx2x0QaIOY1vojmZ2LemERyv33OjFCWKMZg/jSBOqpy4qIXjFkVWLZ1rsIwiGfOO/Y7ueynZ4Tu5KFaoYaEDxjTzImFjGdSVX2UII4BiXrs4xi8HvMBp/noyubw5VigotUgzHPgnbHu45FtPlcpJFj1GCDcT7NINZGETbKEzyE3ULXccqQpsopYlqfVwRBsmmsugpiEmi9EcO6fWJqD4R6o87XBUPdZqr0f09LCZwCfPb0RSfjmdc5RsVGFOp5xx2jvAWyiavD2a31wezhzu/AeY2TxcZs91D1q/t4lD9XhmgSugG644WqQIoObB59Lyy7/Kx+UxXMN9vt/HTu9b+LTai3Je6liNR4U6l8HkaL+HbE7wDsw2cjT4PFjdwP3oYLW46GimsUAZXjJLSEsdayj6adDJ9S+Df+oHC1WB+83AzXsDidnA3mQ2/DGZwPXmY3t/8Dg+TxeBlu2JzUurwYTAejmZolvmxXo51sHNNdlRUWv4wX4zG6EiUD64+Xs+FK70x+W+rNUbTGAywcfOkNtM+Q6PsQuhM8GpeamAZxonsSJSt4cnWUIbtp0Oa246SH2mE/nFkP0oMUL3flj79yqjjmC2vxpSByhm2aKy5kT7W0M9bhYUyA1PvgxkRqwG1qWhBSk8XNnan8th5jm4kDNSZjcw2B3txZS/XtYqKUK6ZVJW5Ix1yfE3Ua0XONDnpJKeq4ssaolLhAb2aP7B7xJ25InBFvYxxie2nU60FTrzqJVM1pVoI9Sbo6SXzigCMn5eOJbCSaS7Mc9VLvUW5CPT+5SruYYePaaFcEqfmUT7zEuTUe8fVqhBLMygFbp4t6CyaqCtMgqit87UVD+GicVysrayYRg5rKy1TA4YVwyFH6rI6DHdBFm3zKE1a7lMGP2FoqSbmdj5u0ZZxjiGpTtQgPtI5UllJIgvl18QfsnS3g0Exs7Um0zKmMRBVT9A8Q7QLjiKqgGZcVdgGYuH/KqZDHPH2rbBhVUxzR2U7Exa2mnZWhrPAQVsap1mkuR+3yHltBhwfpG5UJMzXqjgBg2mAGsjyaBUFkepc/P2vjlG9wQlFLa9vpj7W3x18yHzUpGp7btNNRx1vMkAVSVF6RJBiYUCH6MN15q9UrYhWOTYOXTcVDTaYJqSucl/C5RIx0GB3Hk5sNfkV5crPssh/DJt4eB/u8uiH1ulJRlR6KgAOjzNZoVLDPlyFyyxNN+cFomXxvPLjIE2e+nAf/VCHmil0oZYX8FDXBKT0H+V0TYnm6/Qn9qRdnVaTjcPqmyU/yXd95SXgJ0ttJRiO/jjPRJDqJuGrGk6wOQujx3WOFQWn3q9vsKCreeg8H+xjy0ulanQ6Qi+a+aNhEse1KWm1f8wxUkiDvjVwMddIIA3S2Q7rFZ6xzd0zsocJsY8BpJE8DvbAeHNaYnHbTBw2r7x5hO0S/Idgvf/XcV0dQKmkjd1wrGSyhSBG2nmJDjitDUjwVNq3J/kaG5XrtZ89tpMbZ4YNa9RxG3Ju2rCmHw9atMI0Yk3bYRHumCY0AS1q17TfefaeaQJskqjzQusdQG3v3F7SNN4p4c72Bkp5jKorJhxbcQ56Xp4byWsOTRQycVlhvddyMWDIRjoW+T+EMWDYS2LiU+Z+JRsTtkE/IIUfvJKNCcMhn7PCxK9kY8KwmWWsMPwr2Zgw1RPLQx76ksl+jnTiSYt73f2IIIbvNsi7Mo+ghvOaiFbmeZH72kTd2NTa1etXa7diU6nplWxMWKndV/IoRxLB69OU69ee5plNKdZr2ZgwfZoDHtqcVYpXU41ruVWnC9EOkjR//iYlTXCg+BFmOLIHRbGAb/4u2lmwWCMl/vnF3c8+x2ryGCYhtjjhEqJyPlV9yjINNcss/L6PshB20WPi5/sstEBXIc0YWWXh83O+9nP1wfHU25Re3cfpRsvfbuMoKMTOU3hK9xmkxTyuxIiSIN4v6w1W2CTH6WOEvSW23qswhK8XP1Ga4uuiks3XN+rbuwK3g2U5b2howT2I8ifF/BI/UB+mSRwlxbdQm1ARfr3AnrzJ7sTFbnlFW9ztEu5ZxD1xt1vRqsUpYkJxmPes8nqXVYsuWuJKdS2tactFJy2XatuSVi807T8KnRXcDQplbmRzdHJlYW0KZW5kb2JqCjQzIDAgb2JqCjw8Ci9Gb250IDEwNiAwIFIKL1hPYmplY3QgPDwKL0ZtMSAxMDcgMCBSCi9GbTIgMTA4IDAgUgo+Pgo+PgplbmRvYmoKNDQgMCBvYmoKPDwKL0xlbmd0aCAxOTEwCi9GaWx0ZXIgL0ZsYXRlRGVjb2RlCj4+CnN0cmVhbQ0KeJydWFlz2zYQftev2KeOMhPDOHnoLY4d223iS2qb6Ximw0i0RFciHUqKq3/fBQFQPCDFU42jgNS3Bz7sLhagwOCEAYVIcvyergbfB2eTAcMXgsNkNqBwwhmhoRvTiIjIPoSUcGHHIt6PFSXSYWK+F2YNRYKTKDBjqv+7mAzu0bb+x+FXfHuJY+0JaAADIQWJGERMwWQ1OP3EAH2cPA2Gk+RfuM5/FNk0fTd51nraWihR8KonFKLrHFjI8QWjnIQCynQwdoBIvw8jod3iggIPtbMNhGQNhFHTw1gtlSWtJFQkCDxKGq70IOhqgO4pVfvaQ1RWLEib6UOMnYN6WtQyCRGlJBYdZsdpPktLTWoDGUaqRnKHZAp/GW+KMj1hXXzo0fw5y//J8jk8FMkMflsk5Xv91ZVUztLwclvOkyKHE2CcUtazIZ2N4VVS7pI8gcchDR7fwfvrfJYlXTivFd8t4KYYoVYhVRBGMe1CWa35cjy5vhnZEGuyFwVIrpdAG5bwsZilo5bmSsZL5eXt53MuT1nIolOcKhd9i5L91OJ5skmbBo2I1yAPTn7d5pjYXPVNcQwjznERq6Bv27otMTosfVEoYxFQxWgch2Es0O+/W6vEMX1jVKQiq8iKa0dHwFXLh1oojrXX0hkfugSHGsFRrU2n6QpOvz4xOC+gFd5NDCrBWCXc1JyTxthHsXfad0W5SZYj0L40aPxycTG+uvVwXs+4qSPZrdJ8A18wMDwicm+21v/x9twTexKC2M6rof4sWy5hUow6wRxg6eIdtV/x04UFfY0a9t6HVVZlhTjBqOVYEK+yVTJdJEu4K5NZul7obOSP77qywtoZerM04E71BEYQ159DGegjYrzIXnpEGPRbuDDIN9Nh4P+bESN+jBSDeDMvJpp8vJxn65dkM13AZFEW2/miH4M+fsYXnz95kB5+Pvx5hoXBg63JuT97uPv9+kp4MDUDvWyXmK6q3tVMvvNevrdRqAgJkDbh98PDfYIKFGERcA0VIRGtfVXotxbBwpDIsI/hTOn8dSjJSBx5NKmQRPJn1gLdVVmMxAnFfZBE2WgPikngA4URUfwnIIWaOHMgFZDQA9IMYfOG3aHxuerjegwZhGOoi3EMWZRlqKfJMnTcmmHIYCxDXZBjyILM5Hsgy9BRkGPIgCxDe1B732EkBBVLQuuWNTZ51O50sHEGFVEbrMObgnhKHG72wq/trixm2+kGbpJV6tnAA0pofFRQdycekyLA5lZ6Je83O0+1QRep8OIfbDfSEcBIYf45YX2aFtt84xGKYh2PPiE8CCTflu39NK520ga7fyTLbQciSaCXMrQKh4/D65sHU5vbthXuy8xr+sPKebvHhh3LB9UytK7DLWrrZD6KdWp5sJOL8cTXvBkfjgh0oSLQmV810uMbmLq+tRsZ2Jb5HeEeNDZxgnnRGDD48UdGHPtZiQ8KYW0P/EKHRBSeTeRBkeOnSUUFkYGpSjzy1kCDsDWwh3E10KJMDexrsjXwuDVTAw3G1MAeyNVAC6rKWx9ka+BRkKuBBmRqYA+EDOnkY8ZlPEV5tlEDsPz0IJYfCzL09PUYeo6bqtgxEENOD2PJsZhq2n2M4eYoxlJjMIaZBqbdpegzPFKNu4Tg7dhrlScLw7O7aHVFTVW8IlOSOOhkeaFPKp6UDJlOYJ+IJ4EVFnacrA99OLG4TqwDIt7E+o7fevRsqdTvkDuuLJsr94SzDRgsKz59QiqSJNxLucemWPf2Q0YMsa6F5Y2SDh8XSTlP9b6CLXuWw2tRzta9o4wMhFPAnQKs9vBXWhbwsH1J0zUk+cw83yXZOoXbfLnrapHKaKnutLI1vCS7ynKRYwD9SEsUm1b+wLdkna1HtsfucI81XDDvnC4I/AK35OLNC8DjEMdCUR3JegXcWPOof9wvyMo9awQGl0a0VswtYOP3e5fqtRmly5t+MNeGNm0w/vAT6rKCLHFJeITqAklU6B4rcwjoLCwPtenO4SedLpMy2WRF3l0Axi18yMhkgSuAfwlug6uX7SYtYZ7mKQqmM3fhSM6LdI1RUqbft1mZdtSJ2FkfrrN5nmy2Ja5lCetNsnohwAl8wHP6UzbH92gHf1wvild9L4aBpsNHkK7GqHZQH21PrzCollrAhCn6m0+X23X2A+08weV4AtIY0Qc+nEJlpasz2Hu5/facYke4KaBzj/a8LbP1LJtq0jAcl7ueZ6r2zNcCyKoEC16vRp0mn5CQQ9eHEqu+DiAmm6vI6yJpDoeUVnCBf3GFF9h0MVGdD7PVXPQOiG2YvhKi9hL6pB51JhApogKkiluJZqHYbhYFsoNRMa5WuSh3b04wW51s6NfVSohY74n7HKoB9nH/e7eaIQuyqu7ts3t1JXS2G7299uJRXXtCA70Lm9w344ZXxo3aK/z9aGm267nX2bJxrKQ3hNpKtFCbtD2JTXdQMZbEiiQeApZrykGg2yhg40T24oTVkOYOZqKtnOubwNe0xGU/21WXgRTmA+x1qbtcbIw7fTnHaWvdob5b9et+S/VxRnvreT/4Dx8klXUNCmVuZHN0cmVhbQplbmRvYmoKNDUgMCBvYmoKPDwKL1Byb2NTZXQgWy9QREYgL1RleHQgL0ltYWdlQiAvSW1hZ2VDIC9JbWFnZUldCi9Gb250IDEwOSAwIFIKL1hPYmplY3QgPDwKL1hmMSAxMTAgMCBSCi9YZjIgMTExIDAgUgovaW1nNCAxMTIgMCBSCi9pbWczIDExMyAwIFIKL2ltZzIgMTE0IDAgUgo+Pgo+PgplbmRvYmoKNDYgMCBvYmoKPDwKL0xlbmd0aCAyNDE0Ci9GaWx0ZXIgL0ZsYXRlRGVjb2RlCj4+CnN0cmVhbQ0KeJydWW1z2kgS/s6v6C935VQRWfMmafLpsHFiYhtYIMnuVaquFCGMdoVEhEji/fXbo5EsDUJgn+0qa1A/PT393sP33tWid/meALFhseoRCR6hFuewWPYurve7PN2EGQyWyyzc7d4s/uzdLHq/9b5rFAVCS5QrhcU0apauoxzmUfK4PgQwIKQCuJ7FaQEY77PtPlO0F3AK4RBL8gYCksj/+0VILiwuCmQcrUKIkt0+85MghG0aR8ETBOlm6ydP5xlRz5JuwSgpROjDbbTxg7UfwzTzl+Fu3QfiOtS2D7nwWsOuTSyhDzJawT5ZhnH0I8zCZR+yMN9nCeTpu7OyOJ6w9Jnmg8Ufgwe4mw3eL2D6eQH3i+EpoCMtW2t+Gqc5JKkF3O0DzK07C0bJEq2eRX7c78Pd7WAxGc4G/fPSCGoJpsWZPAzuBuOPIxiP4MtgODoPZo5l67NMplMLrmaLOcwmg+F5JJGW0AZRJs378GH/p188MClsmzawNqjf2YcehZ89wsElnkVg06PCtWi1jHvzBnH2iG+leuvZTCmNUWq5DlBuSQ+N1VvVUglAnigVRTdVAIL/Ci1jbOEvsrq4ngzfwfU6DP6CfI3O5z/53+IQ/E26T3JIk+JTf7s9PLADxNOstaSuUxnwsx9v0tYZcS8mhOUpUmHZHDhVAOK2pXbLEGbCK+g922LClHoaBX/tWzJ5zzKJQibuqY2UTIPR7duZfdx0hyhKLFub7xypIzmaR1F+IZfzT/MX8XdQYaRMMuTy/qUobltEuyO7/PjpqkHuFPp1gKO7oy4dlyvFBhtksiEwTA13cLRipeUKdFRqUal4ojhZz8ZgwR90xIvP97aNzuJwJhzJWGOzwoHUfsUD9QrhBB7JZeWWtNrS8G2KtlQeSL3Cu4uFQH9AWOXehYiyjCNqg1BH1uqdZulyH+QwDHM/ils5X9TBJ9B6DmuciTmocHWm+d2nLhy12Slg9HfYiZQuJrxu7G/5UxeUca6M0I29TuM060JzhingFHqSLbFIjlPrlLJsYREdIHL+lnIpIZicVFINeJ+FIbxANTWCnNNETToLl+cO3uArHMq4I7HGSeZyRzj/I50ploHHbHRBog5jW+iOZnYt6YRHK/fc6MUJYoxmD+NIE6qnLioheMWRVYtnWuwjCIZ8479ju57KdnhO7koVqhhoQPGNPMiYWMZ1JVfZQgjgGJeuzjGLwe8wGn+ejK5vDlWKCi1SDMc+Cdse7jkW0+VykkWPUYINxPs0g1kYRNsoTPITdQtdxypCmyiliWp9XBEGyaay6CmISaL0Rw7p9YmoPhHqjztcFQ91mqvR/T0sJnAJ89vRFJ+OZ1zlGxUYU6nnHHaO8BbKJq8PZrfXB7OHO78B5jZPFxmz3UPWr+3iUP1eGaBK6AbrjhapAig5sHn0vLLv8rH5TFcw32+38dO71v4tNqLcl7qWI1HhTqXweRov4dsTvAOzDZyNPg8WN3A/ehgtbjoaKaxQBleMktISx1rKPpp0Mn1L4N/6gcLVYH7zcDNewOJ2cDeZDb8MZnA9eZje3/wOD5PF4GW7YnNS6vBhMB6OZmiW+bFejnWwc012VFRa/jBfjMboSJQPrj5ez4UrvTH5b6s1RtMYDLBx86Q20z5Do+xC6Ezwal5qYBnGiexIlK3hydZQhu2nQ5rbjpIfaYT+cWQ/SgxQvd+WPv3KqOOYLa/GlIHKGbZorLmRPtbQz1uFhTIDU++DGRGrAbWpaEFKTxc2dqfy2HmObiQM1JmNzDYHe3FlL9e1iopQrplUlbkjHXJ8TdRrRc40Oekkp6riyxqiUuEBvZo/sHvEnbkicEW9jHGJ7adTrQVOvOolUzWlWgj1JujpJfOKAIyfl44lsJJpLsxz1Uu9RbkI9P7lKu5hh49poVwSp+ZRPvMS5NR7x9WqEEszKAVuni3oLJqoK0yCqK3ztRUP4aJxXKytrJhGDmsrLVMDhhXDIUfqsjoMd0EWbfMoTVruUwY/YWipJuZ2Pm7RlnGOIalO1CA+0jlSWUkiC+XXxB+ydLeDQTGztSbTMqYxEFVP0DxDtAuOIqqAZlxV2AZi4f8qpkMc8fatsGFVTHNHZTsTFraadlaGs8BBWxqnWaS5H7fIeW0GHB+kblQkzNeqOAGDaYAayPJoFQWR6lz8/a+OUb3BCUUtr2+mPtbfHXzIfNSkantu001HHW8yQBVJUXpEkGJhQIfow3Xmr1StiFY5Ng5dNxUNNpgmpK5yX8LlEjHQYHceTmw1+RXlys+yyH8Mm3h4H+7y6IfW6UlGVHoqAA6PM1mhUsM+XIXLLE035wWiZfG88uMgTZ76cB/9UIeaKXShlhfwUNcEpPQf5XRNiebr9Cf2pF2dVpONw+qbJT/Jd33lJeAnS20lGI7+OM9EkOom4asaTrA5C6PHdY4VBafer2+woKt56Dwf7GPLS6VqdDpCL5r5o2ESx7UpabV/zDFSSIO+NXAx10ggDdLZDusVnrHN3TOyhwmxjwGkkTwO9sB4c1picdtMHDavvHmE7RL8h2C9/9dxXR1AqaSN3XCsZLKFIEbaeYkOOK0NSPBU2rcn+Robleu1nz22kxtnhg1r1HEbcm7asKYfD1q0wjRiTdthEe6YJjQBLWrXtN959p5pAmySqPNC6x1Abe/cXtI03inhzvYGSnmMqismHFtxDnpenhvJaw5NFDJxWWG913IxYMhGOhb5P4QxYNhLYuJT5n4lGxO2QT8ghR+8ko0JwyGfs8LEr2RjwrCZZaww/CvZmDDVE8tDHvqSyX6OdOJJi3vd/Ygghu82yLsyj6CG85qIVuZ5kfvaRN3Y1NrV61drt2JTqemVbExYqd1X8ihHEsHr05Tr157mmU0p1mvZmDB9mgMe2pxVildTjWu5VacL0Q6SNH/+JiVNcKD4EWY4sgdFsYBv/i7aWbBYIyX++cXdzz7HavIYJiG2OOESonI+VX3KMg01yyz8vo+yEHbRY+Ln+yy0QFchzRhZZeHzc772c/XB8dTblF7dx+lGy99u4ygoxM5TeEr3GaTFPK7EiJIg3i/rDVbYJMfpY4S9JbbeqzCErxc/UZri66KSzdc36tu7AreDZTlvaGjBPYjyJ8X8Ej9QH6ZJHCXFt1CbUBF+vcCevMnuxMVueUVb3O0S7lnEPXG3W9GqxSliQnGY96zyepdViy5a4kp1La1py0UnLZdq25JWLzTtPwqdFdwNCmVuZHN0cmVhbQplbmRvYmoKNDcgMCBvYmoKPDwKL0ZvbnQgMTE1IDAgUgovWE9iamVjdCA8PAovRm0xIDExNiAwIFIKL0ZtMiAxMTcgMCBSCj4+Cj4+CmVuZG9iago0OCAwIG9iago8PAovUyAvSmF2YVNjcmlwdAovSlMgKHRoaXMucHJpbnRcKFwpOykKPj4KZW5kb2JqCjQ5IDAgb2JqCjw8Ci9TIC9KYXZhU2NyaXB0Ci9KUyAodGhpcy5wcmludFwoXCk7KQo+PgplbmRvYmoKNTAgMCBvYmoKPDwKL1MgL0phdmFTY3JpcHQKL0pTICh0aGlzLnByaW50XChcKTspCj4+CmVuZG9iago1MSAwIG9iago8PAovUyAvSmF2YVNjcmlwdAovSlMgKHRoaXMucHJpbnRcKFwpOykKPj4KZW5kb2JqCjUyIDAgb2JqCjw8Ci9TIC9KYXZhU2NyaXB0Ci9KUyAodGhpcy5wcmludFwoXCk7KQo+PgplbmRvYmoKNTMgMCBvYmoKPDwKL1MgL0phdmFTY3JpcHQKL0pTICh0aGlzLnByaW50XChcKTspCj4+CmVuZG9iago1NCAwIG9iago8PAovUyAvSmF2YVNjcmlwdAovSlMgKHRoaXMucHJpbnRcKFwpOykKPj4KZW5kb2JqCjU1IDAgb2JqCjw8Ci9GMSAxMTggMCBSCi9GMiAxMTkgMCBSCj4+CmVuZG9iago1NiAwIG9iago8PAovTGVuZ3RoIDIyNAovU3VidHlwZSAvRm9ybQovRmlsdGVyIC9GbGF0ZURlY29kZQovVHlwZSAvWE9iamVjdAovTWF0cml4IFsxIDAgMCAxIDAgMF0KL0Zvcm1UeXBlIDEKL1Jlc291cmNlcyA8PAovUHJvY1NldCBbL1BERiAvVGV4dCAvSW1hZ2VCIC9JbWFnZUMgL0ltYWdlSV0KL0ZvbnQgMTIwIDAgUgo+PgovQkJveCBbMCAwIDEwNy4yIDM1LjY2XQo+PgpzdHJlYW0NCniclZIxTgUxDET7nCISDTTBdmLHaUHQISSUK/ALJBruX7Cr/7NBO2nooqd4PDMJxZbMIieLYvHnM0gqV0TJb6hspxNyRMxJgOVN97SAKzLhweas5KG3W7oxQ3fScDbL8Dd3ZEV/2Yfe3FEY/RXsRMetP5OOW1WwKS24VY9W9thXZgsnppjWKjZVCZuqi9eooFYb9uSL9/Fy1nJI2hZ/oh3p52QzbI6JBpyxmCAVky4+GR2d0L/QJTz18PjK0WO/BN44RY6iyXmXt9i/w/3dx/P7m1KulB/6V3jp4Rc57aedDQplbmRzdHJlYW0KZW5kb2JqCjU3IDAgb2JqCjw8Ci9MZW5ndGggMjA4Ci9TdWJ0eXBlIC9Gb3JtCi9GaWx0ZXIgL0ZsYXRlRGVjb2RlCi9UeXBlIC9YT2JqZWN0Ci9NYXRyaXggWzEgMCAwIDEgMCAwXQovRm9ybVR5cGUgMQovUmVzb3VyY2VzIDw8Ci9Qcm9jU2V0IFsvUERGIC9UZXh0IC9JbWFnZUIgL0ltYWdlQyAvSW1hZ2VJXQovRm9udCAxMjEgMCBSCj4+Ci9CQm94IFswIDAgOTguNCAzNS42Nl0KPj4Kc3RyZWFtDQp4nJWRsQ4CIRBEe75iS22QXWCB1kRNjJcYwy9oYWLj/xfexQMMS2NHXnZmh1kDSTMDagZieN8VafdFRscVufnVoVhQEyJq6sfQSTcMs6RfioW1ObLFb4m0MpZ+FPspW5O0DdbLdJblL2ySW50TJMgpb0q25uZJVudrJz/aQSc86ISFksUPgpEdBSv9A/deIcmOYk2xnGNlgytEkSOJhtLgBmlwgxSr/x/kofZZ7Y4IEfJD4cwNIFDQjhZvhvxSm9NtOl8nvGzzUx2y+gCOipmbDQplbmRzdHJlYW0KZW5kb2JqCjU4IDAgb2JqCjw8Ci9MZW5ndGggMzY0NQovQ29sb3JTcGFjZSAvRGV2aWNlUkdCCi9TdWJ0eXBlIC9JbWFnZQovSGVpZ2h0IDYwCi9GaWx0ZXIgL0RDVERlY29kZQovVHlwZSAvWE9iamVjdAovV2lkdGggMTE0Ci9CaXRzUGVyQ29tcG9uZW50IDgKPj4Kc3RyZWFtDQr/2P/gABBKRklGAAEBAQBgAGAAAP/hACJFeGlmAABNTQAqAAAACAABARIAAwAAAAEAAQAAAAAAAP/bAEMAAgEBAgEBAgICAgICAgIDBQMDAwMDBgQEAwUHBgcHBwYHBwgJCwkICAoIBwcKDQoKCwwMDAwHCQ4PDQwOCwwMDP/bAEMBAgICAwMDBgMDBgwIBwgMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDP/AABEIADwAcgMBIgACEQEDEQH/xAAfAAABBQEBAQEBAQAAAAAAAAAAAQIDBAUGBwgJCgv/xAC1EAACAQMDAgQDBQUEBAAAAX0BAgMABBEFEiExQQYTUWEHInEUMoGRoQgjQrHBFVLR8CQzYnKCCQoWFxgZGiUmJygpKjQ1Njc4OTpDREVGR0hJSlNUVVZXWFlaY2RlZmdoaWpzdHV2d3h5eoOEhYaHiImKkpOUlZaXmJmaoqOkpaanqKmqsrO0tba3uLm6wsPExcbHyMnK0tPU1dbX2Nna4eLj5OXm5+jp6vHy8/T19vf4+fr/xAAfAQADAQEBAQEBAQEBAAAAAAAAAQIDBAUGBwgJCgv/xAC1EQACAQIEBAMEBwUEBAABAncAAQIDEQQFITEGEkFRB2FxEyIygQgUQpGhscEJIzNS8BVictEKFiQ04SXxFxgZGiYnKCkqNTY3ODk6Q0RFRkdISUpTVFVWV1hZWmNkZWZnaGlqc3R1dnd4eXqCg4SFhoeIiYqSk5SVlpeYmZqio6Slpqeoqaqys7S1tre4ubrCw8TFxsfIycrS09TV1tfY2dri4+Tl5ufo6ery8/T19vf4+fr/2gAMAwEAAhEDEQA/AP38oor4Y/bR/at+Ifwf/aAutB8N+In03SY7S1lSA2NrPtZ0yx3yRMxyfU0Afc9Ffl3+zb/wUG+L/wARf2i/BOg6x4wN5pOsazBY3kH9k2MfnxM+1huSBXXIBGVYEZ61+olABRXiP7ffxL134M/ss+I/Evhq/Om61Yy2S29x9niuPLEt7bxP8kishyjsOVPXjBwa/O8f8FNfjiP+Z4b/AMEum/8AyNQB+v1FfkroH/BVb4zaHMGuNc0vVlx9290e25+phWI/57V7N8IP+C06rdwW3jrwZ5ccgCS3ugzlvL5xu+zzHO3kZIlJ46E4FAH6CUVx3wl+NPhn46+Fv7a8LataatpxOwyQsd8TkZKSIwDRuBg7WAOCD0IJ7GgArD8cfEDR/h7paX2tajZ6baM/liS5lEYZsZ2qOrNgE7VBOAfStyvjX9pq7j1j4o6lLfadH4in0p20/SdOnd1stPiit4Li4u7gbgCrPOuMsq4DF3KoqkA9G8e/tz6Ff6e0Pg2O61q482O3k1CW1lt7KxklcJGh8xVeSVyRtjRTuAJJCK5H0JX5v+GfiI2qfFnwOupa5p+sXFvrVlDpWkaaU/s+3ka4RRP+4C2yBchwIizSNGqsFUmv0goAKKKKACvzi/4KWWLWH7UbTNGFjvNGtJkI/jAMiE/muPwr9Ha+IP8AgrZ4Hawm8H+L44wYW83Rbub+6x/fW4I9P+PnnoOO5GQD4o/ZQ1eHw7+118O5LjIWPxVZQsR0UvciIE+gy4P4V+21fz/+OdQm0XxnJcWskltIJBc2sqNh4WyGDj/aDA4NfsF+xP8Atm6H+1t8O7W4hube38WWVuiazpgkCywzgENIiHloHPzK4zgNtbDKQACj/wAFUpvI/YY8YMf+e2mf+nO0r8jTcqE79K/Wv/grCxh/YM8aNg/LPph6f9RS0r8cpdR/ct/umgD6e0H/AIJtfGDxb4WsNa03w5Z3ljqVnHfWpTVrUPNFIgdCFZwQSrKcHHU5x38b8deCNX+GPiKXR/EGlahourW4BmtLyAxSID0YZ4dT1DqSp7Gv2o/ZrbzP2dfADY6+HNOP/kpHXlP/AAUe/Zgsfj/+zzq15HaRv4m8KWk2paVcJGDO5iUySWucZKyorLtJwH8tu2CAfmr+zj+0prX7MnxLtvEWhsZlJWPUbF5CkGqQ7gWik6gHH3HwSjYIyNyt+zHwz+JGl/GDwPo/iTRpDPpWs2cd5bSHhijrna4/hdSCrKeVYEHkGvwHXU96Bl5BGQfWv1K/4IlfEmTxZ+zfr3h2eTzP+EV1yRbVQf8AV2twgmUfUzfaW/4FQB9qV+ZH/BYDxzPoPxhs/CtjLNb2eraXa63qmyTi9l3SwQowxwsaWqsF6FpMnJVcfePxv/aS8I/s1+Fm1fxhq9rpkKxEw23mBrq9YfwQQj55GPsMDqSACR+N/wC0N8d7z9qz9oPVPEtxbtYx6pKsNrZb9/2O2jGxY892ChixHBdmI60Aetfs4xZ+N/w3VV3H/hItHbHsLyHP6An8K/XyvzE/4J4+DD8Sf2mdNu/I8yz8LwyatcydArgeXAoOMAmR1YA9omPav07oAKKKKACuL+Nvwg0z49/DTVPC+rMVsdShKGRFBkt5QQ0UyZ43I6hgCMHGDwSD2lZur+KtP0LVtPsbq8s7e81VnSzglnSOW6ZF3ssaE5chQWIUHABJ4oA/EX9qn9nvxB8C/GTaD4ktxDdws5sLxATaahADxJE/cHHzDqjHa3QmvFxqd14f1KORJLizvLY7o5EZo3iPTKspBB9we9fvt8VvC/g/4t2LeEvE1noWsGe1a+bS7t42k8oEIbhVyJFCsQolXG0tjcCa+Jf2jP8AgnL8FrH4Ua9438L+JPEE+m6LsM9po13Z65HGzSJFtjEskeGBYEh5s4zjnggHwHr/AO0L418XaRJp+seL/E2rabNjzLO81i6uLeQKQy7o3cqcMAeg5APUDHJ3V9+5b5uxr9BPE/8AwQ80nTvE0OjJ8YdFtdWvF32tjdacsVxdDnlIvtJZh8p5Udj6Vi3n/BD4SeJxoS/Gvw1/bkkPnDTm0v8A0xkP8Yh+0h9vfOOnNAH6Lfsyvv8A2dPh77+GNNP52sddZ4pH/FP3n+1bS/8Aotq5P4YXOk/DDwl4Z8D3Gt6bc61oeiWtr5H2mOO5uI4IVjacQltwT5S2cdPpVrU/jB4V1Hwm17/wk3huPS7xnskv21WD7N55Ugxh9+0uP7oOeDQB/PjpepAabb/N/wAsl/kK6Pwr8WvEHw+S4XQPEGvaKl5t89dO1Ke0E+3O3eI2UPt3NjcDjc2MZOfs3Q/+CE8i64+gL8aPDs2safbrLPZR6X/pUUeBiRovtJdVO5cEgDkeoq9o/wDwRBsbnxXNorfGDw/catZx+ZPYW9iJbyBeDuMP2jcB8y8sAPmHrQB8I3ur3Wv6iZpprq+vZPvSyOZZpPqx5P4mvUv2f/g94g+JnjGHR/DmmXGsa1dZURWwzFaQk4Lu5+WNB3dyBxxk4B+8/Af/AASG+Enw88RWth4m8Yahr2rPE10mli7t9LF3CgbfIYUJlZR1LKwAwSSa+o/gZ4c+HXw2+HtxH4Dt/C9r4dtSftU2lzwvCrICWM8wZtzKuMtIxYCgDD/Yz/Zes/2WPhmdN+0R6hr2qyLc6teqpCyyhcCNMgHyo8kLkAkszEAttHtFZXhHxjpPjvS/t+j6hp2q2LMUW5srmO5hcjqA6EjIPUVq0AFFFFABXyp/wUX8Sw/Bj4xfAP4ra1aXz+Cfh74g1L/hIr+1tnuW0iC80ye1S5kRAWECyON7gHGVGCWUH6rooA/J/wDbQ+Lfh/8AbH/bG8Oa14MvrrVvhfrR8O/CXxHrVtHLa22pyal4hhu59PglKqz5gth5jR/KBIqscSYNX/gtx8C/BP7J3h7Q7fwJ4e0jwbp/j/w5qum+IbLSYfs9rq0VlNp9zbNJECE8yOQuRJgv85BJFfrH/Zlt5EUf2eDy4GDxp5Y2xkdCB2I9qL7S7XU1AubeC4CggCWMPgHr19aAPy88H3H7PehS+OdH/aC0GfUPj3eeN7x78XWl39xrepNJqD/2ZLpjWw877L9n+z7Ut2GFjICkFAfO/s3wltv2TNU8M+ING1hv2zP7VmLqllcnxfN4oa5aSC6huFXb9l27JAysIvKy3L43fsU1rG86StHG0kYIRyo3KD1APbOB+VAtYxced5cfmhdgfaN23OcZ9M9qAPyN8Xfs/wDhnx//AME3PHXxM8XaTpuofFO7+Kc1vqfiJWzdMz+IodMngjmXBFt5EjxCJcIARgKcY9ws/wBgz4OXX/BVjVvBsvw58K/8Iq3woh1n+xo7XFmt5Lqc1k10IgdqyG2hiTeoBBUt945r7+GlWot2h+zW/ks28p5Y2ls5zjpnPOfWnLYW63ZuBDCJyuwyBBvK5zjPXGSTj1NAH4//AA9+C2m/D/8A4J1fs5/EjwHp2m6X8YNY+JEGl23iFci8vXub6+sRbyzNy0DRxwpsb5AsfuSeR/Zs+H1x8TL74e+DdF1r4M+EfjJp+tC+EsvhrxFB4+ttUtiZ7o6lclnjPmBXWQyr5DKxVQPlC/tYuk2qQRxLa24ihcPGgjG1GByCBjg55yO9TeRH5rSbF8xgFLY5IGSBn2yfzNAH5Ln4TaT8Sf2DND+Nmr6LdeJNQ8Z/Em5v/ivqltG9zqtx4Xh1e+tri1jMY85LVBbWe6KHbtSJ8YVSBl/tiat8C/GGlWWofAHSdBXwlp+p6ZL8R72w0LVR4WawQStafb4rfy1kjikdZZlQiUlomy219v6821jDZIFhhihUZICIFAycnp6kk0+KCOBNsaKi5LYUYGSSSfxJJ/GgD89f+CU3gx9Y+P3jTxp4V8R/B8+DW0qPRtZ0f4faPqul6TLqX7uW3u1S8BieRITJGzQNgLJhl3Ek/oZUdvaRWkCxQxRxRoMKiKFVfoKkoAKKKKAP/9kNCmVuZHN0cmVhbQplbmRvYmoKNTkgMCBvYmoKPDwKL0xlbmd0aCA0MjEKL0NvbG9yU3BhY2UgL0RldmljZVJHQgovU3VidHlwZSAvSW1hZ2UKL0hlaWdodCAxMzAKL0ZpbHRlciAvRmxhdGVEZWNvZGUKL1R5cGUgL1hPYmplY3QKL1dpZHRoIDI1NQovU01hc2sgNjAgMCBSCi9CaXRzUGVyQ29tcG9uZW50IDgKPj4Kc3RyZWFtDQp4nO3aaW6DMBAG0Bynh+D+4la0alWCCJhhsY3we8qvKMtEfOMtvF4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwN3x1tUsoauj72iVATUPXVsvDSPhb1vjVb/zn0zLh58+uPeAzYvOMX8GFhq6fPo58wn8fJd4+ni8lmi7yOWd8hn/8olRV3XblNGgxD5EBNhLvy89jp4WFCsjTgxS26zrmuOiXh23xxenB+T2Gf7RVZFSPTBM0YnFkjg/X+SI0q+Gd+W72fIXZh1tp5/ra8FJYsebaHMmD4beqaUrWy114ZkmdOP2Gv52ZjvJHFrNW2rULOHno+soT/vNVUUX1gS5dwIXlbc5f1vxk9ZnAjfCvJDZHUIWfrHaHP/9CYu3P5QP/0NkLM/NO11Jy9i5sgq8P9pRVOhVthrnKrmRthNcslHfgrrbQTUSTzlpYkk2+a/l+icBdbdZCwJ2Z0yHCbA7wJD/bwPSjdoEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMCtfQMUze7fDQplbmRzdHJlYW0KZW5kb2JqCjYwIDAgb2JqCjw8Ci9MZW5ndGggMjQyCi9Db2xvclNwYWNlIC9EZXZpY2VHcmF5Ci9TdWJ0eXBlIC9JbWFnZQovSGVpZ2h0IDEzMAovRmlsdGVyIC9GbGF0ZURlY29kZQovVHlwZSAvWE9iamVjdAovV2lkdGggMjU1Ci9CaXRzUGVyQ29tcG9uZW50IDgKPj4Kc3RyZWFtDQp4nO3X646DIBAG0L7/S0+zySZluRXSbRzac35UNA7hQ1F7uwEAAAAAAAAAAAAAAACcJpL3d5wvn4Bz4r9lpOfEf4uz4sd09/UO84sf7dEiyajd7W27IqH4s5m2O5WLp15q47afxGnmKYoboD14hs7FfxYgfn+iPjV77v8dX/a02xYCRbd5yFw8GeRShuI5f0LmtTE2C3n0mpzG71dcamM80WmNe8sW9AX1Gyyq7bjmI4zizwrK9bJRmU10QnT2O987H2Z/Ya8skjM117j+wIuqVf/7IQnXomQ2vk08XD0UAAAAAAAAAAAAAAAAIJE7nTSBfw0KZW5kc3RyZWFtCmVuZG9iago2MSAwIG9iago8PAovRjEgMTIyIDAgUgovRjEwIDEyMyAwIFIKL0YxMSAxMjQgMCBSCi9GMTIgMTI1IDAgUgovRjEzIDEyNiAwIFIKL0YxNCAxMjcgMCBSCi9GMTUgMTI4IDAgUgovRjE2IDEyOSAwIFIKL0YxNyAxMzAgMCBSCi9GMTggMTMxIDAgUgovRjE5IDEzMiAwIFIKL0YyIDEzMyAwIFIKL0YyMCAxMzQgMCBSCi9GMjEgMTM1IDAgUgovRjIyIDEzNiAwIFIKL0YyMyAxMzcgMCBSCi9GMjQgMTM4IDAgUgovRjI1IDEzOSAwIFIKL0YyNiAxNDAgMCBSCi9GMjcgMTQxIDAgUgovRjI4IDE0MiAwIFIKL0YyOSAxNDMgMCBSCi9GMyAxNDQgMCBSCi9GMzAgMTQ1IDAgUgovRjMxIDE0NiAwIFIKL0YzMiAxNDcgMCBSCi9GMzMgMTQ4IDAgUgovRjM0IDE0OSAwIFIKL0YzNSAxNTAgMCBSCi9GMzYgMTUxIDAgUgovRjM3IDE1MiAwIFIKL0YzOCAxNTMgMCBSCi9GMzkgMTU0IDAgUgovRjQgMTU1IDAgUgovRjQwIDE1NiAwIFIKL0Y0MSAxNTcgMCBSCi9GNDIgMTU4IDAgUgovRjQzIDE1OSAwIFIKL0Y0NCAxNjAgMCBSCi9GNDUgMTYxIDAgUgovRjQ2IDE2MiAwIFIKL0Y0NyAxNjMgMCBSCi9GNDggMTY0IDAgUgovRjQ5IDE2NSAwIFIKL0Y1IDE2NiAwIFIKL0Y1MCAxNjcgMCBSCi9GNTEgMTY4IDAgUgovRjUyIDE2OSAwIFIKL0Y1MyAxNzAgMCBSCi9GNiAxNzEgMCBSCi9GNyAxNzIgMCBSCi9GOCAxNzMgMCBSCi9GOSAxNzQgMCBSCj4+CmVuZG9iago2MiAwIG9iago8PAovTGVuZ3RoIDQ4MgovQkJveCBbMCAwIDIwIDIwXQovRmlsdGVyIC9GbGF0ZURlY29kZQovUmVzb3VyY2VzIDw8Cj4+Ci9TdWJ0eXBlIC9Gb3JtCi9UeXBlIC9YT2JqZWN0Cj4+CnN0cmVhbQ0KeJxV1sttHDEQRdG9omAIXfx0kwHZATj/hdnwmHUG2tyCWK+eZoALXSVWif3z59dPhTt8wxOOy8HtcD3cDwP2/uT45PjhB47hMB0Ww459/nODO/zAE15whEN1MDbMfSvmcDt4Zle8zy/gBg/48f3XcnXoDrfDV8B0WAw7efCFDKocnnC4EG68VYZVhlWGVQbXOx9Kp8nhDg/4hie8zGwOJoXrb8FuwRxM220bDRsNGw0bDQ8/cBgUJoVRYVYYFqbtsMpnWGl4uME3/MDLnK9Qk95S1R45TAfTdljQMGhyePrGR29MDt3B/bdKcPDiC7k4ePiBF/ymXB6/PJHDdDDgKqm+gmlXNlpZYmUHLatkk9nc95FqWjHxLhj14OStew3uMKvh7irIN42XWAtGfrIUDta0ilbPqllcikox6cHOA17sO5rzJluJ6lAVqkERaKqtoNKRtUbWwq+KUzsiR9zYMw4DIkD8l2vs7b9dLSaPovo0H+JL9RS0h/WQXstSLUs1Sim/RqlGEfyG3jBazR41e6A5LFezEr5Td9pO2SUTGCQGOf8c8CkVWSqySQqrwbwOnn/+wflkp24Sa2JL7AX9YT/kd3AWNJgnPMe94GBwMTgZ3AyOBleDs8Hd3z9/AYYKF2ENCmVuZHN0cmVhbQplbmRvYmoKNjMgMCBvYmoKPDwKL0xlbmd0aCAxNzUKL0JCb3ggWzAgMCAyMzQgMzAuOF0KL0ZpbHRlciAvRmxhdGVEZWNvZGUKL1Jlc291cmNlcyA8PAo+PgovU3VidHlwZSAvRm9ybQovVHlwZSAvWE9iamVjdAo+PgpzdHJlYW0NCnicjVK5DcMwDOw9hSYw+IscKBnA+xdxDOTRMUUaATzcQx1Ig4YOpT3Hcdts93Pm830hBTPHRbEvSKSpxC/oY6wKDK01WJutVbN1aSzPC4o3ELEYT4JNZgCQff2c2AItGdVaob4/U0ESs7co5kSWBDqpIGKMPmari2XPcv6BTSiQo3EiV8b0/ttk/EfOnlbUlZV4UITnI0x4YWzIEWxJJFGlvGr02Rr9Pd+3B8Y0oHcNCmVuZHN0cmVhbQplbmRvYmoKNjQgMCBvYmoKPDwKL0YxIDE3NSAwIFIKL0YyIDE3NiAwIFIKPj4KZW5kb2JqCjY1IDAgb2JqCjw8Ci9MZW5ndGggMTk0Ci9TdWJ0eXBlIC9Gb3JtCi9GaWx0ZXIgL0ZsYXRlRGVjb2RlCi9UeXBlIC9YT2JqZWN0Ci9NYXRyaXggWzEgMCAwIDEgMCAwXQovRm9ybVR5cGUgMQovUmVzb3VyY2VzIDw8Ci9Qcm9jU2V0IFsvUERGIC9UZXh0IC9JbWFnZUIgL0ltYWdlQyAvSW1hZ2VJXQovRm9udCAxNzcgMCBSCj4+Ci9CQm94IFswIDAgODkuNiAzNS42Nl0KPj4Kc3RyZWFtDQp4nJWRsRICIQxEe74ipRZiEiBA68zZWckveIUzNv5/IY533A2hsWPeZHcTFiFbESArwALvh2HrfwhtWpCvrw4ljQhX5ddiYa76dgEUNWPslTwIZdG7cdZujvspFyyrqbbHlupRp3rfK73oSwNZlRpYu4XBJmGwiZC+S9qf7OYGTcTWxKaNgyairNody3q/5Fa25aZBF0m5pdYO/kFmcynmfCVIUGZDlSMQcP2l/PUWKC9zuJXpXk58LE8zFfMB+wiOgw0KZW5kc3RyZWFtCmVuZG9iago2NiAwIG9iago8PAovTGVuZ3RoIDIwNwovU3VidHlwZSAvRm9ybQovRmlsdGVyIC9GbGF0ZURlY29kZQovVHlwZSAvWE9iamVjdAovTWF0cml4IFsxIDAgMCAxIDAgMF0KL0Zvcm1UeXBlIDEKL1Jlc291cmNlcyA8PAovUHJvY1NldCBbL1BERiAvVGV4dCAvSW1hZ2VCIC9JbWFnZUMgL0ltYWdlSV0KL0ZvbnQgMTc4IDAgUgo+PgovQkJveCBbMCAwIDk4LjQgMzUuNjZdCj4+CnN0cmVhbQ0KeJyVkTEOwyAMRXdO4bFdKDZgw1qpWdMB9QbNUKlL7z80VUKIYpZu6Mk8f9sOsmUGtAzE8HkasmFBzqYVhfl1QEkjpIX8BCuJlo56lPl5qCOnbbTl2EXjDtuSNJ/3tUfz+S3Lri5VX2MB69/WI+iNiJ4sYmWtLpKeLKr5Y9Y27uTgziFY9Fzi9A3F670LV1/rIZ0syevJUtB7T8qWVbYctSt3cuTtNu4PMplrMZcBIUGZDM7cAQKJDfRzM5S3OY2Pch/GMJ7Ly9yK+QIF45qDDQplbmRzdHJlYW0KZW5kb2JqCjY3IDAgb2JqCjw8Ci9MZW5ndGggMzY0NQovQ29sb3JTcGFjZSAvRGV2aWNlUkdCCi9TdWJ0eXBlIC9JbWFnZQovSGVpZ2h0IDYwCi9GaWx0ZXIgL0RDVERlY29kZQovVHlwZSAvWE9iamVjdAovV2lkdGggMTE0Ci9CaXRzUGVyQ29tcG9uZW50IDgKPj4Kc3RyZWFtDQr/2P/gABBKRklGAAEBAQBgAGAAAP/hACJFeGlmAABNTQAqAAAACAABARIAAwAAAAEAAQAAAAAAAP/bAEMAAgEBAgEBAgICAgICAgIDBQMDAwMDBgQEAwUHBgcHBwYHBwgJCwkICAoIBwcKDQoKCwwMDAwHCQ4PDQwOCwwMDP/bAEMBAgICAwMDBgMDBgwIBwgMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDP/AABEIADwAcgMBIgACEQEDEQH/xAAfAAABBQEBAQEBAQAAAAAAAAAAAQIDBAUGBwgJCgv/xAC1EAACAQMDAgQDBQUEBAAAAX0BAgMABBEFEiExQQYTUWEHInEUMoGRoQgjQrHBFVLR8CQzYnKCCQoWFxgZGiUmJygpKjQ1Njc4OTpDREVGR0hJSlNUVVZXWFlaY2RlZmdoaWpzdHV2d3h5eoOEhYaHiImKkpOUlZaXmJmaoqOkpaanqKmqsrO0tba3uLm6wsPExcbHyMnK0tPU1dbX2Nna4eLj5OXm5+jp6vHy8/T19vf4+fr/xAAfAQADAQEBAQEBAQEBAAAAAAAAAQIDBAUGBwgJCgv/xAC1EQACAQIEBAMEBwUEBAABAncAAQIDEQQFITEGEkFRB2FxEyIygQgUQpGhscEJIzNS8BVictEKFiQ04SXxFxgZGiYnKCkqNTY3ODk6Q0RFRkdISUpTVFVWV1hZWmNkZWZnaGlqc3R1dnd4eXqCg4SFhoeIiYqSk5SVlpeYmZqio6Slpqeoqaqys7S1tre4ubrCw8TFxsfIycrS09TV1tfY2dri4+Tl5ufo6ery8/T19vf4+fr/2gAMAwEAAhEDEQA/AP38oor4Y/bR/at+Ifwf/aAutB8N+In03SY7S1lSA2NrPtZ0yx3yRMxyfU0Afc9Ffl3+zb/wUG+L/wARf2i/BOg6x4wN5pOsazBY3kH9k2MfnxM+1huSBXXIBGVYEZ61+olABRXiP7ffxL134M/ss+I/Evhq/Om61Yy2S29x9niuPLEt7bxP8kishyjsOVPXjBwa/O8f8FNfjiP+Z4b/AMEum/8AyNQB+v1FfkroH/BVb4zaHMGuNc0vVlx9290e25+phWI/57V7N8IP+C06rdwW3jrwZ5ccgCS3ugzlvL5xu+zzHO3kZIlJ46E4FAH6CUVx3wl+NPhn46+Fv7a8LataatpxOwyQsd8TkZKSIwDRuBg7WAOCD0IJ7GgArD8cfEDR/h7paX2tajZ6baM/liS5lEYZsZ2qOrNgE7VBOAfStyvjX9pq7j1j4o6lLfadH4in0p20/SdOnd1stPiit4Li4u7gbgCrPOuMsq4DF3KoqkA9G8e/tz6Ff6e0Pg2O61q482O3k1CW1lt7KxklcJGh8xVeSVyRtjRTuAJJCK5H0JX5v+GfiI2qfFnwOupa5p+sXFvrVlDpWkaaU/s+3ka4RRP+4C2yBchwIizSNGqsFUmv0goAKKKKACvzi/4KWWLWH7UbTNGFjvNGtJkI/jAMiE/muPwr9Ha+IP8AgrZ4Hawm8H+L44wYW83Rbub+6x/fW4I9P+PnnoOO5GQD4o/ZQ1eHw7+118O5LjIWPxVZQsR0UvciIE+gy4P4V+21fz/+OdQm0XxnJcWskltIJBc2sqNh4WyGDj/aDA4NfsF+xP8Atm6H+1t8O7W4hube38WWVuiazpgkCywzgENIiHloHPzK4zgNtbDKQACj/wAFUpvI/YY8YMf+e2mf+nO0r8jTcqE79K/Wv/grCxh/YM8aNg/LPph6f9RS0r8cpdR/ct/umgD6e0H/AIJtfGDxb4WsNa03w5Z3ljqVnHfWpTVrUPNFIgdCFZwQSrKcHHU5x38b8deCNX+GPiKXR/EGlahourW4BmtLyAxSID0YZ4dT1DqSp7Gv2o/ZrbzP2dfADY6+HNOP/kpHXlP/AAUe/Zgsfj/+zzq15HaRv4m8KWk2paVcJGDO5iUySWucZKyorLtJwH8tu2CAfmr+zj+0prX7MnxLtvEWhsZlJWPUbF5CkGqQ7gWik6gHH3HwSjYIyNyt+zHwz+JGl/GDwPo/iTRpDPpWs2cd5bSHhijrna4/hdSCrKeVYEHkGvwHXU96Bl5BGQfWv1K/4IlfEmTxZ+zfr3h2eTzP+EV1yRbVQf8AV2twgmUfUzfaW/4FQB9qV+ZH/BYDxzPoPxhs/CtjLNb2eraXa63qmyTi9l3SwQowxwsaWqsF6FpMnJVcfePxv/aS8I/s1+Fm1fxhq9rpkKxEw23mBrq9YfwQQj55GPsMDqSACR+N/wC0N8d7z9qz9oPVPEtxbtYx6pKsNrZb9/2O2jGxY892ChixHBdmI60Aetfs4xZ+N/w3VV3H/hItHbHsLyHP6An8K/XyvzE/4J4+DD8Sf2mdNu/I8yz8LwyatcydArgeXAoOMAmR1YA9omPav07oAKKKKACuL+Nvwg0z49/DTVPC+rMVsdShKGRFBkt5QQ0UyZ43I6hgCMHGDwSD2lZur+KtP0LVtPsbq8s7e81VnSzglnSOW6ZF3ssaE5chQWIUHABJ4oA/EX9qn9nvxB8C/GTaD4ktxDdws5sLxATaahADxJE/cHHzDqjHa3QmvFxqd14f1KORJLizvLY7o5EZo3iPTKspBB9we9fvt8VvC/g/4t2LeEvE1noWsGe1a+bS7t42k8oEIbhVyJFCsQolXG0tjcCa+Jf2jP8AgnL8FrH4Ua9438L+JPEE+m6LsM9po13Z65HGzSJFtjEskeGBYEh5s4zjnggHwHr/AO0L418XaRJp+seL/E2rabNjzLO81i6uLeQKQy7o3cqcMAeg5APUDHJ3V9+5b5uxr9BPE/8AwQ80nTvE0OjJ8YdFtdWvF32tjdacsVxdDnlIvtJZh8p5Udj6Vi3n/BD4SeJxoS/Gvw1/bkkPnDTm0v8A0xkP8Yh+0h9vfOOnNAH6Lfsyvv8A2dPh77+GNNP52sddZ4pH/FP3n+1bS/8Aotq5P4YXOk/DDwl4Z8D3Gt6bc61oeiWtr5H2mOO5uI4IVjacQltwT5S2cdPpVrU/jB4V1Hwm17/wk3huPS7xnskv21WD7N55Ugxh9+0uP7oOeDQB/PjpepAabb/N/wAsl/kK6Pwr8WvEHw+S4XQPEGvaKl5t89dO1Ke0E+3O3eI2UPt3NjcDjc2MZOfs3Q/+CE8i64+gL8aPDs2safbrLPZR6X/pUUeBiRovtJdVO5cEgDkeoq9o/wDwRBsbnxXNorfGDw/catZx+ZPYW9iJbyBeDuMP2jcB8y8sAPmHrQB8I3ur3Wv6iZpprq+vZPvSyOZZpPqx5P4mvUv2f/g94g+JnjGHR/DmmXGsa1dZURWwzFaQk4Lu5+WNB3dyBxxk4B+8/Af/AASG+Enw88RWth4m8Yahr2rPE10mli7t9LF3CgbfIYUJlZR1LKwAwSSa+o/gZ4c+HXw2+HtxH4Dt/C9r4dtSftU2lzwvCrICWM8wZtzKuMtIxYCgDD/Yz/Zes/2WPhmdN+0R6hr2qyLc6teqpCyyhcCNMgHyo8kLkAkszEAttHtFZXhHxjpPjvS/t+j6hp2q2LMUW5srmO5hcjqA6EjIPUVq0AFFFFABXyp/wUX8Sw/Bj4xfAP4ra1aXz+Cfh74g1L/hIr+1tnuW0iC80ye1S5kRAWECyON7gHGVGCWUH6rooA/J/wDbQ+Lfh/8AbH/bG8Oa14MvrrVvhfrR8O/CXxHrVtHLa22pyal4hhu59PglKqz5gth5jR/KBIqscSYNX/gtx8C/BP7J3h7Q7fwJ4e0jwbp/j/w5qum+IbLSYfs9rq0VlNp9zbNJECE8yOQuRJgv85BJFfrH/Zlt5EUf2eDy4GDxp5Y2xkdCB2I9qL7S7XU1AubeC4CggCWMPgHr19aAPy88H3H7PehS+OdH/aC0GfUPj3eeN7x78XWl39xrepNJqD/2ZLpjWw877L9n+z7Ut2GFjICkFAfO/s3wltv2TNU8M+ING1hv2zP7VmLqllcnxfN4oa5aSC6huFXb9l27JAysIvKy3L43fsU1rG86StHG0kYIRyo3KD1APbOB+VAtYxced5cfmhdgfaN23OcZ9M9qAPyN8Xfs/wDhnx//AME3PHXxM8XaTpuofFO7+Kc1vqfiJWzdMz+IodMngjmXBFt5EjxCJcIARgKcY9ws/wBgz4OXX/BVjVvBsvw58K/8Iq3woh1n+xo7XFmt5Lqc1k10IgdqyG2hiTeoBBUt945r7+GlWot2h+zW/ks28p5Y2ls5zjpnPOfWnLYW63ZuBDCJyuwyBBvK5zjPXGSTj1NAH4//AA9+C2m/D/8A4J1fs5/EjwHp2m6X8YNY+JEGl23iFci8vXub6+sRbyzNy0DRxwpsb5AsfuSeR/Zs+H1x8TL74e+DdF1r4M+EfjJp+tC+EsvhrxFB4+ttUtiZ7o6lclnjPmBXWQyr5DKxVQPlC/tYuk2qQRxLa24ihcPGgjG1GByCBjg55yO9TeRH5rSbF8xgFLY5IGSBn2yfzNAH5Ln4TaT8Sf2DND+Nmr6LdeJNQ8Z/Em5v/ivqltG9zqtx4Xh1e+tri1jMY85LVBbWe6KHbtSJ8YVSBl/tiat8C/GGlWWofAHSdBXwlp+p6ZL8R72w0LVR4WawQStafb4rfy1kjikdZZlQiUlomy219v6821jDZIFhhihUZICIFAycnp6kk0+KCOBNsaKi5LYUYGSSSfxJJ/GgD89f+CU3gx9Y+P3jTxp4V8R/B8+DW0qPRtZ0f4faPqul6TLqX7uW3u1S8BieRITJGzQNgLJhl3Ek/oZUdvaRWkCxQxRxRoMKiKFVfoKkoAKKKKAP/9kNCmVuZHN0cmVhbQplbmRvYmoKNjggMCBvYmoKPDwKL0xlbmd0aCA0MjEKL0NvbG9yU3BhY2UgL0RldmljZVJHQgovU3VidHlwZSAvSW1hZ2UKL0hlaWdodCAxMzAKL0ZpbHRlciAvRmxhdGVEZWNvZGUKL1R5cGUgL1hPYmplY3QKL1dpZHRoIDI1NQovU01hc2sgNjkgMCBSCi9CaXRzUGVyQ29tcG9uZW50IDgKPj4Kc3RyZWFtDQp4nO3aaW6DMBAG0Bynh+D+4la0alWCCJhhsY3we8qvKMtEfOMtvF4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwN3x1tUsoauj72iVATUPXVsvDSPhb1vjVb/zn0zLh58+uPeAzYvOMX8GFhq6fPo58wn8fJd4+ni8lmi7yOWd8hn/8olRV3XblNGgxD5EBNhLvy89jp4WFCsjTgxS26zrmuOiXh23xxenB+T2Gf7RVZFSPTBM0YnFkjg/X+SI0q+Gd+W72fIXZh1tp5/ra8FJYsebaHMmD4beqaUrWy114ZkmdOP2Gv52ZjvJHFrNW2rULOHno+soT/vNVUUX1gS5dwIXlbc5f1vxk9ZnAjfCvJDZHUIWfrHaHP/9CYu3P5QP/0NkLM/NO11Jy9i5sgq8P9pRVOhVthrnKrmRthNcslHfgrrbQTUSTzlpYkk2+a/l+icBdbdZCwJ2Z0yHCbA7wJD/bwPSjdoEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMCtfQMUze7fDQplbmRzdHJlYW0KZW5kb2JqCjY5IDAgb2JqCjw8Ci9MZW5ndGggMjQyCi9Db2xvclNwYWNlIC9EZXZpY2VHcmF5Ci9TdWJ0eXBlIC9JbWFnZQovSGVpZ2h0IDEzMAovRmlsdGVyIC9GbGF0ZURlY29kZQovVHlwZSAvWE9iamVjdAovV2lkdGggMjU1Ci9CaXRzUGVyQ29tcG9uZW50IDgKPj4Kc3RyZWFtDQp4nO3X646DIBAG0L7/S0+zySZluRXSbRzac35UNA7hQ1F7uwEAAAAAAAAAAAAAAACcJpL3d5wvn4Bz4r9lpOfEf4uz4sd09/UO84sf7dEiyajd7W27IqH4s5m2O5WLp15q47afxGnmKYoboD14hs7FfxYgfn+iPjV77v8dX/a02xYCRbd5yFw8GeRShuI5f0LmtTE2C3n0mpzG71dcamM80WmNe8sW9AX1Gyyq7bjmI4zizwrK9bJRmU10QnT2O987H2Z/Ya8skjM117j+wIuqVf/7IQnXomQ2vk08XD0UAAAAAAAAAAAAAAAAIJE7nTSBfw0KZW5kc3RyZWFtCmVuZG9iago3MCAwIG9iago8PAovRjEgMTc5IDAgUgovRjEwIDE4MCAwIFIKL0YxMSAxODEgMCBSCi9GMTIgMTgyIDAgUgovRjEzIDE4MyAwIFIKL0YxNCAxODQgMCBSCi9GMTUgMTg1IDAgUgovRjE2IDE4NiAwIFIKL0YxNyAxODcgMCBSCi9GMTggMTg4IDAgUgovRjE5IDE4OSAwIFIKL0YyIDE5MCAwIFIKL0YyMCAxOTEgMCBSCi9GMjEgMTkyIDAgUgovRjIyIDE5MyAwIFIKL0YyMyAxOTQgMCBSCi9GMjQgMTk1IDAgUgovRjI1IDE5NiAwIFIKL0YyNiAxOTcgMCBSCi9GMjcgMTk4IDAgUgovRjI4IDE5OSAwIFIKL0YyOSAyMDAgMCBSCi9GMyAyMDEgMCBSCi9GMzAgMjAyIDAgUgovRjMxIDIwMyAwIFIKL0YzMiAyMDQgMCBSCi9GMzMgMjA1IDAgUgovRjM0IDIwNiAwIFIKL0YzNSAyMDcgMCBSCi9GMzYgMjA4IDAgUgovRjM3IDIwOSAwIFIKL0YzOCAyMTAgMCBSCi9GMzkgMjExIDAgUgovRjQgMjEyIDAgUgovRjQwIDIxMyAwIFIKL0Y0MSAyMTQgMCBSCi9GNDIgMjE1IDAgUgovRjQzIDIxNiAwIFIKL0Y0NCAyMTcgMCBSCi9GNDUgMjE4IDAgUgovRjQ2IDIxOSAwIFIKL0Y0NyAyMjAgMCBSCi9GNDggMjIxIDAgUgovRjQ5IDIyMiAwIFIKL0Y1IDIyMyAwIFIKL0Y1MCAyMjQgMCBSCi9GNTEgMjI1IDAgUgovRjUyIDIyNiAwIFIKL0Y1MyAyMjcgMCBSCi9GNiAyMjggMCBSCi9GNyAyMjkgMCBSCi9GOCAyMzAgMCBSCi9GOSAyMzEgMCBSCj4+CmVuZG9iago3MSAwIG9iago8PAovTGVuZ3RoIDQ4MgovQkJveCBbMCAwIDIwIDIwXQovRmlsdGVyIC9GbGF0ZURlY29kZQovUmVzb3VyY2VzIDw8Cj4+Ci9TdWJ0eXBlIC9Gb3JtCi9UeXBlIC9YT2JqZWN0Cj4+CnN0cmVhbQ0KeJxV1sttHDEQRdG9omAIXfx0kwHZATj/hdnwmHUG2tyCWK+eZoALXSVWif3z59dPhTt8wxOOy8HtcD3cDwP2/uT45PjhB47hMB0Ww459/nODO/zAE15whEN1MDbMfSvmcDt4Zle8zy/gBg/48f3XcnXoDrfDV8B0WAw7efCFDKocnnC4EG68VYZVhlWGVQbXOx9Kp8nhDg/4hie8zGwOJoXrb8FuwRxM220bDRsNGw0bDQ8/cBgUJoVRYVYYFqbtsMpnWGl4uME3/MDLnK9Qk95S1R45TAfTdljQMGhyePrGR29MDt3B/bdKcPDiC7k4ePiBF/ymXB6/PJHDdDDgKqm+gmlXNlpZYmUHLatkk9nc95FqWjHxLhj14OStew3uMKvh7irIN42XWAtGfrIUDta0ilbPqllcikox6cHOA17sO5rzJluJ6lAVqkERaKqtoNKRtUbWwq+KUzsiR9zYMw4DIkD8l2vs7b9dLSaPovo0H+JL9RS0h/WQXstSLUs1Sim/RqlGEfyG3jBazR41e6A5LFezEr5Td9pO2SUTGCQGOf8c8CkVWSqySQqrwbwOnn/+wflkp24Sa2JL7AX9YT/kd3AWNJgnPMe94GBwMTgZ3AyOBleDs8Hd3z9/AYYKF2ENCmVuZHN0cmVhbQplbmRvYmoKNzIgMCBvYmoKPDwKL0xlbmd0aCAxNzUKL0JCb3ggWzAgMCAyMzQgMzAuOF0KL0ZpbHRlciAvRmxhdGVEZWNvZGUKL1Jlc291cmNlcyA8PAo+PgovU3VidHlwZSAvRm9ybQovVHlwZSAvWE9iamVjdAo+PgpzdHJlYW0NCnicjVK5DcMwDOw9hSYw+IscKBnA+xdxDOTRMUUaATzcQx1Ig4YOpT3Hcdts93Pm830hBTPHRbEvSKSpxC/oY6wKDK01WJutVbN1aSzPC4o3ELEYT4JNZgCQff2c2AItGdVaob4/U0ESs7co5kSWBDqpIGKMPmari2XPcv6BTSiQo3EiV8b0/ttk/EfOnlbUlZV4UITnI0x4YWzIEWxJJFGlvGr02Rr9Pd+3B8Y0oHcNCmVuZHN0cmVhbQplbmRvYmoKNzMgMCBvYmoKPDwKL0YxIDIzMiAwIFIKL0YyIDIzMyAwIFIKPj4KZW5kb2JqCjc0IDAgb2JqCjw8Ci9MZW5ndGggMTk0Ci9TdWJ0eXBlIC9Gb3JtCi9GaWx0ZXIgL0ZsYXRlRGVjb2RlCi9UeXBlIC9YT2JqZWN0Ci9NYXRyaXggWzEgMCAwIDEgMCAwXQovRm9ybVR5cGUgMQovUmVzb3VyY2VzIDw8Ci9Qcm9jU2V0IFsvUERGIC9UZXh0IC9JbWFnZUIgL0ltYWdlQyAvSW1hZ2VJXQovRm9udCAyMzQgMCBSCj4+Ci9CQm94IFswIDAgODkuNiAzNS42Nl0KPj4Kc3RyZWFtDQp4nJWRsRICIQxEe74ipRZiEiBA68zZWckveIUzNv5/IY533A2hsWPeZHcTFiFbESArwALvh2HrfwhtWpCvrw4ljQhX5ddiYa76dgEUNWPslTwIZdG7cdZujvspFyyrqbbHlupRp3rfK73oSwNZlRpYu4XBJmGwiZC+S9qf7OYGTcTWxKaNgyairNody3q/5Fa25aZBF0m5pdYO/kFmcynmfCVIUGZDlSMQcP2l/PUWKC9zuJXpXk58LE8zFfMB+wiOgw0KZW5kc3RyZWFtCmVuZG9iago3NSAwIG9iago8PAovTGVuZ3RoIDIwMAovU3VidHlwZSAvRm9ybQovRmlsdGVyIC9GbGF0ZURlY29kZQovVHlwZSAvWE9iamVjdAovTWF0cml4IFsxIDAgMCAxIDAgMF0KL0Zvcm1UeXBlIDEKL1Jlc291cmNlcyA8PAovUHJvY1NldCBbL1BERiAvVGV4dCAvSW1hZ2VCIC9JbWFnZUMgL0ltYWdlSV0KL0ZvbnQgMjM1IDAgUgo+PgovQkJveCBbMCAwIDk4LjQgMzUuNjZdCj4+CnN0cmVhbQ0KeJyVkjEOwyAMRXdO4bFdKDhgzBo1VdSZKzRDpS69/9BEDU2Uz9INPexnG+MoWxHyVoiF3g/DNnyRs7qiMJ8OSBF5VzM3mecat2hXlubrA2Nf2ebjzjI0J1iDM/o6xv66WH07pugLDnMDvkmsVXeZGaeIjU4iRiW0iW+wiBUk4VypsYsUcLMJbClX2/aa2vgT2phf9UgyuHJjC1ksZv424/4gk+mLudw8KZXJ+Jk78sRqU1zcQuVlTvcsw7Ufx3N5mqGYDx0umlANCmVuZHN0cmVhbQplbmRvYmoKNzYgMCBvYmoKPDwKL0xlbmd0aCAzNjQ1Ci9Db2xvclNwYWNlIC9EZXZpY2VSR0IKL1N1YnR5cGUgL0ltYWdlCi9IZWlnaHQgNjAKL0ZpbHRlciAvRENURGVjb2RlCi9UeXBlIC9YT2JqZWN0Ci9XaWR0aCAxMTQKL0JpdHNQZXJDb21wb25lbnQgOAo+PgpzdHJlYW0NCv/Y/+AAEEpGSUYAAQEBAGAAYAAA/+EAIkV4aWYAAE1NACoAAAAIAAEBEgADAAAAAQABAAAAAAAA/9sAQwACAQECAQECAgICAgICAgMFAwMDAwMGBAQDBQcGBwcHBgcHCAkLCQgICggHBwoNCgoLDAwMDAcJDg8NDA4LDAwM/9sAQwECAgIDAwMGAwMGDAgHCAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwM/8AAEQgAPAByAwEiAAIRAQMRAf/EAB8AAAEFAQEBAQEBAAAAAAAAAAABAgMEBQYHCAkKC//EALUQAAIBAwMCBAMFBQQEAAABfQECAwAEEQUSITFBBhNRYQcicRQygZGhCCNCscEVUtHwJDNicoIJChYXGBkaJSYnKCkqNDU2Nzg5OkNERUZHSElKU1RVVldYWVpjZGVmZ2hpanN0dXZ3eHl6g4SFhoeIiYqSk5SVlpeYmZqio6Slpqeoqaqys7S1tre4ubrCw8TFxsfIycrS09TV1tfY2drh4uPk5ebn6Onq8fLz9PX29/j5+v/EAB8BAAMBAQEBAQEBAQEAAAAAAAABAgMEBQYHCAkKC//EALURAAIBAgQEAwQHBQQEAAECdwABAgMRBAUhMQYSQVEHYXETIjKBCBRCkaGxwQkjM1LwFWJy0QoWJDThJfEXGBkaJicoKSo1Njc4OTpDREVGR0hJSlNUVVZXWFlaY2RlZmdoaWpzdHV2d3h5eoKDhIWGh4iJipKTlJWWl5iZmqKjpKWmp6ipqrKztLW2t7i5usLDxMXGx8jJytLT1NXW19jZ2uLj5OXm5+jp6vLz9PX29/j5+v/aAAwDAQACEQMRAD8A/fyiivhj9tH9q34h/B/9oC60Hw34ifTdJjtLWVIDY2s+1nTLHfJEzHJ9TQB9z0V+Xf7Nv/BQb4v/ABF/aL8E6DrHjA3mk6xrMFjeQf2TYx+fEz7WG5IFdcgEZVgRnrX6iUAFFeI/t9/EvXfgz+yz4j8S+Gr86brVjLZLb3H2eK48sS3tvE/ySKyHKOw5U9eMHBr87x/wU1+OI/5nhv8AwS6b/wDI1AH6/UV+Sugf8FVvjNocwa41zS9WXH3b3R7bn6mFYj/ntXs3wg/4LTqt3BbeOvBnlxyAJLe6DOW8vnG77PMc7eRkiUnjoTgUAfoJRXHfCX40+Gfjr4W/trwtq1pq2nE7DJCx3xORkpIjANG4GDtYA4IPQgnsaACsPxx8QNH+Hulpfa1qNnptoz+WJLmURhmxnao6s2ATtUE4B9K3K+Nf2mruPWPijqUt9p0fiKfSnbT9J06d3Wy0+KK3guLi7uBuAKs864yyrgMXcqiqQD0bx7+3PoV/p7Q+DY7rWrjzY7eTUJbWW3srGSVwkaHzFV5JXJG2NFO4AkkIrkfQlfm/4Z+Ijap8WfA66lrmn6xcW+tWUOlaRppT+z7eRrhFE/7gLbIFyHAiLNI0aqwVSa/SCgAooooAK/OL/gpZYtYftRtM0YWO80a0mQj+MAyIT+a4/Cv0dr4g/wCCtngdrCbwf4vjjBhbzdFu5v7rH99bgj0/4+eeg47kZAPij9lDV4fDv7XXw7kuMhY/FVlCxHRS9yIgT6DLg/hX7bV/P/451CbRfGclxaySW0gkFzayo2HhbIYOP9oMDg1+wX7E/wC2bof7W3w7tbiG5t7fxZZW6JrOmCQLLDOAQ0iIeWgc/MrjOA21sMpAAKP/AAVSm8j9hjxgx/57aZ/6c7SvyNNyoTv0r9a/+CsLGH9gzxo2D8s+mHp/1FLSvxyl1H9y3+6aAPp7Qf8Agm18YPFvhaw1rTfDlneWOpWcd9alNWtQ80UiB0IVnBBKspwcdTnHfxvx14I1f4Y+IpdH8QaVqGi6tbgGa0vIDFIgPRhnh1PUOpKnsa/aj9mtvM/Z18ANjr4c04/+SkdeU/8ABR79mCx+P/7POrXkdpG/ibwpaTalpVwkYM7mJTJJa5xkrKisu0nAfy27YIB+av7OP7SmtfsyfEu28RaGxmUlY9RsXkKQapDuBaKTqAcfcfBKNgjI3K37MfDP4kaX8YPA+j+JNGkM+lazZx3ltIeGKOudrj+F1IKsp5VgQeQa/AddT3oGXkEZB9a/Ur/giV8SZPFn7N+veHZ5PM/4RXXJFtVB/wBXa3CCZR9TN9pb/gVAH2pX5kf8FgPHM+g/GGz8K2Ms1vZ6tpdrreqbJOL2XdLBCjDHCxpaqwXoWkyclVx94/G/9pLwj+zX4WbV/GGr2umQrETDbeYGur1h/BBCPnkY+wwOpIAJH43/ALQ3x3vP2rP2g9U8S3Fu1jHqkqw2tlv3/Y7aMbFjz3YKGLEcF2YjrQB61+zjFn43/DdVXcf+Ei0dsewvIc/oCfwr9fK/MT/gnj4MPxJ/aZ0278jzLPwvDJq1zJ0CuB5cCg4wCZHVgD2iY9q/TugAooooAK4v42/CDTPj38NNU8L6sxWx1KEoZEUGS3lBDRTJnjcjqGAIwcYPBIPaVm6v4q0/QtW0+xuryzt7zVWdLOCWdI5bpkXeyxoTlyFBYhQcAEnigD8Rf2qf2e/EHwL8ZNoPiS3EN3CzmwvEBNpqEAPEkT9wcfMOqMdrdCa8XGp3Xh/Uo5EkuLO8tjujkRmjeI9MqykEH3B71++3xW8L+D/i3Yt4S8TWehawZ7Vr5tLu3jaTygQhuFXIkUKxCiVcbS2NwJr4l/aM/wCCcvwWsfhRr3jfwv4k8QT6bouwz2mjXdnrkcbNIkW2MSyR4YFgSHmzjOOeCAfAev8A7QvjXxdpEmn6x4v8Tatps2PMs7zWLq4t5ApDLujdypwwB6DkA9QMcndX37lvm7Gv0E8T/wDBDzSdO8TQ6Mnxh0W11a8Xfa2N1pyxXF0OeUi+0lmHynlR2PpWLef8EPhJ4nGhL8a/DX9uSQ+cNObS/wDTGQ/xiH7SH29846c0Afot+zK+/wDZ0+Hvv4Y00/nax11nikf8U/ef7VtL/wCi2rk/hhc6T8MPCXhnwPca3ptzrWh6Ja2vkfaY47m4jghWNpxCW3BPlLZx0+lWtT+MHhXUfCbXv/CTeG49LvGeyS/bVYPs3nlSDGH37S4/ug54NAH8+Ol6kBptv83/ACyX+Qro/Cvxa8QfD5LhdA8Qa9oqXm3z107Up7QT7c7d4jZQ+3c2NwONzYxk5+zdD/4ITyLrj6Avxo8Ozaxp9uss9lHpf+lRR4GJGi+0l1U7lwSAOR6ir2j/APBEGxufFc2it8YPD9xq1nH5k9hb2IlvIF4O4w/aNwHzLywA+YetAHwje6vda/qJmmmur69k+9LI5lmk+rHk/ia9S/Z/+D3iD4meMYdH8OaZcaxrV1lRFbDMVpCTgu7n5Y0Hd3IHHGTgH7z8B/8ABIb4SfDzxFa2HibxhqGvas8TXSaWLu30sXcKBt8hhQmVlHUsrADBJJr6j+Bnhz4dfDb4e3EfgO38L2vh21J+1TaXPC8KsgJYzzBm3Mq4y0jFgKAMP9jP9l6z/ZY+GZ037RHqGvarItzq16qkLLKFwI0yAfKjyQuQCSzMQC20e0VleEfGOk+O9L+36PqGnarYsxRbmyuY7mFyOoDoSMg9RWrQAUUUUAFfKn/BRfxLD8GPjF8A/itrVpfP4J+HviDUv+Eiv7W2e5bSILzTJ7VLmREBYQLI43uAcZUYJZQfquigD8n/ANtD4t+H/wBsf9sbw5rXgy+utW+F+tHw78JfEetW0ctrbanJqXiGG7n0+CUqrPmC2HmNH8oEiqxxJg1f+C3HwL8E/sneHtDt/Anh7SPBun+P/Dmq6b4hstJh+z2urRWU2n3Ns0kQITzI5C5EmC/zkEkV+sf9mW3kRR/Z4PLgYPGnljbGR0IHYj2ovtLtdTUC5t4LgKCAJYw+AevX1oA/Lzwfcfs96FL450f9oLQZ9Q+Pd543vHvxdaXf3Gt6k0moP/ZkumNbDzvsv2f7PtS3YYWMgKQUB87+zfCW2/ZM1Twz4g0bWG/bM/tWYuqWVyfF83ihrlpILqG4Vdv2XbskDKwi8rLcvjd+xTWsbzpK0cbSRghHKjcoPUA9s4H5UC1jFx53lx+aF2B9o3bc5xn0z2oA/I3xd+z/AOGfH/8AwTc8dfEzxdpOm6h8U7v4pzW+p+IlbN0zP4ih0yeCOZcEW3kSPEIlwgBGApxj3Cz/AGDPg5df8FWNW8Gy/Dnwr/wirfCiHWf7GjtcWa3kupzWTXQiB2rIbaGJN6gEFS33jmvv4aVai3aH7Nb+SzbynljaWznOOmc859acthbrdm4EMInK7DIEG8rnOM9cZJOPU0Afj/8AD34Lab8P/wDgnV+zn8SPAenabpfxg1j4kQaXbeIVyLy9e5vr6xFvLM3LQNHHCmxvkCx+5J5H9mz4fXHxMvvh74N0XWvgz4R+Mmn60L4Sy+GvEUHj621S2JnujqVyWeM+YFdZDKvkMrFVA+UL+1i6TapBHEtrbiKFw8aCMbUYHIIGODnnI71N5EfmtJsXzGAUtjkgZIGfbJ/M0AfkufhNpPxJ/YM0P42avot14k1Dxn8Sbm/+K+qW0b3Oq3HheHV762uLWMxjzktUFtZ7oodu1InxhVIGX+2Jq3wL8YaVZah8AdJ0FfCWn6npkvxHvbDQtVHhZrBBK1p9vit/LWSOKR1lmVCJSWibLbX2/rzbWMNkgWGGKFRkgIgUDJyenqSTT4oI4E2xoqLkthRgZJJJ/Ekn8aAPz1/4JTeDH1j4/eNPGnhXxH8Hz4NbSo9G1nR/h9o+q6XpMupfu5be7VLwGJ5EhMkbNA2AsmGXcST+hlR29pFaQLFDFHFGgwqIoVV+gqSgAooooA//2Q0KZW5kc3RyZWFtCmVuZG9iago3NyAwIG9iago8PAovTGVuZ3RoIDQyMQovQ29sb3JTcGFjZSAvRGV2aWNlUkdCCi9TdWJ0eXBlIC9JbWFnZQovSGVpZ2h0IDEzMAovRmlsdGVyIC9GbGF0ZURlY29kZQovVHlwZSAvWE9iamVjdAovV2lkdGggMjU1Ci9TTWFzayA3OCAwIFIKL0JpdHNQZXJDb21wb25lbnQgOAo+PgpzdHJlYW0NCnic7dppboMwEAbQHKeH4P7iVrRqVYIImGGxjfB7yq8oy0R84y28XgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADA3fHW1Syhq6PvaJUBNQ9dWy8NI+FvW+NVv/OfTMuHnz6494DNi84xfwYWGrp8+jnzCfx8l3j6eLyWaLvI5Z3yGf/yiVFXdduU0aDEPkQE2Eu/Lz2OnhYUKyNODFLbrOua46JeHbfHF6cH5PYZ/tFVkVI9MEzRicWSOD9f5IjSr4Z35bvZ8hdmHW2nn+trwUlix5tocyYPht6ppStbLXXhmSZ04/Ya/nZmO8kcWs1batQs4eej6yhP+81VRRfWBLl3AheVtzl/W/GT1mcCN8K8kNkdQhZ+sdoc//0Ji7c/lA//Q2Qsz807XUnL2LmyCrw/2lFU6FW2GucquZG2E1yyUd+CuttBNRJPOWliSTb5r+X6JwF1t1kLAnZnTIcJsDvAkP9vA9KN2gQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwK19AxTN7t8NCmVuZHN0cmVhbQplbmRvYmoKNzggMCBvYmoKPDwKL0xlbmd0aCAyNDIKL0NvbG9yU3BhY2UgL0RldmljZUdyYXkKL1N1YnR5cGUgL0ltYWdlCi9IZWlnaHQgMTMwCi9GaWx0ZXIgL0ZsYXRlRGVjb2RlCi9UeXBlIC9YT2JqZWN0Ci9XaWR0aCAyNTUKL0JpdHNQZXJDb21wb25lbnQgOAo+PgpzdHJlYW0NCnic7dfrjoMgEAbQvv9LT7PJJmW5FdJtHNpzflQ0DuFDUXu7AQAAAAAAAAAAAAAAAJwmkvd3nC+fgHPiv2Wk58R/i7Pix3T39Q7zix/t0SLJqN3tbbsiofizmbY7lYunXmrjtp/EaeYpihugPXiGzsV/FiB+f6I+NXvu/x1f9rTbFgJFt3nIXDwZ5FKG4jl/Qua1MTYLefSanMbvV1xqYzzRaY17yxb0BfUbLKrtuOYjjOLPCsr1slGZTXRCdPY73zsfZn9hryySMzXXuP7Ai6pV//shCdeiZDa+TTxcPRQAAAAAAAAAAAAAAAAgkTudNIF/DQplbmRzdHJlYW0KZW5kb2JqCjc5IDAgb2JqCjw8Ci9GMSAyMzYgMCBSCi9GMTAgMjM3IDAgUgovRjExIDIzOCAwIFIKL0YxMiAyMzkgMCBSCi9GMTMgMjQwIDAgUgovRjE0IDI0MSAwIFIKL0YxNSAyNDIgMCBSCi9GMTYgMjQzIDAgUgovRjE3IDI0NCAwIFIKL0YxOCAyNDUgMCBSCi9GMTkgMjQ2IDAgUgovRjIgMjQ3IDAgUgovRjIwIDI0OCAwIFIKL0YyMSAyNDkgMCBSCi9GMjIgMjUwIDAgUgovRjIzIDI1MSAwIFIKL0YyNCAyNTIgMCBSCi9GMjUgMjUzIDAgUgovRjI2IDI1NCAwIFIKL0YyNyAyNTUgMCBSCi9GMjggMjU2IDAgUgovRjI5IDI1NyAwIFIKL0YzIDI1OCAwIFIKL0YzMCAyNTkgMCBSCi9GMzEgMjYwIDAgUgovRjMyIDI2MSAwIFIKL0YzMyAyNjIgMCBSCi9GMzQgMjYzIDAgUgovRjM1IDI2NCAwIFIKL0YzNiAyNjUgMCBSCi9GMzcgMjY2IDAgUgovRjM4IDI2NyAwIFIKL0YzOSAyNjggMCBSCi9GNCAyNjkgMCBSCi9GNDAgMjcwIDAgUgovRjQxIDI3MSAwIFIKL0Y0MiAyNzIgMCBSCi9GNDMgMjczIDAgUgovRjQ0IDI3NCAwIFIKL0Y0NSAyNzUgMCBSCi9GNDYgMjc2IDAgUgovRjQ3IDI3NyAwIFIKL0Y0OCAyNzggMCBSCi9GNDkgMjc5IDAgUgovRjUgMjgwIDAgUgovRjUwIDI4MSAwIFIKL0Y1MSAyODIgMCBSCi9GNTIgMjgzIDAgUgovRjUzIDI4NCAwIFIKL0Y2IDI4NSAwIFIKL0Y3IDI4NiAwIFIKL0Y4IDI4NyAwIFIKL0Y5IDI4OCAwIFIKPj4KZW5kb2JqCjgwIDAgb2JqCjw8Ci9MZW5ndGggNDgyCi9CQm94IFswIDAgMjAgMjBdCi9GaWx0ZXIgL0ZsYXRlRGVjb2RlCi9SZXNvdXJjZXMgPDwKPj4KL1N1YnR5cGUgL0Zvcm0KL1R5cGUgL1hPYmplY3QKPj4Kc3RyZWFtDQp4nFXWy20cMRBF0b2iYAhd/HSTAdkBOP+F2fCYdQba3IJYr55mgAtdJVaJ/fPn10+FO3zDE47Lwe1wPdwPA/b+5Pjk+OEHjuEwHRbDjn3+c4M7/MATXnCEQ3UwNsx9K+ZwO3hmV7zPL+AGD/jx/ddydegOt8NXwHRYDDt58IUMqhyecLgQbrxVhlWGVYZVBtc7H0qnyeEOD/iGJ7zMbA4mhetvwW7BHEzbbRsNGw0bDRsNDz9wGBQmhVFhVhgWpu2wymdYaXi4wTf8wMucr1CT3lLVHjlMB9N2WNAwaHJ4+sZHb0wO3cH9t0pw8OILuTh4+IEX/KZcHr88kcN0MOAqqb6CaVc2WlliZQctq2ST2dz3kWpaMfEuGPXg5K17De4wq+HuKsg3jZdYC0Z+shQO1rSKVs+qWVyKSjHpwc4DXuw7mvMmW4nqUBWqQRFoqq2g0pG1RtbCr4pTOyJH3NgzDgMiQPyXa+ztv10tJo+i+jQf4kv1FLSH9ZBey1ItSzVKKb9GqUYR/IbeMFrNHjV7oDksV7MSvlN32k7ZJRMYJAY5/xzwKRVZKrJJCqvBvA6ef/7B+WSnbhJrYkvsBf1hP+R3cBY0mCc8x73gYHAxOBncDI4GV4Ozwd3fP38BhgoXYQ0KZW5kc3RyZWFtCmVuZG9iago4MSAwIG9iago8PAovTGVuZ3RoIDE3NQovQkJveCBbMCAwIDIzNCAzMC44XQovRmlsdGVyIC9GbGF0ZURlY29kZQovUmVzb3VyY2VzIDw8Cj4+Ci9TdWJ0eXBlIC9Gb3JtCi9UeXBlIC9YT2JqZWN0Cj4+CnN0cmVhbQ0KeJyNUrkNwzAM7D2FJjD4ixwoGcD7F3EM5NExRRoBPNxDHUiDhg6lPcdx22z3c+bzfSEFM8dFsS9IpKnEL+hjrAoMrTVYm61Vs3VpLM8LijcQsRhPgk1mAJB9/ZzYAi0Z1Vqhvj9TQRKztyjmRJYEOqkgYow+ZquLZc9y/oFNKJCjcSJXxvT+22T8R86eVtSVlXhQhOcjTHhhbMgRbEkkUaW8avTZGv0937cHxjSgdw0KZW5kc3RyZWFtCmVuZG9iago4MiAwIG9iago8PAovRjEgMjg5IDAgUgovRjIgMjkwIDAgUgo+PgplbmRvYmoKODMgMCBvYmoKPDwKL0xlbmd0aCAxOTQKL1N1YnR5cGUgL0Zvcm0KL0ZpbHRlciAvRmxhdGVEZWNvZGUKL1R5cGUgL1hPYmplY3QKL01hdHJpeCBbMSAwIDAgMSAwIDBdCi9Gb3JtVHlwZSAxCi9SZXNvdXJjZXMgPDwKL1Byb2NTZXQgWy9QREYgL1RleHQgL0ltYWdlQiAvSW1hZ2VDIC9JbWFnZUldCi9Gb250IDI5MSAwIFIKPj4KL0JCb3ggWzAgMCA4OS42IDM1LjY2XQo+PgpzdHJlYW0NCniclZGxEgIhDER7viKlFmISIEDrzNlZyS94hTM2/n8hjnfcDaGxY95kdxMWIVsRICvAAu+HYet/CG1akK+vDiWNCFfl12Jhrvp2ARQ1Y+yVPAhl0btx1m6O+ykXLKuptseW6lGnet8rvehLA1mVGli7hcEmYbCJkL5L2p/s5gZNxNbEpo2DJqKs2h3Ler/kVrblpkEXSbml1g7+QWZzKeZ8JUhQZkOVIxBw/aX89RYoL3O4leleTnwsTzMV8wH7CI6DDQplbmRzdHJlYW0KZW5kb2JqCjg0IDAgb2JqCjw8Ci9MZW5ndGggMjEzCi9TdWJ0eXBlIC9Gb3JtCi9GaWx0ZXIgL0ZsYXRlRGVjb2RlCi9UeXBlIC9YT2JqZWN0Ci9NYXRyaXggWzEgMCAwIDEgMCAwXQovRm9ybVR5cGUgMQovUmVzb3VyY2VzIDw8Ci9Qcm9jU2V0IFsvUERGIC9UZXh0IC9JbWFnZUIgL0ltYWdlQyAvSW1hZ2VJXQovRm9udCAyOTIgMCBSCj4+Ci9CQm94IFswIDAgOTguNCAzNS42Nl0KPj4Kc3RyZWFtDQp4nJWSPQ7CMAxG95zCIywhdhLHWSuBxMJCBFwABiQW7j/Qqg1BdRa26unL818dZMsMaBmI4X03ZMOMnJUFhfFrhaSiKT4jpHUI/Whd6TFpRm7tIm+Vjbh29pPL1dZynmpvrYKP1dfeeqm+lgtOzxVU1SB6IdFpW6ROLugpYq7dtbeMejLuHIJZ102dXlLQd01J10hZb146/4QsZDrUQtTWs9p5jtqeWd8rf2/j/iAPMxSzOyAIlIfBkTtAILHRT26G8jKby/mabqfhuC1Psy/mA94lmi0NCmVuZHN0cmVhbQplbmRvYmoKODUgMCBvYmoKPDwKL0xlbmd0aCAzNjQ1Ci9Db2xvclNwYWNlIC9EZXZpY2VSR0IKL1N1YnR5cGUgL0ltYWdlCi9IZWlnaHQgNjAKL0ZpbHRlciAvRENURGVjb2RlCi9UeXBlIC9YT2JqZWN0Ci9XaWR0aCAxMTQKL0JpdHNQZXJDb21wb25lbnQgOAo+PgpzdHJlYW0NCv/Y/+AAEEpGSUYAAQEBAGAAYAAA/+EAIkV4aWYAAE1NACoAAAAIAAEBEgADAAAAAQABAAAAAAAA/9sAQwACAQECAQECAgICAgICAgMFAwMDAwMGBAQDBQcGBwcHBgcHCAkLCQgICggHBwoNCgoLDAwMDAcJDg8NDA4LDAwM/9sAQwECAgIDAwMGAwMGDAgHCAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwM/8AAEQgAPAByAwEiAAIRAQMRAf/EAB8AAAEFAQEBAQEBAAAAAAAAAAABAgMEBQYHCAkKC//EALUQAAIBAwMCBAMFBQQEAAABfQECAwAEEQUSITFBBhNRYQcicRQygZGhCCNCscEVUtHwJDNicoIJChYXGBkaJSYnKCkqNDU2Nzg5OkNERUZHSElKU1RVVldYWVpjZGVmZ2hpanN0dXZ3eHl6g4SFhoeIiYqSk5SVlpeYmZqio6Slpqeoqaqys7S1tre4ubrCw8TFxsfIycrS09TV1tfY2drh4uPk5ebn6Onq8fLz9PX29/j5+v/EAB8BAAMBAQEBAQEBAQEAAAAAAAABAgMEBQYHCAkKC//EALURAAIBAgQEAwQHBQQEAAECdwABAgMRBAUhMQYSQVEHYXETIjKBCBRCkaGxwQkjM1LwFWJy0QoWJDThJfEXGBkaJicoKSo1Njc4OTpDREVGR0hJSlNUVVZXWFlaY2RlZmdoaWpzdHV2d3h5eoKDhIWGh4iJipKTlJWWl5iZmqKjpKWmp6ipqrKztLW2t7i5usLDxMXGx8jJytLT1NXW19jZ2uLj5OXm5+jp6vLz9PX29/j5+v/aAAwDAQACEQMRAD8A/fyiivhj9tH9q34h/B/9oC60Hw34ifTdJjtLWVIDY2s+1nTLHfJEzHJ9TQB9z0V+Xf7Nv/BQb4v/ABF/aL8E6DrHjA3mk6xrMFjeQf2TYx+fEz7WG5IFdcgEZVgRnrX6iUAFFeI/t9/EvXfgz+yz4j8S+Gr86brVjLZLb3H2eK48sS3tvE/ySKyHKOw5U9eMHBr87x/wU1+OI/5nhv8AwS6b/wDI1AH6/UV+Sugf8FVvjNocwa41zS9WXH3b3R7bn6mFYj/ntXs3wg/4LTqt3BbeOvBnlxyAJLe6DOW8vnG77PMc7eRkiUnjoTgUAfoJRXHfCX40+Gfjr4W/trwtq1pq2nE7DJCx3xORkpIjANG4GDtYA4IPQgnsaACsPxx8QNH+Hulpfa1qNnptoz+WJLmURhmxnao6s2ATtUE4B9K3K+Nf2mruPWPijqUt9p0fiKfSnbT9J06d3Wy0+KK3guLi7uBuAKs864yyrgMXcqiqQD0bx7+3PoV/p7Q+DY7rWrjzY7eTUJbWW3srGSVwkaHzFV5JXJG2NFO4AkkIrkfQlfm/4Z+Ijap8WfA66lrmn6xcW+tWUOlaRppT+z7eRrhFE/7gLbIFyHAiLNI0aqwVSa/SCgAooooAK/OL/gpZYtYftRtM0YWO80a0mQj+MAyIT+a4/Cv0dr4g/wCCtngdrCbwf4vjjBhbzdFu5v7rH99bgj0/4+eeg47kZAPij9lDV4fDv7XXw7kuMhY/FVlCxHRS9yIgT6DLg/hX7bV/P/451CbRfGclxaySW0gkFzayo2HhbIYOP9oMDg1+wX7E/wC2bof7W3w7tbiG5t7fxZZW6JrOmCQLLDOAQ0iIeWgc/MrjOA21sMpAAKP/AAVSm8j9hjxgx/57aZ/6c7SvyNNyoTv0r9a/+CsLGH9gzxo2D8s+mHp/1FLSvxyl1H9y3+6aAPp7Qf8Agm18YPFvhaw1rTfDlneWOpWcd9alNWtQ80UiB0IVnBBKspwcdTnHfxvx14I1f4Y+IpdH8QaVqGi6tbgGa0vIDFIgPRhnh1PUOpKnsa/aj9mtvM/Z18ANjr4c04/+SkdeU/8ABR79mCx+P/7POrXkdpG/ibwpaTalpVwkYM7mJTJJa5xkrKisu0nAfy27YIB+av7OP7SmtfsyfEu28RaGxmUlY9RsXkKQapDuBaKTqAcfcfBKNgjI3K37MfDP4kaX8YPA+j+JNGkM+lazZx3ltIeGKOudrj+F1IKsp5VgQeQa/AddT3oGXkEZB9a/Ur/giV8SZPFn7N+veHZ5PM/4RXXJFtVB/wBXa3CCZR9TN9pb/gVAH2pX5kf8FgPHM+g/GGz8K2Ms1vZ6tpdrreqbJOL2XdLBCjDHCxpaqwXoWkyclVx94/G/9pLwj+zX4WbV/GGr2umQrETDbeYGur1h/BBCPnkY+wwOpIAJH43/ALQ3x3vP2rP2g9U8S3Fu1jHqkqw2tlv3/Y7aMbFjz3YKGLEcF2YjrQB61+zjFn43/DdVXcf+Ei0dsewvIc/oCfwr9fK/MT/gnj4MPxJ/aZ0278jzLPwvDJq1zJ0CuB5cCg4wCZHVgD2iY9q/TugAooooAK4v42/CDTPj38NNU8L6sxWx1KEoZEUGS3lBDRTJnjcjqGAIwcYPBIPaVm6v4q0/QtW0+xuryzt7zVWdLOCWdI5bpkXeyxoTlyFBYhQcAEnigD8Rf2qf2e/EHwL8ZNoPiS3EN3CzmwvEBNpqEAPEkT9wcfMOqMdrdCa8XGp3Xh/Uo5EkuLO8tjujkRmjeI9MqykEH3B71++3xW8L+D/i3Yt4S8TWehawZ7Vr5tLu3jaTygQhuFXIkUKxCiVcbS2NwJr4l/aM/wCCcvwWsfhRr3jfwv4k8QT6bouwz2mjXdnrkcbNIkW2MSyR4YFgSHmzjOOeCAfAev8A7QvjXxdpEmn6x4v8Tatps2PMs7zWLq4t5ApDLujdypwwB6DkA9QMcndX37lvm7Gv0E8T/wDBDzSdO8TQ6Mnxh0W11a8Xfa2N1pyxXF0OeUi+0lmHynlR2PpWLef8EPhJ4nGhL8a/DX9uSQ+cNObS/wDTGQ/xiH7SH29846c0Afot+zK+/wDZ0+Hvv4Y00/nax11nikf8U/ef7VtL/wCi2rk/hhc6T8MPCXhnwPca3ptzrWh6Ja2vkfaY47m4jghWNpxCW3BPlLZx0+lWtT+MHhXUfCbXv/CTeG49LvGeyS/bVYPs3nlSDGH37S4/ug54NAH8+Ol6kBptv83/ACyX+Qro/Cvxa8QfD5LhdA8Qa9oqXm3z107Up7QT7c7d4jZQ+3c2NwONzYxk5+zdD/4ITyLrj6Avxo8Ozaxp9uss9lHpf+lRR4GJGi+0l1U7lwSAOR6ir2j/APBEGxufFc2it8YPD9xq1nH5k9hb2IlvIF4O4w/aNwHzLywA+YetAHwje6vda/qJmmmur69k+9LI5lmk+rHk/ia9S/Z/+D3iD4meMYdH8OaZcaxrV1lRFbDMVpCTgu7n5Y0Hd3IHHGTgH7z8B/8ABIb4SfDzxFa2HibxhqGvas8TXSaWLu30sXcKBt8hhQmVlHUsrADBJJr6j+Bnhz4dfDb4e3EfgO38L2vh21J+1TaXPC8KsgJYzzBm3Mq4y0jFgKAMP9jP9l6z/ZY+GZ037RHqGvarItzq16qkLLKFwI0yAfKjyQuQCSzMQC20e0VleEfGOk+O9L+36PqGnarYsxRbmyuY7mFyOoDoSMg9RWrQAUUUUAFfKn/BRfxLD8GPjF8A/itrVpfP4J+HviDUv+Eiv7W2e5bSILzTJ7VLmREBYQLI43uAcZUYJZQfquigD8n/ANtD4t+H/wBsf9sbw5rXgy+utW+F+tHw78JfEetW0ctrbanJqXiGG7n0+CUqrPmC2HmNH8oEiqxxJg1f+C3HwL8E/sneHtDt/Anh7SPBun+P/Dmq6b4hstJh+z2urRWU2n3Ns0kQITzI5C5EmC/zkEkV+sf9mW3kRR/Z4PLgYPGnljbGR0IHYj2ovtLtdTUC5t4LgKCAJYw+AevX1oA/Lzwfcfs96FL450f9oLQZ9Q+Pd543vHvxdaXf3Gt6k0moP/ZkumNbDzvsv2f7PtS3YYWMgKQUB87+zfCW2/ZM1Twz4g0bWG/bM/tWYuqWVyfF83ihrlpILqG4Vdv2XbskDKwi8rLcvjd+xTWsbzpK0cbSRghHKjcoPUA9s4H5UC1jFx53lx+aF2B9o3bc5xn0z2oA/I3xd+z/AOGfH/8AwTc8dfEzxdpOm6h8U7v4pzW+p+IlbN0zP4ih0yeCOZcEW3kSPEIlwgBGApxj3Cz/AGDPg5df8FWNW8Gy/Dnwr/wirfCiHWf7GjtcWa3kupzWTXQiB2rIbaGJN6gEFS33jmvv4aVai3aH7Nb+SzbynljaWznOOmc859acthbrdm4EMInK7DIEG8rnOM9cZJOPU0Afj/8AD34Lab8P/wDgnV+zn8SPAenabpfxg1j4kQaXbeIVyLy9e5vr6xFvLM3LQNHHCmxvkCx+5J5H9mz4fXHxMvvh74N0XWvgz4R+Mmn60L4Sy+GvEUHj621S2JnujqVyWeM+YFdZDKvkMrFVA+UL+1i6TapBHEtrbiKFw8aCMbUYHIIGODnnI71N5EfmtJsXzGAUtjkgZIGfbJ/M0AfkufhNpPxJ/YM0P42avot14k1Dxn8Sbm/+K+qW0b3Oq3HheHV762uLWMxjzktUFtZ7oodu1InxhVIGX+2Jq3wL8YaVZah8AdJ0FfCWn6npkvxHvbDQtVHhZrBBK1p9vit/LWSOKR1lmVCJSWibLbX2/rzbWMNkgWGGKFRkgIgUDJyenqSTT4oI4E2xoqLkthRgZJJJ/Ekn8aAPz1/4JTeDH1j4/eNPGnhXxH8Hz4NbSo9G1nR/h9o+q6XpMupfu5be7VLwGJ5EhMkbNA2AsmGXcST+hlR29pFaQLFDFHFGgwqIoVV+gqSgAooooA//2Q0KZW5kc3RyZWFtCmVuZG9iago4NiAwIG9iago8PAovTGVuZ3RoIDQyMQovQ29sb3JTcGFjZSAvRGV2aWNlUkdCCi9TdWJ0eXBlIC9JbWFnZQovSGVpZ2h0IDEzMAovRmlsdGVyIC9GbGF0ZURlY29kZQovVHlwZSAvWE9iamVjdAovV2lkdGggMjU1Ci9TTWFzayA4NyAwIFIKL0JpdHNQZXJDb21wb25lbnQgOAo+PgpzdHJlYW0NCnic7dppboMwEAbQHKeH4P7iVrRqVYIImGGxjfB7yq8oy0R84y28XgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADA3fHW1Syhq6PvaJUBNQ9dWy8NI+FvW+NVv/OfTMuHnz6494DNi84xfwYWGrp8+jnzCfx8l3j6eLyWaLvI5Z3yGf/yiVFXdduU0aDEPkQE2Eu/Lz2OnhYUKyNODFLbrOua46JeHbfHF6cH5PYZ/tFVkVI9MEzRicWSOD9f5IjSr4Z35bvZ8hdmHW2nn+trwUlix5tocyYPht6ppStbLXXhmSZ04/Ya/nZmO8kcWs1batQs4eej6yhP+81VRRfWBLl3AheVtzl/W/GT1mcCN8K8kNkdQhZ+sdoc//0Ji7c/lA//Q2Qsz807XUnL2LmyCrw/2lFU6FW2GucquZG2E1yyUd+CuttBNRJPOWliSTb5r+X6JwF1t1kLAnZnTIcJsDvAkP9vA9KN2gQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwK19AxTN7t8NCmVuZHN0cmVhbQplbmRvYmoKODcgMCBvYmoKPDwKL0xlbmd0aCAyNDIKL0NvbG9yU3BhY2UgL0RldmljZUdyYXkKL1N1YnR5cGUgL0ltYWdlCi9IZWlnaHQgMTMwCi9GaWx0ZXIgL0ZsYXRlRGVjb2RlCi9UeXBlIC9YT2JqZWN0Ci9XaWR0aCAyNTUKL0JpdHNQZXJDb21wb25lbnQgOAo+PgpzdHJlYW0NCnic7dfrjoMgEAbQvv9LT7PJJmW5FdJtHNpzflQ0DuFDUXu7AQAAAAAAAAAAAAAAAJwmkvd3nC+fgHPiv2Wk58R/i7Pix3T39Q7zix/t0SLJqN3tbbsiofizmbY7lYunXmrjtp/EaeYpihugPXiGzsV/FiB+f6I+NXvu/x1f9rTbFgJFt3nIXDwZ5FKG4jl/Qua1MTYLefSanMbvV1xqYzzRaY17yxb0BfUbLKrtuOYjjOLPCsr1slGZTXRCdPY73zsfZn9hryySMzXXuP7Ai6pV//shCdeiZDa+TTxcPRQAAAAAAAAAAAAAAAAgkTudNIF/DQplbmRzdHJlYW0KZW5kb2JqCjg4IDAgb2JqCjw8Ci9GMSAyOTMgMCBSCi9GMTAgMjk0IDAgUgovRjExIDI5NSAwIFIKL0YxMiAyOTYgMCBSCi9GMTMgMjk3IDAgUgovRjE0IDI5OCAwIFIKL0YxNSAyOTkgMCBSCi9GMTYgMzAwIDAgUgovRjE3IDMwMSAwIFIKL0YxOCAzMDIgMCBSCi9GMTkgMzAzIDAgUgovRjIgMzA0IDAgUgovRjIwIDMwNSAwIFIKL0YyMSAzMDYgMCBSCi9GMjIgMzA3IDAgUgovRjIzIDMwOCAwIFIKL0YyNCAzMDkgMCBSCi9GMjUgMzEwIDAgUgovRjI2IDMxMSAwIFIKL0YyNyAzMTIgMCBSCi9GMjggMzEzIDAgUgovRjI5IDMxNCAwIFIKL0YzIDMxNSAwIFIKL0YzMCAzMTYgMCBSCi9GMzEgMzE3IDAgUgovRjMyIDMxOCAwIFIKL0YzMyAzMTkgMCBSCi9GMzQgMzIwIDAgUgovRjM1IDMyMSAwIFIKL0YzNiAzMjIgMCBSCi9GMzcgMzIzIDAgUgovRjM4IDMyNCAwIFIKL0YzOSAzMjUgMCBSCi9GNCAzMjYgMCBSCi9GNDAgMzI3IDAgUgovRjQxIDMyOCAwIFIKL0Y0MiAzMjkgMCBSCi9GNDMgMzMwIDAgUgovRjQ0IDMzMSAwIFIKL0Y0NSAzMzIgMCBSCi9GNDYgMzMzIDAgUgovRjQ3IDMzNCAwIFIKL0Y0OCAzMzUgMCBSCi9GNDkgMzM2IDAgUgovRjUgMzM3IDAgUgovRjUwIDMzOCAwIFIKL0Y1MSAzMzkgMCBSCi9GNTIgMzQwIDAgUgovRjUzIDM0MSAwIFIKL0Y2IDM0MiAwIFIKL0Y3IDM0MyAwIFIKL0Y4IDM0NCAwIFIKL0Y5IDM0NSAwIFIKPj4KZW5kb2JqCjg5IDAgb2JqCjw8Ci9MZW5ndGggNDgyCi9CQm94IFswIDAgMjAgMjBdCi9GaWx0ZXIgL0ZsYXRlRGVjb2RlCi9SZXNvdXJjZXMgPDwKPj4KL1N1YnR5cGUgL0Zvcm0KL1R5cGUgL1hPYmplY3QKPj4Kc3RyZWFtDQp4nFXWy20cMRBF0b2iYAhd/HSTAdkBOP+F2fCYdQba3IJYr55mgAtdJVaJ/fPn10+FO3zDE47Lwe1wPdwPA/b+5Pjk+OEHjuEwHRbDjn3+c4M7/MATXnCEQ3UwNsx9K+ZwO3hmV7zPL+AGD/jx/ddydegOt8NXwHRYDDt58IUMqhyecLgQbrxVhlWGVYZVBtc7H0qnyeEOD/iGJ7zMbA4mhetvwW7BHEzbbRsNGw0bDRsNDz9wGBQmhVFhVhgWpu2wymdYaXi4wTf8wMucr1CT3lLVHjlMB9N2WNAwaHJ4+sZHb0wO3cH9t0pw8OILuTh4+IEX/KZcHr88kcN0MOAqqb6CaVc2WlliZQctq2ST2dz3kWpaMfEuGPXg5K17De4wq+HuKsg3jZdYC0Z+shQO1rSKVs+qWVyKSjHpwc4DXuw7mvMmW4nqUBWqQRFoqq2g0pG1RtbCr4pTOyJH3NgzDgMiQPyXa+ztv10tJo+i+jQf4kv1FLSH9ZBey1ItSzVKKb9GqUYR/IbeMFrNHjV7oDksV7MSvlN32k7ZJRMYJAY5/xzwKRVZKrJJCqvBvA6ef/7B+WSnbhJrYkvsBf1hP+R3cBY0mCc8x73gYHAxOBncDI4GV4Ozwd3fP38BhgoXYQ0KZW5kc3RyZWFtCmVuZG9iago5MCAwIG9iago8PAovTGVuZ3RoIDE3NQovQkJveCBbMCAwIDIzNCAzMC44XQovRmlsdGVyIC9GbGF0ZURlY29kZQovUmVzb3VyY2VzIDw8Cj4+Ci9TdWJ0eXBlIC9Gb3JtCi9UeXBlIC9YT2JqZWN0Cj4+CnN0cmVhbQ0KeJyNUrkNwzAM7D2FJjD4ixwoGcD7F3EM5NExRRoBPNxDHUiDhg6lPcdx22z3c+bzfSEFM8dFsS9IpKnEL+hjrAoMrTVYm61Vs3VpLM8LijcQsRhPgk1mAJB9/ZzYAi0Z1Vqhvj9TQRKztyjmRJYEOqkgYow+ZquLZc9y/oFNKJCjcSJXxvT+22T8R86eVtSVlXhQhOcjTHhhbMgRbEkkUaW8avTZGv0937cHxjSgdw0KZW5kc3RyZWFtCmVuZG9iago5MSAwIG9iago8PAovRjEgMzQ2IDAgUgovRjIgMzQ3IDAgUgo+PgplbmRvYmoKOTIgMCBvYmoKPDwKL0xlbmd0aCAyNTIKL1N1YnR5cGUgL0Zvcm0KL0ZpbHRlciAvRmxhdGVEZWNvZGUKL1R5cGUgL1hPYmplY3QKL01hdHJpeCBbMSAwIDAgMSAwIDBdCi9Gb3JtVHlwZSAxCi9SZXNvdXJjZXMgPDwKL1Byb2NTZXQgWy9QREYgL1RleHQgL0ltYWdlQiAvSW1hZ2VDIC9JbWFnZUldCi9Gb250IDM0OCAwIFIKPj4KL0JCb3ggWzAgMCAxMzMuNiAzNS42Nl0KPj4Kc3RyZWFtDQp4nJVTMVIEMQzr84qUXBMsJ3GSlhl4wfZUXMEMDf8v2OPIhlm5uS6jtWRL9kocySwiWVSL3x9BU7lDkvofVPbXL3T7dof6hFYVZDKXGPL+PFHRJpaTzqZOV2XEuIM6k2Q998w1KVXZZC61IqxWOI/GamVMV0utKneodmbWwWqGRHWWE/myI5GVZXP20Bz/zdhrc2bpwi56oYMgrT54z8O5h+HMMTrfA8QZBFI5KQjdK6BERXEOFk4CUGcd0GMf/+jaeEnI4rjJTM5HOvIQdA0vW3h+Q+xxuwbsuETE/Z/ae+BWuH2FJ2hvZWSTChmjdeg7LttneN3CD8gBzSoNCmVuZHN0cmVhbQplbmRvYmoKOTMgMCBvYmoKPDwKL0xlbmd0aCAyMDUKL1N1YnR5cGUgL0Zvcm0KL0ZpbHRlciAvRmxhdGVEZWNvZGUKL1R5cGUgL1hPYmplY3QKL01hdHJpeCBbMSAwIDAgMSAwIDBdCi9Gb3JtVHlwZSAxCi9SZXNvdXJjZXMgPDwKL1Byb2NTZXQgWy9QREYgL1RleHQgL0ltYWdlQiAvSW1hZ2VDIC9JbWFnZUldCi9Gb250IDM0OSAwIFIKPj4KL0JCb3ggWzAgMCA5OC40IDM1LjY2XQo+PgpzdHJlYW0NCniclZE7DgIxDET7nMIlNCF2EicpQYItkKhScAG2QKLh/gW7Yj8osw2d9RSP3yiOilUltkqi9H4YseGLnM0TCsPUoIyIHW6yH3KbA5yQiWs3xVsBpnhBJo9R+0u8zG5rvo9z2g9bPH6aOuwVQrsZFo/1amT0jRsmUdtNhe7KaKYeG2ia2ZqWHLqliG5J0S0VfJc3XPLiMg4Tg7QCbmXDo2x4lLz88x+kN6dqDhemTLU3PHBHTJJskDFbqb7M7tjduirX+74+zbmaD5Z9mZENCmVuZHN0cmVhbQplbmRvYmoKOTQgMCBvYmoKPDwKL0xlbmd0aCAzNjQ1Ci9Db2xvclNwYWNlIC9EZXZpY2VSR0IKL1N1YnR5cGUgL0ltYWdlCi9IZWlnaHQgNjAKL0ZpbHRlciAvRENURGVjb2RlCi9UeXBlIC9YT2JqZWN0Ci9XaWR0aCAxMTQKL0JpdHNQZXJDb21wb25lbnQgOAo+PgpzdHJlYW0NCv/Y/+AAEEpGSUYAAQEBAGAAYAAA/+EAIkV4aWYAAE1NACoAAAAIAAEBEgADAAAAAQABAAAAAAAA/9sAQwACAQECAQECAgICAgICAgMFAwMDAwMGBAQDBQcGBwcHBgcHCAkLCQgICggHBwoNCgoLDAwMDAcJDg8NDA4LDAwM/9sAQwECAgIDAwMGAwMGDAgHCAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwM/8AAEQgAPAByAwEiAAIRAQMRAf/EAB8AAAEFAQEBAQEBAAAAAAAAAAABAgMEBQYHCAkKC//EALUQAAIBAwMCBAMFBQQEAAABfQECAwAEEQUSITFBBhNRYQcicRQygZGhCCNCscEVUtHwJDNicoIJChYXGBkaJSYnKCkqNDU2Nzg5OkNERUZHSElKU1RVVldYWVpjZGVmZ2hpanN0dXZ3eHl6g4SFhoeIiYqSk5SVlpeYmZqio6Slpqeoqaqys7S1tre4ubrCw8TFxsfIycrS09TV1tfY2drh4uPk5ebn6Onq8fLz9PX29/j5+v/EAB8BAAMBAQEBAQEBAQEAAAAAAAABAgMEBQYHCAkKC//EALURAAIBAgQEAwQHBQQEAAECdwABAgMRBAUhMQYSQVEHYXETIjKBCBRCkaGxwQkjM1LwFWJy0QoWJDThJfEXGBkaJicoKSo1Njc4OTpDREVGR0hJSlNUVVZXWFlaY2RlZmdoaWpzdHV2d3h5eoKDhIWGh4iJipKTlJWWl5iZmqKjpKWmp6ipqrKztLW2t7i5usLDxMXGx8jJytLT1NXW19jZ2uLj5OXm5+jp6vLz9PX29/j5+v/aAAwDAQACEQMRAD8A/fyiivhj9tH9q34h/B/9oC60Hw34ifTdJjtLWVIDY2s+1nTLHfJEzHJ9TQB9z0V+Xf7Nv/BQb4v/ABF/aL8E6DrHjA3mk6xrMFjeQf2TYx+fEz7WG5IFdcgEZVgRnrX6iUAFFeI/t9/EvXfgz+yz4j8S+Gr86brVjLZLb3H2eK48sS3tvE/ySKyHKOw5U9eMHBr87x/wU1+OI/5nhv8AwS6b/wDI1AH6/UV+Sugf8FVvjNocwa41zS9WXH3b3R7bn6mFYj/ntXs3wg/4LTqt3BbeOvBnlxyAJLe6DOW8vnG77PMc7eRkiUnjoTgUAfoJRXHfCX40+Gfjr4W/trwtq1pq2nE7DJCx3xORkpIjANG4GDtYA4IPQgnsaACsPxx8QNH+Hulpfa1qNnptoz+WJLmURhmxnao6s2ATtUE4B9K3K+Nf2mruPWPijqUt9p0fiKfSnbT9J06d3Wy0+KK3guLi7uBuAKs864yyrgMXcqiqQD0bx7+3PoV/p7Q+DY7rWrjzY7eTUJbWW3srGSVwkaHzFV5JXJG2NFO4AkkIrkfQlfm/4Z+Ijap8WfA66lrmn6xcW+tWUOlaRppT+z7eRrhFE/7gLbIFyHAiLNI0aqwVSa/SCgAooooAK/OL/gpZYtYftRtM0YWO80a0mQj+MAyIT+a4/Cv0dr4g/wCCtngdrCbwf4vjjBhbzdFu5v7rH99bgj0/4+eeg47kZAPij9lDV4fDv7XXw7kuMhY/FVlCxHRS9yIgT6DLg/hX7bV/P/451CbRfGclxaySW0gkFzayo2HhbIYOP9oMDg1+wX7E/wC2bof7W3w7tbiG5t7fxZZW6JrOmCQLLDOAQ0iIeWgc/MrjOA21sMpAAKP/AAVSm8j9hjxgx/57aZ/6c7SvyNNyoTv0r9a/+CsLGH9gzxo2D8s+mHp/1FLSvxyl1H9y3+6aAPp7Qf8Agm18YPFvhaw1rTfDlneWOpWcd9alNWtQ80UiB0IVnBBKspwcdTnHfxvx14I1f4Y+IpdH8QaVqGi6tbgGa0vIDFIgPRhnh1PUOpKnsa/aj9mtvM/Z18ANjr4c04/+SkdeU/8ABR79mCx+P/7POrXkdpG/ibwpaTalpVwkYM7mJTJJa5xkrKisu0nAfy27YIB+av7OP7SmtfsyfEu28RaGxmUlY9RsXkKQapDuBaKTqAcfcfBKNgjI3K37MfDP4kaX8YPA+j+JNGkM+lazZx3ltIeGKOudrj+F1IKsp5VgQeQa/AddT3oGXkEZB9a/Ur/giV8SZPFn7N+veHZ5PM/4RXXJFtVB/wBXa3CCZR9TN9pb/gVAH2pX5kf8FgPHM+g/GGz8K2Ms1vZ6tpdrreqbJOL2XdLBCjDHCxpaqwXoWkyclVx94/G/9pLwj+zX4WbV/GGr2umQrETDbeYGur1h/BBCPnkY+wwOpIAJH43/ALQ3x3vP2rP2g9U8S3Fu1jHqkqw2tlv3/Y7aMbFjz3YKGLEcF2YjrQB61+zjFn43/DdVXcf+Ei0dsewvIc/oCfwr9fK/MT/gnj4MPxJ/aZ0278jzLPwvDJq1zJ0CuB5cCg4wCZHVgD2iY9q/TugAooooAK4v42/CDTPj38NNU8L6sxWx1KEoZEUGS3lBDRTJnjcjqGAIwcYPBIPaVm6v4q0/QtW0+xuryzt7zVWdLOCWdI5bpkXeyxoTlyFBYhQcAEnigD8Rf2qf2e/EHwL8ZNoPiS3EN3CzmwvEBNpqEAPEkT9wcfMOqMdrdCa8XGp3Xh/Uo5EkuLO8tjujkRmjeI9MqykEH3B71++3xW8L+D/i3Yt4S8TWehawZ7Vr5tLu3jaTygQhuFXIkUKxCiVcbS2NwJr4l/aM/wCCcvwWsfhRr3jfwv4k8QT6bouwz2mjXdnrkcbNIkW2MSyR4YFgSHmzjOOeCAfAev8A7QvjXxdpEmn6x4v8Tatps2PMs7zWLq4t5ApDLujdypwwB6DkA9QMcndX37lvm7Gv0E8T/wDBDzSdO8TQ6Mnxh0W11a8Xfa2N1pyxXF0OeUi+0lmHynlR2PpWLef8EPhJ4nGhL8a/DX9uSQ+cNObS/wDTGQ/xiH7SH29846c0Afot+zK+/wDZ0+Hvv4Y00/nax11nikf8U/ef7VtL/wCi2rk/hhc6T8MPCXhnwPca3ptzrWh6Ja2vkfaY47m4jghWNpxCW3BPlLZx0+lWtT+MHhXUfCbXv/CTeG49LvGeyS/bVYPs3nlSDGH37S4/ug54NAH8+Ol6kBptv83/ACyX+Qro/Cvxa8QfD5LhdA8Qa9oqXm3z107Up7QT7c7d4jZQ+3c2NwONzYxk5+zdD/4ITyLrj6Avxo8Ozaxp9uss9lHpf+lRR4GJGi+0l1U7lwSAOR6ir2j/APBEGxufFc2it8YPD9xq1nH5k9hb2IlvIF4O4w/aNwHzLywA+YetAHwje6vda/qJmmmur69k+9LI5lmk+rHk/ia9S/Z/+D3iD4meMYdH8OaZcaxrV1lRFbDMVpCTgu7n5Y0Hd3IHHGTgH7z8B/8ABIb4SfDzxFa2HibxhqGvas8TXSaWLu30sXcKBt8hhQmVlHUsrADBJJr6j+Bnhz4dfDb4e3EfgO38L2vh21J+1TaXPC8KsgJYzzBm3Mq4y0jFgKAMP9jP9l6z/ZY+GZ037RHqGvarItzq16qkLLKFwI0yAfKjyQuQCSzMQC20e0VleEfGOk+O9L+36PqGnarYsxRbmyuY7mFyOoDoSMg9RWrQAUUUUAFfKn/BRfxLD8GPjF8A/itrVpfP4J+HviDUv+Eiv7W2e5bSILzTJ7VLmREBYQLI43uAcZUYJZQfquigD8n/ANtD4t+H/wBsf9sbw5rXgy+utW+F+tHw78JfEetW0ctrbanJqXiGG7n0+CUqrPmC2HmNH8oEiqxxJg1f+C3HwL8E/sneHtDt/Anh7SPBun+P/Dmq6b4hstJh+z2urRWU2n3Ns0kQITzI5C5EmC/zkEkV+sf9mW3kRR/Z4PLgYPGnljbGR0IHYj2ovtLtdTUC5t4LgKCAJYw+AevX1oA/Lzwfcfs96FL450f9oLQZ9Q+Pd543vHvxdaXf3Gt6k0moP/ZkumNbDzvsv2f7PtS3YYWMgKQUB87+zfCW2/ZM1Twz4g0bWG/bM/tWYuqWVyfF83ihrlpILqG4Vdv2XbskDKwi8rLcvjd+xTWsbzpK0cbSRghHKjcoPUA9s4H5UC1jFx53lx+aF2B9o3bc5xn0z2oA/I3xd+z/AOGfH/8AwTc8dfEzxdpOm6h8U7v4pzW+p+IlbN0zP4ih0yeCOZcEW3kSPEIlwgBGApxj3Cz/AGDPg5df8FWNW8Gy/Dnwr/wirfCiHWf7GjtcWa3kupzWTXQiB2rIbaGJN6gEFS33jmvv4aVai3aH7Nb+SzbynljaWznOOmc859acthbrdm4EMInK7DIEG8rnOM9cZJOPU0Afj/8AD34Lab8P/wDgnV+zn8SPAenabpfxg1j4kQaXbeIVyLy9e5vr6xFvLM3LQNHHCmxvkCx+5J5H9mz4fXHxMvvh74N0XWvgz4R+Mmn60L4Sy+GvEUHj621S2JnujqVyWeM+YFdZDKvkMrFVA+UL+1i6TapBHEtrbiKFw8aCMbUYHIIGODnnI71N5EfmtJsXzGAUtjkgZIGfbJ/M0AfkufhNpPxJ/YM0P42avot14k1Dxn8Sbm/+K+qW0b3Oq3HheHV762uLWMxjzktUFtZ7oodu1InxhVIGX+2Jq3wL8YaVZah8AdJ0FfCWn6npkvxHvbDQtVHhZrBBK1p9vit/LWSOKR1lmVCJSWibLbX2/rzbWMNkgWGGKFRkgIgUDJyenqSTT4oI4E2xoqLkthRgZJJJ/Ekn8aAPz1/4JTeDH1j4/eNPGnhXxH8Hz4NbSo9G1nR/h9o+q6XpMupfu5be7VLwGJ5EhMkbNA2AsmGXcST+hlR29pFaQLFDFHFGgwqIoVV+gqSgAooooA//2Q0KZW5kc3RyZWFtCmVuZG9iago5NSAwIG9iago8PAovTGVuZ3RoIDQyMQovQ29sb3JTcGFjZSAvRGV2aWNlUkdCCi9TdWJ0eXBlIC9JbWFnZQovSGVpZ2h0IDEzMAovRmlsdGVyIC9GbGF0ZURlY29kZQovVHlwZSAvWE9iamVjdAovV2lkdGggMjU1Ci9TTWFzayA5NiAwIFIKL0JpdHNQZXJDb21wb25lbnQgOAo+PgpzdHJlYW0NCnic7dppboMwEAbQHKeH4P7iVrRqVYIImGGxjfB7yq8oy0R84y28XgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADA3fHW1Syhq6PvaJUBNQ9dWy8NI+FvW+NVv/OfTMuHnz6494DNi84xfwYWGrp8+jnzCfx8l3j6eLyWaLvI5Z3yGf/yiVFXdduU0aDEPkQE2Eu/Lz2OnhYUKyNODFLbrOua46JeHbfHF6cH5PYZ/tFVkVI9MEzRicWSOD9f5IjSr4Z35bvZ8hdmHW2nn+trwUlix5tocyYPht6ppStbLXXhmSZ04/Ya/nZmO8kcWs1batQs4eej6yhP+81VRRfWBLl3AheVtzl/W/GT1mcCN8K8kNkdQhZ+sdoc//0Ji7c/lA//Q2Qsz807XUnL2LmyCrw/2lFU6FW2GucquZG2E1yyUd+CuttBNRJPOWliSTb5r+X6JwF1t1kLAnZnTIcJsDvAkP9vA9KN2gQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwK19AxTN7t8NCmVuZHN0cmVhbQplbmRvYmoKOTYgMCBvYmoKPDwKL0xlbmd0aCAyNDIKL0NvbG9yU3BhY2UgL0RldmljZUdyYXkKL1N1YnR5cGUgL0ltYWdlCi9IZWlnaHQgMTMwCi9GaWx0ZXIgL0ZsYXRlRGVjb2RlCi9UeXBlIC9YT2JqZWN0Ci9XaWR0aCAyNTUKL0JpdHNQZXJDb21wb25lbnQgOAo+PgpzdHJlYW0NCnic7dfrjoMgEAbQvv9LT7PJJmW5FdJtHNpzflQ0DuFDUXu7AQAAAAAAAAAAAAAAAJwmkvd3nC+fgHPiv2Wk58R/i7Pix3T39Q7zix/t0SLJqN3tbbsiofizmbY7lYunXmrjtp/EaeYpihugPXiGzsV/FiB+f6I+NXvu/x1f9rTbFgJFt3nIXDwZ5FKG4jl/Qua1MTYLefSanMbvV1xqYzzRaY17yxb0BfUbLKrtuOYjjOLPCsr1slGZTXRCdPY73zsfZn9hryySMzXXuP7Ai6pV//shCdeiZDa+TTxcPRQAAAAAAAAAAAAAAAAgkTudNIF/DQplbmRzdHJlYW0KZW5kb2JqCjk3IDAgb2JqCjw8Ci9GMSAzNTAgMCBSCi9GMTAgMzUxIDAgUgovRjExIDM1MiAwIFIKL0YxMiAzNTMgMCBSCi9GMTMgMzU0IDAgUgovRjE0IDM1NSAwIFIKL0YxNSAzNTYgMCBSCi9GMTYgMzU3IDAgUgovRjE3IDM1OCAwIFIKL0YxOCAzNTkgMCBSCi9GMTkgMzYwIDAgUgovRjIgMzYxIDAgUgovRjIwIDM2MiAwIFIKL0YyMSAzNjMgMCBSCi9GMjIgMzY0IDAgUgovRjIzIDM2NSAwIFIKL0YyNCAzNjYgMCBSCi9GMjUgMzY3IDAgUgovRjI2IDM2OCAwIFIKL0YyNyAzNjkgMCBSCi9GMjggMzcwIDAgUgovRjI5IDM3MSAwIFIKL0YzIDM3MiAwIFIKL0YzMCAzNzMgMCBSCi9GMzEgMzc0IDAgUgovRjMyIDM3NSAwIFIKL0YzMyAzNzYgMCBSCi9GMzQgMzc3IDAgUgovRjM1IDM3OCAwIFIKL0YzNiAzNzkgMCBSCi9GMzcgMzgwIDAgUgovRjM4IDM4MSAwIFIKL0YzOSAzODIgMCBSCi9GNCAzODMgMCBSCi9GNDAgMzg0IDAgUgovRjQxIDM4NSAwIFIKL0Y0MiAzODYgMCBSCi9GNDMgMzg3IDAgUgovRjQ0IDM4OCAwIFIKL0Y0NSAzODkgMCBSCi9GNDYgMzkwIDAgUgovRjQ3IDM5MSAwIFIKL0Y0OCAzOTIgMCBSCi9GNDkgMzkzIDAgUgovRjUgMzk0IDAgUgovRjUwIDM5NSAwIFIKL0Y1MSAzOTYgMCBSCi9GNTIgMzk3IDAgUgovRjUzIDM5OCAwIFIKL0Y2IDM5OSAwIFIKL0Y3IDQwMCAwIFIKL0Y4IDQwMSAwIFIKL0Y5IDQwMiAwIFIKPj4KZW5kb2JqCjk4IDAgb2JqCjw8Ci9MZW5ndGggNDgyCi9CQm94IFswIDAgMjAgMjBdCi9GaWx0ZXIgL0ZsYXRlRGVjb2RlCi9SZXNvdXJjZXMgPDwKPj4KL1N1YnR5cGUgL0Zvcm0KL1R5cGUgL1hPYmplY3QKPj4Kc3RyZWFtDQp4nFXWy20cMRBF0b2iYAhd/HSTAdkBOP+F2fCYdQba3IJYr55mgAtdJVaJ/fPn10+FO3zDE47Lwe1wPdwPA/b+5Pjk+OEHjuEwHRbDjn3+c4M7/MATXnCEQ3UwNsx9K+ZwO3hmV7zPL+AGD/jx/ddydegOt8NXwHRYDDt58IUMqhyecLgQbrxVhlWGVYZVBtc7H0qnyeEOD/iGJ7zMbA4mhetvwW7BHEzbbRsNGw0bDRsNDz9wGBQmhVFhVhgWpu2wymdYaXi4wTf8wMucr1CT3lLVHjlMB9N2WNAwaHJ4+sZHb0wO3cH9t0pw8OILuTh4+IEX/KZcHr88kcN0MOAqqb6CaVc2WlliZQctq2ST2dz3kWpaMfEuGPXg5K17De4wq+HuKsg3jZdYC0Z+shQO1rSKVs+qWVyKSjHpwc4DXuw7mvMmW4nqUBWqQRFoqq2g0pG1RtbCr4pTOyJH3NgzDgMiQPyXa+ztv10tJo+i+jQf4kv1FLSH9ZBey1ItSzVKKb9GqUYR/IbeMFrNHjV7oDksV7MSvlN32k7ZJRMYJAY5/xzwKRVZKrJJCqvBvA6ef/7B+WSnbhJrYkvsBf1hP+R3cBY0mCc8x73gYHAxOBncDI4GV4Ozwd3fP38BhgoXYQ0KZW5kc3RyZWFtCmVuZG9iago5OSAwIG9iago8PAovTGVuZ3RoIDE3NQovQkJveCBbMCAwIDIzNCAzMC44XQovRmlsdGVyIC9GbGF0ZURlY29kZQovUmVzb3VyY2VzIDw8Cj4+Ci9TdWJ0eXBlIC9Gb3JtCi9UeXBlIC9YT2JqZWN0Cj4+CnN0cmVhbQ0KeJyNUrkNwzAM7D2FJjD4ixwoGcD7F3EM5NExRRoBPNxDHUiDhg6lPcdx22z3c+bzfSEFM8dFsS9IpKnEL+hjrAoMrTVYm61Vs3VpLM8LijcQsRhPgk1mAJB9/ZzYAi0Z1Vqhvj9TQRKztyjmRJYEOqkgYow+ZquLZc9y/oFNKJCjcSJXxvT+22T8R86eVtSVlXhQhOcjTHhhbMgRbEkkUaW8avTZGv0937cHxjSgdw0KZW5kc3RyZWFtCmVuZG9iagoxMDAgMCBvYmoKPDwKL0YxIDQwMyAwIFIKL0YyIDQwNCAwIFIKPj4KZW5kb2JqCjEwMSAwIG9iago8PAovTGVuZ3RoIDI2OQovU3VidHlwZSAvRm9ybQovRmlsdGVyIC9GbGF0ZURlY29kZQovVHlwZSAvWE9iamVjdAovTWF0cml4IFsxIDAgMCAxIDAgMF0KL0Zvcm1UeXBlIDEKL1Jlc291cmNlcyA8PAovUHJvY1NldCBbL1BERiAvVGV4dCAvSW1hZ2VCIC9JbWFnZUMgL0ltYWdlSV0KL0ZvbnQgNDA1IDAgUgo+PgovQkJveCBbMCAwIDE1MS4yIDM1LjY2XQo+PgpzdHJlYW0NCniclVMxbgMxDNv9Co/N4oqyLdtrgeYFt3dqhgJd+v+hlyaOg6OWbgZPJCWCJ3Eks4hkUS3+fAZN5QZJ6neo7K8/6PrtBvUJrSnIZC4x5P15oKJNLCedpo6rMmLsoM4mWY+euSalKZvMpVaE1Qrn0VitjHnVUqvKDtWOzDpYzZBoznKiu+yRyMqyiYOViS1ua+zRnF26k0knh84zTiJDuUrDWH90vgGifASksgvEq+fq5xMdhYsHUC5Ad8qtmdOCVqfy6mSBzOTsrZOZunr6DDr/KQoH4VUVFY9b/gVdwtsWXs+IPW6XgB2XiKj7HfUqb3H7Di/Q3srIJhUyRmsj79l94LR9hfct/ALB2+aDDQplbmRzdHJlYW0KZW5kb2JqCjEwMiAwIG9iago8PAovTGVuZ3RoIDE5OQovU3VidHlwZSAvRm9ybQovRmlsdGVyIC9GbGF0ZURlY29kZQovVHlwZSAvWE9iamVjdAovTWF0cml4IFsxIDAgMCAxIDAgMF0KL0Zvcm1UeXBlIDEKL1Jlc291cmNlcyA8PAovUHJvY1NldCBbL1BERiAvVGV4dCAvSW1hZ2VCIC9JbWFnZUMgL0ltYWdlSV0KL0ZvbnQgNDA2IDAgUgo+PgovQkJveCBbMCAwIDk4LjQgMzUuNjZdCj4+CnN0cmVhbQ0KeJyVkb0OwjAMhPc8RUZYgu38r5VgQGJBeQU6ILHw/gOt2rRVLgtb9Ol8OZ9JZxOCZhO0BP19KTFuQWTSitz0alBCxALETq6NPUdkQguZv14JZJCAuWRLsU9aad2tN5DMhjp50OWq292ca1UO9na5brTPecF+vKsbHHSdNgJ3GEyGzgUiYUdRsKMI/jFjR4mwowT+CTQZWsydC+TOBXLa8v9BRjUUdbmxTrqMiidOmrXMG/GsKx91Gjzdn49C5/JW16J+kiCXyw0KZW5kc3RyZWFtCmVuZG9iagoxMDMgMCBvYmoKPDwKL0xlbmd0aCAzNjQ1Ci9Db2xvclNwYWNlIC9EZXZpY2VSR0IKL1N1YnR5cGUgL0ltYWdlCi9IZWlnaHQgNjAKL0ZpbHRlciAvRENURGVjb2RlCi9UeXBlIC9YT2JqZWN0Ci9XaWR0aCAxMTQKL0JpdHNQZXJDb21wb25lbnQgOAo+PgpzdHJlYW0NCv/Y/+AAEEpGSUYAAQEBAGAAYAAA/+EAIkV4aWYAAE1NACoAAAAIAAEBEgADAAAAAQABAAAAAAAA/9sAQwACAQECAQECAgICAgICAgMFAwMDAwMGBAQDBQcGBwcHBgcHCAkLCQgICggHBwoNCgoLDAwMDAcJDg8NDA4LDAwM/9sAQwECAgIDAwMGAwMGDAgHCAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwM/8AAEQgAPAByAwEiAAIRAQMRAf/EAB8AAAEFAQEBAQEBAAAAAAAAAAABAgMEBQYHCAkKC//EALUQAAIBAwMCBAMFBQQEAAABfQECAwAEEQUSITFBBhNRYQcicRQygZGhCCNCscEVUtHwJDNicoIJChYXGBkaJSYnKCkqNDU2Nzg5OkNERUZHSElKU1RVVldYWVpjZGVmZ2hpanN0dXZ3eHl6g4SFhoeIiYqSk5SVlpeYmZqio6Slpqeoqaqys7S1tre4ubrCw8TFxsfIycrS09TV1tfY2drh4uPk5ebn6Onq8fLz9PX29/j5+v/EAB8BAAMBAQEBAQEBAQEAAAAAAAABAgMEBQYHCAkKC//EALURAAIBAgQEAwQHBQQEAAECdwABAgMRBAUhMQYSQVEHYXETIjKBCBRCkaGxwQkjM1LwFWJy0QoWJDThJfEXGBkaJicoKSo1Njc4OTpDREVGR0hJSlNUVVZXWFlaY2RlZmdoaWpzdHV2d3h5eoKDhIWGh4iJipKTlJWWl5iZmqKjpKWmp6ipqrKztLW2t7i5usLDxMXGx8jJytLT1NXW19jZ2uLj5OXm5+jp6vLz9PX29/j5+v/aAAwDAQACEQMRAD8A/fyiivhj9tH9q34h/B/9oC60Hw34ifTdJjtLWVIDY2s+1nTLHfJEzHJ9TQB9z0V+Xf7Nv/BQb4v/ABF/aL8E6DrHjA3mk6xrMFjeQf2TYx+fEz7WG5IFdcgEZVgRnrX6iUAFFeI/t9/EvXfgz+yz4j8S+Gr86brVjLZLb3H2eK48sS3tvE/ySKyHKOw5U9eMHBr87x/wU1+OI/5nhv8AwS6b/wDI1AH6/UV+Sugf8FVvjNocwa41zS9WXH3b3R7bn6mFYj/ntXs3wg/4LTqt3BbeOvBnlxyAJLe6DOW8vnG77PMc7eRkiUnjoTgUAfoJRXHfCX40+Gfjr4W/trwtq1pq2nE7DJCx3xORkpIjANG4GDtYA4IPQgnsaACsPxx8QNH+Hulpfa1qNnptoz+WJLmURhmxnao6s2ATtUE4B9K3K+Nf2mruPWPijqUt9p0fiKfSnbT9J06d3Wy0+KK3guLi7uBuAKs864yyrgMXcqiqQD0bx7+3PoV/p7Q+DY7rWrjzY7eTUJbWW3srGSVwkaHzFV5JXJG2NFO4AkkIrkfQlfm/4Z+Ijap8WfA66lrmn6xcW+tWUOlaRppT+z7eRrhFE/7gLbIFyHAiLNI0aqwVSa/SCgAooooAK/OL/gpZYtYftRtM0YWO80a0mQj+MAyIT+a4/Cv0dr4g/wCCtngdrCbwf4vjjBhbzdFu5v7rH99bgj0/4+eeg47kZAPij9lDV4fDv7XXw7kuMhY/FVlCxHRS9yIgT6DLg/hX7bV/P/451CbRfGclxaySW0gkFzayo2HhbIYOP9oMDg1+wX7E/wC2bof7W3w7tbiG5t7fxZZW6JrOmCQLLDOAQ0iIeWgc/MrjOA21sMpAAKP/AAVSm8j9hjxgx/57aZ/6c7SvyNNyoTv0r9a/+CsLGH9gzxo2D8s+mHp/1FLSvxyl1H9y3+6aAPp7Qf8Agm18YPFvhaw1rTfDlneWOpWcd9alNWtQ80UiB0IVnBBKspwcdTnHfxvx14I1f4Y+IpdH8QaVqGi6tbgGa0vIDFIgPRhnh1PUOpKnsa/aj9mtvM/Z18ANjr4c04/+SkdeU/8ABR79mCx+P/7POrXkdpG/ibwpaTalpVwkYM7mJTJJa5xkrKisu0nAfy27YIB+av7OP7SmtfsyfEu28RaGxmUlY9RsXkKQapDuBaKTqAcfcfBKNgjI3K37MfDP4kaX8YPA+j+JNGkM+lazZx3ltIeGKOudrj+F1IKsp5VgQeQa/AddT3oGXkEZB9a/Ur/giV8SZPFn7N+veHZ5PM/4RXXJFtVB/wBXa3CCZR9TN9pb/gVAH2pX5kf8FgPHM+g/GGz8K2Ms1vZ6tpdrreqbJOL2XdLBCjDHCxpaqwXoWkyclVx94/G/9pLwj+zX4WbV/GGr2umQrETDbeYGur1h/BBCPnkY+wwOpIAJH43/ALQ3x3vP2rP2g9U8S3Fu1jHqkqw2tlv3/Y7aMbFjz3YKGLEcF2YjrQB61+zjFn43/DdVXcf+Ei0dsewvIc/oCfwr9fK/MT/gnj4MPxJ/aZ0278jzLPwvDJq1zJ0CuB5cCg4wCZHVgD2iY9q/TugAooooAK4v42/CDTPj38NNU8L6sxWx1KEoZEUGS3lBDRTJnjcjqGAIwcYPBIPaVm6v4q0/QtW0+xuryzt7zVWdLOCWdI5bpkXeyxoTlyFBYhQcAEnigD8Rf2qf2e/EHwL8ZNoPiS3EN3CzmwvEBNpqEAPEkT9wcfMOqMdrdCa8XGp3Xh/Uo5EkuLO8tjujkRmjeI9MqykEH3B71++3xW8L+D/i3Yt4S8TWehawZ7Vr5tLu3jaTygQhuFXIkUKxCiVcbS2NwJr4l/aM/wCCcvwWsfhRr3jfwv4k8QT6bouwz2mjXdnrkcbNIkW2MSyR4YFgSHmzjOOeCAfAev8A7QvjXxdpEmn6x4v8Tatps2PMs7zWLq4t5ApDLujdypwwB6DkA9QMcndX37lvm7Gv0E8T/wDBDzSdO8TQ6Mnxh0W11a8Xfa2N1pyxXF0OeUi+0lmHynlR2PpWLef8EPhJ4nGhL8a/DX9uSQ+cNObS/wDTGQ/xiH7SH29846c0Afot+zK+/wDZ0+Hvv4Y00/nax11nikf8U/ef7VtL/wCi2rk/hhc6T8MPCXhnwPca3ptzrWh6Ja2vkfaY47m4jghWNpxCW3BPlLZx0+lWtT+MHhXUfCbXv/CTeG49LvGeyS/bVYPs3nlSDGH37S4/ug54NAH8+Ol6kBptv83/ACyX+Qro/Cvxa8QfD5LhdA8Qa9oqXm3z107Up7QT7c7d4jZQ+3c2NwONzYxk5+zdD/4ITyLrj6Avxo8Ozaxp9uss9lHpf+lRR4GJGi+0l1U7lwSAOR6ir2j/APBEGxufFc2it8YPD9xq1nH5k9hb2IlvIF4O4w/aNwHzLywA+YetAHwje6vda/qJmmmur69k+9LI5lmk+rHk/ia9S/Z/+D3iD4meMYdH8OaZcaxrV1lRFbDMVpCTgu7n5Y0Hd3IHHGTgH7z8B/8ABIb4SfDzxFa2HibxhqGvas8TXSaWLu30sXcKBt8hhQmVlHUsrADBJJr6j+Bnhz4dfDb4e3EfgO38L2vh21J+1TaXPC8KsgJYzzBm3Mq4y0jFgKAMP9jP9l6z/ZY+GZ037RHqGvarItzq16qkLLKFwI0yAfKjyQuQCSzMQC20e0VleEfGOk+O9L+36PqGnarYsxRbmyuY7mFyOoDoSMg9RWrQAUUUUAFfKn/BRfxLD8GPjF8A/itrVpfP4J+HviDUv+Eiv7W2e5bSILzTJ7VLmREBYQLI43uAcZUYJZQfquigD8n/ANtD4t+H/wBsf9sbw5rXgy+utW+F+tHw78JfEetW0ctrbanJqXiGG7n0+CUqrPmC2HmNH8oEiqxxJg1f+C3HwL8E/sneHtDt/Anh7SPBun+P/Dmq6b4hstJh+z2urRWU2n3Ns0kQITzI5C5EmC/zkEkV+sf9mW3kRR/Z4PLgYPGnljbGR0IHYj2ovtLtdTUC5t4LgKCAJYw+AevX1oA/Lzwfcfs96FL450f9oLQZ9Q+Pd543vHvxdaXf3Gt6k0moP/ZkumNbDzvsv2f7PtS3YYWMgKQUB87+zfCW2/ZM1Twz4g0bWG/bM/tWYuqWVyfF83ihrlpILqG4Vdv2XbskDKwi8rLcvjd+xTWsbzpK0cbSRghHKjcoPUA9s4H5UC1jFx53lx+aF2B9o3bc5xn0z2oA/I3xd+z/AOGfH/8AwTc8dfEzxdpOm6h8U7v4pzW+p+IlbN0zP4ih0yeCOZcEW3kSPEIlwgBGApxj3Cz/AGDPg5df8FWNW8Gy/Dnwr/wirfCiHWf7GjtcWa3kupzWTXQiB2rIbaGJN6gEFS33jmvv4aVai3aH7Nb+SzbynljaWznOOmc859acthbrdm4EMInK7DIEG8rnOM9cZJOPU0Afj/8AD34Lab8P/wDgnV+zn8SPAenabpfxg1j4kQaXbeIVyLy9e5vr6xFvLM3LQNHHCmxvkCx+5J5H9mz4fXHxMvvh74N0XWvgz4R+Mmn60L4Sy+GvEUHj621S2JnujqVyWeM+YFdZDKvkMrFVA+UL+1i6TapBHEtrbiKFw8aCMbUYHIIGODnnI71N5EfmtJsXzGAUtjkgZIGfbJ/M0AfkufhNpPxJ/YM0P42avot14k1Dxn8Sbm/+K+qW0b3Oq3HheHV762uLWMxjzktUFtZ7oodu1InxhVIGX+2Jq3wL8YaVZah8AdJ0FfCWn6npkvxHvbDQtVHhZrBBK1p9vit/LWSOKR1lmVCJSWibLbX2/rzbWMNkgWGGKFRkgIgUDJyenqSTT4oI4E2xoqLkthRgZJJJ/Ekn8aAPz1/4JTeDH1j4/eNPGnhXxH8Hz4NbSo9G1nR/h9o+q6XpMupfu5be7VLwGJ5EhMkbNA2AsmGXcST+hlR29pFaQLFDFHFGgwqIoVV+gqSgAooooA//2Q0KZW5kc3RyZWFtCmVuZG9iagoxMDQgMCBvYmoKPDwKL0xlbmd0aCA0MjEKL0NvbG9yU3BhY2UgL0RldmljZVJHQgovU3VidHlwZSAvSW1hZ2UKL0hlaWdodCAxMzAKL0ZpbHRlciAvRmxhdGVEZWNvZGUKL1R5cGUgL1hPYmplY3QKL1dpZHRoIDI1NQovU01hc2sgMTA1IDAgUgovQml0c1BlckNvbXBvbmVudCA4Cj4+CnN0cmVhbQ0KeJzt2mlugzAQBtAcp4fg/uJWtGpVggiYYbGN8HvKryjLRHzjLbxeAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMDd8dbVLKGro+9olQE1D11bLw0j4W9b41W/859My4efPrj3gM2LzjF/BhYaunz6OfMJ/HyXePp4vJZou8jlnfIZ//KJUVd125TRoMQ+RATYS78vPY6eFhQrI04MUtus65rjol4dt8cXpwfk9hn+0VWRUj0wTNGJxZI4P1/kiNKvhnflu9nyF2Ydbaef62vBSWLHm2hzJg+G3qmlK1stdeGZJnTj9hr+dmY7yRxazVtq1Czh56PrKE/7zVVFF9YEuXcCF5W3OX9b8ZPWZwI3wryQ2R1CFn6x2hz//QmLtz+UD/9DZCzPzTtdScvYubIKvD/aUVToVbYa5yq5kbYTXLJR34K620E1Ek85aWJJNvmv5fonAXW3WQsCdmdMhwmwO8CQ/28D0o3aBAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADArX0DFM3u3w0KZW5kc3RyZWFtCmVuZG9iagoxMDUgMCBvYmoKPDwKL0xlbmd0aCAyNDIKL0NvbG9yU3BhY2UgL0RldmljZUdyYXkKL1N1YnR5cGUgL0ltYWdlCi9IZWlnaHQgMTMwCi9GaWx0ZXIgL0ZsYXRlRGVjb2RlCi9UeXBlIC9YT2JqZWN0Ci9XaWR0aCAyNTUKL0JpdHNQZXJDb21wb25lbnQgOAo+PgpzdHJlYW0NCnic7dfrjoMgEAbQvv9LT7PJJmW5FdJtHNpzflQ0DuFDUXu7AQAAAAAAAAAAAAAAAJwmkvd3nC+fgHPiv2Wk58R/i7Pix3T39Q7zix/t0SLJqN3tbbsiofizmbY7lYunXmrjtp/EaeYpihugPXiGzsV/FiB+f6I+NXvu/x1f9rTbFgJFt3nIXDwZ5FKG4jl/Qua1MTYLefSanMbvV1xqYzzRaY17yxb0BfUbLKrtuOYjjOLPCsr1slGZTXRCdPY73zsfZn9hryySMzXXuP7Ai6pV//shCdeiZDa+TTxcPRQAAAAAAAAAAAAAAAAgkTudNIF/DQplbmRzdHJlYW0KZW5kb2JqCjEwNiAwIG9iago8PAovRjEgNDA3IDAgUgovRjEwIDQwOCAwIFIKL0YxMSA0MDkgMCBSCi9GMTIgNDEwIDAgUgovRjEzIDQxMSAwIFIKL0YxNCA0MTIgMCBSCi9GMTUgNDEzIDAgUgovRjE2IDQxNCAwIFIKL0YxNyA0MTUgMCBSCi9GMTggNDE2IDAgUgovRjE5IDQxNyAwIFIKL0YyIDQxOCAwIFIKL0YyMCA0MTkgMCBSCi9GMjEgNDIwIDAgUgovRjIyIDQyMSAwIFIKL0YyMyA0MjIgMCBSCi9GMjQgNDIzIDAgUgovRjI1IDQyNCAwIFIKL0YyNiA0MjUgMCBSCi9GMjcgNDI2IDAgUgovRjI4IDQyNyAwIFIKL0YyOSA0MjggMCBSCi9GMyA0MjkgMCBSCi9GMzAgNDMwIDAgUgovRjMxIDQzMSAwIFIKL0YzMiA0MzIgMCBSCi9GMzMgNDMzIDAgUgovRjM0IDQzNCAwIFIKL0YzNSA0MzUgMCBSCi9GMzYgNDM2IDAgUgovRjM3IDQzNyAwIFIKL0YzOCA0MzggMCBSCi9GMzkgNDM5IDAgUgovRjQgNDQwIDAgUgovRjQwIDQ0MSAwIFIKL0Y0MSA0NDIgMCBSCi9GNDIgNDQzIDAgUgovRjQzIDQ0NCAwIFIKL0Y0NCA0NDUgMCBSCi9GNDUgNDQ2IDAgUgovRjQ2IDQ0NyAwIFIKL0Y0NyA0NDggMCBSCi9GNDggNDQ5IDAgUgovRjQ5IDQ1MCAwIFIKL0Y1IDQ1MSAwIFIKL0Y1MCA0NTIgMCBSCi9GNTEgNDUzIDAgUgovRjUyIDQ1NCAwIFIKL0Y1MyA0NTUgMCBSCi9GNiA0NTYgMCBSCi9GNyA0NTcgMCBSCi9GOCA0NTggMCBSCi9GOSA0NTkgMCBSCj4+CmVuZG9iagoxMDcgMCBvYmoKPDwKL0xlbmd0aCA0ODIKL0JCb3ggWzAgMCAyMCAyMF0KL0ZpbHRlciAvRmxhdGVEZWNvZGUKL1Jlc291cmNlcyA8PAo+PgovU3VidHlwZSAvRm9ybQovVHlwZSAvWE9iamVjdAo+PgpzdHJlYW0NCnicVdbLbRwxEEXRvaJgCF38dJMB2QE4/4XZ8Jh1BtrcglivnmaAC10lVon98+fXT4U7fMMTjsvB7XA93A8D9v7k+OT44QeO4TAdFsOOff5zgzv8wBNecIRDdTA2zH0r5nA7eGZXvM8v4AYP+PH913J16A63w1fAdFgMO3nwhQyqHJ5wuBBuvFWGVYZVhlUG1zsfSqfJ4Q4P+IYnvMxsDiaF62/BbsEcTNttGw0bDRsNGw0PP3AYFCaFUWFWGBam7bDKZ1hpeLjBN/zAy5yvUJPeUtUeOUwH03ZY0DBocnj6xkdvTA7dwf23SnDw4gu5OHj4gRf8plwevzyRw3Qw4CqpvoJpVzZaWWJlBy2rZJPZ3PeRalox8S4Y9eDkrXsN7jCr4e4qyDeNl1gLRn6yFA7WtIpWz6pZXIpKMenBzgNe7Dua8yZbiepQFapBEWiqraDSkbVG1sKvilM7Ikfc2DMOAyJA/Jdr7O2/XS0mj6L6NB/iS/UUtIf1kF7LUi1LNUopv0apRhH8ht4wWs0eNXugOSxXsxK+U3faTtklExgkBjn/HPApFVkqskkKq8G8Dp5//sH5ZKduEmtiS+wF/WE/5HdwFjSYJzzHveBgcDE4GdwMjgZXg7PB3d8/fwGGChdhDQplbmRzdHJlYW0KZW5kb2JqCjEwOCAwIG9iago8PAovTGVuZ3RoIDE3NQovQkJveCBbMCAwIDIzNCAzMC44XQovRmlsdGVyIC9GbGF0ZURlY29kZQovUmVzb3VyY2VzIDw8Cj4+Ci9TdWJ0eXBlIC9Gb3JtCi9UeXBlIC9YT2JqZWN0Cj4+CnN0cmVhbQ0KeJyNUrkNwzAM7D2FJjD4ixwoGcD7F3EM5NExRRoBPNxDHUiDhg6lPcdx22z3c+bzfSEFM8dFsS9IpKnEL+hjrAoMrTVYm61Vs3VpLM8LijcQsRhPgk1mAJB9/ZzYAi0Z1Vqhvj9TQRKztyjmRJYEOqkgYow+ZquLZc9y/oFNKJCjcSJXxvT+22T8R86eVtSVlXhQhOcjTHhhbMgRbEkkUaW8avTZGv0937cHxjSgdw0KZW5kc3RyZWFtCmVuZG9iagoxMDkgMCBvYmoKPDwKL0YxIDQ2MCAwIFIKL0YyIDQ2MSAwIFIKPj4KZW5kb2JqCjExMCAwIG9iago8PAovTGVuZ3RoIDI2OQovU3VidHlwZSAvRm9ybQovRmlsdGVyIC9GbGF0ZURlY29kZQovVHlwZSAvWE9iamVjdAovTWF0cml4IFsxIDAgMCAxIDAgMF0KL0Zvcm1UeXBlIDEKL1Jlc291cmNlcyA8PAovUHJvY1NldCBbL1BERiAvVGV4dCAvSW1hZ2VCIC9JbWFnZUMgL0ltYWdlSV0KL0ZvbnQgNDYyIDAgUgo+PgovQkJveCBbMCAwIDE1MS4yIDM1LjY2XQo+PgpzdHJlYW0NCniclVMxbgMxDNv9Co/N4oqyLdtrgeYFt3dqhgJd+v+hlyaOg6OWbgZPJCWCJ3Eks4hkUS3+fAZN5QZJ6neo7K8/6PrtBvUJrSnIZC4x5P15oKJNLCedpo6rMmLsoM4mWY+euSalKZvMpVaE1Qrn0VitjHnVUqvKDtWOzDpYzZBoznKiu+yRyMqyiYOViS1ua+zRnF26k0knh84zTiJDuUrDWH90vgGifASksgvEq+fq5xMdhYsHUC5Ad8qtmdOCVqfy6mSBzOTsrZOZunr6DDr/KQoH4VUVFY9b/gVdwtsWXs+IPW6XgB2XiKj7HfUqb3H7Di/Q3srIJhUyRmsj79l94LR9hfct/ALB2+aDDQplbmRzdHJlYW0KZW5kb2JqCjExMSAwIG9iago8PAovTGVuZ3RoIDIwMwovU3VidHlwZSAvRm9ybQovRmlsdGVyIC9GbGF0ZURlY29kZQovVHlwZSAvWE9iamVjdAovTWF0cml4IFsxIDAgMCAxIDAgMF0KL0Zvcm1UeXBlIDEKL1Jlc291cmNlcyA8PAovUHJvY1NldCBbL1BERiAvVGV4dCAvSW1hZ2VCIC9JbWFnZUMgL0ltYWdlSV0KL0ZvbnQgNDYzIDAgUgo+PgovQkJveCBbMCAwIDk4LjQgMzUuNjZdCj4+CnN0cmVhbQ0KeJyVkb0OAiEQhHueYkttkOVngfYSjXZq8BG0MLHx/Qvv4nFnGBo78oWZnZ01lLUIsRayQu+7stp/kdFpRn58NShVtAqZtW2/sa9uk+3M4ihp/lmDI+yS5CecIHMGEzvbTnVBI0uYznNNt07wMNNLR5mrcmXBYk9BcFcxQDo5JGBzErH1aLCl6FAbO53EjH6pc53kcbMEJIN/DuifBb3ychvzB3mooajdgSlReSgeuSEmm3QMk7dQeanNZbieb6ej25an2hf1Ae/XmnANCmVuZHN0cmVhbQplbmRvYmoKMTEyIDAgb2JqCjw8Ci9MZW5ndGggMzY0NQovQ29sb3JTcGFjZSAvRGV2aWNlUkdCCi9TdWJ0eXBlIC9JbWFnZQovSGVpZ2h0IDYwCi9GaWx0ZXIgL0RDVERlY29kZQovVHlwZSAvWE9iamVjdAovV2lkdGggMTE0Ci9CaXRzUGVyQ29tcG9uZW50IDgKPj4Kc3RyZWFtDQr/2P/gABBKRklGAAEBAQBgAGAAAP/hACJFeGlmAABNTQAqAAAACAABARIAAwAAAAEAAQAAAAAAAP/bAEMAAgEBAgEBAgICAgICAgIDBQMDAwMDBgQEAwUHBgcHBwYHBwgJCwkICAoIBwcKDQoKCwwMDAwHCQ4PDQwOCwwMDP/bAEMBAgICAwMDBgMDBgwIBwgMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDP/AABEIADwAcgMBIgACEQEDEQH/xAAfAAABBQEBAQEBAQAAAAAAAAAAAQIDBAUGBwgJCgv/xAC1EAACAQMDAgQDBQUEBAAAAX0BAgMABBEFEiExQQYTUWEHInEUMoGRoQgjQrHBFVLR8CQzYnKCCQoWFxgZGiUmJygpKjQ1Njc4OTpDREVGR0hJSlNUVVZXWFlaY2RlZmdoaWpzdHV2d3h5eoOEhYaHiImKkpOUlZaXmJmaoqOkpaanqKmqsrO0tba3uLm6wsPExcbHyMnK0tPU1dbX2Nna4eLj5OXm5+jp6vHy8/T19vf4+fr/xAAfAQADAQEBAQEBAQEBAAAAAAAAAQIDBAUGBwgJCgv/xAC1EQACAQIEBAMEBwUEBAABAncAAQIDEQQFITEGEkFRB2FxEyIygQgUQpGhscEJIzNS8BVictEKFiQ04SXxFxgZGiYnKCkqNTY3ODk6Q0RFRkdISUpTVFVWV1hZWmNkZWZnaGlqc3R1dnd4eXqCg4SFhoeIiYqSk5SVlpeYmZqio6Slpqeoqaqys7S1tre4ubrCw8TFxsfIycrS09TV1tfY2dri4+Tl5ufo6ery8/T19vf4+fr/2gAMAwEAAhEDEQA/AP38oor4Y/bR/at+Ifwf/aAutB8N+In03SY7S1lSA2NrPtZ0yx3yRMxyfU0Afc9Ffl3+zb/wUG+L/wARf2i/BOg6x4wN5pOsazBY3kH9k2MfnxM+1huSBXXIBGVYEZ61+olABRXiP7ffxL134M/ss+I/Evhq/Om61Yy2S29x9niuPLEt7bxP8kishyjsOVPXjBwa/O8f8FNfjiP+Z4b/AMEum/8AyNQB+v1FfkroH/BVb4zaHMGuNc0vVlx9290e25+phWI/57V7N8IP+C06rdwW3jrwZ5ccgCS3ugzlvL5xu+zzHO3kZIlJ46E4FAH6CUVx3wl+NPhn46+Fv7a8LataatpxOwyQsd8TkZKSIwDRuBg7WAOCD0IJ7GgArD8cfEDR/h7paX2tajZ6baM/liS5lEYZsZ2qOrNgE7VBOAfStyvjX9pq7j1j4o6lLfadH4in0p20/SdOnd1stPiit4Li4u7gbgCrPOuMsq4DF3KoqkA9G8e/tz6Ff6e0Pg2O61q482O3k1CW1lt7KxklcJGh8xVeSVyRtjRTuAJJCK5H0JX5v+GfiI2qfFnwOupa5p+sXFvrVlDpWkaaU/s+3ka4RRP+4C2yBchwIizSNGqsFUmv0goAKKKKACvzi/4KWWLWH7UbTNGFjvNGtJkI/jAMiE/muPwr9Ha+IP8AgrZ4Hawm8H+L44wYW83Rbub+6x/fW4I9P+PnnoOO5GQD4o/ZQ1eHw7+118O5LjIWPxVZQsR0UvciIE+gy4P4V+21fz/+OdQm0XxnJcWskltIJBc2sqNh4WyGDj/aDA4NfsF+xP8Atm6H+1t8O7W4hube38WWVuiazpgkCywzgENIiHloHPzK4zgNtbDKQACj/wAFUpvI/YY8YMf+e2mf+nO0r8jTcqE79K/Wv/grCxh/YM8aNg/LPph6f9RS0r8cpdR/ct/umgD6e0H/AIJtfGDxb4WsNa03w5Z3ljqVnHfWpTVrUPNFIgdCFZwQSrKcHHU5x38b8deCNX+GPiKXR/EGlahourW4BmtLyAxSID0YZ4dT1DqSp7Gv2o/ZrbzP2dfADY6+HNOP/kpHXlP/AAUe/Zgsfj/+zzq15HaRv4m8KWk2paVcJGDO5iUySWucZKyorLtJwH8tu2CAfmr+zj+0prX7MnxLtvEWhsZlJWPUbF5CkGqQ7gWik6gHH3HwSjYIyNyt+zHwz+JGl/GDwPo/iTRpDPpWs2cd5bSHhijrna4/hdSCrKeVYEHkGvwHXU96Bl5BGQfWv1K/4IlfEmTxZ+zfr3h2eTzP+EV1yRbVQf8AV2twgmUfUzfaW/4FQB9qV+ZH/BYDxzPoPxhs/CtjLNb2eraXa63qmyTi9l3SwQowxwsaWqsF6FpMnJVcfePxv/aS8I/s1+Fm1fxhq9rpkKxEw23mBrq9YfwQQj55GPsMDqSACR+N/wC0N8d7z9qz9oPVPEtxbtYx6pKsNrZb9/2O2jGxY892ChixHBdmI60Aetfs4xZ+N/w3VV3H/hItHbHsLyHP6An8K/XyvzE/4J4+DD8Sf2mdNu/I8yz8LwyatcydArgeXAoOMAmR1YA9omPav07oAKKKKACuL+Nvwg0z49/DTVPC+rMVsdShKGRFBkt5QQ0UyZ43I6hgCMHGDwSD2lZur+KtP0LVtPsbq8s7e81VnSzglnSOW6ZF3ssaE5chQWIUHABJ4oA/EX9qn9nvxB8C/GTaD4ktxDdws5sLxATaahADxJE/cHHzDqjHa3QmvFxqd14f1KORJLizvLY7o5EZo3iPTKspBB9we9fvt8VvC/g/4t2LeEvE1noWsGe1a+bS7t42k8oEIbhVyJFCsQolXG0tjcCa+Jf2jP8AgnL8FrH4Ua9438L+JPEE+m6LsM9po13Z65HGzSJFtjEskeGBYEh5s4zjnggHwHr/AO0L418XaRJp+seL/E2rabNjzLO81i6uLeQKQy7o3cqcMAeg5APUDHJ3V9+5b5uxr9BPE/8AwQ80nTvE0OjJ8YdFtdWvF32tjdacsVxdDnlIvtJZh8p5Udj6Vi3n/BD4SeJxoS/Gvw1/bkkPnDTm0v8A0xkP8Yh+0h9vfOOnNAH6Lfsyvv8A2dPh77+GNNP52sddZ4pH/FP3n+1bS/8Aotq5P4YXOk/DDwl4Z8D3Gt6bc61oeiWtr5H2mOO5uI4IVjacQltwT5S2cdPpVrU/jB4V1Hwm17/wk3huPS7xnskv21WD7N55Ugxh9+0uP7oOeDQB/PjpepAabb/N/wAsl/kK6Pwr8WvEHw+S4XQPEGvaKl5t89dO1Ke0E+3O3eI2UPt3NjcDjc2MZOfs3Q/+CE8i64+gL8aPDs2safbrLPZR6X/pUUeBiRovtJdVO5cEgDkeoq9o/wDwRBsbnxXNorfGDw/catZx+ZPYW9iJbyBeDuMP2jcB8y8sAPmHrQB8I3ur3Wv6iZpprq+vZPvSyOZZpPqx5P4mvUv2f/g94g+JnjGHR/DmmXGsa1dZURWwzFaQk4Lu5+WNB3dyBxxk4B+8/Af/AASG+Enw88RWth4m8Yahr2rPE10mli7t9LF3CgbfIYUJlZR1LKwAwSSa+o/gZ4c+HXw2+HtxH4Dt/C9r4dtSftU2lzwvCrICWM8wZtzKuMtIxYCgDD/Yz/Zes/2WPhmdN+0R6hr2qyLc6teqpCyyhcCNMgHyo8kLkAkszEAttHtFZXhHxjpPjvS/t+j6hp2q2LMUW5srmO5hcjqA6EjIPUVq0AFFFFABXyp/wUX8Sw/Bj4xfAP4ra1aXz+Cfh74g1L/hIr+1tnuW0iC80ye1S5kRAWECyON7gHGVGCWUH6rooA/J/wDbQ+Lfh/8AbH/bG8Oa14MvrrVvhfrR8O/CXxHrVtHLa22pyal4hhu59PglKqz5gth5jR/KBIqscSYNX/gtx8C/BP7J3h7Q7fwJ4e0jwbp/j/w5qum+IbLSYfs9rq0VlNp9zbNJECE8yOQuRJgv85BJFfrH/Zlt5EUf2eDy4GDxp5Y2xkdCB2I9qL7S7XU1AubeC4CggCWMPgHr19aAPy88H3H7PehS+OdH/aC0GfUPj3eeN7x78XWl39xrepNJqD/2ZLpjWw877L9n+z7Ut2GFjICkFAfO/s3wltv2TNU8M+ING1hv2zP7VmLqllcnxfN4oa5aSC6huFXb9l27JAysIvKy3L43fsU1rG86StHG0kYIRyo3KD1APbOB+VAtYxced5cfmhdgfaN23OcZ9M9qAPyN8Xfs/wDhnx//AME3PHXxM8XaTpuofFO7+Kc1vqfiJWzdMz+IodMngjmXBFt5EjxCJcIARgKcY9ws/wBgz4OXX/BVjVvBsvw58K/8Iq3woh1n+xo7XFmt5Lqc1k10IgdqyG2hiTeoBBUt945r7+GlWot2h+zW/ks28p5Y2ls5zjpnPOfWnLYW63ZuBDCJyuwyBBvK5zjPXGSTj1NAH4//AA9+C2m/D/8A4J1fs5/EjwHp2m6X8YNY+JEGl23iFci8vXub6+sRbyzNy0DRxwpsb5AsfuSeR/Zs+H1x8TL74e+DdF1r4M+EfjJp+tC+EsvhrxFB4+ttUtiZ7o6lclnjPmBXWQyr5DKxVQPlC/tYuk2qQRxLa24ihcPGgjG1GByCBjg55yO9TeRH5rSbF8xgFLY5IGSBn2yfzNAH5Ln4TaT8Sf2DND+Nmr6LdeJNQ8Z/Em5v/ivqltG9zqtx4Xh1e+tri1jMY85LVBbWe6KHbtSJ8YVSBl/tiat8C/GGlWWofAHSdBXwlp+p6ZL8R72w0LVR4WawQStafb4rfy1kjikdZZlQiUlomy219v6821jDZIFhhihUZICIFAycnp6kk0+KCOBNsaKi5LYUYGSSSfxJJ/GgD89f+CU3gx9Y+P3jTxp4V8R/B8+DW0qPRtZ0f4faPqul6TLqX7uW3u1S8BieRITJGzQNgLJhl3Ek/oZUdvaRWkCxQxRxRoMKiKFVfoKkoAKKKKAP/9kNCmVuZHN0cmVhbQplbmRvYmoKMTEzIDAgb2JqCjw8Ci9MZW5ndGggNDIxCi9Db2xvclNwYWNlIC9EZXZpY2VSR0IKL1N1YnR5cGUgL0ltYWdlCi9IZWlnaHQgMTMwCi9GaWx0ZXIgL0ZsYXRlRGVjb2RlCi9UeXBlIC9YT2JqZWN0Ci9XaWR0aCAyNTUKL1NNYXNrIDExNCAwIFIKL0JpdHNQZXJDb21wb25lbnQgOAo+PgpzdHJlYW0NCnic7dppboMwEAbQHKeH4P7iVrRqVYIImGGxjfB7yq8oy0R84y28XgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADA3fHW1Syhq6PvaJUBNQ9dWy8NI+FvW+NVv/OfTMuHnz6494DNi84xfwYWGrp8+jnzCfx8l3j6eLyWaLvI5Z3yGf/yiVFXdduU0aDEPkQE2Eu/Lz2OnhYUKyNODFLbrOua46JeHbfHF6cH5PYZ/tFVkVI9MEzRicWSOD9f5IjSr4Z35bvZ8hdmHW2nn+trwUlix5tocyYPht6ppStbLXXhmSZ04/Ya/nZmO8kcWs1batQs4eej6yhP+81VRRfWBLl3AheVtzl/W/GT1mcCN8K8kNkdQhZ+sdoc//0Ji7c/lA//Q2Qsz807XUnL2LmyCrw/2lFU6FW2GucquZG2E1yyUd+CuttBNRJPOWliSTb5r+X6JwF1t1kLAnZnTIcJsDvAkP9vA9KN2gQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwK19AxTN7t8NCmVuZHN0cmVhbQplbmRvYmoKMTE0IDAgb2JqCjw8Ci9MZW5ndGggMjQyCi9Db2xvclNwYWNlIC9EZXZpY2VHcmF5Ci9TdWJ0eXBlIC9JbWFnZQovSGVpZ2h0IDEzMAovRmlsdGVyIC9GbGF0ZURlY29kZQovVHlwZSAvWE9iamVjdAovV2lkdGggMjU1Ci9CaXRzUGVyQ29tcG9uZW50IDgKPj4Kc3RyZWFtDQp4nO3X646DIBAG0L7/S0+zySZluRXSbRzac35UNA7hQ1F7uwEAAAAAAAAAAAAAAACcJpL3d5wvn4Bz4r9lpOfEf4uz4sd09/UO84sf7dEiyajd7W27IqH4s5m2O5WLp15q47afxGnmKYoboD14hs7FfxYgfn+iPjV77v8dX/a02xYCRbd5yFw8GeRShuI5f0LmtTE2C3n0mpzG71dcamM80WmNe8sW9AX1Gyyq7bjmI4zizwrK9bJRmU10QnT2O987H2Z/Ya8skjM117j+wIuqVf/7IQnXomQ2vk08XD0UAAAAAAAAAAAAAAAAIJE7nTSBfw0KZW5kc3RyZWFtCmVuZG9iagoxMTUgMCBvYmoKPDwKL0YxIDQ2NCAwIFIKL0YxMCA0NjUgMCBSCi9GMTEgNDY2IDAgUgovRjEyIDQ2NyAwIFIKL0YxMyA0NjggMCBSCi9GMTQgNDY5IDAgUgovRjE1IDQ3MCAwIFIKL0YxNiA0NzEgMCBSCi9GMTcgNDcyIDAgUgovRjE4IDQ3MyAwIFIKL0YxOSA0NzQgMCBSCi9GMiA0NzUgMCBSCi9GMjAgNDc2IDAgUgovRjIxIDQ3NyAwIFIKL0YyMiA0NzggMCBSCi9GMjMgNDc5IDAgUgovRjI0IDQ4MCAwIFIKL0YyNSA0ODEgMCBSCi9GMjYgNDgyIDAgUgovRjI3IDQ4MyAwIFIKL0YyOCA0ODQgMCBSCi9GMjkgNDg1IDAgUgovRjMgNDg2IDAgUgovRjMwIDQ4NyAwIFIKL0YzMSA0ODggMCBSCi9GMzIgNDg5IDAgUgovRjMzIDQ5MCAwIFIKL0YzNCA0OTEgMCBSCi9GMzUgNDkyIDAgUgovRjM2IDQ5MyAwIFIKL0YzNyA0OTQgMCBSCi9GMzggNDk1IDAgUgovRjM5IDQ5NiAwIFIKL0Y0IDQ5NyAwIFIKL0Y0MCA0OTggMCBSCi9GNDEgNDk5IDAgUgovRjQyIDUwMCAwIFIKL0Y0MyA1MDEgMCBSCi9GNDQgNTAyIDAgUgovRjQ1IDUwMyAwIFIKL0Y0NiA1MDQgMCBSCi9GNDcgNTA1IDAgUgovRjQ4IDUwNiAwIFIKL0Y0OSA1MDcgMCBSCi9GNSA1MDggMCBSCi9GNTAgNTA5IDAgUgovRjUxIDUxMCAwIFIKL0Y1MiA1MTEgMCBSCi9GNTMgNTEyIDAgUgovRjYgNTEzIDAgUgovRjcgNTE0IDAgUgovRjggNTE1IDAgUgovRjkgNTE2IDAgUgo+PgplbmRvYmoKMTE2IDAgb2JqCjw8Ci9MZW5ndGggNDgyCi9CQm94IFswIDAgMjAgMjBdCi9GaWx0ZXIgL0ZsYXRlRGVjb2RlCi9SZXNvdXJjZXMgPDwKPj4KL1N1YnR5cGUgL0Zvcm0KL1R5cGUgL1hPYmplY3QKPj4Kc3RyZWFtDQp4nFXWy20cMRBF0b2iYAhd/HSTAdkBOP+F2fCYdQba3IJYr55mgAtdJVaJ/fPn10+FO3zDE47Lwe1wPdwPA/b+5Pjk+OEHjuEwHRbDjn3+c4M7/MATXnCEQ3UwNsx9K+ZwO3hmV7zPL+AGD/jx/ddydegOt8NXwHRYDDt58IUMqhyecLgQbrxVhlWGVYZVBtc7H0qnyeEOD/iGJ7zMbA4mhetvwW7BHEzbbRsNGw0bDRsNDz9wGBQmhVFhVhgWpu2wymdYaXi4wTf8wMucr1CT3lLVHjlMB9N2WNAwaHJ4+sZHb0wO3cH9t0pw8OILuTh4+IEX/KZcHr88kcN0MOAqqb6CaVc2WlliZQctq2ST2dz3kWpaMfEuGPXg5K17De4wq+HuKsg3jZdYC0Z+shQO1rSKVs+qWVyKSjHpwc4DXuw7mvMmW4nqUBWqQRFoqq2g0pG1RtbCr4pTOyJH3NgzDgMiQPyXa+ztv10tJo+i+jQf4kv1FLSH9ZBey1ItSzVKKb9GqUYR/IbeMFrNHjV7oDksV7MSvlN32k7ZJRMYJAY5/xzwKRVZKrJJCqvBvA6ef/7B+WSnbhJrYkvsBf1hP+R3cBY0mCc8x73gYHAxOBncDI4GV4Ozwd3fP38BhgoXYQ0KZW5kc3RyZWFtCmVuZG9iagoxMTcgMCBvYmoKPDwKL0xlbmd0aCAxNzUKL0JCb3ggWzAgMCAyMzQgMzAuOF0KL0ZpbHRlciAvRmxhdGVEZWNvZGUKL1Jlc291cmNlcyA8PAo+PgovU3VidHlwZSAvRm9ybQovVHlwZSAvWE9iamVjdAo+PgpzdHJlYW0NCnicjVK5DcMwDOw9hSYw+IscKBnA+xdxDOTRMUUaATzcQx1Ig4YOpT3Hcdts93Pm830hBTPHRbEvSKSpxC/oY6wKDK01WJutVbN1aSzPC4o3ELEYT4JNZgCQff2c2AItGdVaob4/U0ESs7co5kSWBDqpIGKMPmari2XPcv6BTSiQo3EiV8b0/ttk/EfOnlbUlZV4UITnI0x4YWzIEWxJJFGlvGr02Rr9Pd+3B8Y0oHcNCmVuZHN0cmVhbQplbmRvYmoKMTE4IDAgb2JqCjw8Ci9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwo+PgplbmRvYmoKMTE5IDAgb2JqCjw8Ci9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCj4+CmVuZG9iagoxMjAgMCBvYmoKPDwKL0YxIDExOCAwIFIKPj4KZW5kb2JqCjEyMSAwIG9iago8PAovRjEgMTE4IDAgUgo+PgplbmRvYmoKMTIyIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxMjMgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjEyNCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMTI1IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxMjYgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxMjcgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxMjggMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxMjkgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxMzAgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjEzMSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjEzMiAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMTMzIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxMzQgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxMzUgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjEzNiAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjEzNyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMTM4IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMTM5IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxNDAgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjE0MSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMTQyIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxNDMgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjE0NCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjE0NSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMTQ2IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxNDcgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjE0OCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMTQ5IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMTUwIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMTUxIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMTUyIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMTUzIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMTU0IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMTU1IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxNTYgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxNTcgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxNTggMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxNTkgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxNjAgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxNjEgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxNjIgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxNjMgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxNjQgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxNjUgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxNjYgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxNjcgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjE2OCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMTY5IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxNzAgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxNzEgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjE3MiAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjE3MyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMTc0IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxNzUgMCBvYmoKPDwKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCj4+CmVuZG9iagoxNzYgMCBvYmoKPDwKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKPj4KZW5kb2JqCjE3NyAwIG9iago8PAovRjEgMTc1IDAgUgo+PgplbmRvYmoKMTc4IDAgb2JqCjw8Ci9GMSAxNzUgMCBSCj4+CmVuZG9iagoxNzkgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjE4MCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMTgxIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxODIgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjE4MyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjE4NCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjE4NSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjE4NiAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjE4NyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMTg4IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMTg5IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxOTAgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjE5MSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjE5MiAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMTkzIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMTk0IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxOTUgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxOTYgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjE5NyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMTk4IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoxOTkgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjIwMCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjAxIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjAyIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoyMDMgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjIwNCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjA1IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoyMDYgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoyMDcgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoyMDggMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoyMDkgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoyMTAgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoyMTEgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoyMTIgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjIxMyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjIxNCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjIxNSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjIxNiAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjIxNyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjIxOCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjIxOSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjIyMCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjIyMSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjIyMiAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjIyMyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjIyNCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjI1IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoyMjYgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjIyNyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjIyOCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjI5IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjMwIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoyMzEgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjIzMiAwIG9iago8PAovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKPj4KZW5kb2JqCjIzMyAwIG9iago8PAovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwo+PgplbmRvYmoKMjM0IDAgb2JqCjw8Ci9GMSAyMzIgMCBSCj4+CmVuZG9iagoyMzUgMCBvYmoKPDwKL0YxIDIzMiAwIFIKPj4KZW5kb2JqCjIzNiAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjM3IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoyMzggMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjIzOSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjQwIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjQxIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjQyIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjQzIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjQ0IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoyNDUgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoyNDYgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjI0NyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjQ4IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjQ5IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoyNTAgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoyNTEgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjI1MiAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjI1MyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjU0IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoyNTUgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjI1NiAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjU3IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoyNTggMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoyNTkgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjI2MCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjYxIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoyNjIgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjI2MyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjI2NCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjI2NSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjI2NiAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjI2NyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjI2OCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjI2OSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjcwIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjcxIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjcyIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjczIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjc0IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjc1IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjc2IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjc3IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjc4IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjc5IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjgwIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjgxIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoyODIgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjI4MyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjg0IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjg1IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoyODYgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoyODcgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjI4OCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjg5IDAgb2JqCjw8Ci9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwo+PgplbmRvYmoKMjkwIDAgb2JqCjw8Ci9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCj4+CmVuZG9iagoyOTEgMCBvYmoKPDwKL0YxIDI4OSAwIFIKPj4KZW5kb2JqCjI5MiAwIG9iago8PAovRjEgMjg5IDAgUgo+PgplbmRvYmoKMjkzIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoyOTQgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjI5NSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMjk2IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoyOTcgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoyOTggMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagoyOTkgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozMDAgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozMDEgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjMwMiAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjMwMyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMzA0IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozMDUgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozMDYgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjMwNyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjMwOCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMzA5IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMzEwIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozMTEgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjMxMiAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMzEzIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozMTQgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjMxNSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjMxNiAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMzE3IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozMTggMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjMxOSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMzIwIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMzIxIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMzIyIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMzIzIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMzI0IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMzI1IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMzI2IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozMjcgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozMjggMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozMjkgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozMzAgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozMzEgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozMzIgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozMzMgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozMzQgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozMzUgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozMzYgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozMzcgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozMzggMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjMzOSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMzQwIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozNDEgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozNDIgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjM0MyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjM0NCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMzQ1IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozNDYgMCBvYmoKPDwKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCj4+CmVuZG9iagozNDcgMCBvYmoKPDwKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKPj4KZW5kb2JqCjM0OCAwIG9iago8PAovRjEgMzQ2IDAgUgo+PgplbmRvYmoKMzQ5IDAgb2JqCjw8Ci9GMSAzNDYgMCBSCj4+CmVuZG9iagozNTAgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjM1MSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMzUyIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozNTMgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjM1NCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjM1NSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjM1NiAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjM1NyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjM1OCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMzU5IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMzYwIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozNjEgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjM2MiAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjM2MyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMzY0IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMzY1IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozNjYgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozNjcgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjM2OCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMzY5IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozNzAgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjM3MSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMzcyIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMzczIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozNzQgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjM3NSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMzc2IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozNzcgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozNzggMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozNzkgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozODAgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozODEgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozODIgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozODMgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjM4NCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjM4NSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjM4NiAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjM4NyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjM4OCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjM4OSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjM5MCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjM5MSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjM5MiAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjM5MyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjM5NCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjM5NSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKMzk2IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagozOTcgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjM5OCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjM5OSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDAwIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDAxIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago0MDIgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjQwMyAwIG9iago8PAovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKPj4KZW5kb2JqCjQwNCAwIG9iago8PAovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwo+PgplbmRvYmoKNDA1IDAgb2JqCjw8Ci9GMSA0MDMgMCBSCj4+CmVuZG9iago0MDYgMCBvYmoKPDwKL0YxIDQwMyAwIFIKPj4KZW5kb2JqCjQwNyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDA4IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago0MDkgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjQxMCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDExIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDEyIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDEzIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDE0IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDE1IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago0MTYgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago0MTcgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjQxOCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDE5IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDIwIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago0MjEgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago0MjIgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjQyMyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjQyNCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDI1IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago0MjYgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjQyNyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDI4IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago0MjkgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago0MzAgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjQzMSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDMyIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago0MzMgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjQzNCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjQzNSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjQzNiAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjQzNyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjQzOCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjQzOSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjQ0MCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDQxIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDQyIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDQzIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDQ0IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDQ1IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDQ2IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDQ3IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDQ4IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDQ5IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDUwIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDUxIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDUyIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago0NTMgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjQ1NCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDU1IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDU2IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago0NTcgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago0NTggMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjQ1OSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDYwIDAgb2JqCjw8Ci9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwo+PgplbmRvYmoKNDYxIDAgb2JqCjw8Ci9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCj4+CmVuZG9iago0NjIgMCBvYmoKPDwKL0YxIDQ2MCAwIFIKPj4KZW5kb2JqCjQ2MyAwIG9iago8PAovRjEgNDYwIDAgUgo+PgplbmRvYmoKNDY0IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago0NjUgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjQ2NiAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDY3IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago0NjggMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago0NjkgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago0NzAgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago0NzEgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago0NzIgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjQ3MyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjQ3NCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDc1IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago0NzYgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago0NzcgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjQ3OCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjQ3OSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDgwIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDgxIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago0ODIgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjQ4MyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDg0IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago0ODUgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjQ4NiAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjQ4NyAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDg4IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago0ODkgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjQ5MCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDkxIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDkyIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDkzIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDk0IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDk1IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDk2IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNDk3IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago0OTggMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago0OTkgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago1MDAgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago1MDEgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago1MDIgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago1MDMgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago1MDQgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago1MDUgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago1MDYgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago1MDcgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago1MDggMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago1MDkgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjUxMCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNTExIDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago1MTIgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iago1MTMgMCBvYmoKPDwKL0Jhc2VGb250IC9IZWx2ZXRpY2EtQm9sZAovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjUxNCAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYQovRW5jb2RpbmcgL1dpbkFuc2lFbmNvZGluZwovU3VidHlwZSAvVHlwZTEKL1R5cGUgL0ZvbnQKPj4KZW5kb2JqCjUxNSAwIG9iago8PAovQmFzZUZvbnQgL0hlbHZldGljYS1Cb2xkCi9FbmNvZGluZyAvV2luQW5zaUVuY29kaW5nCi9TdWJ0eXBlIC9UeXBlMQovVHlwZSAvRm9udAo+PgplbmRvYmoKNTE2IDAgb2JqCjw8Ci9CYXNlRm9udCAvSGVsdmV0aWNhLUJvbGQKL0VuY29kaW5nIC9XaW5BbnNpRW5jb2RpbmcKL1N1YnR5cGUgL1R5cGUxCi9UeXBlIC9Gb250Cj4+CmVuZG9iagp4cmVmCjAgNTE3CjAwMDAwMDAwMDAgNjU1MzUgZg0KMDAwMDAwMDAxNSAwMDAwMCBuDQowMDAwMDAwMTg3IDAwMDAwIG4NCjAwMDAwMDAzMzIgMDAwMDAgbg0KMDAwMDAwMDA5MSAwMDAwMCBuDQowMDAwMDAwMzcyIDAwMDAwIG4NCjAwMDAwMDA1MjggMDAwMDAgbg0KMDAwMDAwMDcwNiAwMDAwMCBuDQowMDAwMDAwODYyIDAwMDAwIG4NCjAwMDAwMDEwNDAgMDAwMDAgbg0KMDAwMDAwMTE5NiAwMDAwMCBuDQowMDAwMDAxMzc1IDAwMDAwIG4NCjAwMDAwMDE1MzIgMDAwMDAgbg0KMDAwMDAwMTcxMSAwMDAwMCBuDQowMDAwMDAxODY4IDAwMDAwIG4NCjAwMDAwMDIwNDcgMDAwMDAgbg0KMDAwMDAwMjIwNCAwMDAwMCBuDQowMDAwMDAyMzgzIDAwMDAwIG4NCjAwMDAwMDI1NDAgMDAwMDAgbg0KMDAwMDAwMjcxOSAwMDAwMCBuDQowMDAwMDAyOTMyIDAwMDAwIG4NCjAwMDAwMDUwMzYgMDAwMDAgbg0KMDAwMDAwNTE5NSAwMDAwMCBuDQowMDAwMDA3Njg1IDAwMDAwIG4NCjAwMDAwMDc3NTkgMDAwMDAgbg0KMDAwMDAwOTg1OSAwMDAwMCBuDQowMDAwMDEwMDE4IDAwMDAwIG4NCjAwMDAwMTI1MDggMDAwMDAgbg0KMDAwMDAxMjU4MiAwMDAwMCBuDQowMDAwMDE0NjgxIDAwMDAwIG4NCjAwMDAwMTQ4NDAgMDAwMDAgbg0KMDAwMDAxNzMzMCAwMDAwMCBuDQowMDAwMDE3NDA0IDAwMDAwIG4NCjAwMDAwMTk1MDIgMDAwMDAgbg0KMDAwMDAxOTY2MSAwMDAwMCBuDQowMDAwMDIyMTUxIDAwMDAwIG4NCjAwMDAwMjIyMjUgMDAwMDAgbg0KMDAwMDAyNDE4NiAwMDAwMCBuDQowMDAwMDI0MzQ1IDAwMDAwIG4NCjAwMDAwMjY4MzUgMDAwMDAgbg0KMDAwMDAyNjkwOSAwMDAwMCBuDQowMDAwMDI4ODczIDAwMDAwIG4NCjAwMDAwMjkwMzggMDAwMDAgbg0KMDAwMDAzMTUyOCAwMDAwMCBuDQowMDAwMDMxNjA1IDAwMDAwIG4NCjAwMDAwMzM1OTEgMDAwMDAgbg0KMDAwMDAzMzc1NiAwMDAwMCBuDQowMDAwMDM2MjQ2IDAwMDAwIG4NCjAwMDAwMzYzMjMgMDAwMDAgbg0KMDAwMDAzNjM4MiAwMDAwMCBuDQowMDAwMDM2NDQxIDAwMDAwIG4NCjAwMDAwMzY1MDAgMDAwMDAgbg0KMDAwMDAzNjU1OSAwMDAwMCBuDQowMDAwMDM2NjE4IDAwMDAwIG4NCjAwMDAwMzY2NzcgMDAwMDAgbg0KMDAwMDAzNjczNiAwMDAwMCBuDQowMDAwMDM2NzgyIDAwMDAwIG4NCjAwMDAwMzcyNDYgMDAwMDAgbg0KMDAwMDAzNzY5MyAwMDAwMCBuDQowMDAwMDQxNTA4IDAwMDAwIG4NCjAwMDAwNDIxMTUgMDAwMDAgbg0KMDAwMDA0MjUzMCAwMDAwMCBuDQowMDAwMDQzMjMyIDAwMDAwIG4NCjAwMDAwNDM4NTQgMDAwMDAgbg0KMDAwMDA0NDE3MiAwMDAwMCBuDQowMDAwMDQ0MjE4IDAwMDAwIG4NCjAwMDAwNDQ2NTEgMDAwMDAgbg0KMDAwMDA0NTA5NyAwMDAwMCBuDQowMDAwMDQ4OTEyIDAwMDAwIG4NCjAwMDAwNDk1MTkgMDAwMDAgbg0KMDAwMDA0OTkzNCAwMDAwMCBuDQowMDAwMDUwNjM2IDAwMDAwIG4NCjAwMDAwNTEyNTggMDAwMDAgbg0KMDAwMDA1MTU3NiAwMDAwMCBuDQowMDAwMDUxNjIyIDAwMDAwIG4NCjAwMDAwNTIwNTUgMDAwMDAgbg0KMDAwMDA1MjQ5NCAwMDAwMCBuDQowMDAwMDU2MzA5IDAwMDAwIG4NCjAwMDAwNTY5MTYgMDAwMDAgbg0KMDAwMDA1NzMzMSAwMDAwMCBuDQowMDAwMDU4MDMzIDAwMDAwIG4NCjAwMDAwNTg2NTUgMDAwMDAgbg0KMDAwMDA1ODk3MyAwMDAwMCBuDQowMDAwMDU5MDE5IDAwMDAwIG4NCjAwMDAwNTk0NTIgMDAwMDAgbg0KMDAwMDA1OTkwNCAwMDAwMCBuDQowMDAwMDYzNzE5IDAwMDAwIG4NCjAwMDAwNjQzMjYgMDAwMDAgbg0KMDAwMDA2NDc0MSAwMDAwMCBuDQowMDAwMDY1NDQzIDAwMDAwIG4NCjAwMDAwNjYwNjUgMDAwMDAgbg0KMDAwMDA2NjM4MyAwMDAwMCBuDQowMDAwMDY2NDI5IDAwMDAwIG4NCjAwMDAwNjY5MjEgMDAwMDAgbg0KMDAwMDA2NzM2NSAwMDAwMCBuDQowMDAwMDcxMTgwIDAwMDAwIG4NCjAwMDAwNzE3ODcgMDAwMDAgbg0KMDAwMDA3MjIwMiAwMDAwMCBuDQowMDAwMDcyOTA0IDAwMDAwIG4NCjAwMDAwNzM1MjYgMDAwMDAgbg0KMDAwMDA3Mzg0NCAwMDAwMCBuDQowMDAwMDczODkxIDAwMDAwIG4NCjAwMDAwNzQ0MDEgMDAwMDAgbg0KMDAwMDA3NDg0MCAwMDAwMCBuDQowMDAwMDc4NjU2IDAwMDAwIG4NCjAwMDAwNzkyNjUgMDAwMDAgbg0KMDAwMDA3OTY4MSAwMDAwMCBuDQowMDAwMDgwMzg0IDAwMDAwIG4NCjAwMDAwODEwMDcgMDAwMDAgbg0KMDAwMDA4MTMyNiAwMDAwMCBuDQowMDAwMDgxMzczIDAwMDAwIG4NCjAwMDAwODE4ODMgMDAwMDAgbg0KMDAwMDA4MjMyNiAwMDAwMCBuDQowMDAwMDg2MTQyIDAwMDAwIG4NCjAwMDAwODY3NTEgMDAwMDAgbg0KMDAwMDA4NzE2NyAwMDAwMCBuDQowMDAwMDg3ODcwIDAwMDAwIG4NCjAwMDAwODg0OTMgMDAwMDAgbg0KMDAwMDA4ODgxMiAwMDAwMCBuDQowMDAwMDg4OTExIDAwMDAwIG4NCjAwMDAwODkwMTUgMDAwMDAgbg0KMDAwMDA4OTA1MCAwMDAwMCBuDQowMDAwMDg5MDg1IDAwMDAwIG4NCjAwMDAwODkxODkgMDAwMDAgbg0KMDAwMDA4OTI5MyAwMDAwMCBuDQowMDAwMDg5Mzk3IDAwMDAwIG4NCjAwMDAwODk1MDEgMDAwMDAgbg0KMDAwMDA4OTYwMCAwMDAwMCBuDQowMDAwMDg5Njk5IDAwMDAwIG4NCjAwMDAwODk3OTggMDAwMDAgbg0KMDAwMDA4OTg5NyAwMDAwMCBuDQowMDAwMDkwMDAxIDAwMDAwIG4NCjAwMDAwOTAxMDAgMDAwMDAgbg0KMDAwMDA5MDIwNCAwMDAwMCBuDQowMDAwMDkwMzA4IDAwMDAwIG4NCjAwMDAwOTA0MDcgMDAwMDAgbg0KMDAwMDA5MDUxMSAwMDAwMCBuDQowMDAwMDkwNjEwIDAwMDAwIG4NCjAwMDAwOTA3MTQgMDAwMDAgbg0KMDAwMDA5MDgxMyAwMDAwMCBuDQowMDAwMDkwOTE3IDAwMDAwIG4NCjAwMDAwOTEwMjEgMDAwMDAgbg0KMDAwMDA5MTEyNSAwMDAwMCBuDQowMDAwMDkxMjI5IDAwMDAwIG4NCjAwMDAwOTEzMzMgMDAwMDAgbg0KMDAwMDA5MTQzMiAwMDAwMCBuDQowMDAwMDkxNTM2IDAwMDAwIG4NCjAwMDAwOTE2NDAgMDAwMDAgbg0KMDAwMDA5MTc0NCAwMDAwMCBuDQowMDAwMDkxODQ4IDAwMDAwIG4NCjAwMDAwOTE5NDcgMDAwMDAgbg0KMDAwMDA5MjA0NiAwMDAwMCBuDQowMDAwMDkyMTQ1IDAwMDAwIG4NCjAwMDAwOTIyNDQgMDAwMDAgbg0KMDAwMDA5MjM0MyAwMDAwMCBuDQowMDAwMDkyNDQyIDAwMDAwIG4NCjAwMDAwOTI1NDYgMDAwMDAgbg0KMDAwMDA5MjY0NSAwMDAwMCBuDQowMDAwMDkyNzQ0IDAwMDAwIG4NCjAwMDAwOTI4NDMgMDAwMDAgbg0KMDAwMDA5Mjk0MiAwMDAwMCBuDQowMDAwMDkzMDQxIDAwMDAwIG4NCjAwMDAwOTMxNDAgMDAwMDAgbg0KMDAwMDA5MzIzOSAwMDAwMCBuDQowMDAwMDkzMzM4IDAwMDAwIG4NCjAwMDAwOTM0MzcgMDAwMDAgbg0KMDAwMDA5MzUzNiAwMDAwMCBuDQowMDAwMDkzNjM1IDAwMDAwIG4NCjAwMDAwOTM3MzkgMDAwMDAgbg0KMDAwMDA5Mzg0MyAwMDAwMCBuDQowMDAwMDkzOTQ3IDAwMDAwIG4NCjAwMDAwOTQwNDYgMDAwMDAgbg0KMDAwMDA5NDE1MCAwMDAwMCBuDQowMDAwMDk0MjQ5IDAwMDAwIG4NCjAwMDAwOTQzNTMgMDAwMDAgbg0KMDAwMDA5NDQ1NyAwMDAwMCBuDQowMDAwMDk0NTU2IDAwMDAwIG4NCjAwMDAwOTQ2NjAgMDAwMDAgbg0KMDAwMDA5NDY5NSAwMDAwMCBuDQowMDAwMDk0NzMwIDAwMDAwIG4NCjAwMDAwOTQ4MzQgMDAwMDAgbg0KMDAwMDA5NDkzOCAwMDAwMCBuDQowMDAwMDk1MDQyIDAwMDAwIG4NCjAwMDAwOTUxNDYgMDAwMDAgbg0KMDAwMDA5NTI0NSAwMDAwMCBuDQowMDAwMDk1MzQ0IDAwMDAwIG4NCjAwMDAwOTU0NDMgMDAwMDAgbg0KMDAwMDA5NTU0MiAwMDAwMCBuDQowMDAwMDk1NjQ2IDAwMDAwIG4NCjAwMDAwOTU3NDUgMDAwMDAgbg0KMDAwMDA5NTg0OSAwMDAwMCBuDQowMDAwMDk1OTUzIDAwMDAwIG4NCjAwMDAwOTYwNTIgMDAwMDAgbg0KMDAwMDA5NjE1NiAwMDAwMCBuDQowMDAwMDk2MjU1IDAwMDAwIG4NCjAwMDAwOTYzNTkgMDAwMDAgbg0KMDAwMDA5NjQ1OCAwMDAwMCBuDQowMDAwMDk2NTYyIDAwMDAwIG4NCjAwMDAwOTY2NjYgMDAwMDAgbg0KMDAwMDA5Njc3MCAwMDAwMCBuDQowMDAwMDk2ODc0IDAwMDAwIG4NCjAwMDAwOTY5NzggMDAwMDAgbg0KMDAwMDA5NzA3NyAwMDAwMCBuDQowMDAwMDk3MTgxIDAwMDAwIG4NCjAwMDAwOTcyODUgMDAwMDAgbg0KMDAwMDA5NzM4OSAwMDAwMCBuDQowMDAwMDk3NDkzIDAwMDAwIG4NCjAwMDAwOTc1OTIgMDAwMDAgbg0KMDAwMDA5NzY5MSAwMDAwMCBuDQowMDAwMDk3NzkwIDAwMDAwIG4NCjAwMDAwOTc4ODkgMDAwMDAgbg0KMDAwMDA5Nzk4OCAwMDAwMCBuDQowMDAwMDk4MDg3IDAwMDAwIG4NCjAwMDAwOTgxOTEgMDAwMDAgbg0KMDAwMDA5ODI5MCAwMDAwMCBuDQowMDAwMDk4Mzg5IDAwMDAwIG4NCjAwMDAwOTg0ODggMDAwMDAgbg0KMDAwMDA5ODU4NyAwMDAwMCBuDQowMDAwMDk4Njg2IDAwMDAwIG4NCjAwMDAwOTg3ODUgMDAwMDAgbg0KMDAwMDA5ODg4NCAwMDAwMCBuDQowMDAwMDk4OTgzIDAwMDAwIG4NCjAwMDAwOTkwODIgMDAwMDAgbg0KMDAwMDA5OTE4MSAwMDAwMCBuDQowMDAwMDk5MjgwIDAwMDAwIG4NCjAwMDAwOTkzODQgMDAwMDAgbg0KMDAwMDA5OTQ4OCAwMDAwMCBuDQowMDAwMDk5NTkyIDAwMDAwIG4NCjAwMDAwOTk2OTEgMDAwMDAgbg0KMDAwMDA5OTc5NSAwMDAwMCBuDQowMDAwMDk5ODk0IDAwMDAwIG4NCjAwMDAwOTk5OTggMDAwMDAgbg0KMDAwMDEwMDEwMiAwMDAwMCBuDQowMDAwMTAwMjAxIDAwMDAwIG4NCjAwMDAxMDAzMDUgMDAwMDAgbg0KMDAwMDEwMDM0MCAwMDAwMCBuDQowMDAwMTAwMzc1IDAwMDAwIG4NCjAwMDAxMDA0NzkgMDAwMDAgbg0KMDAwMDEwMDU4MyAwMDAwMCBuDQowMDAwMTAwNjg3IDAwMDAwIG4NCjAwMDAxMDA3OTEgMDAwMDAgbg0KMDAwMDEwMDg5MCAwMDAwMCBuDQowMDAwMTAwOTg5IDAwMDAwIG4NCjAwMDAxMDEwODggMDAwMDAgbg0KMDAwMDEwMTE4NyAwMDAwMCBuDQowMDAwMTAxMjkxIDAwMDAwIG4NCjAwMDAxMDEzOTAgMDAwMDAgbg0KMDAwMDEwMTQ5NCAwMDAwMCBuDQowMDAwMTAxNTk4IDAwMDAwIG4NCjAwMDAxMDE2OTcgMDAwMDAgbg0KMDAwMDEwMTgwMSAwMDAwMCBuDQowMDAwMTAxOTAwIDAwMDAwIG4NCjAwMDAxMDIwMDQgMDAwMDAgbg0KMDAwMDEwMjEwMyAwMDAwMCBuDQowMDAwMTAyMjA3IDAwMDAwIG4NCjAwMDAxMDIzMTEgMDAwMDAgbg0KMDAwMDEwMjQxNSAwMDAwMCBuDQowMDAwMTAyNTE5IDAwMDAwIG4NCjAwMDAxMDI2MjMgMDAwMDAgbg0KMDAwMDEwMjcyMiAwMDAwMCBuDQowMDAwMTAyODI2IDAwMDAwIG4NCjAwMDAxMDI5MzAgMDAwMDAgbg0KMDAwMDEwMzAzNCAwMDAwMCBuDQowMDAwMTAzMTM4IDAwMDAwIG4NCjAwMDAxMDMyMzcgMDAwMDAgbg0KMDAwMDEwMzMzNiAwMDAwMCBuDQowMDAwMTAzNDM1IDAwMDAwIG4NCjAwMDAxMDM1MzQgMDAwMDAgbg0KMDAwMDEwMzYzMyAwMDAwMCBuDQowMDAwMTAzNzMyIDAwMDAwIG4NCjAwMDAxMDM4MzYgMDAwMDAgbg0KMDAwMDEwMzkzNSAwMDAwMCBuDQowMDAwMTA0MDM0IDAwMDAwIG4NCjAwMDAxMDQxMzMgMDAwMDAgbg0KMDAwMDEwNDIzMiAwMDAwMCBuDQowMDAwMTA0MzMxIDAwMDAwIG4NCjAwMDAxMDQ0MzAgMDAwMDAgbg0KMDAwMDEwNDUyOSAwMDAwMCBuDQowMDAwMTA0NjI4IDAwMDAwIG4NCjAwMDAxMDQ3MjcgMDAwMDAgbg0KMDAwMDEwNDgyNiAwMDAwMCBuDQowMDAwMTA0OTI1IDAwMDAwIG4NCjAwMDAxMDUwMjkgMDAwMDAgbg0KMDAwMDEwNTEzMyAwMDAwMCBuDQowMDAwMTA1MjM3IDAwMDAwIG4NCjAwMDAxMDUzMzYgMDAwMDAgbg0KMDAwMDEwNTQ0MCAwMDAwMCBuDQowMDAwMTA1NTM5IDAwMDAwIG4NCjAwMDAxMDU2NDMgMDAwMDAgbg0KMDAwMDEwNTc0NyAwMDAwMCBuDQowMDAwMTA1ODQ2IDAwMDAwIG4NCjAwMDAxMDU5NTAgMDAwMDAgbg0KMDAwMDEwNTk4NSAwMDAwMCBuDQowMDAwMTA2MDIwIDAwMDAwIG4NCjAwMDAxMDYxMjQgMDAwMDAgbg0KMDAwMDEwNjIyOCAwMDAwMCBuDQowMDAwMTA2MzMyIDAwMDAwIG4NCjAwMDAxMDY0MzYgMDAwMDAgbg0KMDAwMDEwNjUzNSAwMDAwMCBuDQowMDAwMTA2NjM0IDAwMDAwIG4NCjAwMDAxMDY3MzMgMDAwMDAgbg0KMDAwMDEwNjgzMiAwMDAwMCBuDQowMDAwMTA2OTM2IDAwMDAwIG4NCjAwMDAxMDcwMzUgMDAwMDAgbg0KMDAwMDEwNzEzOSAwMDAwMCBuDQowMDAwMTA3MjQzIDAwMDAwIG4NCjAwMDAxMDczNDIgMDAwMDAgbg0KMDAwMDEwNzQ0NiAwMDAwMCBuDQowMDAwMTA3NTQ1IDAwMDAwIG4NCjAwMDAxMDc2NDkgMDAwMDAgbg0KMDAwMDEwNzc0OCAwMDAwMCBuDQowMDAwMTA3ODUyIDAwMDAwIG4NCjAwMDAxMDc5NTYgMDAwMDAgbg0KMDAwMDEwODA2MCAwMDAwMCBuDQowMDAwMTA4MTY0IDAwMDAwIG4NCjAwMDAxMDgyNjggMDAwMDAgbg0KMDAwMDEwODM2NyAwMDAwMCBuDQowMDAwMTA4NDcxIDAwMDAwIG4NCjAwMDAxMDg1NzUgMDAwMDAgbg0KMDAwMDEwODY3OSAwMDAwMCBuDQowMDAwMTA4NzgzIDAwMDAwIG4NCjAwMDAxMDg4ODIgMDAwMDAgbg0KMDAwMDEwODk4MSAwMDAwMCBuDQowMDAwMTA5MDgwIDAwMDAwIG4NCjAwMDAxMDkxNzkgMDAwMDAgbg0KMDAwMDEwOTI3OCAwMDAwMCBuDQowMDAwMTA5Mzc3IDAwMDAwIG4NCjAwMDAxMDk0ODEgMDAwMDAgbg0KMDAwMDEwOTU4MCAwMDAwMCBuDQowMDAwMTA5Njc5IDAwMDAwIG4NCjAwMDAxMDk3NzggMDAwMDAgbg0KMDAwMDEwOTg3NyAwMDAwMCBuDQowMDAwMTA5OTc2IDAwMDAwIG4NCjAwMDAxMTAwNzUgMDAwMDAgbg0KMDAwMDExMDE3NCAwMDAwMCBuDQowMDAwMTEwMjczIDAwMDAwIG4NCjAwMDAxMTAzNzIgMDAwMDAgbg0KMDAwMDExMDQ3MSAwMDAwMCBuDQowMDAwMTEwNTcwIDAwMDAwIG4NCjAwMDAxMTA2NzQgMDAwMDAgbg0KMDAwMDExMDc3OCAwMDAwMCBuDQowMDAwMTEwODgyIDAwMDAwIG4NCjAwMDAxMTA5ODEgMDAwMDAgbg0KMDAwMDExMTA4NSAwMDAwMCBuDQowMDAwMTExMTg0IDAwMDAwIG4NCjAwMDAxMTEyODggMDAwMDAgbg0KMDAwMDExMTM5MiAwMDAwMCBuDQowMDAwMTExNDkxIDAwMDAwIG4NCjAwMDAxMTE1OTUgMDAwMDAgbg0KMDAwMDExMTYzMCAwMDAwMCBuDQowMDAwMTExNjY1IDAwMDAwIG4NCjAwMDAxMTE3NjkgMDAwMDAgbg0KMDAwMDExMTg3MyAwMDAwMCBuDQowMDAwMTExOTc3IDAwMDAwIG4NCjAwMDAxMTIwODEgMDAwMDAgbg0KMDAwMDExMjE4MCAwMDAwMCBuDQowMDAwMTEyMjc5IDAwMDAwIG4NCjAwMDAxMTIzNzggMDAwMDAgbg0KMDAwMDExMjQ3NyAwMDAwMCBuDQowMDAwMTEyNTgxIDAwMDAwIG4NCjAwMDAxMTI2ODAgMDAwMDAgbg0KMDAwMDExMjc4NCAwMDAwMCBuDQowMDAwMTEyODg4IDAwMDAwIG4NCjAwMDAxMTI5ODcgMDAwMDAgbg0KMDAwMDExMzA5MSAwMDAwMCBuDQowMDAwMTEzMTkwIDAwMDAwIG4NCjAwMDAxMTMyOTQgMDAwMDAgbg0KMDAwMDExMzM5MyAwMDAwMCBuDQowMDAwMTEzNDk3IDAwMDAwIG4NCjAwMDAxMTM2MDEgMDAwMDAgbg0KMDAwMDExMzcwNSAwMDAwMCBuDQowMDAwMTEzODA5IDAwMDAwIG4NCjAwMDAxMTM5MTMgMDAwMDAgbg0KMDAwMDExNDAxMiAwMDAwMCBuDQowMDAwMTE0MTE2IDAwMDAwIG4NCjAwMDAxMTQyMjAgMDAwMDAgbg0KMDAwMDExNDMyNCAwMDAwMCBuDQowMDAwMTE0NDI4IDAwMDAwIG4NCjAwMDAxMTQ1MjcgMDAwMDAgbg0KMDAwMDExNDYyNiAwMDAwMCBuDQowMDAwMTE0NzI1IDAwMDAwIG4NCjAwMDAxMTQ4MjQgMDAwMDAgbg0KMDAwMDExNDkyMyAwMDAwMCBuDQowMDAwMTE1MDIyIDAwMDAwIG4NCjAwMDAxMTUxMjYgMDAwMDAgbg0KMDAwMDExNTIyNSAwMDAwMCBuDQowMDAwMTE1MzI0IDAwMDAwIG4NCjAwMDAxMTU0MjMgMDAwMDAgbg0KMDAwMDExNTUyMiAwMDAwMCBuDQowMDAwMTE1NjIxIDAwMDAwIG4NCjAwMDAxMTU3MjAgMDAwMDAgbg0KMDAwMDExNTgxOSAwMDAwMCBuDQowMDAwMTE1OTE4IDAwMDAwIG4NCjAwMDAxMTYwMTcgMDAwMDAgbg0KMDAwMDExNjExNiAwMDAwMCBuDQowMDAwMTE2MjE1IDAwMDAwIG4NCjAwMDAxMTYzMTkgMDAwMDAgbg0KMDAwMDExNjQyMyAwMDAwMCBuDQowMDAwMTE2NTI3IDAwMDAwIG4NCjAwMDAxMTY2MjYgMDAwMDAgbg0KMDAwMDExNjczMCAwMDAwMCBuDQowMDAwMTE2ODI5IDAwMDAwIG4NCjAwMDAxMTY5MzMgMDAwMDAgbg0KMDAwMDExNzAzNyAwMDAwMCBuDQowMDAwMTE3MTM2IDAwMDAwIG4NCjAwMDAxMTcyNDAgMDAwMDAgbg0KMDAwMDExNzI3NSAwMDAwMCBuDQowMDAwMTE3MzEwIDAwMDAwIG4NCjAwMDAxMTc0MTQgMDAwMDAgbg0KMDAwMDExNzUxOCAwMDAwMCBuDQowMDAwMTE3NjIyIDAwMDAwIG4NCjAwMDAxMTc3MjYgMDAwMDAgbg0KMDAwMDExNzgyNSAwMDAwMCBuDQowMDAwMTE3OTI0IDAwMDAwIG4NCjAwMDAxMTgwMjMgMDAwMDAgbg0KMDAwMDExODEyMiAwMDAwMCBuDQowMDAwMTE4MjI2IDAwMDAwIG4NCjAwMDAxMTgzMjUgMDAwMDAgbg0KMDAwMDExODQyOSAwMDAwMCBuDQowMDAwMTE4NTMzIDAwMDAwIG4NCjAwMDAxMTg2MzIgMDAwMDAgbg0KMDAwMDExODczNiAwMDAwMCBuDQowMDAwMTE4ODM1IDAwMDAwIG4NCjAwMDAxMTg5MzkgMDAwMDAgbg0KMDAwMDExOTAzOCAwMDAwMCBuDQowMDAwMTE5MTQyIDAwMDAwIG4NCjAwMDAxMTkyNDYgMDAwMDAgbg0KMDAwMDExOTM1MCAwMDAwMCBuDQowMDAwMTE5NDU0IDAwMDAwIG4NCjAwMDAxMTk1NTggMDAwMDAgbg0KMDAwMDExOTY1NyAwMDAwMCBuDQowMDAwMTE5NzYxIDAwMDAwIG4NCjAwMDAxMTk4NjUgMDAwMDAgbg0KMDAwMDExOTk2OSAwMDAwMCBuDQowMDAwMTIwMDczIDAwMDAwIG4NCjAwMDAxMjAxNzIgMDAwMDAgbg0KMDAwMDEyMDI3MSAwMDAwMCBuDQowMDAwMTIwMzcwIDAwMDAwIG4NCjAwMDAxMjA0NjkgMDAwMDAgbg0KMDAwMDEyMDU2OCAwMDAwMCBuDQowMDAwMTIwNjY3IDAwMDAwIG4NCjAwMDAxMjA3NzEgMDAwMDAgbg0KMDAwMDEyMDg3MCAwMDAwMCBuDQowMDAwMTIwOTY5IDAwMDAwIG4NCjAwMDAxMjEwNjggMDAwMDAgbg0KMDAwMDEyMTE2NyAwMDAwMCBuDQowMDAwMTIxMjY2IDAwMDAwIG4NCjAwMDAxMjEzNjUgMDAwMDAgbg0KMDAwMDEyMTQ2NCAwMDAwMCBuDQowMDAwMTIxNTYzIDAwMDAwIG4NCjAwMDAxMjE2NjIgMDAwMDAgbg0KMDAwMDEyMTc2MSAwMDAwMCBuDQowMDAwMTIxODYwIDAwMDAwIG4NCjAwMDAxMjE5NjQgMDAwMDAgbg0KMDAwMDEyMjA2OCAwMDAwMCBuDQowMDAwMTIyMTcyIDAwMDAwIG4NCjAwMDAxMjIyNzEgMDAwMDAgbg0KMDAwMDEyMjM3NSAwMDAwMCBuDQowMDAwMTIyNDc0IDAwMDAwIG4NCjAwMDAxMjI1NzggMDAwMDAgbg0KMDAwMDEyMjY4MiAwMDAwMCBuDQowMDAwMTIyNzgxIDAwMDAwIG4NCjAwMDAxMjI4ODUgMDAwMDAgbg0KMDAwMDEyMjkyMCAwMDAwMCBuDQowMDAwMTIyOTU1IDAwMDAwIG4NCjAwMDAxMjMwNTkgMDAwMDAgbg0KMDAwMDEyMzE2MyAwMDAwMCBuDQowMDAwMTIzMjY3IDAwMDAwIG4NCjAwMDAxMjMzNzEgMDAwMDAgbg0KMDAwMDEyMzQ3MCAwMDAwMCBuDQowMDAwMTIzNTY5IDAwMDAwIG4NCjAwMDAxMjM2NjggMDAwMDAgbg0KMDAwMDEyMzc2NyAwMDAwMCBuDQowMDAwMTIzODcxIDAwMDAwIG4NCjAwMDAxMjM5NzAgMDAwMDAgbg0KMDAwMDEyNDA3NCAwMDAwMCBuDQowMDAwMTI0MTc4IDAwMDAwIG4NCjAwMDAxMjQyNzcgMDAwMDAgbg0KMDAwMDEyNDM4MSAwMDAwMCBuDQowMDAwMTI0NDgwIDAwMDAwIG4NCjAwMDAxMjQ1ODQgMDAwMDAgbg0KMDAwMDEyNDY4MyAwMDAwMCBuDQowMDAwMTI0Nzg3IDAwMDAwIG4NCjAwMDAxMjQ4OTEgMDAwMDAgbg0KMDAwMDEyNDk5NSAwMDAwMCBuDQowMDAwMTI1MDk5IDAwMDAwIG4NCjAwMDAxMjUyMDMgMDAwMDAgbg0KMDAwMDEyNTMwMiAwMDAwMCBuDQowMDAwMTI1NDA2IDAwMDAwIG4NCjAwMDAxMjU1MTAgMDAwMDAgbg0KMDAwMDEyNTYxNCAwMDAwMCBuDQowMDAwMTI1NzE4IDAwMDAwIG4NCjAwMDAxMjU4MTcgMDAwMDAgbg0KMDAwMDEyNTkxNiAwMDAwMCBuDQowMDAwMTI2MDE1IDAwMDAwIG4NCjAwMDAxMjYxMTQgMDAwMDAgbg0KMDAwMDEyNjIxMyAwMDAwMCBuDQowMDAwMTI2MzEyIDAwMDAwIG4NCjAwMDAxMjY0MTYgMDAwMDAgbg0KMDAwMDEyNjUxNSAwMDAwMCBuDQowMDAwMTI2NjE0IDAwMDAwIG4NCjAwMDAxMjY3MTMgMDAwMDAgbg0KMDAwMDEyNjgxMiAwMDAwMCBuDQowMDAwMTI2OTExIDAwMDAwIG4NCjAwMDAxMjcwMTAgMDAwMDAgbg0KMDAwMDEyNzEwOSAwMDAwMCBuDQowMDAwMTI3MjA4IDAwMDAwIG4NCjAwMDAxMjczMDcgMDAwMDAgbg0KMDAwMDEyNzQwNiAwMDAwMCBuDQowMDAwMTI3NTA1IDAwMDAwIG4NCjAwMDAxMjc2MDkgMDAwMDAgbg0KMDAwMDEyNzcxMyAwMDAwMCBuDQowMDAwMTI3ODE3IDAwMDAwIG4NCjAwMDAxMjc5MTYgMDAwMDAgbg0KMDAwMDEyODAyMCAwMDAwMCBuDQowMDAwMTI4MTE5IDAwMDAwIG4NCjAwMDAxMjgyMjMgMDAwMDAgbg0KdHJhaWxlcgo8PAovUm9vdCAxIDAgUgovSW5mbyA0IDAgUgovSUQgWzwzMkM4OTM3NDUzRTFDQ0YzNjRFNjU3MUY0RUY4NDM0QT4gPDMyQzg5Mzc0NTNFMUNDRjM2NEU2NTcxRjRFRjg0MzRBPl0KL1NpemUgNTE3Cj4+CnN0YXJ0eHJlZgoxMjgzMjcKJSVFT0YK"
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_sample_base64_pdf() -> str:
+    """Base64 of the Play_Mode sample invoice, read from disk on first use."""
+    with open(SAMPLE_PDF_PATH, "rb") as f:
+        return base64.b64encode(f.read()).decode('utf-8')
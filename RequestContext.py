@@ -1,13 +1,47 @@
+import threading
+import time
 from contextvars import ContextVar
-from typing import Optional
+from typing import Optional, Dict, List, Tuple
 
 # ContextVar to store the RequestContext for each request
 _request_context: ContextVar[Optional['RequestContext']] = ContextVar('request_context', default=None)
 
+
+class SpanRecorder:
+    """Collects (category, name, duration) spans for one request, e.g. ("mongo", "fetch_chat_history", 0.012)."""
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self._spans: List[Tuple[str, str, float]] = []
+        self._lock = threading.Lock()
+
+    def record(self, category: str, name: str, duration: float):
+        with self._lock:
+            self._spans.append((category, name, duration))
+
+    def spans(self) -> List[Tuple[str, str, float]]:
+        with self._lock:
+            return list(self._spans)
+
+    def summary(self) -> Dict[str, Dict]:
+        """Per category call count and total time in milliseconds."""
+        summary = {}
+        for category, name, duration in self.spans():
+            entry = summary.setdefault(category, {"count": 0, "ms": 0.0})
+            entry["count"] += 1
+            entry["ms"] += duration * 1000
+        for entry in summary.values():
+            entry["ms"] = round(entry["ms"], 2)
+        return summary
+
+    def elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self.started_at) * 1000, 2)
+
+
 class RequestContext:
     """Stores request-specific data like tenantCode, userId, and sessionId."""
     def __init__(self):
         self._storage = {}
+        self.spans = SpanRecorder()
 
     def set(self, key: str, value: str):
         self._storage[key] = value
@@ -26,7 +60,12 @@ class RequestContext:
             raise RuntimeError("No RequestContext available. Ensure middleware is configured and called within a request scope.")
         return context
 
+    @staticmethod
+    def current_or_none() -> Optional['RequestContext']:
+        """Returns the current request-specific context, or None outside a request scope."""
+        return _request_context.get()
+
     @staticmethod
     def set_current(context: Optional['RequestContext']):
         """Sets the current request-specific context."""
-        _request_context.set(context)
\ No newline at end of file
+        _request_context.set(context)
@@ -0,0 +1,81 @@
+"""
+Import-time profile of the application, i.e. what a Lambda cold start pays before the first request.
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter and reports the cumulative
+cost per top-level package, most expensive first.
+
+Usage (from the repository root):
+    python -m benchmarks.import_profile                    # profile main
+    python -m benchmarks.import_profile --top 25 --budget-ms 400
+
+With --budget-ms the command exits non-zero when the total import time exceeds the budget.
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def profile_imports(module: str) -> List[Tuple[str, int, int]]:
+    """Returns (module, depth, cumulative_us) for every import, in the order they completed."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-W", "ignore", "-c", f"import {module}"],
+        cwd=REPO_ROOT, capture_output=True, text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{completed.stderr}")
+
+    entries = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        name = name[1:]
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), depth, int(cumulative_us)))
+    return entries
+
+
+def direct_import_costs(entries: List[Tuple[str, int, int]], module: str) -> Tuple[int, Dict[str, int]]:
+    """
+    Total cost of importing the module, plus the cumulative cost of each package it imported
+    directly, grouped by top-level package. Nested imports are counted towards whichever direct
+    import pulled them in first, so nothing is counted twice.
+    """
+    index = max(i for i, (name, depth, _) in enumerate(entries) if name == module and depth == 0)
+    first = index
+    while first > 0 and entries[first - 1][1] > 0:
+        first -= 1
+
+    totals: Dict[str, int] = {}
+    for name, depth, cumulative_us in entries[first:index]:
+        if depth == 1:
+            package = name.split(".")[0]
+            totals[package] = totals.get(package, 0) + cumulative_us
+    return entries[index][2], totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-package import-time report")
+    parser.add_argument("--module", default="main", help="module to import (default: main)")
+    parser.add_argument("--top", type=int, default=15, help="number of packages to show")
+    parser.add_argument("--budget-ms", type=float, default=None, help="fail if total import time exceeds this")
+    args = parser.parse_args()
+
+    total_us, totals = direct_import_costs(profile_imports(args.module), args.module)
+
+    print(f"import {args.module}: {total_us / 1000:.1f} ms")
+    print(f"{'package':<40}{'cumulative ms':>15}")
+    for package, cost in sorted(totals.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"{package:<40}{cost / 1000:>15.1f}")
+
+    if args.budget_ms is not None and total_us / 1000 > args.budget_ms:
+        print(f"over budget: {total_us / 1000:.1f} ms > {args.budget_ms} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
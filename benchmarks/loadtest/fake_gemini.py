@@ -0,0 +1,180 @@
+"""
+Scripted stand-in for google.generativeai.GenerativeModel.
+
+Decides what to answer from the last message of the conversation, the way the real model behaves
+for the load-test script: tool results get a short text reply, "process" turns become a
+process_order call, "switch" turns a switch_facility call and order questions a fetch_order call.
+Every call is recorded, so tests can assert on what the bot sent. Context caches
+(google.generativeai.caching.CachedContent) are kept in memory: calls made through a cached-content
+model are recorded with the cache name and only the contents actually sent.
+"""
+import itertools
+import threading
+import time
+from types import SimpleNamespace
+from typing import Dict, List
+
+TOOL_RESULT_PREFIXES = (
+    "found", "failure", "[system feed]", "invoices", "unable", "successfully switched", "unknown",
+)
+
+
+def _text_part(text: str):
+    return SimpleNamespace(text=text, function_call=None)
+
+
+def _tool_part(name: str, args: Dict):
+    return SimpleNamespace(text="", function_call=SimpleNamespace(name=name, args=args))
+
+
+def _response(parts: List, prompt_tokens: int, response_tokens: int):
+    return SimpleNamespace(
+        candidates=[SimpleNamespace(content=SimpleNamespace(parts=parts))],
+        usage_metadata=SimpleNamespace(prompt_token_count=prompt_tokens, candidates_token_count=response_tokens,
+                                       cached_content_token_count=0),
+    )
+
+
+def _token_count(messages: List[Dict]) -> int:
+    return sum(len(str(part)) for message in messages for part in message.get("parts", [])) // 4
+
+
+class FakeGemini:
+    """Holds the script settings and the call log shared by every FakeGenerativeModel instance."""
+
+    def __init__(self, latency_ms: float = 0.0, orders_to_process: int = 10):
+        self.latency = latency_ms / 1000.0
+        self.orders_to_process = orders_to_process
+        self.calls: List[Dict] = []
+        self.caches: Dict[str, Dict] = {}
+        self.cache_events: List[Dict] = []
+        self._cache_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def record(self, call: Dict):
+        with self._lock:
+            self.calls.append(call)
+
+    def reply(self, messages: List[Dict]):
+        last = messages[-1] if messages else {"parts": [""]}
+        text = str(last.get("parts", [""])[0]).strip()
+        lowered = text.lower()
+        prompt_tokens = _token_count(messages)
+
+        if lowered.startswith(TOOL_RESULT_PREFIXES):
+            return _response([_text_part(f"Here is what happened: {text[:200]}")], prompt_tokens, 40)
+
+        if "process" in lowered:
+            orders = [
+                {"saleOrderNum": f"SO-{i}", "shipment": f"SHIP-{i}", "channel": "CH_1",
+                 "channelName": "Channel 1", "channelId": 1}
+                for i in range(self.orders_to_process)
+            ]
+            return _response([_tool_part("process_order", {"orders": orders})], prompt_tokens, 20)
+
+        if "switch" in lowered:
+            return _response([_tool_part("switch_facility", {"facilityCode": "F2"})], prompt_tokens, 10)
+
+        if "order" in lowered:
+            args = {"entity": "SaleOrder", "filterOptions": [
+                {"key": "channelFilter", "selectedValues": ["1"]},
+                {"key": "orderStatusFilter", "selectedValues": ["CREATED"]},
+            ]}
+            return _response([_tool_part("fetch_order", args)], prompt_tokens, 15)
+
+        return _response([_text_part("How can I help you with your orders today?")], prompt_tokens, 12)
+
+    def record_cache_event(self, event: str, name: str):
+        with self._lock:
+            self.cache_events.append({"event": event, "name": name})
+
+    def model_class(self):
+        """Returns a GenerativeModel replacement bound to this script."""
+        fake = self
+
+        class FakeGenerativeModel:
+            def __init__(self, model_name=None, system_instruction=None, generation_config=None,
+                         safety_settings=None, tools=None, **kwargs):
+                self.model_name = model_name
+                self.system_instruction = system_instruction
+                self.tools = tools
+                self.cached_content = None
+
+            @classmethod
+            def from_cached_content(cls, cached_content, generation_config=None, safety_settings=None):
+                name = cached_content if isinstance(cached_content, str) else cached_content.name
+                cache = fake.get_cache(name)
+                model = cls(model_name=cache["model"], system_instruction=cache["system_instruction"],
+                            generation_config=generation_config, safety_settings=safety_settings,
+                            tools=cache["tools"])
+                model.cached_content = name
+                return model
+
+            def generate_content(self, contents, **kwargs):
+                cached_contents = []
+                if self.cached_content:
+                    cached_contents = fake.get_cache(self.cached_content)["contents"]
+                fake.record({
+                    "model": self.model_name,
+                    "system_instruction": self.system_instruction,
+                    "cached_content": self.cached_content,
+                    "contents": contents,
+                })
+                if fake.latency:
+                    time.sleep(fake.latency)
+                response = fake.reply(cached_contents + list(contents))
+                response.usage_metadata.prompt_token_count = _token_count(contents)
+                response.usage_metadata.cached_content_token_count = _token_count(cached_contents)
+                return response
+
+        return FakeGenerativeModel
+
+    def get_cache(self, name: str) -> Dict:
+        with self._lock:
+            cache = self.caches.get(name)
+        if cache is None or cache["expire_at"] <= time.time():
+            raise LookupError(f"cached content {name} not found")
+        return cache
+
+    def cached_content_class(self):
+        """Returns a caching.CachedContent replacement that keeps caches in this fake."""
+        fake = self
+
+        class FakeCachedContent:
+            def __init__(self, name: str):
+                self.name = name
+                self.model = fake.get_cache(name)["model"]
+
+            @classmethod
+            def create(cls, model, system_instruction=None, contents=None, tools=None, ttl=None, **kwargs):
+                name = f"cachedContents/fake-{next(fake._cache_ids)}"
+                ttl_seconds = ttl.total_seconds() if ttl is not None else 3600
+                with fake._lock:
+                    fake.caches[name] = {
+                        "model": model,
+                        "system_instruction": system_instruction,
+                        "contents": list(contents or []),
+                        "tools": tools,
+                        "expire_at": time.time() + ttl_seconds,
+                    }
+                fake.record_cache_event("create", name)
+                return cls(name)
+
+            @classmethod
+            def get(cls, name):
+                return cls(name)
+
+            def delete(self):
+                with fake._lock:
+                    fake.caches.pop(self.name, None)
+                fake.record_cache_event("delete", self.name)
+
+        return FakeCachedContent
+
+
+def install_fake_gemini(fake: FakeGemini):
+    """Swaps the SDK model and cached-content classes used by gemini_service for the scripted ones."""
+    import gemini_service
+    genai = gemini_service.get_genai()
+    genai.GenerativeModel = fake.model_class()
+    genai.caching.CachedContent = fake.cached_content_class()
@@ -0,0 +1,74 @@
+"""
+Local Mongo for the load test.
+
+By default every database.py call gets the same in-memory mongomock client, so no server is needed.
+Pass a URI (e.g. a throwaway local mongod) to measure against a real server instead.
+"""
+from typing import Optional
+
+
+def install_local_mongo(mongo_uri: Optional[str] = None):
+    """Points database.py at a local Mongo; returns a client handle for seeding data."""
+    import database
+
+    if mongo_uri:
+        database.MONGO_URI = mongo_uri
+        return database.get_mongo_client()
+
+    import mongomock
+
+    install_merge_stage()
+    client = mongomock.MongoClient()
+    database.get_mongo_client = lambda: client
+    return client
+
+
+def _substitute_new(expression, new_document):
+    """Replaces "$$new.<field>" references in a whenMatched pipeline with literal values."""
+    if isinstance(expression, str) and expression.startswith("$$new."):
+        return {"$literal": new_document.get(expression[len("$$new."):])}
+    if isinstance(expression, dict):
+        return {key: _substitute_new(value, new_document) for key, value in expression.items()}
+    if isinstance(expression, list):
+        return [_substitute_new(value, new_document) for value in expression]
+    return expression
+
+
+def install_merge_stage():
+    """
+    mongomock has no $merge stage. Emulates the subset database.py uses (whenNotMatched "insert";
+    whenMatched "keepExisting", "replace", "merge" or a pipeline) by running the rest of the
+    pipeline and writing its output from the client.
+    """
+    from mongomock.collection import Collection
+
+    if getattr(Collection.aggregate, "emulates_merge", False):
+        return
+    original_aggregate = Collection.aggregate
+
+    def aggregate(self, pipeline, session=None, **kwargs):
+        if not pipeline or "$merge" not in pipeline[-1]:
+            return original_aggregate(self, pipeline, session=session, **kwargs)
+
+        spec = pipeline[-1]["$merge"]
+        target = self.database[spec["into"]]
+        on = spec.get("on", "_id")
+        on = [on] if isinstance(on, str) else on
+        when_matched = spec.get("whenMatched", "merge")
+
+        for document in original_aggregate(self, pipeline[:-1], session=session, **kwargs):
+            existing = target.find_one({field: document.get(field) for field in on}) \
+                if all(field in document for field in on) else None
+            if existing is None:
+                target.insert_one(document)
+            elif when_matched == "replace":
+                target.replace_one({"_id": existing["_id"]}, dict(document, _id=existing["_id"]))
+            elif when_matched == "merge":
+                document.pop("_id", None)
+                target.update_one({"_id": existing["_id"]}, {"$set": document})
+            elif isinstance(when_matched, list):
+                target.update_one({"_id": existing["_id"]}, _substitute_new(when_matched, document))
+        return iter([])
+
+    aggregate.emulates_merge = True
+    Collection.aggregate = aggregate
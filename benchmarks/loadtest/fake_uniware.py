@@ -0,0 +1,173 @@
+"""
+Local stand-in for a tenant's Uniware instance.
+
+Serves the endpoints the bot calls (getChannels, facilities, switchfacility, export/data,
+invoice/create, provider/allocate and the bulk print endpoints) from synthetic data, with a
+configurable per-call latency. Tenants are addressed by path prefix, so point the bot at it with
+UNIWARE_BASE_URL=http://127.0.0.1:<port>/{tenant_code}.
+
+Exports are scoped by the Facility request header and report each row's facility. With
+honour_facility_header off the header is ignored and every export returns the current facility's
+rows, as a Uniware that does not support the header would. Likewise, with honour_shipment_filter off a
+shippingPackageCodes filter is ignored. Shipments listed in cancelled are reported as CANCELLED.
+"""
+import io
+import json
+import threading
+import time
+import zlib
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List
+
+from PyPDF2 import PdfWriter
+
+CHANNEL_COUNT = 12
+FACILITY_COUNT = 4
+CURRENT_FACILITY = "F1"
+# Shipments an updatedDateRangeFilter export reports as changed since the last sync
+UPDATED_SHIPMENTS = 2
+
+
+@lru_cache(maxsize=64)
+def synthetic_pdf(pages: int) -> bytes:
+    """A valid PDF with the given number of blank A6 pages, cached per page count."""
+    writer = PdfWriter()
+    for _ in range(max(1, pages)):
+        writer.add_blank_page(width=298, height=420)
+    output = io.BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+
+class FakeUniware:
+    """Synthetic tenant data plus call counters, shared by all handler threads."""
+
+    def __init__(self, orders: int = 50, latency_ms: float = 0.0, invoiced_fraction: float = 0.0,
+                 honour_facility_header: bool = True, honour_shipment_filter: bool = True,
+                 cancelled: Iterable[str] = ()):
+        self.orders = orders
+        self.honour_facility_header = honour_facility_header
+        self.honour_shipment_filter = honour_shipment_filter
+        self.cancelled = set(cancelled)
+        self.latency = latency_ms / 1000.0
+        self.invoiced_fraction = invoiced_fraction
+        self.calls: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def count(self, endpoint: str):
+        with self._lock:
+            self.calls[endpoint] = self.calls.get(endpoint, 0) + 1
+
+    def channels(self) -> Dict:
+        return {"successful": True, "channels": [
+            {"channelId": i, "code": f"CH_{i}", "name": f"Channel {i}",
+             "sourceDTO": {"code": f"SOURCE_{i % 3}", "name": f"Source {i % 3}"}}
+            for i in range(1, CHANNEL_COUNT + 1)
+        ]}
+
+    def facilities(self) -> Dict:
+        return {"successful": True, "currentFacilityCode": CURRENT_FACILITY, "facilityDTOList": [
+            {"code": f"F{i}", "displayName": f"Warehouse {i}"} for i in range(1, FACILITY_COUNT + 1)
+        ]}
+
+    def shipment_row(self, index: int, columns: List[str], shipment: str = None,
+                     facility: str = CURRENT_FACILITY) -> Dict:
+        shipment = shipment or (f"SHIP-{index}" if facility == CURRENT_FACILITY else f"{facility}-SHIP-{index}")
+        invoiced = (zlib.crc32(shipment.encode()) % 100) < self.invoiced_fraction * 100
+        values = {
+            "saleOrderNum": f"SO-{index}",
+            "shipment": shipment,
+            "channel": f"CH_{index % CHANNEL_COUNT + 1}",
+            "channelName": f"Channel {index % CHANNEL_COUNT + 1}",
+            "channelId": index % CHANNEL_COUNT + 1,
+            "picklist": None,
+            "fulfillmentTat": "2025-01-01T00:00:00.000Z",
+            "status": "CANCELLED" if shipment in self.cancelled else "PACKED" if invoiced else "CREATED",
+            "invoiceCode": f"INV-{shipment}" if invoiced else None,
+            "shippingProvider": None,
+            "facility": facility,
+        }
+        return {"values": [values.get(column) for column in columns]}
+
+    def export(self, body: Dict, facility: str = CURRENT_FACILITY) -> Dict:
+        columns = body.get("columns", [])
+        shipment_codes = None
+        updated_only = False
+        for export_filter in body.get("filters", []):
+            if export_filter.get("id") == "shippingPackageCodes":
+                shipment_codes = export_filter.get("shippingPackageCodes", [])
+            elif export_filter.get("id") == "updatedDateRangeFilter":
+                updated_only = True
+
+        if shipment_codes is not None and self.honour_shipment_filter:
+            rows = [self.shipment_row(i, columns, code, facility) for i, code in enumerate(shipment_codes)]
+        elif updated_only:
+            rows = [self.shipment_row(i, columns, facility=facility)
+                    for i in range(min(self.orders, UPDATED_SHIPMENTS))]
+        else:
+            rows = [self.shipment_row(i, columns, facility=facility) for i in range(self.orders)]
+        return {"successful": True, "rows": rows, "totalRecords": len(rows)}
+
+    def handle(self, endpoint: str, body: Dict, headers: Dict = None):
+        """Returns (status, content type, payload bytes) for an endpoint."""
+        self.count(endpoint)
+        if self.latency:
+            time.sleep(self.latency)
+
+        if endpoint == "/data/channel/getChannels":
+            payload = self.channels()
+        elif endpoint == "/data/user/facilities":
+            payload = self.facilities()
+        elif endpoint == "/data/user/switchfacility":
+            payload = {"successful": True}
+        elif endpoint == "/data/tasks/export/data":
+            facility = (headers or {}).get("Facility") if self.honour_facility_header else None
+            payload = self.export(body, facility or CURRENT_FACILITY)
+        elif endpoint == "/data/oms/invoice/create":
+            payload = {"successful": True, "invoiceCode": f"INV-{body.get('shippingPackageCode')}"}
+        elif endpoint == "/data/oms/shipment/provider/allocate":
+            payload = {"successful": True, "shippingProviderCode": "FAKE_COURIER"}
+        elif endpoint in ("/data/oms/invoice/show/bulk", "/data/oms/shipment/show/bulk",
+                          "/data/oms/shipment/printInvoiceAndLabel/bulk"):
+            codes = body.get("invoiceCodes") or body.get("shippingPackageCodes") or []
+            return 200, "application/pdf", synthetic_pdf(len(codes))
+        else:
+            return 404, "application/json", json.dumps({"successful": False}).encode()
+
+        return 200, "application/json", json.dumps(payload).encode()
+
+
+def _handler_for(fake: FakeUniware):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _serve(self):
+            # Path is /<tenant>/<endpoint>; the bot joins base URL and endpoint with an extra slash
+            endpoint = "/" + self.path.split("?", 1)[0].lstrip("/").split("/", 1)[-1].lstrip("/")
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+            body = json.loads(raw) if raw else {}
+
+            status, content_type, payload = fake.handle(endpoint, body, self.headers)
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        do_GET = _serve
+        do_POST = _serve
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def start_fake_uniware(fake: FakeUniware, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """Starts the server on a daemon thread and returns it; server.server_address holds the bound port."""
+    server = ThreadingHTTPServer((host, port), _handler_for(fake))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
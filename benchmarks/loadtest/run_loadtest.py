@@ -0,0 +1,208 @@
+"""
+Offline load test for the chat API.
+
+Boots the FastAPI app under uvicorn against the fake Uniware server, the scripted Gemini and a
+local Mongo, then drives complete seller sessions over HTTP:
+
+    /chat/initiate -> /chat (fetch_order) -> /chat (process_order)
+
+and reports throughput plus p50/p95/p99 latency per step.
+
+Usage (from the repository root):
+    python -m benchmarks.loadtest.run_loadtest --sessions 200 --concurrency 20 --orders 500
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from benchmarks.loadtest.fake_gemini import FakeGemini, install_fake_gemini
+from benchmarks.loadtest.fake_mongo import install_local_mongo
+from benchmarks.loadtest.fake_uniware import FakeUniware, start_fake_uniware
+
+SESSION_SCRIPT = [
+    ("initiate", "/chat/initiate", None),
+    ("fetch_order", "/chat", "Show me the created orders for Channel 1"),
+    ("process_order", "/chat", "Yes, process these orders"),
+]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100.0 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_app(port: int):
+    """Runs main:app under uvicorn on a daemon thread and waits until it accepts requests."""
+    import uvicorn
+    import main
+
+    server = uvicorn.Server(uvicorn.Config(main.app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+def run_session(base_url: str, index: int, tenants: int, results: Dict[str, List[float]], errors: List[str]):
+    import requests
+    from database import create_chat_session_auth
+
+    tenant_code = f"tenant{index % tenants}"
+    user_id = f"loadtest{index}_{tenant_code}"
+    session_id = f"loadtest-session-{index}"
+    create_chat_session_auth(session_id, f"loadtest{index}", tenant_code, False, "loadtest-token")
+
+    headers = {"x-tenant-code": tenant_code, "x-chat-session-id": session_id, "x-user-id": user_id}
+    history = []
+    with requests.Session() as http:
+        for step, path, text in SESSION_SCRIPT:
+            body = None
+            if text is not None:
+                history.append({"role": "user", "parts": [text]})
+                body = {"messages": history[-1:]}
+
+            started_at = time.perf_counter()
+            response = http.post(f"{base_url}{path}", headers=headers, json=body)
+            elapsed = time.perf_counter() - started_at
+
+            if response.status_code != 200:
+                errors.append(f"{step}: HTTP {response.status_code}")
+                return
+            results.setdefault(step, []).append(elapsed)
+
+
+def run_session_safely(base_url: str, index: int, tenants: int, results: Dict[str, List[float]],
+                       errors: List[str]):
+    try:
+        run_session(base_url, index, tenants, results, errors)
+    except Exception as e:
+        errors.append(f"session {index}: {e!r}")
+
+
+def report(results: Dict[str, List[float]], errors: List[str], sessions: int, wall_time: float) -> Dict:
+    all_latencies = [value for values in results.values() for value in values]
+    summary = {
+        "sessions": sessions,
+        "completedSessions": len(results.get(SESSION_SCRIPT[-1][0], [])),
+        "errors": len(errors),
+        "wallSeconds": round(wall_time, 3),
+        "sessionsPerSecond": round(sessions / wall_time, 2) if wall_time else 0.0,
+        "requestsPerSecond": round(len(all_latencies) / wall_time, 2) if wall_time else 0.0,
+        "steps": {},
+    }
+    for step, _, _ in SESSION_SCRIPT + [("all", None, None)]:
+        values = all_latencies if step == "all" else results.get(step, [])
+        summary["steps"][step] = {
+            "count": len(values),
+            "meanMs": round(statistics.mean(values) * 1000, 2) if values else 0.0,
+            "p50Ms": round(percentile(values, 50) * 1000, 2),
+            "p95Ms": round(percentile(values, 95) * 1000, 2),
+            "p99Ms": round(percentile(values, 99) * 1000, 2),
+        }
+    return summary
+
+
+def print_report(summary: Dict):
+    print(f"sessions={summary['sessions']} completed={summary['completedSessions']} errors={summary['errors']} "
+          f"wall={summary['wallSeconds']}s sessions/s={summary['sessionsPerSecond']} "
+          f"requests/s={summary['requestsPerSecond']}")
+    print(f"{'step':<15}{'count':>8}{'mean ms':>12}{'p50 ms':>12}{'p95 ms':>12}{'p99 ms':>12}")
+    for step, stats in summary["steps"].items():
+        print(f"{step:<15}{stats['count']:>8}{stats['meanMs']:>12}{stats['p50Ms']:>12}"
+              f"{stats['p95Ms']:>12}{stats['p99Ms']:>12}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline load test for the Uniware chat bot")
+    parser.add_argument("--sessions", type=int, default=50, help="number of seller sessions to run")
+    parser.add_argument("--concurrency", type=int, default=10, help="sessions running at the same time")
+    parser.add_argument("--tenants", type=int, default=3, help="distinct tenant codes to spread sessions over")
+    parser.add_argument("--orders", type=int, default=200, help="CREATED shipments per tenant export")
+    parser.add_argument("--process-orders", type=int, default=20, help="orders sent to process_order per session")
+    parser.add_argument("--invoiced-fraction", type=float, default=0.0,
+                        help="share of shipments the fake reports as already invoiced")
+    parser.add_argument("--uniware-latency-ms", type=float, default=20.0)
+    parser.add_argument("--gemini-latency-ms", type=float, default=300.0)
+    parser.add_argument("--mongo-uri", default=None, help="use a real (local) Mongo instead of mongomock")
+    parser.add_argument("--play-mode", action="store_true", help="keep Play_Mode on (no invoice/label calls)")
+    parser.add_argument("--context-cache", action="store_true",
+                        help="enable Gemini context caching (GEMINI_CONTEXT_CACHE_ENABLED)")
+    parser.add_argument("--write-behind", action="store_true",
+                        help="queue transcript writes for a background flusher (TRANSCRIPT_WRITE_BEHIND)")
+    parser.add_argument("--delta-orders", action="store_true",
+                        help="refresh pending orders incrementally (PENDING_ORDERS_DELTA_ENABLED)")
+    parser.add_argument("--prefetch", action="store_true",
+                        help="prefetch other facilities' pending orders after initiate (FACILITY_PREFETCH_ENABLED)")
+    parser.add_argument("--json-out", default=None, help="also write the report as JSON to this file")
+    args = parser.parse_args()
+
+    if args.context_cache:
+        os.environ["GEMINI_CONTEXT_CACHE_ENABLED"] = "true"
+    if args.write_behind:
+        os.environ["TRANSCRIPT_WRITE_BEHIND"] = "true"
+    if args.delta_orders:
+        os.environ["PENDING_ORDERS_DELTA_ENABLED"] = "true"
+    if args.prefetch:
+        os.environ["FACILITY_PREFETCH_ENABLED"] = "true"
+
+    fake_uniware = FakeUniware(args.orders, args.uniware_latency_ms, args.invoiced_fraction)
+    uniware_server = start_fake_uniware(fake_uniware)
+    os.environ["UNIWARE_BASE_URL"] = f"http://127.0.0.1:{uniware_server.server_address[1]}/{{tenant_code}}"
+
+    install_local_mongo(args.mongo_uri)
+    fake_gemini = FakeGemini(args.gemini_latency_ms, args.process_orders)
+    install_fake_gemini(fake_gemini)
+
+    import main as app_main
+    app_main.Play_Mode = args.play_mode
+
+    port = free_port()
+    server = start_app(port)
+    base_url = f"http://127.0.0.1:{port}"
+
+    results: Dict[str, List[float]] = {}
+    errors: List[str] = []
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        for index in range(args.sessions):
+            pool.submit(run_session_safely, base_url, index, args.tenants, results, errors)
+    wall_time = time.perf_counter() - started_at
+
+    server.should_exit = True
+    uniware_server.shutdown()
+
+    summary = report(results, errors, args.sessions, wall_time)
+    summary["uniwareCalls"] = dict(fake_uniware.calls)
+    summary["geminiCalls"] = len(fake_gemini.calls)
+    summary["geminiCachedCalls"] = sum(1 for call in fake_gemini.calls if call.get("cached_content"))
+    summary["geminiPromptTokens"] = sum(
+        len(str(part)) for call in fake_gemini.calls for message in call["contents"]
+        for part in message.get("parts", [])) // 4
+    print_report(summary)
+    print(f"gemini calls={summary['geminiCalls']} cached={summary['geminiCachedCalls']} "
+          f"prompt tokens sent={summary['geminiPromptTokens']}")
+    for error in errors[:10]:
+        print(f"error: {error}")
+
+    if args.json_out:
+        with open(args.json_out, "w") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
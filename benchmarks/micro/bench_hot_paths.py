@@ -0,0 +1,82 @@
+"""
+Micro-benchmarks for the pure-Python functions that run on every request.
+
+Run from the repository root:
+    python -m benchmarks.micro.run save     # record a baseline on this machine
+    python -m benchmarks.micro.run check    # compare against it, fail on regressions
+"""
+from benchmarks.micro.conftest import SHIPMENT_COLUMNS, ORDERS_COLUMNS
+
+
+def bench_extract_orders_response(benchmark, export_response):
+    from main import extract_orders_response
+
+    result = benchmark(extract_orders_response, export_response, SHIPMENT_COLUMNS, ORDERS_COLUMNS)
+    assert len(result) == len(export_response["rows"])
+
+
+def bench_transform_filter_options(benchmark, filter_options):
+    from main import transform_filter_options
+
+    result = benchmark(transform_filter_options, filter_options)
+    assert result
+
+
+def bench_simplify_channels(benchmark, channels_response):
+    from uniwareService import simplify_channels
+
+    result = benchmark(simplify_channels, channels_response)
+    assert "Channel 1" in result
+
+
+def bench_simplify_warehouses(benchmark, facilities_response):
+    from uniwareService import simplify_warehouses
+
+    result = benchmark(simplify_warehouses, facilities_response)
+    assert "Warehouse 1" in result
+
+
+def bench_normalize_gemini_args(benchmark, process_order_args):
+    from proto_utils import normalize_gemini_args
+
+    result = benchmark(normalize_gemini_args, process_order_args)
+    assert len(result["orders"]) > 0
+
+
+def bench_merge_pdfs_base64(benchmark, pdf_pair_base64):
+    from main import merge_pdfs_base64
+
+    result = benchmark.pedantic(merge_pdfs_base64, args=pdf_pair_base64, rounds=3, iterations=1)
+    assert result
+
+
+def bench_build_formatted_history(benchmark, chat_history_document):
+    from main import build_formatted_history
+
+    new_messages = [{"role": "user", "parts": ["process all orders"]}]
+    result = benchmark(build_formatted_history, chat_history_document, new_messages)
+    assert result[-1] == new_messages[0]
+
+
+def bench_name_index_shortlist(benchmark, large_channel_catalogue, long_seller_message):
+    from name_resolver import NameIndex, NAME_INDEX_FIELDS
+
+    index = NameIndex(large_channel_catalogue, *NAME_INDEX_FIELDS["channels"])
+    result = benchmark(index.shortlist, long_seller_message, 10)
+    assert result[0]["channelName"] == "Amazon Mumbai Store 1200"
+
+
+def bench_render_pdf_chat_response(benchmark, pdf_pair_base64):
+    from models import ChatResponse
+
+    reply = ChatResponse(response=pdf_pair_base64[0], type="pdf")
+    result = benchmark(reply.model_dump_json)
+    assert result.startswith("{")
+
+
+def bench_parse_export_response(benchmark, export_response):
+    from json_utils import dumps, loads
+
+    body = dumps(export_response)
+    result = benchmark(loads, body)
+    assert len(result["rows"]) == len(export_response["rows"])
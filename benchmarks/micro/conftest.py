@@ -0,0 +1,122 @@
+"""
+Synthetic inputs for the micro-benchmarks, sized like our largest tenants.
+"""
+import base64
+import os
+import sys
+import warnings
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+warnings.filterwarnings("ignore", category=FutureWarning)
+
+EXPORT_ROWS = 5000
+CHANNELS = 300
+WAREHOUSES = 60
+PDF_PAGES = 500
+TOOL_ARG_ORDERS = 500
+HISTORY_MESSAGES = 50
+SHORTLIST_CHANNELS = 2000
+SHORTLIST_MESSAGE_WORDS = 150
+
+SHIPMENT_COLUMNS = ["saleOrderNum", "channel", "picklist", "fulfillmentTat", "shipment", "channelName", "channelId"]
+ORDERS_COLUMNS = ["saleOrderNum", "shipment", "channel", "channelName", "channelId"]
+
+
+@pytest.fixture(scope="session")
+def export_response():
+    return {"rows": [
+        {"values": [f"SO-{i}", f"CH_{i % CHANNELS}", None, "2025-01-01T00:00:00.000Z", f"SHIP-{i}",
+                    f"Channel {i % CHANNELS}", i % CHANNELS]}
+        for i in range(EXPORT_ROWS)
+    ]}
+
+
+@pytest.fixture(scope="session")
+def channels_response():
+    return {"channels": [
+        {"channelId": i, "code": f"CH_{i}", "name": f"Channel {i}",
+         "sourceDTO": {"code": f"SOURCE_{i % 20}", "name": f"Source {i % 20}"}}
+        for i in range(CHANNELS)
+    ]}
+
+
+@pytest.fixture(scope="session")
+def facilities_response():
+    return {"currentFacilityCode": "F0", "facilityDTOList": [
+        {"code": f"F{i}", "displayName": f"Warehouse {i}"} for i in range(WAREHOUSES)
+    ]}
+
+
+@pytest.fixture(scope="session")
+def filter_options():
+    return [
+        {"key": "channelFilter", "selectedValues": [str(i) for i in range(CHANNELS)]},
+        {"key": "createdDateFilter", "selectedValues": ["15-06-2025"]},
+        {"key": "fulfillmentTATFilter", "selectedValues": ["16-06-2025"]},
+        {"key": "orderStatusFilter", "selectedValues": ["CREATED"]},
+    ]
+
+
+@pytest.fixture(scope="session")
+def process_order_args():
+    """process_order tool args as the SDK hands them over: a proto-plus MapComposite over a Struct."""
+    from google.ai.generativelanguage import FunctionCall
+
+    orders = [
+        {"saleOrderNum": f"SO-{i}", "shipment": f"SHIP-{i}", "channel": f"CH_{i % CHANNELS}",
+         "channelName": f"Channel {i % CHANNELS}", "channelId": i % CHANNELS,
+         "meta": {"tags": [f"t{j}" for j in range(3)], "nested": {"level": {"deep": [1, 2, {"x": True}]}}}}
+        for i in range(TOOL_ARG_ORDERS)
+    ]
+    return FunctionCall(name="process_order", args={"orders": orders}).args
+
+
+@pytest.fixture(scope="session")
+def pdf_pair_base64():
+    from benchmarks.loadtest.fake_uniware import synthetic_pdf
+
+    encoded = base64.b64encode(synthetic_pdf(PDF_PAGES // 2)).decode("utf-8")
+    return encoded, encoded
+
+
+@pytest.fixture(scope="session")
+def chat_history_document(export_response):
+    pending_orders = [
+        dict(zip(ORDERS_COLUMNS, (row["values"][0], row["values"][4], row["values"][1], row["values"][5],
+                                  row["values"][6])))
+        for row in export_response["rows"]
+    ]
+    feeds = [f"[System Feed] feed {i}" for i in range(4)]
+    feeds.append(f"[System Feed] pending orders  : {pending_orders}")
+    return {
+        "messages_metadata": [{"role": "user", "message": feed} for feed in feeds],
+        "messages": [
+            {"role": "user" if i % 2 == 0 else "model", "message": f"message {i} " * 20}
+            for i in range(HISTORY_MESSAGES)
+        ],
+    }
+
+
+@pytest.fixture(scope="session")
+def large_channel_catalogue():
+    """Session-feed channels of a tenant far over NAME_FEED_FULL_LIMIT, with overlapping names."""
+    markets = ["Amazon", "Flipkart", "Myntra", "Ajio", "Meesho", "Nykaa", "Tata Cliq", "Snapdeal", "Shopify", "Jiomart"]
+    cities = ["Mumbai", "Delhi", "Gurgaon", "Bangalore", "Pune", "Chennai", "Kolkata", "Jaipur", "Noida", "Hyderabad"]
+    return [
+        {"channelId": i,
+         "channelCode": f"{markets[i % 10].upper().replace(' ', '_')}_{cities[i // 10 % 10].upper()}_{i}",
+         "channelName": f"{markets[i % 10]} {cities[i // 10 % 10]} Store {i}"}
+        for i in range(SHORTLIST_CHANNELS)
+    ]
+
+
+@pytest.fixture(scope="session")
+def long_seller_message():
+    words = ("please show me all the pending orders for amazon mumbai store 1200 from yesterday and also the "
+             "flipkart delhi ones that were created last week with tat breach").split()
+    return " ".join(words[i % len(words)] for i in range(SHORTLIST_MESSAGE_WORDS))
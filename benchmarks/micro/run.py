@@ -0,0 +1,38 @@
+"""
+Saves and checks the micro-benchmark baseline.
+
+    python -m benchmarks.micro.run save            # store results as the baseline
+    python -m benchmarks.micro.run check           # compare with the latest baseline
+    python -m benchmarks.micro.run check --threshold 10
+
+check exits non-zero when any benchmark's median regressed by more than the threshold (percent).
+Baselines live in benchmarks/micro/.benchmarks and are machine specific, so they are not committed.
+"""
+import argparse
+import os
+import sys
+
+import pytest
+
+MICRO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmark baseline management")
+    parser.add_argument("action", choices=["save", "check"])
+    parser.add_argument("--threshold", type=int, default=20, help="allowed median regression in percent")
+    parser.add_argument("pytest_args", nargs="*", help="extra arguments passed to pytest")
+    args = parser.parse_args()
+
+    pytest_args = [MICRO_DIR, "-q", "-p", "no:cacheprovider"]
+    if args.action == "save":
+        pytest_args += ["--benchmark-save=baseline"]
+    else:
+        pytest_args += ["--benchmark-compare", f"--benchmark-compare-fail=median:{args.threshold}%"]
+
+    os.chdir(MICRO_DIR)
+    sys.exit(pytest.main(pytest_args + args.pytest_args))
+
+
+if __name__ == "__main__":
+    main()
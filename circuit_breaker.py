@@ -0,0 +1,110 @@
+import threading
+import time
+import logging
+from typing import Dict
+
+import requests
+
+from metrics import UNIWARE_CIRCUIT_OPEN
+from config import UNIWARE_CIRCUIT_FAILURE_THRESHOLD, UNIWARE_CIRCUIT_RESET_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+CIRCUIT_CLOSED = "CLOSED"
+CIRCUIT_OPEN = "OPEN"
+CIRCUIT_HALF_OPEN = "HALF_OPEN"
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised instead of calling a tenant host whose circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for a single tenant host.
+
+    CLOSED    -> calls go through, failures are counted
+    OPEN      -> calls fail fast until reset_timeout has passed
+    HALF_OPEN -> a single probe call is let through; success closes, failure re-opens
+    """
+
+    def __init__(self, host: str, failure_threshold: int = UNIWARE_CIRCUIT_FAILURE_THRESHOLD,
+                 reset_timeout: float = UNIWARE_CIRCUIT_RESET_TIMEOUT):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = CIRCUIT_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """Raises CircuitOpenError if the call must not be attempted."""
+        with self._lock:
+            if self._state == CIRCUIT_OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    raise CircuitOpenError(f"Circuit open for {self.host}")
+                self._state = CIRCUIT_HALF_OPEN
+                self._probe_in_flight = False
+
+            if self._state == CIRCUIT_HALF_OPEN:
+                if self._probe_in_flight:
+                    raise CircuitOpenError(f"Circuit half-open for {self.host}, probe in flight")
+                self._probe_in_flight = True
+
+    def record_success(self):
+        with self._lock:
+            if self._state != CIRCUIT_CLOSED:
+                logger.info(f"circuit closed for {self.host}")
+                UNIWARE_CIRCUIT_OPEN.labels(self.host).set(0)
+            self._state = CIRCUIT_CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def release_probe(self):
+        """Frees the half-open probe of a call that ended without a verdict on the host (e.g. it never went out)."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._state == CIRCUIT_HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != CIRCUIT_OPEN:
+                    logger.info(f"circuit opened for {self.host} after {self._failures} failures")
+                    UNIWARE_CIRCUIT_OPEN.labels(self.host).set(1)
+                self._state = CIRCUIT_OPEN
+                self._opened_at = time.monotonic()
+
+    def state(self) -> Dict:
+        with self._lock:
+            state = self._state
+            if state == CIRCUIT_OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                state = CIRCUIT_HALF_OPEN
+            return {
+                "host": self.host,
+                "state": state,
+                "consecutiveFailures": self._failures,
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(host: str) -> CircuitBreaker:
+    """Returns the process-wide circuit breaker for a tenant host, creating it on first use."""
+    breaker = _breakers.get(host)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.setdefault(host, CircuitBreaker(host))
+    return breaker
+
+
+def get_circuit_states() -> Dict[str, Dict]:
+    """Returns the current state of every known tenant circuit, keyed by host."""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.host: breaker.state() for breaker in breakers}
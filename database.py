@@ -1,14 +1,67 @@
-from pymongo import MongoClient
-from config import MONGO_URI, DATABASE_NAME, COLLECTION_NAME
-from typing import List, Dict, Optional
+from config import MONGO_URI, DATABASE_NAME, COLLECTION_NAME, CHAT_HISTORY_MAX_MESSAGES, PROCESS_ORDER_BATCH_TTL
+from typing import List, Dict, Optional, Tuple, TYPE_CHECKING
 import datetime
+import os
+import threading
 import uuid
 
-def get_mongo_client() -> MongoClient:
-    """Returns a MongoClient instance."""
-    return MongoClient(MONGO_URI)
-
-def get_database(client: MongoClient):
+from request_timing import timed
+
+if TYPE_CHECKING:
+    from pymongo import MongoClient
+
+_client: Optional["MongoClient"] = None
+_client_pid: Optional[int] = None
+_client_lock = threading.Lock()
+_indexed_collections = set()
+
+# Transcript entries live one per document in chat_messages, ordered by a per-session seq allocated
+# from the message_seq counter on the session's chat_history document. kind tells the transcript
+# apart from the [System Feed] metadata Gemini reads before it.
+CHAT_MESSAGES_COLLECTION = "chat_messages"
+ARCHIVED_CHAT_MESSAGES_COLLECTION = "archived_chat_messages"
+KIND_MESSAGE = "message"
+KIND_METADATA = "metadata"
+MESSAGES_KEPT_ON_ARCHIVE = 10
+# Bumped by every write that changes what fetch_chat_history returns, so a cached copy of the
+# session can be validated by reading this one field
+STATE_VERSION_FIELD = "state_version"
+BUMP_STATE_VERSION = {STATE_VERSION_FIELD: 1}
+# Batch id stamped on every process_orders_data write, see archive_session_orders
+ORDERS_BATCH_FIELD = "process_orders_batch"
+
+
+def get_mongo_client() -> "MongoClient":
+    """
+    Returns the process-wide MongoClient. MongoClient keeps its own connection pool and is
+    thread-safe, so one instance is shared by every call in a worker. It is created lazily and
+    re-created after a fork, since pymongo clients must not be shared across processes.
+    """
+    global _client, _client_pid
+    if _client is None or _client_pid != os.getpid():
+        with _client_lock:
+            if _client is None or _client_pid != os.getpid():
+                from pymongo import MongoClient
+                _client = MongoClient(MONGO_URI)
+                _client_pid = os.getpid()
+    return _client
+
+
+def close_mongo_client():
+    """Closes the process-wide client, e.g. on worker shutdown."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+def ping_mongo() -> bool:
+    """Opens a pooled connection and round-trips a ping; used to warm a worker before it takes traffic."""
+    get_mongo_client().admin.command("ping")
+    return True
+
+def get_database(client: "MongoClient"):
     """Returns the MongoDB database."""
     return client[DATABASE_NAME]
 
@@ -16,19 +69,212 @@ def get_collection(database):
     """Returns the MongoDB collection for chat history."""
     return database[COLLECTION_NAME]
 
-def fetch_chat_history(user_id: str,session_id: str) -> Dict:
+
+def get_chat_messages_collection(database, archived: bool = False):
     """
-    Fetches the chat history from MongoDB for a given user.
-    ... (rest of your fetch_chat_history function)
+    Returns the per-message transcript collection (or its archive), creating the
+    (user_id, session_id, kind, seq) index the first time this client uses it.
+    """
+    collection = database[ARCHIVED_CHAT_MESSAGES_COLLECTION if archived else CHAT_MESSAGES_COLLECTION]
+    index_key = (id(database.client), collection.name)
+    if index_key not in _indexed_collections:
+        collection.create_index([("user_id", 1), ("session_id", 1), ("kind", 1), ("seq", 1)],
+                                unique=not archived)
+        _indexed_collections.add(index_key)
+    return collection
+
+
+def allocate_message_seqs(collection, user_id: str, session_id: str, count: int) -> Tuple[int, int]:
+    """
+    Reserves `count` consecutive seq numbers for the session and returns the first one with the
+    session's new state version. Also creates the session's chat_history document if this is its
+    first write.
     """
+    document = collection.find_one_and_update(
+        {"user_id": user_id, "session_id": session_id},
+        {
+            "$inc": {"message_seq": count, **BUMP_STATE_VERSION},
+            "$setOnInsert": {
+                "user_id": user_id,
+                "session_id": session_id
+            }
+        },
+        projection={"message_seq": 1, STATE_VERSION_FIELD: 1},
+        upsert=True,
+        return_document=True
+    )
+    return document["message_seq"] - count + 1, document[STATE_VERSION_FIELD]
+
+
+def append_chat_entries(user_id: str, session_id: str, kind: str, entries: List[Dict]) -> Optional[Tuple[int, int]]:
+    """
+    Appends transcript or metadata entries ({role, message, timestamp, metadata}) in order. Returns
+    the first entry's seq and the session's new state version.
+    """
+    if not entries:
+        return None
     client = get_mongo_client()
     db = get_database(client)
+    first_seq, state_version = allocate_message_seqs(get_collection(db), user_id, session_id, len(entries))
+
+    get_chat_messages_collection(db).insert_many([
+        dict(entry, user_id=user_id, session_id=session_id, kind=kind, seq=first_seq + offset)
+        for offset, entry in enumerate(entries)
+    ])
+    return first_seq, state_version
+
+
+def fetch_state_version(user_id: str, session_id: str) -> Optional[int]:
+    """The session's state version, or None when it has no chat_history document."""
+    client = get_mongo_client()
+    db = get_database(client)
+    document = get_collection(db).find_one({"user_id": user_id, "session_id": session_id},
+                                           {"_id": 0, STATE_VERSION_FIELD: 1})
+    return None if document is None else document.get(STATE_VERSION_FIELD, 0)
+
+
+def fetch_chat_entries(collection, user_id: str, session_id: str, legacy_document: Dict,
+                       max_messages: int = 0) -> Dict[str, List[Dict]]:
+    """
+    Returns {"messages": [...], "messages_metadata": [...]} in seq order, with only the last
+    max_messages transcript messages when it is set. Sessions written before the per-message
+    collection still carry arrays on their document; those entries come first.
+    """
+    session_query = {"user_id": user_id, "session_id": session_id}
+    projection = {"_id": 0, "seq": 1, "role": 1, "message": 1, "timestamp": 1, "metadata": 1}
+
+    metadata = list(legacy_document.get("messages_metadata") or [])
+    metadata.extend(collection.find(dict(session_query, kind=KIND_METADATA), projection).sort("seq", 1))
+
+    messages_cursor = collection.find(dict(session_query, kind=KIND_MESSAGE), projection).sort("seq", -1)
+    if max_messages > 0:
+        messages_cursor = messages_cursor.limit(max_messages)
+    messages = list(legacy_document.get("messages") or []) + list(messages_cursor)[::-1]
+    if max_messages > 0:
+        messages = messages[-max_messages:]
+
+    return {"messages": messages, "messages_metadata": metadata}
+
+
+def merge_stage(into: str, on, when_matched="keepExisting") -> Dict:
+    """$merge stage writing the pipeline output into another collection without leaving the server."""
+    return {"$merge": {"into": into, "on": on, "whenMatched": when_matched, "whenNotMatched": "insert"}}
+
+
+def migrate_legacy_chat_arrays(db, user_id: str, session_id: str):
+    """
+    Moves messages / messages_metadata still stored as arrays on a chat_history document into
+    chat_messages, entirely on the server. Entries are numbered -len .. -1 so they sort before
+    everything written since. The $merge is keyed on the unique (user_id, session_id, kind, seq)
+    index, so re-running after a failure before the $unset does not duplicate entries.
+    """
+    session_query = {"user_id": user_id, "session_id": session_id}
+    messages_collection = get_chat_messages_collection(db)
+    for field, kind in (("messages", KIND_MESSAGE), ("messages_metadata", KIND_METADATA)):
+        get_collection(db).aggregate([
+            {"$match": dict(session_query, **{f"{field}.0": {"$exists": True}})},
+            {"$project": {"_id": 0, "entry": f"${field}", "count": {"$size": f"${field}"}}},
+            {"$unwind": {"path": "$entry", "includeArrayIndex": "offset"}},
+            {"$addFields": {
+                "entry.user_id": {"$literal": user_id},
+                "entry.session_id": {"$literal": session_id},
+                "entry.kind": kind,
+                "entry.seq": {"$subtract": ["$offset", "$count"]},
+            }},
+            {"$replaceRoot": {"newRoot": "$entry"}},
+            merge_stage(messages_collection.name, ["user_id", "session_id", "kind", "seq"]),
+        ])
+    get_collection(db).update_one(session_query, {
+        "$unset": {"messages": "", "messages_metadata": ""},
+        "$inc": BUMP_STATE_VERSION
+    })
+
+
+def move_chat_entries(db, query: Dict):
+    """
+    Moves the chat_messages entries matching the query into archived_chat_messages with a
+    server-side $merge followed by a delete. The merge is keyed on _id and keeps entries already
+    archived, so if the delete fails the whole move can simply be retried. The query must bound seq,
+    so entries appended between the two steps are neither archived nor deleted.
+    """
+    source = get_chat_messages_collection(db)
+    archive = get_chat_messages_collection(db, archived=True)
+    source.aggregate([{"$match": query}, merge_stage(archive.name, "_id")])
+    source.delete_many(query)
+
+
+def archive_session_orders(db, user_id: str, session_id: str):
+    """
+    Appends the session's process_orders_data to its archived_chat_history document and clears it,
+    without reading the orders into the worker. Every stored set of orders carries a batch id
+    (ORDERS_BATCH_FIELD): the archive records the batches it holds, so a retry after a failure
+    before the clear does not append the same orders twice, and the clear only applies to the
+    batch that was archived, so orders stored in between are kept.
+    """
+    session_query = {"user_id": user_id, "session_id": session_id}
     collection = get_collection(db)
-    history = collection.find_one({"user_id": user_id,"session_id":session_id})
-    client.close()
-    return history or {}
+    document = collection.find_one(session_query, {ORDERS_BATCH_FIELD: 1, "process_orders_data": {"$slice": 1}})
+    if not document or not document.get("process_orders_data"):
+        return
+    if document.get(ORDERS_BATCH_FIELD) is None:
+        # Orders stored before batches were stamped
+        collection.update_one(dict(session_query, **{ORDERS_BATCH_FIELD: {"$exists": False}}),
+                              {"$set": {ORDERS_BATCH_FIELD: uuid.uuid4().hex}})
+        document = collection.find_one(session_query, {ORDERS_BATCH_FIELD: 1})
+    batch = document[ORDERS_BATCH_FIELD]
+    batch_query = dict(session_query, **{ORDERS_BATCH_FIELD: batch})
+
+    archived_orders = {"$ifNull": ["$process_orders_data", []]}
+    archived_batches = {"$ifNull": ["$archived_order_batches", []]}
+    collection.aggregate([
+        {"$match": dict(batch_query, **{"process_orders_data.0": {"$exists": True}})},
+        {"$project": {"_id": 0, "user_id": 1, "session_id": 1, "process_orders_data": 1,
+                      "archived_order_batches": {"$literal": [batch]}}},
+        merge_stage(get_archived_history_collection(db).name, ["user_id", "session_id"], [{"$set": {
+            "process_orders_data": {"$cond": [
+                {"$in": [batch, archived_batches]},
+                archived_orders,
+                {"$concatArrays": [archived_orders, "$$new.process_orders_data"]},
+            ]},
+            "archived_order_batches": {"$setUnion": [archived_batches, [batch]]},
+        }}]),
+    ])
+    collection.update_one(batch_query, {"$set": {"process_orders_data": []}, "$unset": {ORDERS_BATCH_FIELD: ""}})
+
+
+def get_archived_history_collection(database):
+    """
+    Returns archived_chat_history, creating the unique (user_id, session_id) index that $merge needs
+    to match on the first time this client uses it.
+    """
+    collection = database["archived_chat_history"]
+    index_key = (id(database.client), collection.name)
+    if index_key not in _indexed_collections:
+        collection.create_index([("user_id", 1), ("session_id", 1)], unique=True)
+        _indexed_collections.add(index_key)
+    return collection
+
+@timed("mongo")
+def fetch_chat_history(user_id: str,session_id: str, max_messages: int = CHAT_HISTORY_MAX_MESSAGES) -> Dict:
+    """
+    Fetches the chat history from MongoDB for a given user: the session document without
+    process_orders_data (see get_shipments_by_user), the [System Feed] metadata and the last
+    max_messages transcript messages (all of them when 0).
+    """
+    client = get_mongo_client()
+    db = get_database(client)
+    collection = get_collection(db)
+    projection = {"process_orders_data": 0}
+    if max_messages > 0:
+        projection["messages"] = {"$slice": -max_messages}
+    history = collection.find_one({"user_id": user_id,"session_id":session_id}, projection)
+    if not history:
+        return {}
+    history.update(fetch_chat_entries(get_chat_messages_collection(db), user_id, session_id, history, max_messages))
+    return history
 
 
+@timed("mongo")
 def fetch_archived_chat_history(user_id: str,session_id: str) -> Dict:
     """
     Fetches the chat history from MongoDB for a given user.
@@ -36,11 +282,13 @@ def fetch_archived_chat_history(user_id: str,session_id: str) -> Dict:
     """
     client = get_mongo_client()
     db = get_database(client)
-    collection = db["archived_chat_history"]
-    history = collection.find_one({"user_id": user_id,"session_id":session_id})
-    client.close()
-    return history or {}
+    collection = get_archived_history_collection(db)
+    history = collection.find_one({"user_id": user_id,"session_id":session_id}) or {}
+    history.update(fetch_chat_entries(get_chat_messages_collection(db, archived=True), user_id, session_id,
+                                      history))
+    return history
 
+@timed("mongo")
 def store_user_context(user_id: str, message: str, role: str, metadata: Optional[dict] = None):
 
     client = get_mongo_client()
@@ -64,14 +312,10 @@ def store_user_context(user_id: str, message: str, role: str, metadata: Optional
         upsert=True
     )
 
-    client.close()
 
+@timed("mongo")
 def store_message_metadata(user_id: str,session_id:str, message: str, role: str, metadata: Optional[dict] = None):
 
-    client = get_mongo_client()
-    db = get_database(client)
-    collection = get_collection(db)
-
     message_data = {
         "role": role,
         "message": message,
@@ -79,38 +323,38 @@ def store_message_metadata(user_id: str,session_id:str, message: str, role: str,
         "metadata": metadata,
     }
 
-    # Upsert the document and push the new message to the messages array
-    collection.update_one(
-        {"user_id": user_id, "session_id": session_id},
-        {
-            "$push": {"messages_metadata": message_data},
-                        "$setOnInsert": {
-                "user_id": user_id,
-                "session_id": session_id
-            }
-        },
-        upsert=True
-    )
+    append_chat_entries(user_id, session_id, KIND_METADATA, [message_data])
+
 
-    client.close()
+@timed("mongo")
+def store_message_metadata_batch(user_id: str, session_id: str, messages: List[str], role: str):
+    """Stores several metadata messages in order with one seq allocation and one insert."""
+    timestamp = datetime.datetime.utcnow()
+    append_chat_entries(user_id, session_id, KIND_METADATA, [
+        {"role": role, "message": message, "timestamp": timestamp, "metadata": None}
+        for message in messages
+    ])
 
+
+@timed("mongo")
 def clear_message_metadata(user_id: str, session_id: str):
     client = get_mongo_client()
     db = get_database(client)
     collection = get_collection(db)
 
+    get_chat_messages_collection(db).delete_many(
+        {"user_id": user_id, "session_id": session_id, "kind": KIND_METADATA}
+    )
+    collection.update_one({"user_id": user_id, "session_id": session_id}, {"$inc": BUMP_STATE_VERSION})
+    # Sessions from before chat_messages keep metadata on the document
     collection.update_one(
-        {"user_id": user_id, "session_id": session_id},
+        {"user_id": user_id, "session_id": session_id, "messages_metadata": {"$exists": True}},
         {"$set": {"messages_metadata": []}}
     )
 
-    client.close()
 
+@timed("mongo")
 def store_message(user_id: str, session_id: str, message: str, role: str, metadata: Optional[dict] = None):
-    client = get_mongo_client()
-    db = get_database(client)
-    collection = get_collection(db)
-
     message_data = {
         "role": role,
         "message": message,
@@ -118,10 +362,24 @@ def store_message(user_id: str, session_id: str, message: str, role: str, metada
         "metadata": metadata,
     }
 
+    append_chat_entries(user_id, session_id, KIND_MESSAGE, [message_data])
+
+
+@timed("mongo")
+def store_session_feed(user_id: str, session_id: str, feed: Dict):
+    """
+    Stores structured session data (channels, facilities, current facility) next to the [System Feed]
+    text, so code paths that bypass Gemini can read it. Only the given keys are overwritten.
+    """
+    client = get_mongo_client()
+    db = get_database(client)
+    collection = get_collection(db)
+
     collection.update_one(
         {"user_id": user_id, "session_id": session_id},
         {
-            "$push": {"messages": message_data},
+            "$set": {f"session_feed.{key}": value for key, value in feed.items()},
+            "$inc": BUMP_STATE_VERSION,
             "$setOnInsert": {
                 "user_id": user_id,
                 "session_id": session_id
@@ -130,9 +388,31 @@ def store_message(user_id: str, session_id: str, message: str, role: str, metada
         upsert=True
     )
 
-    client.close()
+
+@timed("mongo")
+def store_gemini_context_cache(user_id: str, session_id: str, cache: Optional[Dict]):
+    """Records the session's Gemini context cache reference, or removes it when cache is None."""
+    client = get_mongo_client()
+    db = get_database(client)
+    collection = get_collection(db)
+
+    update = {"$set": {"gemini_context_cache": cache}} if cache else {"$unset": {"gemini_context_cache": ""}}
+    update["$inc"] = BUMP_STATE_VERSION
+    collection.update_one({"user_id": user_id, "session_id": session_id}, update)
+
+
+@timed("mongo")
+def fetch_gemini_context_cache(user_id: str, session_id: str) -> Optional[Dict]:
+    client = get_mongo_client()
+    db = get_database(client)
+    collection = get_collection(db)
+
+    document = collection.find_one({"user_id": user_id, "session_id": session_id},
+                                   {"gemini_context_cache": 1})
+    return (document or {}).get("gemini_context_cache")
 
 
+@timed("mongo")
 def update_user_order_mappings(
         user_id: str,
         session_id: str,
@@ -147,117 +427,67 @@ def update_user_order_mappings(
         return
 
     update_data = {
-        "$set": {"process_orders_data": new_orders}
+        "$set": {"process_orders_data": new_orders, ORDERS_BATCH_FIELD: uuid.uuid4().hex}
     }
 
     collection.update_one(
         {"user_id": user_id,"session_id":session_id},
         update_data,
     )
-    client.close()
 
 
+@timed("mongo")
 def archive_processed_orders_data(user_id: str,session_id: str):
     client = get_mongo_client()
     db = get_database(client)
 
-    source_collection = db["chat_history"]
-    archive_collection = db["archived_chat_history"]
-
-    # Fetch current user document
-    document = source_collection.find_one({"user_id": user_id,"session_id": session_id})
-    if not document:
-        client.close()
-        return
-
-    orders_to_archive = document.get("process_orders_data", [])
+    archive_session_orders(db, user_id, session_id)
 
-    # Build push update
-    archive_update = {}
-
-    if orders_to_archive:
-        archive_update.setdefault("$push", {})["process_orders_data"] = {"$each": orders_to_archive}
-
-    if archive_update:
-        archive_collection.update_one(
-            {"user_id": user_id,"session_id": session_id},
-            archive_update,
-            upsert=True
-        )
-
-    source_collection.update_one(
-        {"user_id": user_id,"session_id":session_id},
-        {
-            "$set": {
-                "process_orders_data": [],
-            }
-        }
-    )
-
-    client.close()
 
+@timed("mongo")
 def archive_user_data(user_id: str,session_id: str,is_initialisation: bool):
+    """
+    Moves the transcript into archived_chat_messages: all of it when a session is (re)initialised,
+    otherwise everything but the last MESSAGES_KEPT_ON_ARCHIVE messages. On initialisation the
+    metadata and process_orders_data are archived and cleared as well. Everything is copied on the
+    server; the worker only reads the seq counter and whether legacy arrays / orders exist.
+    """
     client = get_mongo_client()
     db = get_database(client)
 
-    source_collection = db["chat_history"]
-    archive_collection = db["archived_chat_history"]
+    source_collection = get_collection(db)
+    session_query = {"user_id": user_id, "session_id": session_id}
 
-    # Fetch current user document
-    document = source_collection.find_one({"user_id": user_id,"session_id":session_id})
+    # $slice 1 keeps the probe small while still telling whether the arrays hold anything
+    document = source_collection.find_one(session_query, {
+        "message_seq": 1,
+        "messages": {"$slice": 1},
+        "messages_metadata": {"$slice": 1},
+        "process_orders_data": {"$slice": 1},
+    })
     if not document:
-        client.close()
         return
 
-    all_messages = document.get("messages", [])
-    orders_to_archive = document.get("process_orders_data", [])
-    messages_metadata = document.get("messages_metadata", [])
+    if "messages" in document or "messages_metadata" in document:
+        migrate_legacy_chat_arrays(db, user_id, session_id)
+    # Entries allocated after this point belong to the next turn and stay where they are
+    archived_seqs = {"$lte": document.get("message_seq", 0)}
 
     if is_initialisation is True:
-        messages_to_archive = all_messages
-        messages_to_keep = []
-
+        move_chat_entries(db, dict(session_query, seq=archived_seqs))
     else:
-        if len(all_messages) > 10:
-            messages_to_archive = all_messages[:-10]
-            messages_to_keep = all_messages[-10:]
-        else:
-            messages_to_archive = []
-            messages_to_keep = all_messages
-
-    # Build push update
-    archive_update = {}
-    if messages_to_archive:
-        archive_update.setdefault("$push", {})["messages"] = {"$each": messages_to_archive}
-    if orders_to_archive and is_initialisation is True:
-        archive_update.setdefault("$push", {})["process_orders_data"] = {"$each": orders_to_archive}
-    if messages_metadata:
-        archive_update.setdefault("$set", {})["message_metadata"] = messages_metadata
-
-    if archive_update:
-        archive_collection.update_one(
-            {"user_id": user_id,"session_id":session_id},
-            archive_update,
-            upsert=True
-        )
+        kept = list(get_chat_messages_collection(db).find(
+            dict(session_query, kind=KIND_MESSAGE, seq=archived_seqs), {"seq": 1}
+        ).sort("seq", -1).skip(MESSAGES_KEPT_ON_ARCHIVE).limit(1))
+        if kept:
+            move_chat_entries(db, dict(session_query, kind=KIND_MESSAGE, seq={"$lte": kept[0]["seq"]}))
+    source_collection.update_one(session_query, {"$inc": BUMP_STATE_VERSION})
 
-    if is_initialisation is True:
-        messages_metadata = []
-        orders_to_archive = []
+    if document.get("process_orders_data") and is_initialisation is True:
+        archive_session_orders(db, user_id, session_id)
 
-    source_collection.update_one(
-        {"user_id": user_id,"session_id":session_id},
-        {
-            "$set": {
-                "messages": messages_to_keep,
-                "process_orders_data": orders_to_archive,
-                "messages_metadata" : messages_metadata
-            }
-        }
-    )
-
-    client.close()
 
+@timed("mongo")
 def get_shipments_by_user(
         user_id: str,
         session_id: str
@@ -266,17 +496,92 @@ def get_shipments_by_user(
     client = get_mongo_client()
     db = get_database(client)
     collection = get_collection(db)
-    # Query MongoDB
+    # Only the orders; the transcript is read by fetch_chat_history
     existing_chat = collection.find_one(
-        {"user_id": user_id,"session_id":session_id}
+        {"user_id": user_id,"session_id":session_id},
+        {"_id": 0, "process_orders_data": 1}
     )
 
-    user_order_data = existing_chat.get("process_orders_data")
+    user_order_data = (existing_chat or {}).get("process_orders_data")
     if not user_order_data:
         return []
 
     return user_order_data
 
+def get_pending_order_snapshots_collection(database):
+    """Returns pending_order_snapshots, creating its (tenant_code, facility_code) index on first use."""
+    collection = database["pending_order_snapshots"]
+    index_key = (id(database.client), collection.name)
+    if index_key not in _indexed_collections:
+        collection.create_index([("tenant_code", 1), ("facility_code", 1)], unique=True)
+        _indexed_collections.add(index_key)
+    return collection
+
+
+@timed("mongo")
+def fetch_pending_order_snapshot(tenant_code: str, facility_code: str) -> Optional[Dict]:
+    """The stored CREATED shipments of a tenant's facility: {orders, syncedAt, fullSyncedAt}."""
+    client = get_mongo_client()
+    db = get_database(client)
+    return get_pending_order_snapshots_collection(db).find_one(
+        {"tenant_code": tenant_code, "facility_code": facility_code},
+        {"_id": 0, "orders": 1, "syncedAt": 1, "fullSyncedAt": 1}
+    )
+
+
+@timed("mongo")
+def store_pending_order_snapshot(tenant_code: str, facility_code: str, orders: List[Dict],
+                                 synced_at: datetime.datetime, full_synced_at: datetime.datetime):
+    client = get_mongo_client()
+    db = get_database(client)
+    get_pending_order_snapshots_collection(db).update_one(
+        {"tenant_code": tenant_code, "facility_code": facility_code},
+        {"$set": {"orders": orders, "syncedAt": synced_at, "fullSyncedAt": full_synced_at}},
+        upsert=True
+    )
+
+
+def get_batch_items_collection(database):
+    """
+    Returns process_order_batch_items, creating the unique (batch_id, shipment) index and the TTL
+    index on expireAt on first use.
+    """
+    collection = database["process_order_batch_items"]
+    index_key = (id(database.client), collection.name)
+    if index_key not in _indexed_collections:
+        collection.create_index([("batch_id", 1), ("shipment", 1)], unique=True)
+        collection.create_index("expireAt", expireAfterSeconds=0)
+        _indexed_collections.add(index_key)
+    return collection
+
+
+@timed("mongo")
+def fetch_batch_items(batch_id: str) -> Dict[str, Dict]:
+    """Progress recorded so far for a process_order batch, by shipment code."""
+    client = get_mongo_client()
+    db = get_database(client)
+    cursor = get_batch_items_collection(db).find({"batch_id": batch_id}, {"_id": 0, "batch_id": 0, "expireAt": 0})
+    return {item["shipment"]: item for item in cursor}
+
+
+@timed("mongo")
+def record_batch_item(batch_id: str, shipment: str, fields: Dict):
+    """Records a finished step (invoice, label) for one shipment of a process_order batch."""
+    client = get_mongo_client()
+    db = get_database(client)
+    now = datetime.datetime.utcnow()
+    get_batch_items_collection(db).update_one(
+        {"batch_id": batch_id, "shipment": shipment},
+        {
+            "$set": dict(fields, updatedAt=now,
+                         expireAt=now + datetime.timedelta(seconds=PROCESS_ORDER_BATCH_TTL)),
+            "$setOnInsert": {"batch_id": batch_id, "shipment": shipment}
+        },
+        upsert=True
+    )
+
+
+@timed("mongo")
 def create_chat_session_auth(
     chat_session_id: str,
     user_id: str,
@@ -301,16 +606,12 @@ def create_chat_session_auth(
     # Insert the new entry into the collection
     collection.insert_one(new_entry)
 
-    # Close the MongoDB client connection
-    client.close()
 
+@timed("mongo")
 def fetch_chat_session_auth(chat_session_id: str) -> dict | None:
     client = get_mongo_client()
     db = get_database(client)
     collection = db["chat_session_auth"]
 
-    try:
-        result = collection.find_one({"chat_session_id": chat_session_id})
-        return result
-    finally:
-        client.close()
\ No newline at end of file
+    result = collection.find_one({"chat_session_id": chat_session_id})
+    return result
\ No newline at end of file
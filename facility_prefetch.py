@@ -0,0 +1,114 @@
+"""
+Background warm-up of other facilities' pending orders.
+
+After /chat/initiate the session's other facilities are refreshed on a small per-worker thread
+pool, so a later switch_facility can answer from the stored snapshot instead of exporting while the
+seller waits. Each task runs with a copy of the session's RequestContext (tenant, user, session, and
+a /ws/chat connection's resolved auth), and everything still queued for a session is cancelled when
+it is re-initialised or the worker shuts down.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from RequestContext import RequestContext
+from config import FACILITY_PREFETCH_CONCURRENCY, FACILITY_PREFETCH_MAX_FACILITIES
+from metrics import FACILITY_PREFETCHES
+
+logger = logging.getLogger(__name__)
+
+CONTEXT_KEYS = ("tenant_code", "user_id", "session_id", "session_auth")
+
+SessionKey = Tuple[str, str]
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+# Per session, the event that cancels its queued prefetches and how many of them have not finished
+_sessions: Dict[SessionKey, List] = {}
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=FACILITY_PREFETCH_CONCURRENCY,
+                                               thread_name_prefix="facility-prefetch")
+    return _executor
+
+
+def prefetch_facilities(facility_codes: Iterable[str], refresh: Callable[[str], None]):
+    """
+    Queues refresh(facility_code) for up to FACILITY_PREFETCH_MAX_FACILITIES facilities, in the
+    current session's context. Replaces (cancels) whatever the session still had queued.
+    """
+    context = RequestContext.current()
+    values = {key: context.get(key) for key in CONTEXT_KEYS}
+    key = (values["user_id"], values["session_id"])
+
+    facility_codes = list(facility_codes)[:FACILITY_PREFETCH_MAX_FACILITIES]
+    if not facility_codes:
+        return
+    cancelled = threading.Event()
+    with _executor_lock:
+        previous = _sessions.get(key)
+        _sessions[key] = [cancelled, len(facility_codes)]
+    if previous:
+        previous[0].set()
+
+    executor = _get_executor()
+    for facility_code in facility_codes:
+        executor.submit(_run, key, values, cancelled, refresh, facility_code)
+
+
+def cancel_session(user_id: str, session_id: str):
+    """Drops the session's queued prefetches; one already running finishes its export."""
+    with _executor_lock:
+        entry = _sessions.pop((user_id, session_id), None)
+    if entry:
+        entry[0].set()
+
+
+def cancel_all():
+    """Cancels every queued prefetch and stops the pool without waiting, e.g. on worker shutdown."""
+    global _executor
+    with _executor_lock:
+        events: List[threading.Event] = [entry[0] for entry in _sessions.values()]
+        _sessions.clear()
+        executor, _executor = _executor, None
+    for cancelled in events:
+        cancelled.set()
+    if executor:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _run(key: SessionKey, values: Dict, cancelled: threading.Event, refresh: Callable[[str], None],
+         facility_code: str):
+    try:
+        if cancelled.is_set():
+            FACILITY_PREFETCHES.labels("cancelled").inc()
+            return
+        _refresh_in_context(values, refresh, facility_code)
+    finally:
+        with _executor_lock:
+            entry = _sessions.get(key)
+            if entry and entry[0] is cancelled:
+                entry[1] -= 1
+                if entry[1] <= 0:
+                    del _sessions[key]
+
+
+def _refresh_in_context(values: Dict, refresh: Callable[[str], None], facility_code: str):
+    context = RequestContext()
+    for key, value in values.items():
+        context.set(key, value)
+    RequestContext.set_current(context)
+    try:
+        refresh(facility_code)
+        FACILITY_PREFETCHES.labels("done").inc()
+    except Exception as e:
+        logger.info(f"prefetch of facility {facility_code} failed: {str(e)}")
+        FACILITY_PREFETCHES.labels("failed").inc()
+    finally:
+        RequestContext.set_current(None)
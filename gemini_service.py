@@ -1,15 +1,45 @@
-import google.generativeai as genai
-from config import GOOGLE_API_KEY
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+from config import GOOGLE_API_KEY, GEMINI_CONTEXT_CACHE_TTL, GEMINI_CACHED_MODELS_MAX
 from typing import List, Dict, Optional, Union
-from datetime import datetime
-from google.generativeai.types import FunctionDeclaration
-from google.protobuf.json_format import MessageToDict
+from datetime import datetime, timedelta
 
 from proto_utils import normalize_gemini_args
+from request_timing import span
+from metrics import record_gemini_usage
+
+logger = logging.getLogger(__name__)
+
+# google.generativeai is the heaviest import in the app, so it is loaded (and configured) on the
+# first Gemini call instead of at module load. Tool declarations are kept as plain kwargs until then.
+_genai = None
+_tools = None
+
+
+def get_genai():
+    """Returns the configured google.generativeai module, importing it on first use."""
+    global _genai
+    if _genai is None:
+        import google.generativeai as genai
+        genai.configure(api_key=GOOGLE_API_KEY)
+        _genai = genai
+    return _genai
 
-genai.configure(api_key=GOOGLE_API_KEY)
 
-switch_facility_tool = FunctionDeclaration(
+def get_tools() -> list:
+    """Returns the FunctionDeclarations for all tools, built on first use."""
+    global _tools
+    if _tools is None:
+        get_genai()
+        from google.generativeai.types import FunctionDeclaration
+        _tools = [FunctionDeclaration(**declaration) for declaration in tools]
+    return _tools
+
+
+switch_facility_tool = dict(
     name="switch_facility",
     description=(
         "Switches the seller's active warehouse (facility) to a different one. "
@@ -29,7 +59,7 @@ switch_facility_tool = FunctionDeclaration(
     }
 )
 
-fetch_order_tool = FunctionDeclaration(
+fetch_order_tool = dict(
     name="fetch_order",
     description="Fetches a seller’s orders or picklists before processing, using provided filter options.",
     parameters={
@@ -78,7 +108,7 @@ fetch_order_tool = FunctionDeclaration(
 #     }
 # )
 
-process_order_tool = FunctionDeclaration(
+process_order_tool = dict(
     name="process_order",
     description="Processes selected orders from the current session. Gemini should select and return only orders that the seller has confirmed.",
     parameters={
@@ -137,37 +167,147 @@ def extract_gemini_response_parts(response):
     return result
 
 
+_models: Dict[tuple, object] = {}
+_models_lock = threading.Lock()
+
+
+def model_settings() -> Dict:
+    """Generation config and safety settings shared by plain and cached-content models."""
+    genai = get_genai()
+    generation_config = genai.types.GenerationConfig(
+        temperature=0.5
+    )
+    safety_settings = {
+        "HARM_CATEGORY_HARASSMENT": "BLOCK_ONLY_HIGH",
+        "HARM_CATEGORY_HATE_SPEECH": "BLOCK_ONLY_HIGH",
+        "HARM_CATEGORY_SEXUALLY_EXPLICIT": "BLOCK_ONLY_HIGH",
+        "HARM_CATEGORY_DANGEROUS_CONTENT": "BLOCK_ONLY_HIGH"
+    }
+    return {"generation_config": generation_config, "safety_settings": safety_settings}
+
+
+def get_model(model_name: str, system_instruction: Optional[str] = None):
+    """
+    Returns the GenerativeModel for a (model, system instruction) pair, building it once per worker.
+    Models hold no conversation state, so one instance is safely shared by all requests.
+    """
+    key = (model_name, system_instruction)
+    model = _models.get(key)
+    if model is None:
+        with _models_lock:
+            model = _models.get(key)
+            if model is None:
+                genai = get_genai()
+                model = genai.GenerativeModel(
+                    model_name=model_name,
+                    system_instruction=system_instruction,
+                    tools=get_tools(),
+                    **model_settings()
+                )
+                _models[key] = model
+    return model
+
+
+# Models bound to a provider-side context cache, by cache name. Building one looks the cache up over
+# the network, so they are kept per worker (least recently used dropped beyond GEMINI_CACHED_MODELS_MAX).
+_cached_models: "OrderedDict[str, object]" = OrderedDict()
+
+
+def instruction_hash(system_instruction: Optional[str]) -> str:
+    return hashlib.sha256((system_instruction or "").encode()).hexdigest()[:16]
+
+
+def create_context_cache(model_name: str, system_instruction: Optional[str], feed: List[Dict]) -> Optional[Dict]:
+    """
+    Caches the system instruction, tool declarations and session [System Feed] messages on the
+    Gemini side for GEMINI_CONTEXT_CACHE_TTL seconds, so later turns only send the transcript.
+    Returns the cache reference to store with the session, or None if the cache could not be
+    created (e.g. the context is below the provider's minimum cacheable size).
+    """
+    try:
+        with span("gemini", "cache_create"):
+            cached_content = get_genai().caching.CachedContent.create(
+                model=model_name,
+                system_instruction=system_instruction,
+                contents=feed,
+                tools=get_tools(),
+                ttl=timedelta(seconds=GEMINI_CONTEXT_CACHE_TTL),
+            )
+    except Exception as e:
+        logger.error(f"Error creating context cache: {e}")
+        return None
+
+    return {
+        "name": cached_content.name,
+        "model": model_name,
+        "instructionHash": instruction_hash(system_instruction),
+        "messages": len(feed),
+        "expireAt": datetime.utcnow() + timedelta(seconds=GEMINI_CONTEXT_CACHE_TTL),
+    }
+
+
+def delete_context_cache(cache_name: Optional[str]):
+    """Deletes a context cache ahead of its TTL; failures (already expired, deleted) are ignored."""
+    if not cache_name:
+        return
+    with _models_lock:
+        _cached_models.pop(cache_name, None)
+    try:
+        get_genai().caching.CachedContent.get(name=cache_name).delete()
+    except Exception as e:
+        logger.warning(f"Error deleting context cache {cache_name}: {e}")
+
+
+def get_cached_model(cache_name: str):
+    """Returns a GenerativeModel whose context is the given provider-side cache."""
+    with _models_lock:
+        model = _cached_models.get(cache_name)
+        if model is not None:
+            _cached_models.move_to_end(cache_name)
+            return model
+
+    genai = get_genai()
+    model = genai.GenerativeModel.from_cached_content(cached_content=cache_name, **model_settings())
+    with _models_lock:
+        _cached_models[cache_name] = model
+        while len(_cached_models) > GEMINI_CACHED_MODELS_MAX:
+            _cached_models.popitem(last=False)
+    return model
+
+
 def send_message_gemini(
     model_name: str,
     messages: List[Dict],
-    system_instruction: Optional[str] = None
+    system_instruction: Optional[str] = None,
+    context_cache: Optional[Dict] = None
 ) -> Union[str, Dict]:
     """
     Sends a message to Gemini and returns either:
     - a string (text response), or
     - a dict with tool_call if Gemini wants to invoke a function.
+
+    With a context_cache (see create_context_cache) the leading messages it covers are not sent;
+    if the cache cannot be used the full conversation is sent instead.
     """
-    try:
-        generation_config = genai.types.GenerationConfig(
-            temperature=0.5
-        )
-        safety_settings = {
-            "HARM_CATEGORY_HARASSMENT": "BLOCK_ONLY_HIGH",
-            "HARM_CATEGORY_HATE_SPEECH": "BLOCK_ONLY_HIGH",
-            "HARM_CATEGORY_SEXUALLY_EXPLICIT": "BLOCK_ONLY_HIGH",
-            "HARM_CATEGORY_DANGEROUS_CONTENT": "BLOCK_ONLY_HIGH"
-        }
+    if context_cache:
+        try:
+            model = get_cached_model(context_cache["name"])
+            with span("gemini", model_name):
+                response = model.generate_content(messages[context_cache["messages"]:])
+            record_gemini_usage(model_name, response)
+            return extract_gemini_response_parts(response)
+        except Exception as e:
+            logger.warning(f"Context cache {context_cache.get('name')} unusable, sending full context: {e}")
+            with _models_lock:
+                _cached_models.pop(context_cache.get("name"), None)
 
-        model = genai.GenerativeModel(
-            model_name=model_name,
-            system_instruction=system_instruction,
-            generation_config=generation_config,
-            safety_settings=safety_settings,
-            tools=tools
-        )
+    try:
+        model = get_model(model_name, system_instruction)
 
         # Use generate_content directly (tool mode)
-        response = model.generate_content(messages)
+        with span("gemini", model_name):
+            response = model.generate_content(messages)
+        record_gemini_usage(model_name, response)
 
         # part = response.candidates[0].content.parts[0]
         # if part.function_call is not None and part.function_call.name :
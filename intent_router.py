@@ -0,0 +1,135 @@
+"""
+Rule-based router in front of Gemini.
+
+Recognises the few chat commands whose meaning is not in doubt and maps them straight onto a tool
+call, using the structured session feed stored at /chat/initiate (channels, facilities) and the
+orders already fetched for the session. Anything it is not certain about returns None and goes to
+Gemini as before.
+"""
+import re
+from typing import Callable, Dict, List, Optional
+
+from name_resolver import normalise
+
+INTENT_PROCESS_ALL_ORDERS = "process_all_orders"
+INTENT_SWITCH_FACILITY = "switch_facility"
+INTENT_ORDER_CODES = "order_codes"
+
+MAX_PASTED_ORDER_CODES = 100
+
+PROCESS_ALL_PATTERN = re.compile(
+    r"^(?:(?:yes|ok|okay|sure)[\s,.!]+)?(?:please\s+)?(?:process|invoice)\s+(?:all|every)\s+"
+    r"(?:(?:the|my|of\s+the|of\s+my)\s+)?(?:(?:pending|created|fetched)\s+)?orders?"
+    r"(?:\s+now)?(?:\s+please)?\s*[.!]*$",
+    re.IGNORECASE,
+)
+SWITCH_PATTERN = re.compile(
+    r"^(?:please\s+)?(?:switch|change|move)\s+(?:(?:the|my)\s+)?(?:(?:warehouse|facility)\s+)?to\s+"
+    r"(?P<name>.+?)\s*[.!]*$",
+    re.IGNORECASE,
+)
+NAME_NOISE_PATTERN = re.compile(r"^(?:the\s+)?(?:(?:warehouse|facility)\s+)?|\s+(?:warehouse|facility)$",
+                                re.IGNORECASE)
+ORDER_CODE_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_\-/#.]{4,}$")
+DATE_PATTERN = re.compile(r"^\d{1,4}[-/.]\d{1,2}[-/.]\d{1,4}$")
+CODE_PREFIX_PATTERN = re.compile(r"^[^\d]*")
+TOKEN_SEPARATORS = re.compile(r"[\s,;]+")
+
+
+def route_intent(message: str, session_feed: Optional[Dict],
+                 load_pending_orders: Callable[[], Optional[List[Dict]]]) -> Optional[Dict]:
+    """
+    Returns a Gemini-shaped tool call ({"intent", "tool_call": {"name", "args"}}) for a
+    high-confidence command, or None when the message should go to Gemini. The session's orders
+    are only loaded (load_pending_orders) for a "process all orders" command or a pasted list of
+    codes, which is checked against the session's sale orders.
+    """
+    if not isinstance(message, str):
+        return None
+    text = message.strip()
+    if not text:
+        return None
+
+    if PROCESS_ALL_PATTERN.match(text):
+        pending_orders = load_pending_orders()
+        if not pending_orders:
+            return None
+        return {
+            "intent": INTENT_PROCESS_ALL_ORDERS,
+            "tool_call": {"name": "process_order", "args": {"orders": pending_orders}},
+        }
+
+    switch_match = SWITCH_PATTERN.match(text)
+    if switch_match:
+        facility = match_facility(switch_match.group("name"), (session_feed or {}).get("facilities", []))
+        if not facility:
+            return None
+        return {
+            "intent": INTENT_SWITCH_FACILITY,
+            "tool_call": {"name": "switch_facility", "args": {"facilityCode": facility["facilityCode"]}},
+        }
+
+    order_codes = parse_order_codes(text)
+    if order_codes and are_sale_order_codes(order_codes, load_pending_orders() or []):
+        return {
+            "intent": INTENT_ORDER_CODES,
+            "tool_call": {"name": "fetch_order", "args": {
+                "entity": "SaleOrder",
+                "filterOptions": [{"key": "orderCodeFilter", "selectedValues": order_codes}],
+            }},
+        }
+
+    return None
+
+
+def match_facility(name: str, facilities: List[Dict]) -> Optional[Dict]:
+    """
+    Exact match, after normalising case and punctuation, of the requested name against facility
+    display names and codes. Returns the facility only when exactly one matches; near misses are
+    left to Gemini, which asks the seller to choose.
+    """
+    candidates = {normalise(name), normalise(NAME_NOISE_PATTERN.sub("", name.strip()))}
+    candidates.discard("")
+
+    matches = [
+        facility for facility in facilities
+        if normalise(facility.get("facilityDisplayName")) in candidates
+        or normalise(facility.get("facilityCode")) in candidates
+    ]
+    return matches[0] if len(matches) == 1 else None
+
+
+def parse_order_codes(text: str) -> List[str]:
+    """
+    Returns the codes when the message is nothing but a pasted list of order codes, else [].
+    Every token must look like a code (at least five characters, contains a digit, not a date).
+    """
+    tokens = [token for token in TOKEN_SEPARATORS.split(text) if token]
+    if not tokens or len(tokens) > MAX_PASTED_ORDER_CODES:
+        return []
+
+    for token in tokens:
+        if not ORDER_CODE_PATTERN.match(token) or not any(ch.isdigit() for ch in token) \
+                or DATE_PATTERN.match(token):
+            return []
+
+    return list(dict.fromkeys(tokens))
+
+
+def are_sale_order_codes(codes: List[str], session_orders: List[Dict]) -> bool:
+    """
+    True when every code is one of the session's sale orders, or shares their prefix (e.g. "SO-")
+    and not their shipments'. Bare numbers (pincodes, phone numbers) and unfamiliar prefixes
+    (invoice, picklist codes) are often answers to a question Gemini asked, so they go to Gemini.
+    """
+    sale_orders = {order.get("saleOrderNum") for order in session_orders if order.get("saleOrderNum")}
+    shipment_prefixes = {code_prefix(order["shipment"]) for order in session_orders if order.get("shipment")}
+    sale_order_prefixes = {code_prefix(sale_order) for sale_order in sale_orders} - shipment_prefixes
+    sale_order_prefixes.discard("")
+
+    return all(code in sale_orders or code_prefix(code) in sale_order_prefixes for code in codes)
+
+
+def code_prefix(code: str) -> str:
+    """The part of a code before its first digit, upper-cased: "ship-0042" -> "SHIP-"."""
+    return CODE_PREFIX_PATTERN.match(code).group(0).upper()
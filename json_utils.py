@@ -0,0 +1,33 @@
+"""
+JSON encoding for Uniware payloads and /ws/chat frames.
+
+orjson is used when it is installed and the stdlib json module otherwise; both produce the same
+documents for what the bot sends and receives (dicts, lists, strings, numbers). orjson is several
+times faster on the large cases: pending-order exports parsed on /chat/initiate and base64 PDFs
+sent in WebSocket replies. HTTP responses are rendered by FastAPI from the endpoints' return types.
+"""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(value: Any) -> bytes:
+    """Encodes value as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def response_json(response) -> Any:
+    """Decodes the JSON body of a requests.Response, like response.json()."""
+    return loads(response.content)
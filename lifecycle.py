@@ -0,0 +1,94 @@
+import signal
+import threading
+import time
+import logging
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Condition()
+_in_flight: Dict[str, int] = {}
+_draining = False
+_components: Dict[str, Dict] = {}
+
+
+@contextmanager
+def track_work(name: str):
+    """Counts the enclosed block as in-flight work that shutdown has to wait for."""
+    with _lock:
+        _in_flight[name] = _in_flight.get(name, 0) + 1
+    try:
+        yield
+    finally:
+        with _lock:
+            _in_flight[name] -= 1
+            _lock.notify_all()
+
+
+def in_flight_work() -> Dict[str, int]:
+    with _lock:
+        return {name: count for name, count in _in_flight.items() if count}
+
+
+def start_draining():
+    """Flags the worker as shutting down; readiness turns false so no new traffic is routed here."""
+    global _draining
+    with _lock:
+        _draining = True
+
+
+def drain_on_signal(signum: int = signal.SIGTERM):
+    """
+    Puts start_draining in front of the handler currently installed for signum (uvicorn's, once the
+    server is running), so readiness turns false when the signal arrives rather than when the
+    lifespan shutdown runs after open connections have finished. Must be called from the main thread.
+    """
+    previous = signal.getsignal(signum)
+
+    def handler(sig, frame):
+        start_draining()
+        if callable(previous):
+            previous(sig, frame)
+        elif previous == signal.SIG_DFL:
+            signal.signal(sig, signal.SIG_DFL)
+            signal.raise_signal(sig)
+
+    signal.signal(signum, handler)
+
+
+def wait_for_drain(timeout: float) -> bool:
+    """Blocks until all tracked work has finished or the timeout passes. Returns True if drained."""
+    deadline = time.monotonic() + timeout
+    with _lock:
+        while any(_in_flight.values()):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.info(f"shutdown drain timed out with work in flight: {in_flight_work()}")
+                return False
+            _lock.wait(remaining)
+    return True
+
+
+def mark_warm(component: str, ready: bool, detail: Optional[str] = None):
+    """Records whether a shared component (connection pool, model registry) is warmed up."""
+    with _lock:
+        _components[component] = {"ready": ready, "detail": detail}
+
+
+def readiness_report(preloaded: bool) -> Dict:
+    """
+    Ready when not draining and, if preloading is on, every warmed component came up.
+    Without preloading components are created on first use, so the worker is ready right away.
+    """
+    with _lock:
+        components = dict(_components)
+        draining = _draining
+    ready = not draining and (not preloaded or (components and all(c["ready"] for c in components.values())))
+    return {
+        "ready": bool(ready),
+        "draining": draining,
+        "preloaded": preloaded,
+        "components": components,
+        "inFlight": in_flight_work(),
+    }
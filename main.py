@@ -1,29 +1,55 @@
 import base64
 
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
 from starlette.middleware import Middleware
-from mangum import Mangum
-from Constants import Gemini_System_Instruction, Gemini_Model_Name, sampleBase64Pdf, Play_Mode
-from database import fetch_chat_history, store_message, update_user_order_mappings, get_shipments_by_user, \
-    store_message_metadata, archive_user_data, archive_processed_orders_data, clear_message_metadata, \
-    create_chat_session_auth
-from gemini_service import send_message_gemini
+from Constants import Gemini_System_Instruction, Gemini_Model_Name, get_sample_base64_pdf, Play_Mode, \
+    SHIPMENT_NEEDS_INVOICE, SHIPMENT_NEEDS_LABEL, SHIPMENT_READY_TO_PRINT, SHIPMENT_CANCELLED
+from database import update_user_order_mappings, get_shipments_by_user, \
+    store_message_metadata_batch, archive_user_data, archive_processed_orders_data, clear_message_metadata, \
+    create_chat_session_auth, ping_mongo, close_mongo_client, store_session_feed, store_gemini_context_cache, \
+    fetch_gemini_context_cache, fetch_pending_order_snapshot, store_pending_order_snapshot, fetch_batch_items, \
+    record_batch_item, fetch_chat_session_auth
+from gemini_service import send_message_gemini, get_model, create_context_cache, delete_context_cache, \
+    instruction_hash
+from config import PRELOAD_ON_STARTUP, SHUTDOWN_DRAIN_TIMEOUT, INTENT_FAST_PATH_ENABLED, NAME_FEED_FULL_LIMIT, \
+    NAME_SHORTLIST_SIZE, GEMINI_CONTEXT_CACHE_ENABLED, FOLLOWUP_MODE, PENDING_ORDERS_DELTA_ENABLED, \
+    PENDING_ORDERS_FULL_REFRESH_AGE, PENDING_ORDERS_SYNC_OVERLAP, FACILITY_PREFETCH_ENABLED, FACILITY_PREFETCH_TTL, \
+    WEBSOCKET_TRANSCRIPT_WRITE_BEHIND, WEBSOCKET_IDLE_TIMEOUT, RESPONSE_COMPRESSION_ENABLED, RESPONSE_COMPRESSION_MIN_SIZE
+from intent_router import route_intent
+from facility_prefetch import prefetch_facilities, cancel_session, cancel_all
+from transcript_writer import fetch_chat_history, store_message, flush_session, flush_all
+from name_resolver import session_name_index
+from response_cache import followup_cache, followup_cache_key, followup_names
+from reply_templates import render_tool_reply
+from lifecycle import track_work, start_draining, drain_on_signal, wait_for_drain, mark_warm, readiness_report
 from models import ChatHistory, ChatResponse, LoginRequest, ChatSessionRequest
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Union, Optional, Tuple
 import json
 from datetime import datetime, timedelta
 from starlette.middleware.cors import CORSMiddleware
+from response_compression import CompressionMiddleware
 import io
-from PyPDF2 import PdfMerger
 from fastapi import HTTPException, status, Response, Request
 import requests
-from RequestContext import RequestContext
+from RequestContext import RequestContext, SpanRecorder
 from urllib.parse import urlencode
 import hashlib
 from fastapi.responses import JSONResponse
-
-from uniwareService import make_unicommerce_request, simplify_channels, simplify_warehouses
+from json_utils import dumps, loads, response_json
+
+from uniwareService import make_unicommerce_request, get_http_session, close_http_session, extract_channels, \
+    extract_warehouses, format_channels, format_warehouses
+from circuit_breaker import get_circuit_states
+from outbound_scheduler import outbound_scheduler
+from request_timing import timed, server_timing_header, timing_log_line
+from metrics import HTTP_REQUEST_LATENCY, HTTP_REQUESTS_IN_FLIGHT, INVOICES, LABELS, FAST_PATH_TURNS, PENDING_ORDER_SYNCS, \
+    WEBSOCKET_CONNECTIONS, WEBSOCKET_TURN_LATENCY, render_metrics, mark_worker_dead
+import asyncio
+import os
+import time
 import logging, traceback
+from contextlib import asynccontextmanager
 
 middleware = [
     Middleware(
@@ -35,19 +61,102 @@ middleware = [
         allow_headers=["*"],
     )
 ]
+if RESPONSE_COMPRESSION_ENABLED:
+    middleware.append(Middleware(CompressionMiddleware, minimum_size=RESPONSE_COMPRESSION_MIN_SIZE))
 
-app = FastAPI(middleware=middleware)
+# How long a /ws/chat turn waits for a progress event to be sent before dropping it
+PROGRESS_SEND_TIMEOUT = 5
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
 
+def preload_worker_state():
+    """
+    Warms the per-worker shared state (Mongo pool, Uniware HTTP pool, Gemini model registry) before
+    the worker takes traffic, when PRELOAD_ON_STARTUP is set. /ready reports the outcome.
+    """
+    if not PRELOAD_ON_STARTUP:
+        return
+
+    warmups = {
+        "mongo": ping_mongo,
+        "uniware_http": get_http_session,
+        "gemini_model": lambda: get_model(Gemini_Model_Name, Gemini_System_Instruction),
+    }
+    for component, warmup in warmups.items():
+        try:
+            warmup()
+            mark_warm(component, True)
+        except Exception as e:
+            logger.error(f"failed to warm {component}: {str(e)}")
+            mark_warm(component, False, str(e))
+
+
+def drain_on_sigterm():
+    """
+    Stops reporting ready as soon as SIGTERM arrives. uvicorn has installed its own handler by now
+    and only runs the lifespan shutdown once open connections are done; it is still called after ours.
+    """
+    try:
+        drain_on_signal()
+    except ValueError:
+        # Signal handlers can only be installed from the main thread, which e.g. a TestClient is not
+        logger.info("SIGTERM drain hook not installed outside the main thread")
+
+
+def drain_worker():
+    """
+    Stops reporting ready, waits for in-flight process_order runs to finish (up to
+    SHUTDOWN_DRAIN_TIMEOUT), cancels facility prefetches and writes queued transcript messages,
+    then releases pooled connections and this worker's metrics.
+    """
+    start_draining()
+    wait_for_drain(SHUTDOWN_DRAIN_TIMEOUT)
+    cancel_all()
+    flush_all(SHUTDOWN_DRAIN_TIMEOUT)
+    close_http_session()
+    close_mongo_client()
+    mark_worker_dead(os.getpid())
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Worker startup and shutdown. Runs on the event loop thread, which the SIGTERM hook needs."""
+    preload_worker_state()
+    drain_on_sigterm()
+    yield
+    drain_worker()
+
+
+app = FastAPI(middleware=middleware, lifespan=lifespan)
+
+
 def generate_session_id(user_id: str) -> str:
     """Generates a SHA-256 hash of userId and timestamp."""
     timestamp = int(datetime.now().timestamp() * 1000)
     return hashlib.sha256(f"{user_id}{timestamp}".encode()).hexdigest()
 
 
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """
+    Middleware to record latency and in-flight count for every request, labelled by route template.
+    """
+    started_at = time.perf_counter()
+    status_code = 500
+    HTTP_REQUESTS_IN_FLIGHT.inc()
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        HTTP_REQUESTS_IN_FLIGHT.dec()
+        route = request.scope.get("route")
+        HTTP_REQUEST_LATENCY.labels(request.method, route.path if route else "unmatched",
+                                    str(status_code)).observe(time.perf_counter() - started_at)
+
+
 # Middleware to enforce authentication
 @app.middleware("http")
 async def authenticate_request(request: Request, call_next):
@@ -61,7 +170,11 @@ async def authenticate_request(request: Request, call_next):
 
     public_paths = [
         "/login",
-        "/bot/session/create"
+        "/bot/session/create",
+        "/health/circuits",
+        "/health/outbound",
+        "/metrics",
+        "/ready"
     ]
     # Initialize RequestContext
     context = RequestContext()
@@ -80,16 +193,14 @@ async def authenticate_request(request: Request, call_next):
 
     if not tenant_code:
         return JSONResponse(
-            content=json.dumps({"detail": "Tenant code is required"}),
+            content={"detail": "Tenant code is required"},
             status_code=status.HTTP_400_BAD_REQUEST,
-            media_type="application/json"
         )
 
     if not session_id:
         return JSONResponse(
-            content=json.dumps({"detail": "Session missing, Not logged in"}),
+            content={"detail": "Session missing, Not logged in"},
             status_code=status.HTTP_401_UNAUTHORIZED,
-            media_type="application/json"
         )
     try:
         # validate_response = requests.get(
@@ -110,12 +221,14 @@ async def authenticate_request(request: Request, call_next):
 
         # Proceed with the request
         response = await call_next(request)
+        response.headers["Server-Timing"] = server_timing_header(context.spans)
+        logger.info(timing_log_line(context.spans, request.method, request.url.path, response.status_code,
+                                    tenant_code))
         return response
     except requests.RequestException:
         return JSONResponse(
-            content=json.dumps({"detail": "Invalid or expired token"}),
+            content={"detail": "Invalid or expired token"},
             status_code=status.HTTP_401_UNAUTHORIZED,
-            media_type="application/json"
         )
     finally:
         # Clear context after request
@@ -123,102 +236,432 @@ async def authenticate_request(request: Request, call_next):
 
 
 @app.post("/chat")
-async def chat(
+def chat(
         request: Request,
         history: ChatHistory,
         model_name: str = Gemini_Model_Name,
         system_instruction: str = Gemini_System_Instruction,
-):
+) -> ChatResponse:
     """
-    Handles chat interaction with Gemini model, supports function calling.
+    Handles chat interaction with Gemini model, supports function calling. The return type lets
+    FastAPI serialise the reply, base64 PDFs included, straight to JSON bytes through Pydantic.
     """
     context = RequestContext.current()
-    tenant_code = context.get("tenant_code")
-    session_id = context.get("session_id")
-    user_id = context.get("user_id")
+    return run_chat_turn(context.get("tenant_code"), context.get("user_id"), context.get("session_id"),
+                         history.messages, model_name, system_instruction)
 
-    # Prepare full conversation history
-    formatted_history = []
 
+def run_chat_turn(tenant_code: str, user_id: str, session_id: str, messages: List[Dict],
+                  model_name: str = Gemini_Model_Name,
+                  system_instruction: str = Gemini_System_Instruction) -> ChatResponse:
+    """
+    One chat turn, shared by POST /chat and /ws/chat: the intent fast path, else Gemini and the tool
+    it calls, with the transcript stored along the way.
+    """
+    # Prepare full conversation history
     db_history = fetch_chat_history(user_id, session_id)
-    messages_metadata = db_history.get("messages_metadata", [])
-    messages = db_history.get("messages", [])
-
-    for meta in messages_metadata:
-        formatted_history.append({
-            "role": "user",
-            "parts": [meta["message"]]
-        })
-
-    for message in messages:
-        formatted_history.append({
-            "role": message["role"],
-            "parts": [message["message"]]
-        })
-
-    formatted_history.extend(history.messages)
-    user_message_text = history.messages[-1]["parts"][0]
+    user_message_text = messages[-1]["parts"][0]
+    shortlist_feed = catalogue_shortlist_feed(tenant_code, db_history.get("session_feed"), user_message_text)
+    formatted_history = build_formatted_history(db_history, shortlist_feed + messages)
 
     # Save user message
     store_message(user_id, session_id, user_message_text, "user")
 
+    # Unambiguous commands are answered by the intent router, without a Gemini round trip
+    if INTENT_FAST_PATH_ENABLED:
+        intent = route_intent(user_message_text, db_history.get("session_feed"),
+                              lambda: get_shipments_by_user(user_id, session_id))
+        if intent:
+            return answer_with_template(user_id, session_id, intent, db_history.get("session_feed"))
+
     # Call Gemini
-    response = send_message_gemini(model_name, formatted_history, system_instruction)
+    report_progress("thinking")
+    context_cache = usable_context_cache(db_history, model_name, system_instruction)
+    response = send_message_gemini(model_name, formatted_history, system_instruction, context_cache)
 
     # CASE 1: Tool call
     if isinstance(response, dict) and "tool_call" in response:
         tool_name = response["tool_call"]["name"]
         args = response["tool_call"]["args"]
+        report_progress("tool", tool=tool_name)
 
-        if tool_name == "fetch_order":
-            result = fetch_order(args)
-            store_message(user_id, session_id, result, "user")
+        outcome = run_tool(tool_name, args, db_history.get("session_feed"))
+        if outcome is None:
+            return ChatResponse(response="Unknown tool call", type="text")
+        store_message(user_id, session_id, outcome["result"], "user")
 
-            followup_history = formatted_history + [{
-                "role": "user",
-                "parts": [result]
-            }]
-            final_response = send_message_gemini(model_name, followup_history, system_instruction)
-            store_message(user_id, session_id, final_response["text_response"], "model")
-            return ChatResponse(response=final_response["text_response"], type="text")
+        # A facility switch replaces the feed (and its cache), so its follow-up goes uncached
+        final_text = followup_reply(tool_name, args, outcome, formatted_history, db_history.get("session_feed"),
+                                    model_name, system_instruction,
+                                    None if tool_name == "switch_facility" else context_cache)
+        store_message(user_id, session_id, final_text, "model")
 
-        elif tool_name == "process_order":
+        return tool_chat_response(outcome, final_text)
+
+    store_message(user_id, session_id, response["text_response"], "model")
+    return ChatResponse(response=response["text_response"], type="text")
+
+
+def chat_user_id(username: str, tenant_code: str) -> str:
+    """The user id handed to the client at login; chat_session_auth stores the bare username."""
+    return f"{username}_{tenant_code}"
+
+
+@app.websocket("/ws/chat")
+async def chat_socket(websocket: WebSocket):
+    """
+    Chat over one WebSocket connection. Tenant, session and user come from the x-tenant-code /
+    x-chat-session-id / x-user-id headers (or tenantCode / sessionId / userId query parameters, for
+    browsers) and the session's Uniware auth is resolved once, when the connection opens; the
+    connection is refused unless the session belongs to that tenant and user. Each
+    {"messages": [...]} sent is a turn, answered with progress events and then
+    {"event": "response", "response": ..., "type": ...}.
+    """
+    tenant_code = websocket.headers.get("x-tenant-code") or websocket.query_params.get("tenantCode")
+    session_id = websocket.headers.get("x-chat-session-id") or websocket.query_params.get("sessionId")
+    user_id = websocket.headers.get("x-user-id") or websocket.query_params.get("userId")
+    if not tenant_code or not session_id:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    session_auth = await run_in_threadpool(fetch_chat_session_auth, session_id)
+    if not session_auth or session_auth.get("tenant_code") != tenant_code \
+            or not user_id or user_id != chat_user_id(session_auth.get("user_id"), tenant_code):
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    loop = asyncio.get_running_loop()
+    context = RequestContext()
+    context.set("tenant_code", tenant_code)
+    context.set("user_id", user_id)
+    context.set("session_id", session_id)
+    context.set("session_auth", session_auth)
+    context.set("transcript_write_behind", WEBSOCKET_TRANSCRIPT_WRITE_BEHIND)
+    context.set("progress", lambda event: send_progress(websocket, loop, event))
+
+    await websocket.accept()
+    WEBSOCKET_CONNECTIONS.inc()
+    logger.info(f"websocket chat opened for session {session_id}")
+    try:
+        while True:
+            try:
+                payload = await asyncio.wait_for(websocket.receive_json(), WEBSOCKET_IDLE_TIMEOUT)
+            except asyncio.TimeoutError:
+                await websocket.close(code=status.WS_1000_NORMAL_CLOSURE)
+                return
+
+            started_at = time.perf_counter()
+            outcome = "error"
+            try:
+                history = ChatHistory(**payload)
+                reply = await run_in_threadpool(run_socket_turn, context, history.messages)
+                outcome = "ok"
+            except Exception as e:
+                logger.error(f"websocket chat turn failed for session {session_id}: {str(e)}")
+                await websocket.send_json({"event": "error", "detail": "Unable to process the message"})
+                continue
+            finally:
+                WEBSOCKET_TURN_LATENCY.labels(outcome).observe(time.perf_counter() - started_at)
+            await websocket.send_text(dumps({"event": "response", "response": reply.response,
+                                             "type": reply.type}).decode("utf-8"))
+    except WebSocketDisconnect:
+        logger.info(f"websocket chat closed for session {session_id}")
+    finally:
+        WEBSOCKET_CONNECTIONS.dec()
+        # The connection's queued transcript messages are written now rather than on the next flush
+        await run_in_threadpool(flush_session, user_id, session_id)
+
+
+def run_socket_turn(context: RequestContext, messages: List[Dict]) -> ChatResponse:
+    """Runs a /ws/chat turn on the threadpool in the connection's RequestContext, timed on its own."""
+    context.spans = SpanRecorder()
+    RequestContext.set_current(context)
+    try:
+        reply = run_chat_turn(context.get("tenant_code"), context.get("user_id"), context.get("session_id"),
+                              messages)
+        logger.info(timing_log_line(context.spans, "WS", "/ws/chat", 200, context.get("tenant_code")))
+        return reply
+    finally:
+        RequestContext.set_current(None)
+
+
+def send_progress(websocket: WebSocket, loop: asyncio.AbstractEventLoop, event: Dict):
+    """Sends a progress event from a turn's worker thread; a client that went away only misses it."""
+    try:
+        asyncio.run_coroutine_threadsafe(websocket.send_json(event), loop).result(PROGRESS_SEND_TIMEOUT)
+    except Exception as e:
+        logger.info(f"progress event not delivered: {str(e)}")
+
+
+def report_progress(stage: str, **details):
+    """
+    Sends a progress event of the current turn to its /ws/chat client. A no-op for HTTP requests,
+    which only get the final response.
+    """
+    context = RequestContext.current_or_none()
+    listener = context.get("progress") if context else None
+    if listener is not None:
+        listener({"event": "progress", "stage": stage, **details})
+
+
+def followup_reply(tool_name: str, args: Dict, outcome: Dict[str, Any], formatted_history: List[Dict],
+                   session_feed: Optional[Dict], model_name: str, system_instruction: str,
+                   context_cache: Optional[Dict]) -> str:
+    """
+    Phrases a tool result for the seller according to FOLLOWUP_MODE: a template, a cached earlier
+    Gemini reply for the same tenant, warehouse, tool, result and recent context, or a fresh
+    Gemini call.
+    """
+    if FOLLOWUP_MODE == "template":
+        reply = render_tool_reply(tool_name, args, outcome)
+        if reply is not None:
+            return reply
+
+    cache_key = None
+    if FOLLOWUP_MODE == "cache":
+        # A switch's reply can name the facility switched to as well as the one switched from
+        names = dict(followup_names(session_feed), switchedTo=outcome.get("facilityDisplayName"))
+        cache_key = followup_cache_key(model_name, instruction_hash(system_instruction),
+                                       RequestContext.current().get("tenant_code"), names, tool_name,
+                                       outcome["result"], formatted_history)
+        cached_reply = followup_cache.get(cache_key)
+        if cached_reply is not None:
+            return cached_reply
+
+    followup_history = formatted_history + [{
+        "role": "user",
+        "parts": [outcome["result"]]
+    }]
+    final_response = send_message_gemini(model_name, followup_history, system_instruction, context_cache)
+    logger.info(f"final response is {final_response}")
+
+    if cache_key is not None and isinstance(final_response, dict) and final_response.get("text_response"):
+        followup_cache.put(cache_key, final_response["text_response"])
+    return final_response["text_response"]
+
+
+def run_tool(tool_name: str, args: Dict, session_feed: Optional[Dict] = None) -> Optional[Dict[str, Any]]:
+    """
+    Executes a tool call, whether it came from Gemini or from the intent router.
+    Returns the tool result fed back to the model plus the details reply templates need
+    (orders, PDF, switched facility), or None for an unknown tool.
+    """
+    args = resolve_tool_names(tool_name, args, session_feed)
+
+    if tool_name == "fetch_order":
+        result, orders = fetch_order_details(args)
+        return {"result": result, "orders": orders}
+
+    if tool_name == "process_order":
+        with track_work("process_order"):
             result, pdf_base64 = process_order(args)
-            store_message(user_id, session_id, result, "user")
+        return {"result": result, "pdf": pdf_base64}
 
-            followup_history = formatted_history + [{
-                "role": "user",
-                "parts": [result]
-            }]
-            final_response = send_message_gemini(model_name, followup_history, system_instruction)
-            logger.info(f"final response is {final_response}")
-            store_message(user_id, session_id, final_response["text_response"], "user")
+    if tool_name == "switch_facility":
+        result, switched, pending_orders = switch_facility_details(args)
+        display_name = facility_display_name(session_feed, args.get("facilityCode"))
+        if switched and session_feed:
+            refresh_system_feed(session_feed, display_name, pending_orders)
+        return {
+            "result": result,
+            "switched": switched,
+            "orders": pending_orders,
+            "facilityDisplayName": display_name,
+        }
+
+    return None
+
+
+def resolve_tool_names(tool_name: str, args: Dict, session_feed: Optional[Dict]) -> Dict:
+    """
+    Maps channel / facility names passed in place of a channelId / facilityCode onto the id through
+    the tenant's name index. Values that already are ids, or do not resolve unambiguously, are
+    passed through unchanged.
+    """
+    if not session_feed:
+        return args
+    tenant_code = RequestContext.current().get("tenant_code")
+
+    if tool_name == "switch_facility" and args.get("facilityCode"):
+        index = session_name_index(tenant_code, "facilities", session_feed)
+        if index.get(args["facilityCode"]) is None:
+            facility = index.resolve(args["facilityCode"])
+            if facility:
+                args = dict(args, facilityCode=facility["facilityCode"])
+
+    elif tool_name == "fetch_order":
+        index = session_name_index(tenant_code, "channels", session_feed)
+        filter_options = []
+        for option in args.get("filterOptions") or []:
+            if option.get("key") == "channelFilter" and option.get("selectedValues") is not None:
+                values = option["selectedValues"] if isinstance(option["selectedValues"], list) \
+                    else [option["selectedValues"]]
+                resolved = []
+                for value in values:
+                    channel = index.resolve(value) if index.get(value) is None else None
+                    resolved.append(str(channel["channelId"]) if channel else value)
+                option = dict(option, selectedValues=resolved)
+            filter_options.append(option)
+        args = dict(args, filterOptions=filter_options)
+
+    return args
+
+
+def store_system_feed(user_id: str, session_id: str, channels: List[Dict], facilities: List[Dict],
+                      warehouse_display_name: str, pending_orders: List[Dict]) -> List[str]:
+    """
+    Stores the [System Feed] metadata messages Gemini reads before the transcript and returns them.
+    """
+    # Get current date in correct format
+    current_date = datetime.now().strftime("%d-%m-%Y")
 
-            if pdf_base64:
-                return ChatResponse(response=pdf_base64, type="pdf")
-            return ChatResponse(response=final_response["text_response"], type="text")
+    feed = [
+        f"[System Feed] CHANNELS: {catalogue_feed(channels, format_channels, 'channels')}",
+        f"[System Feed] CURRENT WAREHOUSE DISPLAY NAME: {warehouse_display_name}",
+        f"[System Feed] ALL WAREHOUSES USER HAS ACCESS TO: {catalogue_feed(facilities, format_warehouses, 'warehouses')}",
+        f"[System Feed] Today's Date is : {current_date} , calculate relative dates like tomorrow , today , next week , taking this as reference",
+        f"[System Feed] summary of Pending/Created orders for user for the warehouse :{warehouse_display_name} pending orders  : {pending_orders}",
+    ]
+    store_message_metadata_batch(user_id, session_id, feed, "user")
+    return feed
+
+
+def refresh_system_feed(session_feed: Dict, warehouse_display_name: str, pending_orders: List[Dict]):
+    """
+    Rewrites the [System Feed] after a facility switch, so the current warehouse and its pending
+    orders are what Gemini sees from the next turn on, and replaces the context cache built from it.
+    """
+    context = RequestContext.current()
+    user_id = context.get("user_id")
+    session_id = context.get("session_id")
+
+    previous_cache = fetch_gemini_context_cache(user_id, session_id) if GEMINI_CONTEXT_CACHE_ENABLED else None
+    clear_message_metadata(user_id, session_id)
+    feed = store_system_feed(user_id, session_id, session_feed.get("channels") or [],
+                             session_feed.get("facilities") or [], warehouse_display_name, pending_orders)
+    refresh_context_cache(user_id, session_id, feed, previous_cache)
+
+
+def refresh_context_cache(user_id: str, session_id: str, feed: List[str], previous_cache: Optional[Dict]):
+    """
+    Replaces the session's Gemini context cache with one holding the system instruction, tools and
+    the given [System Feed] messages. Without a usable cache turns simply send the full context.
+    """
+    if not GEMINI_CONTEXT_CACHE_ENABLED:
+        return
+    if previous_cache:
+        delete_context_cache(previous_cache.get("name"))
+
+    cache = create_context_cache(Gemini_Model_Name, Gemini_System_Instruction,
+                                 [{"role": "user", "parts": [message]} for message in feed])
+    store_gemini_context_cache(user_id, session_id, cache)
+
+
+def usable_context_cache(db_history: Dict, model_name: str, system_instruction: str) -> Optional[Dict]:
+    """
+    The session's context cache if it still matches this turn: same model and system instruction,
+    same number of [System Feed] messages, and not about to expire.
+    """
+    cache = db_history.get("gemini_context_cache")
+    if not GEMINI_CONTEXT_CACHE_ENABLED or not cache:
+        return None
+    if cache.get("model") != model_name or cache.get("instructionHash") != instruction_hash(system_instruction):
+        return None
+    if cache.get("messages") != len(db_history.get("messages_metadata", [])):
+        return None
+    if not cache.get("expireAt") or cache["expireAt"] <= datetime.utcnow() + timedelta(seconds=60):
+        return None
+    return cache
+
+
+def catalogue_feed(entries: List[Dict], formatter, label: str) -> str:
+    """
+    [System Feed] text for the channel / warehouse catalogue. Catalogues over NAME_FEED_FULL_LIMIT
+    are not listed; each turn gets the matching entries instead (see catalogue_shortlist_feed).
+    """
+    if len(entries) <= NAME_FEED_FULL_LIMIT:
+        return formatter(entries)
+    return (f"The seller has {len(entries)} {label}, too many to list here. The {label} matching each "
+            f"seller message are given in a separate [System Feed] with that message.")
 
-        elif tool_name == "switch_facility":
-            result = switch_facility_uniware(args)
-            store_message(user_id, session_id, result, "user")
 
-            followup_history = formatted_history + [{
+def catalogue_shortlist_feed(tenant_code: str, session_feed: Optional[Dict], message_text: str) -> List[Dict]:
+    """
+    For catalogues too large for the stored [System Feed], the channels / warehouses the current
+    message mentions, as transient feed messages sent with this turn only.
+    """
+    feed = []
+    catalogues = (("channels", "CHANNELS", format_channels), ("facilities", "WAREHOUSES", format_warehouses))
+    for kind, label, formatter in catalogues:
+        entries = (session_feed or {}).get(kind) or []
+        if len(entries) <= NAME_FEED_FULL_LIMIT:
+            continue
+        shortlist = session_name_index(tenant_code, kind, session_feed).shortlist(str(message_text),
+                                                                                  NAME_SHORTLIST_SIZE)
+        if shortlist:
+            feed.append({
                 "role": "user",
-                "parts": [result]
-            }]
-            final_response = send_message_gemini(model_name, followup_history, system_instruction)
-            store_message(user_id, session_id, final_response["text_response"], "user")
+                "parts": [f"[System Feed] {label} MATCHING THE SELLER'S MESSAGE: {formatter(shortlist)}"]
+            })
+    return feed
 
-            return ChatResponse(response=final_response["text_response"], type="text")
 
-        return ChatResponse(response="Unknown tool call", type="text")
+def tool_chat_response(outcome: Dict[str, Any], text_response: str) -> ChatResponse:
+    if outcome.get("pdf"):
+        return ChatResponse(response=outcome["pdf"], type="pdf")
+    return ChatResponse(response=text_response, type="text")
+
+
+def answer_with_template(user_id: str, session_id: str, intent: Dict, session_feed: Optional[Dict]) -> ChatResponse:
+    """
+    Runs the tool picked by the intent router and answers with a templated reply. The tool result
+    and reply are stored like a Gemini turn, so later turns see the same transcript either way.
+    """
+    tool_name = intent["tool_call"]["name"]
+    args = intent["tool_call"]["args"]
+    FAST_PATH_TURNS.labels(intent["intent"]).inc()
+    report_progress("tool", tool=tool_name)
+
+    outcome = run_tool(tool_name, args, session_feed)
+    reply = render_tool_reply(tool_name, args, outcome)
+    store_message(user_id, session_id, outcome["result"], "user")
+    store_message(user_id, session_id, reply, "model")
+
+    return tool_chat_response(outcome, reply)
 
-    store_message(user_id, session_id, response["text_response"], "model")
-    return ChatResponse(response=response["text_response"], type="text")
+
+def facility_display_name(session_feed: Optional[Dict], facility_code: Optional[str]) -> Optional[str]:
+    for facility in (session_feed or {}).get("facilities", []):
+        if facility.get("facilityCode") == facility_code:
+            return facility.get("facilityDisplayName")
+    return facility_code
+
+
+def build_formatted_history(db_history: Dict, new_messages: List[Dict]) -> List[Dict]:
+    """
+    Assembles the Gemini conversation: [System Feed] metadata first, then the stored transcript,
+    then the messages of the current turn.
+    """
+    formatted_history = []
+
+    for meta in db_history.get("messages_metadata", []):
+        formatted_history.append({
+            "role": "user",
+            "parts": [meta["message"]]
+        })
+
+    for message in db_history.get("messages", []):
+        formatted_history.append({
+            "role": message["role"],
+            "parts": [message["message"]]
+        })
+
+    formatted_history.extend(new_messages)
+    return formatted_history
 
 
 @app.post("/chat/initiate")
-async def chat():
+def chat():
     """
     Endpoint for chatting with the Gemini model.
     """
@@ -228,12 +671,27 @@ async def chat():
     session_id = context.get("session_id")
     user_id = context.get("user_id")
 
+    previous_cache = fetch_gemini_context_cache(user_id, session_id) if GEMINI_CONTEXT_CACHE_ENABLED else None
+    # Queued messages of the previous conversation have to be stored before it is archived
+    flush_session(user_id, session_id)
+    cancel_session(user_id, session_id)
     clear_message_metadata(user_id, session_id)
     archive_user_data(user_id, session_id, True)
     channels_response = make_unicommerce_request(tenant_code, "/data/channel/getChannels", "POST", session_id, {})
     facility_response = make_unicommerce_request(tenant_code, "/data/user/facilities", "GET", session_id, {})
-    warehouse_display_name = get_current_warehouse_display_name(facility_response.json())
-    pending_orders = fetch_pending_orders_shipment()
+    facility_data = response_json(facility_response)
+    warehouse_display_name = get_current_warehouse_display_name(facility_data)
+
+    channels = extract_channels(response_json(channels_response))
+    facilities = extract_warehouses(facility_data)
+    current_facility_code = facility_data.get("currentFacilityCode") or \
+        (facilities[0]["facilityCode"] if facilities else None)
+    pending_orders = fetch_pending_orders_shipment(current_facility_code)
+    store_session_feed(user_id, session_id, {
+        "channels": channels,
+        "facilities": facilities,
+        "currentFacilityCode": current_facility_code,
+    })
 
     if len(pending_orders) > 0:
         update_user_order_mappings(
@@ -244,26 +702,25 @@ async def chat():
 
     store_message(user_id, session_id, "Hi, I'm your Uniware assistant. I'll help analyze your data.", "model")
 
-    # Get current date in correct format
-    current_date = datetime.now().strftime("%d-%m-%Y")
+    feed = store_system_feed(user_id, session_id, channels, facilities, warehouse_display_name, pending_orders)
+    refresh_context_cache(user_id, session_id, feed, previous_cache)
 
-    store_message_metadata(user_id, session_id,
-                           f"[System Feed] CHANNELS: {simplify_channels(channels_response.json())}", "user")
-    store_message_metadata(user_id, session_id,
-                           f"[System Feed] CURRENT WAREHOUSE DISPLAY NAME: {warehouse_display_name}", "user")
-    store_message_metadata(user_id, session_id,
-                           f"[System Feed] ALL WAREHOUSES USER HAS ACCESS TO: {simplify_warehouses(facility_response.json())}",
-                           "user")
-    store_message_metadata(user_id, session_id,
-                           f"[System Feed] Today's Date is : {current_date} , calculate relative dates like tomorrow , today , next week , taking this as reference",
-                           "user")
-    store_message_metadata(user_id, session_id,
-                           f"[System Feed] summary of Pending/Created orders for user for the warehouse :{warehouse_display_name} pending orders  : {pending_orders}",
-                           "user")
+    if FACILITY_PREFETCH_ENABLED:
+        prefetch_facilities([facility["facilityCode"] for facility in facilities
+                             if facility.get("facilityCode") and facility["facilityCode"] != current_facility_code],
+                            prefetch_pending_orders)
 
     return {"message": "Hi, How can I assist you today", "session_id": session_id}
 
 
+PENDING_SHIPMENT_COLUMNS = ["saleOrderNum", "channel", "picklist", "fulfillmentTat", "shipment", "channelName",
+                            "channelId"]
+PENDING_ORDER_FIELDS = ["saleOrderNum", "shipment", "channel", "channelName", "channelId"]
+PENDING_DELTA_MAX_ROWS = 5000
+# Exports scoped to another facility also ask for each row's facility, to check the scoping held
+FACILITY_COLUMN = "facility"
+
+
 def build_filter(filter_id, selected_values):
     return {
         "id": filter_id,
@@ -301,13 +758,18 @@ def convert_date_format(input_date: str) -> Dict[str, str]:
         end_date = dt.replace(hour=23, minute=59, second=59, microsecond=999000)
 
         return {
-            "start": start_date.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z",
-            "end": end_date.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+            "start": format_export_date(start_date),
+            "end": format_export_date(end_date)
         }
     except ValueError as e:
         raise ValueError(f"Invalid date format. Expected dd-MM-yyyy, got {input_date}") from e
 
 
+def format_export_date(value: datetime) -> str:
+    """Export filter timestamp, e.g. 2025-01-31T23:59:59.999Z."""
+    return value.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
 def transform_filter_options(filter_options: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Transform filter options according to business rules
@@ -396,28 +858,146 @@ def process_validation_request_filters(input_json: Dict[str, Any]) -> Union[list
         return input_json.get("filterOptions")
 
 
-def fetch_pending_orders_shipment() -> list:
-    # Usage
-    extracted_data = []
-    result = ""
+def fetch_pending_orders_shipment(facility_code: Optional[str] = None, allow_warm: bool = False,
+                                  scoped: bool = False) -> list:
+    """
+    CREATED shipments of the current facility. With PENDING_ORDERS_DELTA_ENABLED they come from the
+    tenant + facility snapshot in Mongo, brought up to date with only the shipments updated since
+    its last sync; the full export runs when there is no snapshot, it is older than
+    PENDING_ORDERS_FULL_REFRESH_AGE or the delta could not be fetched.
+    With allow_warm, a snapshot synced less than FACILITY_PREFETCH_TTL ago (e.g. by the background
+    prefetch) is returned as is. scoped sends the exports with a Facility header, for a facility
+    other than the user's current one; a scoped export with any row of another facility is discarded.
+    """
+    if not (PENDING_ORDERS_DELTA_ENABLED or FACILITY_PREFETCH_ENABLED) or not facility_code:
+        return export_pending_orders() or []
+
+    tenant_code = RequestContext.current().get("tenant_code")
+    facility_header = facility_code if scoped else None
+    sync_started_at = datetime.utcnow()
+    snapshot = fetch_pending_order_snapshot(tenant_code, facility_code)
+
+    if snapshot and allow_warm and FACILITY_PREFETCH_ENABLED and \
+            sync_started_at - snapshot["syncedAt"] < timedelta(seconds=FACILITY_PREFETCH_TTL):
+        PENDING_ORDER_SYNCS.labels("warm").inc()
+        return snapshot.get("orders") or []
+
+    if PENDING_ORDERS_DELTA_ENABLED and snapshot and \
+            sync_started_at - snapshot["fullSyncedAt"] < timedelta(seconds=PENDING_ORDERS_FULL_REFRESH_AGE):
+        since = snapshot["syncedAt"] - timedelta(seconds=PENDING_ORDERS_SYNC_OVERLAP)
+        updated_shipments = export_updated_shipments(since, sync_started_at, facility_header)
+        if updated_shipments is not None:
+            pending_orders = merge_pending_orders(snapshot.get("orders") or [], updated_shipments)
+            store_pending_order_snapshot(tenant_code, facility_code, pending_orders, sync_started_at,
+                                         snapshot["fullSyncedAt"])
+            PENDING_ORDER_SYNCS.labels("delta").inc()
+            return pending_orders
+
+    pending_orders = export_pending_orders(facility_header)
+    if pending_orders is None:
+        return []
+    store_pending_order_snapshot(tenant_code, facility_code, pending_orders, sync_started_at, sync_started_at)
+    PENDING_ORDER_SYNCS.labels("full").inc()
+    return pending_orders
+
+
+def prefetch_pending_orders(facility_code: str):
+    """Background task: warms the snapshot of a facility the seller may switch to."""
+    fetch_pending_orders_shipment(facility_code, allow_warm=True, scoped=True)
+
+
+def facility_headers(facility_code: Optional[str]) -> Optional[Dict[str, str]]:
+    """Scopes a Uniware call to a facility without switching the user's current one."""
+    return {"Facility": facility_code} if facility_code else None
+
+
+def scoped_export_columns(columns: List[str], facility_code: Optional[str]) -> List[str]:
+    return columns + [FACILITY_COLUMN] if facility_code else columns
+
+
+def rows_in_facility(rows: List[Dict], facility_code: Optional[str]) -> bool:
+    """
+    For an export scoped to facility_code: True when every row reports that facility, and strips the
+    facility field. Uniware not honouring the Facility header would otherwise put the current
+    facility's shipments into another facility's snapshot.
+    """
+    if not facility_code:
+        return True
+    if any(row.pop(FACILITY_COLUMN, None) != facility_code for row in rows):
+        logger.error(f"export scoped to facility {facility_code} returned rows of another facility, discarded")
+        return False
+    return True
+
+
+def export_pending_orders(facility_code: Optional[str] = None) -> Optional[List[Dict]]:
+    """
+    Full export of the current (or given) facility's CREATED shipments; None when the export failed
+    or was not scoped to the given facility.
+    """
     context = RequestContext.current()
 
     tenant_code = context.get("tenant_code")
-    user_id = context.get("user_id")
     session_id = context.get("session_id")
 
-    shipment_columns = ["saleOrderNum", "channel", "picklist", "fulfillmentTat", "shipment", "channelName", "channelId"]
-    orders_columns = ["saleOrderNum", "shipment", "channel", "channelName", "channelId"]
     shipment_filters = [{
         "id": "statusFilter",
         "selectedValues": ["CREATED"]
     }]
-    shipment_request_body = build_request_body(shipment_columns, shipment_filters)
+    columns = scoped_export_columns(PENDING_SHIPMENT_COLUMNS, facility_code)
+    shipment_request_body = build_request_body(columns, shipment_filters)
     orders_response = make_unicommerce_request(tenant_code, "/data/tasks/export/data", "POST", session_id,
-                                               shipment_request_body)
-    extracted_data = extract_orders_response(orders_response.json(), shipment_columns, orders_columns)
+                                               shipment_request_body, facility_headers(facility_code))
+    if orders_response.status_code != 200:
+        return None
+    rows = extract_orders_response(response_json(orders_response), columns,
+                                   scoped_export_columns(PENDING_ORDER_FIELDS, facility_code))
+    return rows if rows_in_facility(rows, facility_code) else None
+
+
+def export_updated_shipments(since: datetime, until: datetime,
+                             facility_code: Optional[str] = None) -> Optional[List[Dict]]:
+    """
+    Shipments of the current (or given) facility updated in [since, until], in any status, with their status.
+    None when the export failed, hit the row limit or was not scoped to the given facility, so the
+    caller falls back to a full export.
+    """
+    context = RequestContext.current()
 
-    return extracted_data
+    tenant_code = context.get("tenant_code")
+    session_id = context.get("session_id")
+
+    columns = scoped_export_columns(PENDING_SHIPMENT_COLUMNS + ["status"], facility_code)
+    shipment_filters = [{
+        "id": "updatedDateRangeFilter",
+        "dateRange": {"start": format_export_date(since), "end": format_export_date(until)}
+    }]
+    shipment_request_body = build_request_body(columns, shipment_filters, no_of_results=PENDING_DELTA_MAX_ROWS)
+    try:
+        orders_response = make_unicommerce_request(tenant_code, "/data/tasks/export/data", "POST", session_id,
+                                                   shipment_request_body, facility_headers(facility_code))
+        if orders_response.status_code != 200:
+            return None
+        rows = extract_orders_response(response_json(orders_response), columns,
+                                       scoped_export_columns(PENDING_ORDER_FIELDS + ["status"], facility_code))
+    except (requests.RequestException, ValueError) as e:
+        logger.info(f"pending order delta export failed: {str(e)}")
+        return None
+
+    if not rows_in_facility(rows, facility_code):
+        return None
+    return rows if len(rows) < PENDING_DELTA_MAX_ROWS else None
+
+
+def merge_pending_orders(orders: List[Dict], updated_shipments: List[Dict]) -> List[Dict]:
+    """Applies updated shipments to the stored set: CREATED ones are added or replaced, others dropped."""
+    merged = {order.get("shipment"): order for order in orders}
+    for shipment in updated_shipments:
+        status = shipment.pop("status", None)
+        if status == "CREATED":
+            merged[shipment.get("shipment")] = shipment
+        else:
+            merged.pop(shipment.get("shipment"), None)
+    return list(merged.values())
 
 
 def fetch_order(validation_request: dict) -> str:
@@ -425,48 +1005,40 @@ def fetch_order(validation_request: dict) -> str:
     Simulates validating an order with an external system.
     Replace this with your actual order validation logic.
     """
+    result, _ = fetch_order_details(validation_request)
+    return result
+
+
+def fetch_order_details(validation_request: dict) -> Tuple[str, List[Dict]]:
+    """
+    Runs fetch_order and also returns the orders found, for callers that render their own reply.
+    """
     # Usage
     extracted_data = []
     result = ""
     context = RequestContext.current()
 
     tenant_code = context.get("tenant_code")
-    access_token = context.get("access_token")
-    headers = {"Authorization": f"Bearer {access_token}"}
     user_id = context.get("user_id")
     session_id = context.get("session_id")
 
     if validation_request.get("entity", "").upper() == "SALEORDER":
 
-        shipment_columns = ["saleOrderNum", "channel", "picklist", "fulfillmentTat", "shipment"]
+        shipment_columns = ["saleOrderNum", "channel", "picklist", "fulfillmentTat", "shipment", "channelName",
+                            "channelId"]
         orders_columns = ["saleOrderNum", "shipment", "channel", "channelName", "channelId"]
         shipment_filters = process_validation_request_filters(validation_request)
+        shipment_request_body = build_request_body(shipment_columns, shipment_filters)
+        orders_response = make_unicommerce_request(tenant_code, "/data/tasks/export/data", "POST", session_id,
+                                                   shipment_request_body)
+        if orders_response.status_code == 200:
+            extracted_data = extract_orders_response(response_json(orders_response), shipment_columns, orders_columns)
+
         if len(shipment_filters) == 1 and shipment_filters[0].get("id") in "saleOrderCodes":
-            saleOrdersCodes = shipment_filters[0].get("saleOrderCodes")
-            for saleOrder in saleOrdersCodes:
-                sale_order_details_request = {
-                    "saleOrderCode": saleOrder
-                }
-
-                orders_response = make_unicommerce_request(tenant_code, "/data/tasks/export/data", "POST", session_id,
-                                                           shipment_request_body)
-                if order_response.status_code == 200:
-                    order_response_json = order_response.json()
-                    if order_response_json.get("successful") is True:
-                        shipping_packages = order_response_json.get("shippingPackages", [])
-                        for shipping_package in shipping_packages:
-                            extracted_data.extend([
-                                {"saleOrderNum": saleOrder, "shipment": shipping_package.get("code")}
-                            ])
-                    else:
-                        result = f"\n{result} - No ShippingPackage found for saleOrderCode {saleOrder}"
-                else:
-                    result = f"\n{result} - Invalid SaleOrderCode {saleOrder}"
-        else:
-            shipment_request_body = build_request_body(shipment_columns, shipment_filters)
-            orders_response = make_unicommerce_request(tenant_code, "/data/tasks/export/data", "POST",
-                                                       shipment_request_body, headers)
-            extracted_data = extract_orders_response(orders_response.json(), shipment_columns, orders_columns)
+            found_sale_orders = {order.get("saleOrderNum") for order in extracted_data}
+            for saleOrder in shipment_filters[0].get("saleOrderCodes"):
+                if saleOrder not in found_sale_orders:
+                    result = f"\n{result} - No ShippingPackage found for saleOrderCode {saleOrder}"
 
     elif validation_request.get("entity", "").upper() == "PICKLIST":
 
@@ -476,9 +1048,9 @@ def fetch_order(validation_request: dict) -> str:
                 "picklistCode": picklist
             }
             packlist_response = make_unicommerce_request(tenant_code, "/data/oms/packer/packlist/fetch", "POST",
-                                                         packlist_request_body, headers)
+                                                         session_id, packlist_request_body)
             if packlist_response.status_code == 200:
-                packlist = packlist_response.json().get("packlist", {})
+                packlist = response_json(packlist_response).get("packlist", {})
 
                 packlist_items = packlist.get("packlistItems", [])
 
@@ -497,11 +1069,11 @@ def fetch_order(validation_request: dict) -> str:
             session_id=session_id,
             new_orders=extracted_data
         )
-        result = f" Found {len(extracted_data)} orders that can be processed based on criteria."
+        result = f" Found {len(extracted_data)} orders that can be processed based on criteria.{result}"
     else:
         result = "Failure. No orders found to be process based on given criteria"
 
-    return result
+    return result, extracted_data
 
 
 def extract_orders_response(response_data, column_names, extract_fields) -> list:
@@ -531,7 +1103,7 @@ def process_order(order_details: dict) -> tuple[str, str]:
 
     if Play_Mode:
         logger.info("play mode returning sample order")
-        return "[System feed] Invoices has been generated successfully, Please provide appropriate response for the user.", sampleBase64Pdf
+        return "[System feed] Invoices has been generated successfully, Please provide appropriate response for the user.", get_sample_base64_pdf()
 
     context = RequestContext.current()
     tenant_code = context.get("tenant_code")
@@ -542,6 +1114,9 @@ def process_order(order_details: dict) -> tuple[str, str]:
     combined_returned_pdf = ""
     # orders = get_shipments_by_user(user_id,session_id)
     orders = order_details.get("orders");
+    # Steps a previous run of the same batch finished are not sent to Uniware again
+    batch_id = order_details.get("batchId") or process_order_batch_id(tenant_code, orders)
+    batch_items = fetch_batch_items(batch_id)
     invoice_success_shipments = []
     invoice_failed_shipments = []
     label_failed_shipments = []
@@ -550,11 +1125,69 @@ def process_order(order_details: dict) -> tuple[str, str]:
     print_invoices_labels = []
     print_labels = []
 
+    # Pre-flight: one export call tells us which shipments still need an invoice / label,
+    # so a retried batch does not pay for invoice/create on already invoiced shipments. What it
+    # reports decides; the batch's recorded progress only stands in for shipments it does not cover.
+    shipment_states = partition_shipments_by_status([order.get('shipment') for order in orders])
+    label_pending_orders = []
+    cancelled_shipments = []
+
     for order in orders:
+        shipment = order.get('shipment')
+        state = shipment_states.get(shipment)
+        item = None if state else batch_items.get(shipment)
+
+        if state and state["stage"] == SHIPMENT_CANCELLED:
+            cancelled_shipments.append(shipment)
+            INVOICES.labels("cancelled").inc()
+            continue
+
+        if item and item.get("invoiceStatus") == "created":
+            invoice_success_shipments.append(shipment)
+            INVOICES.labels("skipped").inc()
+            if item.get("withLabel"):
+                print_invoices_labels.append(shipment)
+            else:
+                print_invoices.append(item.get("invoiceCode"))
+                if item.get("labelStatus") == "allocated":
+                    print_labels.append(shipment)
+                    label_success_shipments.append(shipment)
+                    LABELS.labels("skipped").inc()
+                else:
+                    label_pending_orders.append(order)
+            continue
+
+        if state and state["stage"] == SHIPMENT_READY_TO_PRINT:
+            print_invoices_labels.append(shipment)
+            invoice_success_shipments.append(shipment)
+            INVOICES.labels("skipped").inc()
+            LABELS.labels("skipped").inc()
+            continue
+
+        if state and state["stage"] == SHIPMENT_NEEDS_LABEL:
+            print_invoices.append(state["invoiceCode"])
+            invoice_success_shipments.append(shipment)
+            label_pending_orders.append(order)
+            INVOICES.labels("skipped").inc()
+            continue
+
+        step = {}
         process_order_response = process_invoice_for_order(order, print_invoices_labels, print_invoices,
-                                                           invoice_success_shipments, invoice_failed_shipments)
+                                                           invoice_success_shipments, invoice_failed_shipments,
+                                                           step)
+        # step is only filled in when the invoice was created, which spares scanning the result lists
+        created = bool(step)
+        report_progress("invoice", shipment=shipment, created=created, total=len(orders))
+        if created:
+            INVOICES.labels("created").inc()
+            record_batch_item(batch_id, shipment, {"invoiceStatus": "created", "labelStatus": "pending", **step})
+            if not step.get("withLabel"):
+                label_pending_orders.append(order)
+        else:
+            INVOICES.labels("failed").inc()
         print(process_order_response)
 
+    report_progress("printing")
     if print_invoices_labels:
         print_invoice_label_request = {
             "shippingPackageCodes": print_invoices_labels
@@ -581,9 +1214,17 @@ def process_order(order_details: dict) -> tuple[str, str]:
             invoice_encoded = base64.b64encode(print_invoice_response.content).decode('utf-8')
             process_order_response = f"Invoices have been Successfully generated. "
 
-            for order in orders:
+            resumed_labels = len(label_success_shipments)
+            for order in label_pending_orders:
+                step = {}
                 process_label_for_order_response = process_label_for_order(order, print_labels, label_success_shipments,
-                                                                           label_failed_shipments)
+                                                                           label_failed_shipments, step)
+                report_progress("label", shipment=order.get('shipment'), allocated=bool(step),
+                                total=len(label_pending_orders))
+                if step:
+                    record_batch_item(batch_id, order.get('shipment'), {"labelStatus": "allocated", **step})
+            LABELS.labels("allocated").inc(len(label_success_shipments) - resumed_labels)
+            LABELS.labels("failed").inc(len(label_failed_shipments))
             print_label_request = {
                 "shippingPackageCodes": print_labels
             }
@@ -601,14 +1242,27 @@ def process_order(order_details: dict) -> tuple[str, str]:
         else:
             process_order_response = f"Unable to process orders at the time due to internal error"
 
+    if cancelled_shipments:
+        process_order_response = f"{process_order_response} Skipped cancelled shipments: " \
+                                 f"{', '.join(cancelled_shipments)}".strip()
+
     return process_order_response, combined_returned_pdf
 
 
+def process_order_batch_id(tenant_code: str, orders: List[Dict]) -> str:
+    """Batch id of a process_order run: the same shipments of a tenant always map to the same batch."""
+    shipments = sorted(str(order.get('shipment')) for order in orders if order.get('shipment'))
+    return hashlib.sha256(json.dumps([tenant_code, shipments]).encode()).hexdigest()[:32]
+
+
+@timed("pdf")
 def merge_pdfs_base64(encoded_invoice: str, encoded_label: str) -> str:
     # Decode base64 strings to binary PDF content
     invoice_pdf = base64.b64decode(encoded_invoice)
     label_pdf = base64.b64decode(encoded_label)
 
+    from PyPDF2 import PdfMerger
+
     # Use BytesIO to handle in-memory binary streams
     merger = PdfMerger()
     merger.append(io.BytesIO(invoice_pdf))
@@ -623,22 +1277,84 @@ def merge_pdfs_base64(encoded_invoice: str, encoded_label: str) -> str:
     return merged_base64
 
 
+def partition_shipments_by_status(shipment_codes: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Looks up invoice / label status for all shipments in a single export call and tags each one with
+    the stage it is at: cancelled, needs invoice, needs label or ready to print.
+    Shipments missing from the export (or all of them, if the lookup fails) are left out, so callers
+    fall back to the regular invoice/create path for them. An export that reports shipments we did
+    not ask for has ignored the shippingPackageCodes filter, and counts as a failed lookup.
+    """
+    context = RequestContext.current()
+    tenant_code = context.get("tenant_code")
+    session_id = context.get("session_id")
+
+    shipment_codes = [code for code in shipment_codes if code]
+    if not shipment_codes:
+        return {}
+
+    status_columns = ["shipment", "status", "invoiceCode", "shippingProvider"]
+    status_filters = [{
+        "id": "shippingPackageCodes",
+        "shippingPackageCodes": shipment_codes
+    }]
+    status_request_body = build_request_body(status_columns, status_filters, no_of_results=len(shipment_codes))
+
+    try:
+        status_response = make_unicommerce_request(tenant_code, "/data/tasks/export/data", "POST", session_id,
+                                                   status_request_body)
+        if status_response.status_code != 200:
+            logger.info(f"shipment status lookup failed with status {status_response.status_code}")
+            return {}
+        rows = extract_orders_response(response_json(status_response), status_columns, status_columns)
+    except (requests.RequestException, ValueError) as e:
+        logger.info(f"shipment status lookup failed: {str(e)}")
+        return {}
+
+    requested = set(shipment_codes)
+    unrequested = [row.get("shipment") for row in rows if row.get("shipment") not in requested]
+    if unrequested:
+        logger.error(f"shipment status lookup ignored the shipment filter, {len(unrequested)} rows not requested")
+        return {}
+
+    shipment_states = {}
+    for row in rows:
+        invoice_code = row.get("invoiceCode")
+        shipping_provider = row.get("shippingProvider")
+
+        if row.get("status") == SHIPMENT_CANCELLED:
+            stage = SHIPMENT_CANCELLED
+        elif not invoice_code:
+            stage = SHIPMENT_NEEDS_INVOICE
+        elif not shipping_provider:
+            stage = SHIPMENT_NEEDS_LABEL
+        else:
+            stage = SHIPMENT_READY_TO_PRINT
+
+        shipment_states[row.get("shipment")] = {
+            "stage": stage,
+            "status": row.get("status"),
+            "invoiceCode": invoice_code,
+            "shippingProvider": shipping_provider
+        }
+
+    return shipment_states
+
+
 def process_invoice_for_order(order, print_invoices_labels,
                               print_invoices,
                               invoice_success_shipments,
-                              invoice_failed_shipments):
-    user_id = context.get("user_id")
+                              invoice_failed_shipments,
+                              step: Optional[Dict] = None):
+    """step, when given, receives the invoiceCode and whether the label came with it (withLabel)."""
+    context = RequestContext.current()
+    tenant_code = context.get("tenant_code")
     session_id = context.get("session_id")
-    access_token = context.get("access_token")
-    headers = {"Authorization": f"Bearer {access_token}"}
 
     request_body = {
         "shippingPackageCode": order.get('shipment')
     }
 
-    context = RequestContext.current()
-    tenant_code = context.get("tenant_code")
-
     invoice_response = make_unicommerce_request(tenant_code, "/data/oms/invoice/create", "POST", session_id,
                                                 request_body)
     status_code = invoice_response.status_code
@@ -646,12 +1362,14 @@ def process_invoice_for_order(order, print_invoices_labels,
 
     if 200 <= status_code < 300:
         try:
-            data = invoice_response.json()
+            data = response_json(invoice_response)
             successful = data.get("successful", False)
             invoice_code = data.get("invoiceCode")
             shipping_label_link = data.get("shippingLabelLink")
 
             if successful is True or (successful is False and invoice_code):
+                if step is not None:
+                    step.update(invoiceCode=invoice_code, withLabel=shipping_label_link is not None)
                 if shipping_label_link is not None:
                     print_invoices_labels.append(shipment)
                     invoice_success_shipments.append(shipment)
@@ -679,7 +1397,9 @@ def process_invoice_for_order(order, print_invoices_labels,
 def process_label_for_order(order,
                             print_labels,
                             label_success_shipments,
-                            label_failed_shipments):
+                            label_failed_shipments,
+                            step: Optional[Dict] = None):
+    """step, when given, receives the labelProvider once a provider is allocated."""
     context = RequestContext.current()
     tenant_code = context.get("tenant_code")
 
@@ -699,11 +1419,13 @@ def process_label_for_order(order,
 
     if 200 <= status_code < 300:
         try:
-            data = label_response.json()
+            data = response_json(label_response)
             successful = data.get("successful", False)
             shipping_provider_code = data.get("shippingProviderCode")
 
             if successful is True or (successful is False and shipping_provider_code):
+                if step is not None:
+                    step["labelProvider"] = shipping_provider_code
                 print_labels.append(shipment)
                 label_success_shipments.append(shipment)
                 return f"Label successfully created with provider {shipping_provider_code} for package: {shipment}"
@@ -763,6 +1485,15 @@ def get_current_warehouse_display_name(response: dict) -> str:
 
 
 def switch_facility_uniware(switch_facility_request) -> str:
+    result, _, _ = switch_facility_details(switch_facility_request)
+    return result
+
+
+def switch_facility_details(switch_facility_request) -> Tuple[str, bool, List[Dict]]:
+    """
+    Switches facility and returns the tool result, whether the switch went through and the
+    facility's pending orders.
+    """
     context = RequestContext.current()
     tenant_code = context.get("tenant_code")
     user_id = context.get("user_id")
@@ -771,9 +1502,10 @@ def switch_facility_uniware(switch_facility_request) -> str:
     switch_facility_response = make_unicommerce_request(tenant_code, "/data/user/switchfacility", "POST", session_id,
                                                         switch_facility_request)
     if switch_facility_response.status_code != 200:
-        return "Unable to switch facility due to internal error"
+        return "Unable to switch facility due to internal error", False, []
 
-    pending_orders = fetch_pending_orders_shipment()
+    store_session_feed(user_id, session_id, {"currentFacilityCode": switch_facility_request.get("facilityCode")})
+    pending_orders = fetch_pending_orders_shipment(switch_facility_request.get("facilityCode"), allow_warm=True)
 
     if len(pending_orders) > 0:
         update_user_order_mappings(
@@ -782,11 +1514,12 @@ def switch_facility_uniware(switch_facility_request) -> str:
             new_orders=pending_orders
         )
 
-    return f"Successfully switched facility. Here are the PENDING/CREATED orders for the user : {pending_orders}"
+    return f"Successfully switched facility. Here are the PENDING/CREATED orders for the user : {pending_orders}", \
+        True, pending_orders
 
 
 @app.post("/login")
-async def authenticate_user(
+def authenticate_user(
         login_data: LoginRequest,
         response: Response):
     """
@@ -807,7 +1540,7 @@ async def authenticate_user(
     }
     try:
         oauth_response = requests.get(base_url, params=urlencode(params))
-        oauth_data = oauth_response.json()
+        oauth_data = response_json(oauth_response)
 
         if oauth_response.status_code != 200 or "access_token" not in oauth_data:
             raise HTTPException(
@@ -828,7 +1561,7 @@ async def authenticate_user(
                 detail="Failed to fetch facility information for the user"
             )
 
-        userId = f"{username}_{tenantCode}"
+        userId = chat_user_id(username, tenantCode)
 
         # Use RequestContext.current()
         context = RequestContext.current()
@@ -848,7 +1581,7 @@ async def authenticate_user(
 
 
 @app.post("/session/verify")
-async def authenticate_user():
+def authenticate_user():
     """
     Authenticates user and sets access_token in an HttpOnly cookie.
     """
@@ -869,7 +1602,7 @@ async def authenticate_user():
 
 
 @app.get("/bot/session/create")
-async def create_uniware_internal_chat_session_user(request: Request):
+def create_uniware_internal_chat_session_user(request: Request):
     """
     Authenticates user and sets access_token in an HttpOnly cookie.
     """
@@ -886,9 +1619,9 @@ async def create_uniware_internal_chat_session_user(request: Request):
     )
     if user_response.status_code != 200:
         return {"successful": False, "sessionId": None}
-    user_response_json = user_response.json()
+    user_response_json = response_json(user_response)
     username = user_response_json.get('user').get('email')
-    user_id = f"{username}_{tenantCode}"
+    user_id = chat_user_id(username, tenantCode)
 
     logger.info(f"user_id is :{user_id}")
     session_id = generate_session_id(user_id)
@@ -899,6 +1632,40 @@ async def create_uniware_internal_chat_session_user(request: Request):
     return {"successful": True, "sessionId": session_id, "userId": user_id, "tenantCode": tenantCode}
 
 
+@app.get("/health/circuits")
+async def uniware_circuit_states():
+    """
+    Returns the circuit breaker state of every tenant host this worker has called.
+    """
+    return {"circuits": get_circuit_states()}
+
+
+@app.get("/health/outbound")
+async def uniware_outbound_queue_stats():
+    """
+    Returns per-tenant queue depth, in-flight count and wait times of the outbound Uniware scheduler.
+    """
+    return {"tenants": outbound_scheduler.snapshot()}
+
+
+@app.get("/ready")
+def readiness():
+    """
+    Readiness probe: 200 once this worker's shared state is warm, 503 while warming or draining.
+    """
+    report = readiness_report(PRELOAD_ON_STARTUP)
+    return JSONResponse(content=report, status_code=200 if report["ready"] else 503)
+
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    """
+    Prometheus scrape endpoint, aggregated across uvicorn workers when PROMETHEUS_MULTIPROC_DIR is set.
+    """
+    payload, content_type = render_metrics()
+    return Response(content=payload, media_type=content_type)
+
+
 def extract_pure_json(response: str) -> dict:
     """
     Extracts JSON from a markdown-style code block like ```json ... ```.
@@ -907,7 +1674,19 @@ def extract_pure_json(response: str) -> dict:
         response = response.split("```json", 1)[1]
     if "```" in response:
         response = response.split("```", 1)[0]
-    return json.loads(response.strip())
+    return loads(response.strip())
 
 
-handler = Mangum(app)
\ No newline at end of file
+_mangum_handler = None
+
+
+def handler(event, lambda_context):
+    """
+    AWS Lambda entry point. Mangum is built on the first invocation rather than at import,
+    keeping it off the cold-start import path.
+    """
+    global _mangum_handler
+    if _mangum_handler is None:
+        from mangum import Mangum
+        _mangum_handler = Mangum(app)
+    return _mangum_handler(event, lambda_context)
@@ -0,0 +1,187 @@
+import os
+
+from prometheus_client import Counter, Gauge, Histogram, CollectorRegistry, REGISTRY, generate_latest, \
+    CONTENT_TYPE_LATEST, multiprocess
+
+# With several uvicorn workers each process keeps its own counters; setting PROMETHEUS_MULTIPROC_DIR
+# (to an empty directory shared by the workers) makes every worker write its samples there and
+# /metrics aggregates them, so a scrape sees the whole server no matter which worker answers.
+PROMETHEUS_MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+HTTP_REQUEST_LATENCY = Histogram(
+    "uniwarebot_http_request_duration_seconds",
+    "Latency of bot API requests",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "uniwarebot_http_requests_in_flight",
+    "Bot API requests currently being served",
+    multiprocess_mode="livesum",
+)
+WEBSOCKET_CONNECTIONS = Gauge(
+    "uniwarebot_websocket_connections",
+    "Open /ws/chat connections",
+    multiprocess_mode="livesum",
+)
+WEBSOCKET_TURN_LATENCY = Histogram(
+    "uniwarebot_websocket_turn_duration_seconds",
+    "Latency of chat turns served over /ws/chat, by outcome (ok, error)",
+    ["outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+UNIWARE_REQUEST_LATENCY = Histogram(
+    "uniwarebot_uniware_request_duration_seconds",
+    "Latency of Uniware calls including retries and queueing",
+    ["endpoint", "tenant"],
+    buckets=LATENCY_BUCKETS,
+)
+UNIWARE_REQUESTS_IN_FLIGHT = Gauge(
+    "uniwarebot_uniware_requests_in_flight",
+    "Uniware calls currently on the wire",
+    ["tenant"],
+    multiprocess_mode="livesum",
+)
+UNIWARE_QUEUE_DEPTH = Gauge(
+    "uniwarebot_uniware_queue_depth",
+    "Uniware calls waiting for an outbound slot",
+    ["tenant"],
+    multiprocess_mode="livesum",
+)
+UNIWARE_QUEUE_WAIT = Histogram(
+    "uniwarebot_uniware_queue_wait_seconds",
+    "Time Uniware calls waited for an outbound slot",
+    ["tenant"],
+    buckets=LATENCY_BUCKETS,
+)
+UNIWARE_CIRCUIT_OPEN = Gauge(
+    "uniwarebot_uniware_circuit_open",
+    "1 while the circuit breaker for a tenant host is open",
+    ["tenant"],
+    multiprocess_mode="max",
+)
+MONGO_OPERATION_LATENCY = Histogram(
+    "uniwarebot_mongo_operation_duration_seconds",
+    "Latency of database.py operations",
+    ["operation"],
+    buckets=LATENCY_BUCKETS,
+)
+MONGO_OPERATIONS_IN_FLIGHT = Gauge(
+    "uniwarebot_mongo_operations_in_flight",
+    "database.py operations currently running",
+    multiprocess_mode="livesum",
+)
+GEMINI_REQUEST_LATENCY = Histogram(
+    "uniwarebot_gemini_request_duration_seconds",
+    "Latency of Gemini generate_content calls",
+    ["model"],
+    buckets=LATENCY_BUCKETS,
+)
+GEMINI_TOKENS = Counter(
+    "uniwarebot_gemini_tokens_total",
+    "Gemini tokens as reported by response usage metadata",
+    ["model", "kind"],
+)
+PDF_OPERATION_LATENCY = Histogram(
+    "uniwarebot_pdf_operation_duration_seconds",
+    "Latency of PDF work (merging, encoding)",
+    ["operation"],
+    buckets=LATENCY_BUCKETS,
+)
+INVOICES = Counter(
+    "uniwarebot_invoices_total",
+    "Shipments handled by process_order, by outcome (created, skipped, cancelled, failed)",
+    ["outcome"],
+)
+LABELS = Counter(
+    "uniwarebot_labels_total",
+    "Shipping labels handled by process_order, by outcome (allocated, skipped, failed)",
+    ["outcome"],
+)
+FAST_PATH_TURNS = Counter(
+    "uniwarebot_fast_path_turns_total",
+    "Chat turns answered by the intent router without calling Gemini, by intent",
+    ["intent"],
+)
+PENDING_ORDER_SYNCS = Counter(
+    "uniwarebot_pending_order_syncs_total",
+    "Pending-order refreshes, by mode (full, delta, warm)",
+    ["mode"],
+)
+FACILITY_PREFETCHES = Counter(
+    "uniwarebot_facility_prefetches_total",
+    "Background pending-order prefetches, by result (done, failed, cancelled)",
+    ["result"],
+)
+TRANSCRIPT_QUEUE_DEPTH = Gauge(
+    "uniwarebot_transcript_queue_depth",
+    "Transcript messages queued for the write-behind flusher",
+    multiprocess_mode="livesum",
+)
+TRANSCRIPT_WRITES = Counter(
+    "uniwarebot_transcript_writes_total",
+    "Transcript messages stored, by path (buffered, sync, retried)",
+    ["path"],
+)
+CACHE_EVENTS = Counter(
+    "uniwarebot_cache_events_total",
+    "Cache lookups and evictions, by cache and result (hit, miss, evict)",
+    ["cache", "result"],
+)
+
+_SPAN_HISTOGRAMS = {
+    "uniware": UNIWARE_REQUEST_LATENCY,
+    "mongo": MONGO_OPERATION_LATENCY,
+    "gemini": GEMINI_REQUEST_LATENCY,
+    "pdf": PDF_OPERATION_LATENCY,
+}
+
+_SPAN_IN_FLIGHT = {
+    "mongo": lambda tenant: MONGO_OPERATIONS_IN_FLIGHT,
+    "uniware": lambda tenant: UNIWARE_REQUESTS_IN_FLIGHT.labels(tenant or "unknown"),
+}
+
+
+def span_in_flight(category: str, tenant: str = None):
+    """Returns the in-flight gauge for a span category, or None if the category has none."""
+    gauge = _SPAN_IN_FLIGHT.get(category)
+    return gauge(tenant) if gauge else None
+
+
+def observe_span(category: str, name: str, duration: float, tenant: str = None):
+    """Feeds a finished request_timing span into the matching latency histogram."""
+    histogram = _SPAN_HISTOGRAMS.get(category)
+    if histogram is None:
+        return
+    if category == "uniware":
+        histogram.labels(name, tenant or "unknown").observe(duration)
+    else:
+        histogram.labels(name).observe(duration)
+
+
+def record_gemini_usage(model_name: str, response):
+    """Counts prompt / response tokens from a Gemini response's usage metadata, if present."""
+    usage = getattr(response, "usage_metadata", None)
+    if usage is None:
+        return
+    GEMINI_TOKENS.labels(model_name, "prompt").inc(getattr(usage, "prompt_token_count", 0) or 0)
+    GEMINI_TOKENS.labels(model_name, "response").inc(getattr(usage, "candidates_token_count", 0) or 0)
+    GEMINI_TOKENS.labels(model_name, "cached").inc(getattr(usage, "cached_content_token_count", 0) or 0)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Returns the exposition payload and its content type, aggregated across workers when configured."""
+    if PROMETHEUS_MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_worker_dead(pid: int):
+    """Drops a stopped worker's live gauges from the multiprocess aggregation."""
+    if PROMETHEUS_MULTIPROC_DIR:
+        multiprocess.mark_process_dead(pid)
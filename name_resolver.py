@@ -0,0 +1,233 @@
+"""
+Per-tenant fuzzy index over channel and facility names.
+
+Resolves what a seller typed ("amazon in", "gurgaon warehouse") to a channelId / facilityCode using
+normalised tokens, character trigrams and edit distance, so tool arguments can be resolved locally
+and the prompt only needs the shortlisted candidates instead of the whole catalogue.
+Indexes are built from the structured session feed (see extract_channels / extract_warehouses)
+and kept per worker, keyed by tenant and catalogue.
+"""
+import re
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config import NAME_INDEX_MAX_TENANTS
+from metrics import CACHE_EVENTS
+
+# kind -> (id field, fields that hold a name the seller may type)
+NAME_INDEX_FIELDS = {
+    "channels": ("channelId", ("channelName", "channelCode")),
+    "facilities": ("facilityCode", ("facilityDisplayName", "facilityCode")),
+}
+
+SEARCH_MIN_SCORE = 0.5
+RESOLVE_MIN_SCORE = 0.8
+RESOLVE_MARGIN = 0.1
+SHORTLIST_MIN_SCORE = 0.75
+MAX_SCORED_CANDIDATES = 50
+MAX_WINDOW_TOKENS = 4
+MIN_SHARED_TRIGRAM_RATIO = 0.5
+# Candidates (by shared trigrams) per search that also get the edit-distance score; the rest are
+# scored by trigram overlap only
+MAX_EDIT_DISTANCE_CANDIDATES = 5
+# shortlist: at most this many distinct word windows are searched, and only those with a trigram
+# found in at most RARE_TRIGRAM_MAX_SHARE of the names ("store", "the" never narrow anything down)
+MAX_SHORTLIST_WINDOWS = 64
+RARE_TRIGRAM_MAX_SHARE = 0.2
+
+NON_ALNUM_PATTERN = re.compile(r"[^a-z0-9]+")
+
+
+def normalise(text) -> str:
+    """Lower-cases and collapses everything that is not a letter or digit into single spaces."""
+    return NON_ALNUM_PATTERN.sub(" ", str(text or "").lower()).strip()
+
+
+def trigrams(normalised: str) -> set:
+    padded = f"  {normalised} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance, two rows at a time."""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def similarity(query: str, name: str, query_trigrams: Optional[set] = None, name_trigrams: Optional[set] = None,
+               with_edit_distance: bool = True) -> float:
+    """
+    Score in [0, 1] between two normalised strings: 1.0 for an exact match, 0.9 when every query
+    token is a name token, otherwise the better of trigram Jaccard and edit-distance ratio (Jaccard
+    alone without with_edit_distance).
+    """
+    if query == name:
+        return 1.0
+    if not query or not name:
+        return 0.0
+    if set(query.split()) <= set(name.split()):
+        return 0.9
+
+    query_trigrams = query_trigrams if query_trigrams is not None else trigrams(query)
+    name_trigrams = name_trigrams if name_trigrams is not None else trigrams(name)
+    jaccard = len(query_trigrams & name_trigrams) / len(query_trigrams | name_trigrams)
+    if not with_edit_distance:
+        return jaccard
+    edit_ratio = 1.0 - edit_distance(query, name) / max(len(query), len(name))
+    return max(jaccard, edit_ratio)
+
+
+class NameIndex:
+    """Fuzzy lookup over a list of entries (channels or facilities) by any of their name fields."""
+
+    def __init__(self, entries: List[Dict], id_field: str, name_fields: Iterable[str]):
+        self.entries = entries
+        self.id_field = id_field
+        self._by_id = {str(entry.get(id_field)): entry for entry in entries}
+        self._names: List[Tuple[int, str, set]] = []
+        self._exact: Dict[str, List[int]] = {}
+        self._postings: Dict[str, List[int]] = {}
+
+        for entry_index, entry in enumerate(entries):
+            for field in name_fields:
+                name = normalise(entry.get(field))
+                if not name:
+                    continue
+                name_index = len(self._names)
+                name_trigrams = trigrams(name)
+                self._names.append((entry_index, name, name_trigrams))
+                self._exact.setdefault(name, []).append(name_index)
+                for gram in name_trigrams:
+                    self._postings.setdefault(gram, []).append(name_index)
+
+    def get(self, entry_id) -> Optional[Dict]:
+        return self._by_id.get(str(entry_id))
+
+    def search(self, query: str, limit: int = 5, min_score: float = SEARCH_MIN_SCORE) -> List[Tuple[Dict, float]]:
+        """Best matching entries for the query, highest score first, one result per entry."""
+        normalised = normalise(query)
+        if not normalised:
+            return []
+
+        query_trigrams = trigrams(normalised)
+        shared: Counter = Counter()
+        for gram in query_trigrams:
+            shared.update(self._postings.get(gram, ()))
+        for name_index in self._exact.get(normalised, ()):
+            shared[name_index] = len(query_trigrams)
+
+        # Names sharing few trigrams with the query cannot reach min_score; skip scoring them
+        min_shared = min_score * len(query_trigrams) * MIN_SHARED_TRIGRAM_RATIO
+        candidates = sorted((name_index for name_index, count in shared.items() if count >= min_shared),
+                            key=shared.get, reverse=True)[:MAX_SCORED_CANDIDATES]
+        best: Dict[int, float] = {}
+        for rank, name_index in enumerate(candidates):
+            entry_index, name, name_trigrams = self._names[name_index]
+            score = similarity(normalised, name, query_trigrams, name_trigrams,
+                               with_edit_distance=rank < MAX_EDIT_DISTANCE_CANDIDATES)
+            if score >= min_score and score > best.get(entry_index, 0.0):
+                best[entry_index] = score
+
+        ranked = sorted(best.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return [(self.entries[entry_index], score) for entry_index, score in ranked]
+
+    def resolve(self, query: str) -> Optional[Dict]:
+        """
+        The single entry the query refers to, or None when nothing matches closely enough or the
+        best two candidates are too close to call (the seller has to choose). A unique exact match
+        always resolves.
+        """
+        matches = self.search(query, limit=2)
+        if not matches or matches[0][1] < RESOLVE_MIN_SCORE:
+            return None
+        if len(matches) > 1 and matches[1][1] == 1.0:
+            return None
+        if len(matches) > 1 and matches[0][1] < 1.0 and matches[0][1] - matches[1][1] < RESOLVE_MARGIN:
+            return None
+        return matches[0][0]
+
+    def has_rare_trigram(self, normalised: str) -> bool:
+        """True when some trigram of the text occurs in the index, in few enough names to narrow it down."""
+        max_names = max(1, int(len(self._names) * RARE_TRIGRAM_MAX_SHARE))
+        return any(0 < len(self._postings.get(gram, ())) <= max_names for gram in trigrams(normalised))
+
+    def shortlist(self, text: str, limit: int) -> List[Dict]:
+        """
+        Entries that free text plausibly mentions, found by matching runs of up to MAX_WINDOW_TOKENS
+        consecutive words against the index. Windows without a rare trigram are not searched, and
+        at most MAX_SHORTLIST_WINDOWS distinct windows are, so long messages stay cheap.
+        """
+        tokens = normalise(text).split()
+        windows = []
+        seen = set()
+        rare_tokens = {token for token in set(tokens) if len(token) >= 3 and self.has_rare_trigram(token)}
+        for start in range(len(tokens)):
+            for size in range(1, MAX_WINDOW_TOKENS + 1):
+                window = tokens[start:start + size]
+                if len(window) < size or (size == 1 and len(window[0]) < 3):
+                    continue
+                # A window matching a name shares that name's rare trigrams within one of its words
+                if not any(token in rare_tokens for token in window):
+                    continue
+                query = " ".join(window)
+                if query not in seen:
+                    seen.add(query)
+                    windows.append(query)
+
+        best: Dict[str, Tuple[Dict, float]] = {}
+        for query in windows[:MAX_SHORTLIST_WINDOWS]:
+            for entry, score in self.search(query, limit=limit, min_score=SHORTLIST_MIN_SCORE):
+                key = str(entry.get(self.id_field))
+                if score > best.get(key, (None, 0.0))[1]:
+                    best[key] = (entry, score)
+
+        ranked = sorted(best.values(), key=lambda item: item[1], reverse=True)[:limit]
+        return [entry for entry, _ in ranked]
+
+
+_indexes: "OrderedDict[Tuple[str, str, int], Tuple[Tuple, NameIndex]]" = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def get_name_index(tenant_code: str, kind: str, entries: List[Dict]) -> NameIndex:
+    """
+    Returns the tenant's index for `kind` ("channels" or "facilities") over exactly these entries,
+    building it when this worker has none yet. Indexes are keyed by the catalogue too, since users
+    of one tenant can have access to different facilities. The least recently used are evicted
+    beyond NAME_INDEX_MAX_TENANTS.
+    """
+    id_field, name_fields = NAME_INDEX_FIELDS[kind]
+    fingerprint = tuple((str(entry.get(id_field)),) + tuple(entry.get(field) for field in name_fields)
+                        for entry in entries)
+    key = (tenant_code, kind, hash(fingerprint))
+
+    with _indexes_lock:
+        cached = _indexes.get(key)
+        if cached and cached[0] == fingerprint:
+            _indexes.move_to_end(key)
+            CACHE_EVENTS.labels("name_index", "hit").inc()
+            return cached[1]
+
+    CACHE_EVENTS.labels("name_index", "miss").inc()
+    index = NameIndex(entries, id_field, name_fields)
+
+    with _indexes_lock:
+        _indexes[key] = (fingerprint, index)
+        _indexes.move_to_end(key)
+        while len(_indexes) > NAME_INDEX_MAX_TENANTS:
+            _indexes.popitem(last=False)
+            CACHE_EVENTS.labels("name_index", "evict").inc()
+    return index
+
+
+def session_name_index(tenant_code: str, kind: str, session_feed: Optional[Dict]) -> NameIndex:
+    """Index over the channels or facilities stored in the session feed at /chat/initiate."""
+    return get_name_index(tenant_code, kind, (session_feed or {}).get(kind) or [])
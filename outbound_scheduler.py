@@ -0,0 +1,220 @@
+import asyncio
+import threading
+import time
+import logging
+from collections import deque
+from contextlib import contextmanager, asynccontextmanager
+from typing import Dict, Optional
+
+import requests
+
+from metrics import UNIWARE_QUEUE_DEPTH, UNIWARE_QUEUE_WAIT
+from config import UNIWARE_TENANT_MAX_IN_FLIGHT, UNIWARE_TENANT_RATE_LIMIT, UNIWARE_TENANT_BURST, \
+    UNIWARE_MAX_IN_FLIGHT, UNIWARE_QUEUE_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+
+class SchedulerTimeoutError(requests.exceptions.RequestException):
+    """Raised when a caller waited longer than the queue timeout for an outbound slot."""
+
+
+class _Ticket:
+    """A caller waiting for a slot. Sync callers wait on an Event, async callers on a Future."""
+
+    def __init__(self, tenant: str, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.tenant = tenant
+        self.enqueued_at = time.monotonic()
+        self.granted = False
+        self.loop = loop
+        self.event = None if loop else threading.Event()
+        self.future = loop.create_future() if loop else None
+
+    def grant(self):
+        self.granted = True
+        if self.loop:
+            self.loop.call_soon_threadsafe(self._resolve)
+        else:
+            self.event.set()
+
+    def _resolve(self):
+        if not self.future.done():
+            self.future.set_result(True)
+
+
+class _TenantState:
+    def __init__(self, burst: int):
+        self.waiters = deque()
+        self.in_flight = 0
+        self.tokens = float(burst)
+        self.refilled_at = time.monotonic()
+        self.acquired = 0
+        self.timed_out = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+
+class OutboundScheduler:
+    """
+    Admission control for outbound Uniware traffic.
+
+    Every call takes a slot for its tenant before going out. A tenant is limited to max_in_flight
+    concurrent calls and a token bucket of rate_limit requests/second (bursting to burst), and all
+    tenants share max_in_flight_total. Waiting tenants are served round-robin, so one seller pushing
+    thousands of shipments cannot starve the others.
+    """
+
+    def __init__(self, max_in_flight: int = UNIWARE_TENANT_MAX_IN_FLIGHT,
+                 rate_limit: float = UNIWARE_TENANT_RATE_LIMIT,
+                 burst: int = UNIWARE_TENANT_BURST,
+                 max_in_flight_total: int = UNIWARE_MAX_IN_FLIGHT,
+                 queue_timeout: float = UNIWARE_QUEUE_TIMEOUT):
+        self.max_in_flight = max_in_flight
+        self.rate_limit = rate_limit
+        self.burst = max(1, burst)
+        self.max_in_flight_total = max_in_flight_total
+        self.queue_timeout = queue_timeout
+        self._lock = threading.Lock()
+        self._tenants: Dict[str, _TenantState] = {}
+        self._rotation = deque()
+        self._in_flight_total = 0
+        self._timer: Optional[threading.Timer] = None
+
+    @contextmanager
+    def slot(self, tenant: str):
+        """Blocks until the tenant may issue a call. For sync callers."""
+        ticket = self._enqueue(_Ticket(tenant))
+        if not ticket.event.wait(self.queue_timeout):
+            if self._abandon(ticket):
+                raise SchedulerTimeoutError(f"Timed out waiting for an outbound slot for {tenant}")
+        try:
+            yield
+        finally:
+            self._release(tenant)
+
+    @asynccontextmanager
+    async def async_slot(self, tenant: str):
+        """Awaits until the tenant may issue a call. For async callers, never blocks the event loop."""
+        ticket = self._enqueue(_Ticket(tenant, asyncio.get_running_loop()))
+        try:
+            await asyncio.wait_for(asyncio.shield(ticket.future), self.queue_timeout)
+        except asyncio.TimeoutError:
+            if self._abandon(ticket):
+                raise SchedulerTimeoutError(f"Timed out waiting for an outbound slot for {tenant}")
+        except asyncio.CancelledError:
+            if not self._abandon(ticket):
+                self._release(tenant)
+            raise
+        try:
+            yield
+        finally:
+            self._release(tenant)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Queue depth, in-flight count and wait-time stats per tenant."""
+        with self._lock:
+            return {
+                tenant: {
+                    "queueDepth": len(state.waiters),
+                    "inFlight": state.in_flight,
+                    "acquired": state.acquired,
+                    "timedOut": state.timed_out,
+                    "waitSecondsTotal": round(state.wait_total, 6),
+                    "waitSecondsMax": round(state.wait_max, 6),
+                }
+                for tenant, state in self._tenants.items()
+            }
+
+    def _enqueue(self, ticket: _Ticket) -> _Ticket:
+        with self._lock:
+            state = self._tenants.get(ticket.tenant)
+            if state is None:
+                state = self._tenants[ticket.tenant] = _TenantState(self.burst)
+            if not state.waiters:
+                self._rotation.append(ticket.tenant)
+            state.waiters.append(ticket)
+            UNIWARE_QUEUE_DEPTH.labels(ticket.tenant).inc()
+            self._dispatch()
+        return ticket
+
+    def _abandon(self, ticket: _Ticket) -> bool:
+        """Removes a waiting ticket. Returns False if it was granted meanwhile (caller owns the slot)."""
+        with self._lock:
+            if ticket.granted:
+                return False
+            state = self._tenants[ticket.tenant]
+            state.waiters.remove(ticket)
+            state.timed_out += 1
+            UNIWARE_QUEUE_DEPTH.labels(ticket.tenant).dec()
+            if not state.waiters and ticket.tenant in self._rotation:
+                self._rotation.remove(ticket.tenant)
+            return True
+
+    def _release(self, tenant: str):
+        with self._lock:
+            self._tenants[tenant].in_flight -= 1
+            self._in_flight_total -= 1
+            self._dispatch()
+
+    def _refill(self, state: _TenantState, now: float):
+        if self.rate_limit <= 0:
+            state.tokens = float(self.burst)
+            return
+        state.tokens = min(float(self.burst), state.tokens + (now - state.refilled_at) * self.rate_limit)
+        state.refilled_at = now
+
+    def _dispatch(self):
+        """Grants slots round-robin across waiting tenants. Must be called with the lock held."""
+        now = time.monotonic()
+        next_token_in = None
+        skipped = 0
+
+        while self._rotation and skipped < len(self._rotation):
+            if self.max_in_flight_total > 0 and self._in_flight_total >= self.max_in_flight_total:
+                break
+
+            tenant = self._rotation.popleft()
+            state = self._tenants[tenant]
+            self._refill(state, now)
+
+            if state.in_flight >= self.max_in_flight or state.tokens < 1:
+                if state.tokens < 1:
+                    wait = (1 - state.tokens) / self.rate_limit
+                    next_token_in = wait if next_token_in is None else min(next_token_in, wait)
+                self._rotation.append(tenant)
+                skipped += 1
+                continue
+
+            ticket = state.waiters.popleft()
+            state.tokens -= 1
+            state.in_flight += 1
+            state.acquired += 1
+            waited = now - ticket.enqueued_at
+            state.wait_total += waited
+            state.wait_max = max(state.wait_max, waited)
+            UNIWARE_QUEUE_DEPTH.labels(tenant).dec()
+            UNIWARE_QUEUE_WAIT.labels(tenant).observe(waited)
+            self._in_flight_total += 1
+            ticket.grant()
+
+            if state.waiters:
+                self._rotation.append(tenant)
+            skipped = 0
+
+        if next_token_in is not None:
+            self._schedule_dispatch(next_token_in)
+
+    def _schedule_dispatch(self, delay: float):
+        if self._timer is not None and self._timer.is_alive():
+            return
+        self._timer = threading.Timer(delay, self._on_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _on_timer(self):
+        with self._lock:
+            self._timer = None
+            self._dispatch()
+
+
+outbound_scheduler = OutboundScheduler()
@@ -1,35 +1,157 @@
-def normalize_gemini_args(data):
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+PLAIN_SCALARS = (str, int, float, bool, bytes, type(None))
+
+# A handler turns a node into (converted value, children). Children are (key, child) pairs still to
+# convert and store into the value; a leaf has no children, a wrapper has no value and one child.
+Handler = Callable[[Any], Tuple[Any, Optional[Iterable]]]
+
+_handlers: Dict[type, Handler] = {}
+
+
+def _leaf(data):
+    return data, None
+
+
+def _mapping(data):
+    return {}, data.items()
+
+
+def _sequence(data):
+    if not hasattr(data, "__len__"):
+        data = list(data)
+    return [None] * len(data), enumerate(data)
+
+
+def _raw_mapping(data):
+    # proto-plus MapComposite: walk the underlying protobuf map, skipping proto-plus marshalling
+    return _mapping(data.pb)
+
+
+def _raw_sequence(data):
+    # proto-plus RepeatedComposite: walk the underlying protobuf repeated field
+    return _sequence(data.pb)
+
+
+def _proto_value(data):
+    kind = data.WhichOneof("kind")
+    if kind == "struct_value":
+        return _mapping(data.struct_value.fields)
+    if kind == "list_value":
+        return _sequence(data.list_value.values)
+    if kind == "null_value" or kind is None:
+        return None, None
+    return getattr(data, kind), None
+
+
+def _proto_struct(data):
+    return _mapping(data.fields)
+
+
+def _proto_list_value(data):
+    return _sequence(data.values)
+
+
+def _struct_value_wrapper(data):
+    return _mapping(data.struct_value.fields)
+
+
+def _list_value_wrapper(data):
+    return _sequence(data.list_value.values)
+
+
+def _attribute(name: str) -> Handler:
+    def handler(data):
+        return getattr(data, name), None
+    return handler
+
+
+def _null(data):
+    return None, None
+
+
+def _unwrap_value(data):
+    return None, [(None, data.value)]
+
+
+PROTO_HANDLERS = {
+    "google.protobuf.Value": _proto_value,
+    "google.protobuf.Struct": _proto_struct,
+    "google.protobuf.ListValue": _proto_list_value,
+}
+
+
+def _resolve_handler(node_type: type) -> Handler:
     """
-    Recursively converts Gemini tool call args (MapComposite, Value, etc.) to plain Python dict/list.
+    Picks how to convert values of a type, once per type. The probes keep the order of the original
+    recursive version (mappings before iterables, as strings are iterable).
     """
-    # dict-like or MapComposite
-    if isinstance(data, dict) or hasattr(data, "items"):
-        return {k: normalize_gemini_args(v) for k, v in data.items()}
+    if issubclass(node_type, PLAIN_SCALARS):
+        return _leaf
+
+    descriptor = getattr(node_type, "DESCRIPTOR", None)
+    full_name = getattr(descriptor, "full_name", None)
+    if full_name in PROTO_HANDLERS:
+        return PROTO_HANDLERS[full_name]
+
+    if issubclass(node_type, dict) or hasattr(node_type, "items"):
+        return _raw_mapping if hasattr(node_type, "pb") else _mapping
 
-    # List or ListValue
-    if isinstance(data, list) or hasattr(data, "__iter__") and not isinstance(data, str):
-        return [normalize_gemini_args(v) for v in data]
+    if issubclass(node_type, list) or hasattr(node_type, "__iter__"):
+        return _raw_sequence if hasattr(node_type, "pb") else _sequence
 
     # Value wrappers
-    if hasattr(data, "struct_value"):
-        return normalize_gemini_args(data.struct_value.fields)
+    if hasattr(node_type, "struct_value"):
+        return _struct_value_wrapper
+    if hasattr(node_type, "list_value"):
+        return _list_value_wrapper
+    for name in ("string_value", "number_value", "bool_value"):
+        if hasattr(node_type, name):
+            return _attribute(name)
+    if hasattr(node_type, "null_value"):
+        return _null
+    if hasattr(node_type, "value"):  # Protobuf Value wrapper
+        return _unwrap_value
 
-    if hasattr(data, "list_value"):
-        return [normalize_gemini_args(v) for v in data.list_value.values]
+    return _leaf
 
-    if hasattr(data, "string_value"):
-        return data.string_value
 
-    if hasattr(data, "number_value"):
-        return data.number_value
+def _handler_for(node_type: type) -> Handler:
+    handler = _handlers.get(node_type)
+    if handler is None:
+        handler = _handlers[node_type] = _resolve_handler(node_type)
+    return handler
 
-    if hasattr(data, "bool_value"):
-        return data.bool_value
 
-    if hasattr(data, "null_value"):
-        return None
+def _expand(node):
+    value, children = _handler_for(type(node))(node)
+    while value is None and children is not None:
+        # Wrapper node: convert the wrapped value in its place
+        (_, node), = children
+        value, children = _handler_for(type(node))(node)
+    return value, children
+
+
+def normalize_gemini_args(data):
+    """
+    Converts Gemini tool call args (MapComposite, Value, etc.) to plain Python dict/list.
+    Walks the tree with an explicit stack, so deep or large payloads (process_order with hundreds
+    of orders) neither recurse nor re-probe every node's attributes.
+    """
+    if type(data) in PLAIN_SCALARS:
+        return data
 
-    if hasattr(data, "value"):  # Protobuf Value wrapper
-        return normalize_gemini_args(data.value)
+    value, children = _expand(data)
+    stack = [(value, children)] if children is not None else []
+    while stack:
+        container, children = stack.pop()
+        for key, child in children:
+            if type(child) in PLAIN_SCALARS:
+                container[key] = child
+                continue
+            child_value, grandchildren = _expand(child)
+            container[key] = child_value
+            if grandchildren is not None:
+                stack.append((child_value, grandchildren))
 
-    return data
+    return value
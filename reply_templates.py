@@ -0,0 +1,85 @@
+"""
+Templated seller-facing replies for tool results, used when a turn is answered without asking
+Gemini to phrase the tool outcome.
+"""
+from typing import Any, Dict, List, Optional
+
+FETCH_ORDER_FOUND = "I found {count} {orders} ready to process:\n{summary}\nShall I generate invoices and labels for them?"
+FETCH_ORDER_NONE = "I couldn't find any orders that can be processed for these details. Could you check them and try again?"
+FETCH_ORDER_MISSING = "No shipment was found for: {codes}."
+PROCESS_ORDER_DONE = "Done! Invoices and labels for {count} {orders} have been generated and are ready to download."
+PROCESS_ORDER_FAILED = "Sorry, I couldn't generate the documents for these orders right now. Please try again in a little while."
+SWITCH_FACILITY_DONE = "Switched to {facility}. There {are} {count} pending {orders} here:\n{summary}\nWould you like me to process them?"
+SWITCH_FACILITY_EMPTY = "Switched to {facility}. There are no pending orders in this warehouse right now."
+SWITCH_FACILITY_FAILED = "Sorry, I couldn't switch to {facility} right now. Please try again in a little while."
+
+
+def pluralise_orders(count: int) -> str:
+    return "order" if count == 1 else "orders"
+
+
+def summarise_orders_by_channel(orders: List[Dict]) -> str:
+    """One line per channel with its order count, busiest channel first."""
+    counts: Dict[str, int] = {}
+    for order in orders:
+        channel = order.get("channelName") or order.get("channel") or "Unknown channel"
+        counts[channel] = counts.get(channel, 0) + 1
+
+    return "\n".join(
+        f"• {channel}: {count} {pluralise_orders(count)}"
+        for channel, count in sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+    )
+
+
+def requested_order_codes(args: Dict) -> List[str]:
+    for option in args.get("filterOptions") or []:
+        if option.get("key") == "orderCodeFilter":
+            values = option.get("selectedValues")
+            return values if isinstance(values, list) else [values]
+    return []
+
+
+def render_fetch_order_reply(args: Dict, orders: List[Dict]) -> str:
+    if orders:
+        reply = FETCH_ORDER_FOUND.format(count=len(orders), orders=pluralise_orders(len(orders)),
+                                         summary=summarise_orders_by_channel(orders))
+    else:
+        reply = FETCH_ORDER_NONE
+
+    found = {order.get("saleOrderNum") for order in orders}
+    missing = [code for code in requested_order_codes(args) if code not in found]
+    if orders and missing:
+        reply = f"{FETCH_ORDER_MISSING.format(codes=', '.join(missing))}\n{reply}"
+    return reply
+
+
+def render_process_order_reply(args: Dict, pdf_base64: Optional[str]) -> str:
+    if not pdf_base64:
+        return PROCESS_ORDER_FAILED
+    count = len(args.get("orders") or [])
+    return PROCESS_ORDER_DONE.format(count=count, orders=pluralise_orders(count))
+
+
+def render_switch_facility_reply(facility: str, switched: bool, orders: List[Dict]) -> str:
+    if not switched:
+        return SWITCH_FACILITY_FAILED.format(facility=facility)
+    if not orders:
+        return SWITCH_FACILITY_EMPTY.format(facility=facility)
+    return SWITCH_FACILITY_DONE.format(facility=facility, are="is" if len(orders) == 1 else "are",
+                                       count=len(orders), orders=pluralise_orders(len(orders)),
+                                       summary=summarise_orders_by_channel(orders))
+
+
+def render_tool_reply(tool_name: str, args: Dict, outcome: Dict[str, Any]) -> Optional[str]:
+    """
+    Reply for a finished tool call. `outcome` is what main.run_tool returned; returns None for a
+    tool without a template so the caller can fall back to Gemini.
+    """
+    if tool_name == "fetch_order":
+        return render_fetch_order_reply(args, outcome.get("orders") or [])
+    if tool_name == "process_order":
+        return render_process_order_reply(args, outcome.get("pdf"))
+    if tool_name == "switch_facility":
+        facility = outcome.get("facilityDisplayName") or args.get("facilityCode")
+        return render_switch_facility_reply(facility, outcome.get("switched", False), outcome.get("orders") or [])
+    return None
@@ -0,0 +1,72 @@
+import functools
+import json
+import time
+from contextlib import contextmanager
+
+from RequestContext import RequestContext, SpanRecorder
+from metrics import observe_span, span_in_flight
+
+
+@contextmanager
+def span(category: str, name: str):
+    """
+    Times the enclosed block, records it on the current request's SpanRecorder and feeds the
+    matching Prometheus histogram. Outside a request scope (startup, background jobs) only the
+    metrics are updated.
+    """
+    context = RequestContext.current_or_none()
+    tenant_code = context.get("tenant_code") if context else None
+    in_flight = span_in_flight(category, tenant_code)
+
+    if in_flight:
+        in_flight.inc()
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - started_at
+        if in_flight:
+            in_flight.dec()
+        if context is not None:
+            context.spans.record(category, name, duration)
+        observe_span(category, name, duration, tenant_code)
+
+
+def timed(category: str, name: str = None):
+    """Decorator form of span(); the span name defaults to the function name."""
+    def decorator(func):
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(category, span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def server_timing_header(recorder: SpanRecorder) -> str:
+    """Renders the recorder as a Server-Timing header value, one metric per category plus total."""
+    metrics = [
+        f'{category};dur={entry["ms"]};desc="{entry["count"]} calls"'
+        for category, entry in recorder.summary().items()
+    ]
+    metrics.append(f"total;dur={recorder.elapsed_ms()}")
+    return ", ".join(metrics)
+
+
+def timing_log_line(recorder: SpanRecorder, method: str, path: str, status_code: int, tenant_code: str = None) -> str:
+    """Structured per-request summary, one JSON object per line."""
+    return json.dumps({
+        "event": "request_timing",
+        "method": method,
+        "path": path,
+        "status": status_code,
+        "tenantCode": tenant_code,
+        "totalMs": recorder.elapsed_ms(),
+        "breakdown": recorder.summary(),
+        "spans": [
+            {"category": category, "name": name, "ms": round(duration * 1000, 2)}
+            for category, name, duration in recorder.spans()
+        ],
+    })
@@ -0,0 +1,100 @@
+"""
+Per-worker cache for the Gemini call that phrases a tool result for the seller.
+
+The follow-up after fetch_order / process_order / switch_facility only turns the tool result into a
+sentence, so for the same tenant and warehouse, tool, result and recent conversation the answer can
+be reused across sessions. Entries expire after FOLLOWUP_CACHE_TTL seconds and the least recently used ones are dropped
+beyond FOLLOWUP_CACHE_MAX_ENTRIES.
+"""
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from config import FOLLOWUP_CACHE_TTL, FOLLOWUP_CACHE_MAX_ENTRIES, FOLLOWUP_CACHE_CONTEXT_MESSAGES
+from metrics import CACHE_EVENTS
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+FEED_PREFIX = "[System Feed]"
+
+
+class TTLCache:
+    """Thread-safe LRU mapping whose entries expire `ttl` seconds after they were stored."""
+
+    def __init__(self, name: str, ttl: float, max_entries: int):
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                CACHE_EVENTS.labels(self.name, "hit").inc()
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+        CACHE_EVENTS.labels(self.name, "miss").inc()
+        return None
+
+    def put(self, key: str, value: str):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                CACHE_EVENTS.labels(self.name, "evict").inc()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+followup_cache = TTLCache("followup", FOLLOWUP_CACHE_TTL, FOLLOWUP_CACHE_MAX_ENTRIES)
+
+
+def normalise_text(text) -> str:
+    return WHITESPACE_PATTERN.sub(" ", str(text)).strip().lower()
+
+
+def followup_cache_key(model_name: str, system_instruction_hash: str, tenant_code: str, names: Dict,
+                       tool_name: str, result: str, history: List[Dict]) -> str:
+    """
+    Key for a follow-up reply: model and system instruction, the tenant and the names Gemini phrases
+    replies with (current warehouse, channel and facility names, see followup_names), tool name, the
+    normalised tool result and the last FOLLOWUP_CACHE_CONTEXT_MESSAGES conversation messages before
+    it. The rest of the [System Feed] (today's date, the session's pending orders) is left out, so
+    sessions of the same tenant and warehouse share entries.
+    """
+    conversation = [message for message in history
+                    if not any(str(part).startswith(FEED_PREFIX) for part in message.get("parts", []))]
+    recent = conversation[-FOLLOWUP_CACHE_CONTEXT_MESSAGES:] if FOLLOWUP_CACHE_CONTEXT_MESSAGES > 0 else []
+    key_parts = [
+        model_name,
+        system_instruction_hash,
+        tenant_code,
+        names,
+        tool_name,
+        normalise_text(result),
+        [[message.get("role"), [normalise_text(part) for part in message.get("parts", [])]] for message in recent],
+    ]
+    return hashlib.sha256(json.dumps(key_parts, ensure_ascii=False, sort_keys=True).encode()).hexdigest()
+
+
+def followup_names(session_feed: Optional[Dict]) -> Dict:
+    """The names in a session feed that a follow-up reply can mention."""
+    session_feed = session_feed or {}
+    facilities = session_feed.get("facilities") or []
+    current = session_feed.get("currentFacilityCode")
+    return {
+        "warehouse": next((facility.get("facilityDisplayName") for facility in facilities
+                           if facility.get("facilityCode") == current), current),
+        "channels": sorted(str(channel.get("channelName")) for channel in session_feed.get("channels") or []),
+        "facilities": sorted(str(facility.get("facilityDisplayName")) for facility in facilities),
+    }
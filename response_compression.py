@@ -0,0 +1,155 @@
+"""
+Negotiated compression of API responses.
+
+/chat responses can carry multi-megabyte base64 PDFs, which compress well. CompressionMiddleware
+picks zstd, brotli or gzip from the client's Accept-Encoding, in that order of preference, and
+uses zstd and brotli only when the zstandard / brotli packages are installed. gzip is Starlette's
+own GZipResponder; zstd and brotli plug into IdentityResponder.apply_compression, the hook Starlette
+exposes for other encodings. Either way bodies under the minimum size, excluded content types,
+partial responses and responses that already have a Content-Encoding pass through unchanged,
+streaming bodies are compressed chunk by chunk, and large chunks are compressed off the event loop.
+"""
+from typing import Any, Dict, Optional
+
+import anyio.to_thread
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import DEFAULT_EXCLUDED_CONTENT_TYPES, GZipResponder, IdentityResponder
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Downloads that are compressed already gain nothing from another pass
+EXCLUDED_CONTENT_TYPES = DEFAULT_EXCLUDED_CONTENT_TYPES + ("application/pdf", "application/octet-stream")
+
+# Levels that trade a little ratio for speed, since multi-megabyte bodies are compressed per request
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+ZSTD_LEVEL = 3
+
+# Chunks at least this large are compressed on a worker thread rather than on the event loop
+THREAD_MINIMUM_SIZE = 128 * 1024
+
+
+class StreamCompressionResponder(IdentityResponder):
+    """
+    A responder for one encoding: a compressor is created for the response on its first compressed
+    chunk, and each chunk is flushed so a streaming client can decode it as it arrives.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int, *, exclude_content_types=EXCLUDED_CONTENT_TYPES):
+        super().__init__(app, minimum_size, exclude_content_types=exclude_content_types)
+        self.compressor = None
+
+    async def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        if len(body) >= THREAD_MINIMUM_SIZE:
+            return await anyio.to_thread.run_sync(self.compress_chunk, body, more_body)
+        return self.compress_chunk(body, more_body)
+
+    def compress_chunk(self, body: bytes, more_body: bool) -> bytes:
+        if self.compressor is None:
+            self.compressor = self.new_compressor()
+        return self.compress(self.compressor, body, more_body)
+
+    def new_compressor(self) -> Any:
+        raise NotImplementedError
+
+    def compress(self, compressor: Any, body: bytes, more_body: bool) -> bytes:
+        """Compresses body; the stream is flushed while more_body, else finished."""
+        raise NotImplementedError
+
+
+class BrotliResponder(StreamCompressionResponder):
+    content_encoding = "br"
+
+    def new_compressor(self):
+        return brotli.Compressor(quality=BROTLI_QUALITY)
+
+    def compress(self, compressor, body: bytes, more_body: bool) -> bytes:
+        return compressor.process(body) + (compressor.flush() if more_body else compressor.finish())
+
+
+class ZstdResponder(StreamCompressionResponder):
+    content_encoding = "zstd"
+
+    def new_compressor(self):
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+
+    def compress(self, compressor, body: bytes, more_body: bool) -> bytes:
+        if more_body:
+            return compressor.compress(body) + compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        return compressor.compress(body) + compressor.flush()
+
+
+def available_encodings() -> Dict[str, type]:
+    """Content encodings this worker can produce, most preferred first."""
+    encodings = {}
+    if zstandard is not None:
+        encodings["zstd"] = ZstdResponder
+    if brotli is not None:
+        encodings["br"] = BrotliResponder
+    encodings["gzip"] = GZipResponder
+    return encodings
+
+
+def accepted_encodings(accept_encoding: str) -> Dict[str, float]:
+    """Parses an Accept-Encoding header into {coding: q}, e.g. "gzip, br;q=0.5" -> {"gzip": 1.0, "br": 0.5}."""
+    accepted = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+
+def negotiate_encoding(accept_encoding: str, encodings: Dict[str, type]) -> Optional[str]:
+    """The best encoding the client accepts: highest q first, then our order of preference."""
+    accepted = accepted_encodings(accept_encoding)
+    candidates = []
+    for preference, coding in enumerate(encodings):
+        quality = accepted.get(coding, accepted.get("*", 0.0))
+        if quality > 0:
+            candidates.append((-quality, preference, coding))
+    return min(candidates)[2] if candidates else None
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encodings = available_encodings()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        coding = negotiate_encoding(Headers(scope=scope).get("Accept-Encoding", ""), self.encodings)
+        if coding is None:
+            responder = IdentityResponder(self.app, self.minimum_size,
+                                          exclude_content_types=EXCLUDED_CONTENT_TYPES)
+        elif coding == "gzip":
+            responder = GZipResponder(self.app, self.minimum_size, compresslevel=GZIP_LEVEL,
+                                      thread_minimum_size=THREAD_MINIMUM_SIZE,
+                                      exclude_content_types=EXCLUDED_CONTENT_TYPES)
+        else:
+            responder = self.encodings[coding](self.app, self.minimum_size,
+                                               exclude_content_types=EXCLUDED_CONTENT_TYPES)
+        await responder(scope, receive, send)
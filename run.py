@@ -1,5 +1,42 @@
-from main import app
+import argparse
+import os
+import tempfile
+from importlib.util import find_spec
+
 import uvicorn
 
+from config import SHUTDOWN_DRAIN_TIMEOUT
+
+
+def production_options(workers: int) -> dict:
+    """
+    Multi-process uvicorn settings: one worker per core by default, uvloop / httptools when
+    installed, and a graceful shutdown window long enough for in-flight process_order runs.
+    """
+    if workers > 1 and not os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        # Workers must share a metrics directory for /metrics to aggregate across them
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(prefix="uniwarebot-metrics-")
+    os.environ.setdefault("PRELOAD_ON_STARTUP", "true")
+
+    return {
+        "workers": workers,
+        "loop": "uvloop" if find_spec("uvloop") else "auto",
+        "http": "httptools" if find_spec("httptools") else "auto",
+        "timeout_graceful_shutdown": int(SHUTDOWN_DRAIN_TIMEOUT) + 5,
+        "proxy_headers": True,
+        "access_log": False,
+    }
+
+
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8001, reload=True)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Run the Uniware chat bot API")
+    parser.add_argument("--mode", choices=["dev", "prod"], default=os.getenv("APP_MODE", "dev"))
+    parser.add_argument("--host", default=os.getenv("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8001")))
+    parser.add_argument("--workers", type=int, default=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)))
+    args = parser.parse_args()
+
+    if args.mode == "prod":
+        uvicorn.run("main:app", host=args.host, port=args.port, **production_options(args.workers))
+    else:
+        uvicorn.run("main:app", host=args.host, port=args.port, reload=True)
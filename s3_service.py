@@ -1,6 +1,4 @@
-import boto3
 import logging
-from botocore.exceptions import ClientError
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -9,7 +7,8 @@ logger = logging.getLogger(__name__)
 
 class S3Service:
     def __init__(self):
-        # Initialize S3 client
+        # Initialize S3 client (boto3 is imported here, not at module load, to keep cold starts fast)
+        import boto3
         self.s3_client = boto3.client('s3')
 
     def upload_file(self, file_path, bucket_name, key=None):
@@ -41,9 +40,6 @@ class S3Service:
 
             return resource_url
 
-        except ClientError as e:
-            logger.error(f"Error while uploading file to S3: {str(e)}")
-            raise RuntimeError(str(e))
         except Exception as e:
             logger.error(f"Error while uploading file to S3: {str(e)}")
             raise RuntimeError(str(e))
\ No newline at end of file
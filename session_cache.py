@@ -0,0 +1,133 @@
+"""
+Per-worker LRU of the session state /chat reads every turn (what database.fetch_chat_history
+returns), keyed by (user_id, session_id).
+
+Every write that changes that state bumps state_version on the session's chat_history document, so
+a cached copy is checked with a one-field projection read instead of re-reading the document, the
+metadata and the transcript. Transcript appends made through this worker are applied to the cached
+copy as well, which keeps it valid across turns as long as the same worker serves the session.
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+import database
+from config import SESSION_CACHE_ENABLED, SESSION_CACHE_MAX_ENTRIES, SESSION_CACHE_MAX_BYTES, \
+    CHAT_HISTORY_MAX_MESSAGES
+from metrics import CACHE_EVENTS
+
+SessionKey = Tuple[str, str]
+
+# key -> (state version, max_messages the history was read with, history, estimated size)
+_states: "OrderedDict[SessionKey, Tuple[int, int, Dict, int]]" = OrderedDict()
+_states_bytes = 0
+_states_lock = threading.Lock()
+
+
+def estimate_size(history: Dict) -> int:
+    """Rough size of a cached history: the message texts plus a fixed overhead per entry."""
+    entries = history.get("messages", []) + history.get("messages_metadata", [])
+    feed = history.get("session_feed") or {}
+    return sum(len(str(entry.get("message", ""))) + 200 for entry in entries) + \
+        sum(len(feed.get(kind) or []) * 200 for kind in ("channels", "facilities"))
+
+
+def copy_history(history: Dict) -> Dict:
+    """A copy callers can modify without touching the cached lists."""
+    return dict(history, messages=list(history.get("messages", [])),
+                messages_metadata=list(history.get("messages_metadata", [])))
+
+
+def _store(key: SessionKey, version: int, max_messages: int, history: Dict):
+    global _states_bytes
+    size = estimate_size(history)
+    with _states_lock:
+        previous = _states.pop(key, None)
+        if previous:
+            _states_bytes -= previous[3]
+        if size > SESSION_CACHE_MAX_BYTES:
+            return
+        _states[key] = (version, max_messages, history, size)
+        _states_bytes += size
+        _evict_over_caps()
+
+
+def _evict_over_caps():
+    """Drops least recently used sessions beyond the entry and byte caps. Caller holds _states_lock."""
+    global _states_bytes
+    while _states and (len(_states) > SESSION_CACHE_MAX_ENTRIES or _states_bytes > SESSION_CACHE_MAX_BYTES):
+        _, evicted = _states.popitem(last=False)
+        _states_bytes -= evicted[3]
+        CACHE_EVENTS.labels("session_state", "evict").inc()
+
+
+def invalidate(user_id: str, session_id: str):
+    global _states_bytes
+    with _states_lock:
+        previous = _states.pop((user_id, session_id), None)
+        if previous:
+            _states_bytes -= previous[3]
+
+
+def fetch_chat_history(user_id: str, session_id: str, max_messages: int = CHAT_HISTORY_MAX_MESSAGES) -> Dict:
+    """database.fetch_chat_history, answered from this worker's copy while its state_version matches."""
+    if not SESSION_CACHE_ENABLED:
+        return database.fetch_chat_history(user_id, session_id, max_messages)
+
+    key = (user_id, session_id)
+    with _states_lock:
+        cached = _states.get(key)
+        if cached:
+            _states.move_to_end(key)
+
+    if cached and cached[1] == max_messages:
+        if database.fetch_state_version(user_id, session_id) == cached[0]:
+            CACHE_EVENTS.labels("session_state", "hit").inc()
+            return copy_history(cached[2])
+        CACHE_EVENTS.labels("session_state", "stale").inc()
+    else:
+        CACHE_EVENTS.labels("session_state", "miss").inc()
+
+    history = database.fetch_chat_history(user_id, session_id, max_messages)
+    if history:
+        # The document is read before the entries, so its version never claims more than was read
+        _store(key, history.get(database.STATE_VERSION_FIELD, 0), max_messages, history)
+        return copy_history(history)
+    invalidate(user_id, session_id)
+    return history
+
+
+def record_append(user_id: str, session_id: str, kind: str, entries: List[Dict], first_seq: int, version: int):
+    """
+    Applies entries this worker just stored with append_chat_entries to the cached copy. Only when
+    no other write happened in between (the new version is the cached one plus one); otherwise the
+    copy is dropped.
+    """
+    if not SESSION_CACHE_ENABLED:
+        return
+    global _states_bytes
+    key = (user_id, session_id)
+    field = "messages_metadata" if kind == database.KIND_METADATA else "messages"
+    with _states_lock:
+        cached = _states.get(key)
+        if not cached:
+            return
+        cached_version, max_messages, history, size = cached
+        if cached_version != version - 1:
+            del _states[key]
+            _states_bytes -= size
+            return
+
+        stored = history.get(field, [])
+        last_seq = stored[-1].get("seq", float("-inf")) if stored else float("-inf")
+        # The history may have been read after these entries were inserted; skip what it already has
+        appended = [dict(entry, seq=first_seq + offset) for offset, entry in enumerate(entries)
+                    if first_seq + offset > last_seq]
+        updated = dict(history, **{field: stored + appended})
+        if field == "messages" and max_messages > 0:
+            updated["messages"] = updated["messages"][-max_messages:]
+        updated[database.STATE_VERSION_FIELD] = version
+        new_size = estimate_size(updated)
+        _states[key] = (version, max_messages, updated, new_size)
+        _states_bytes += new_size - size
+        _evict_over_caps()
@@ -0,0 +1,61 @@
+"""
+Shared setup for the unit tests. Run from the repository root:
+    python -m pytest tests
+"""
+import os
+import sys
+import warnings
+
+import mongomock
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+warnings.filterwarnings("ignore", category=FutureWarning)
+
+
+class FakeResponse:
+    """The parts of requests.Response main.py reads."""
+
+    def __init__(self, status_code: int, content_type: str, content: bytes):
+        self.status_code = status_code
+        self.headers = {"Content-Type": content_type}
+        self.content = content
+        self.text = content.decode("utf-8", errors="ignore")
+
+    def json(self):
+        from json_utils import loads
+
+        return loads(self.content)
+
+
+@pytest.fixture
+def uniware(monkeypatch):
+    """
+    A FakeUniware behind main.make_unicommerce_request, Mongo on mongomock and a request context for
+    tenant t1. fake.requests lists the (endpoint, body) of every call.
+    """
+    import database
+    import main
+    from RequestContext import RequestContext
+    from benchmarks.loadtest.fake_uniware import FakeUniware
+
+    fake = FakeUniware(orders=3)
+    fake.requests = []
+    client = mongomock.MongoClient()
+    monkeypatch.setattr(database, "get_mongo_client", lambda: client)
+
+    def make_unicommerce_request(tenant_code, endpoint, method, session_id, data=None, custom_headers=None,
+                                 custom_cookies=None):
+        fake.requests.append((endpoint, data or {}))
+        return FakeResponse(*fake.handle(endpoint, data or {}, custom_headers))
+
+    monkeypatch.setattr(main, "make_unicommerce_request", make_unicommerce_request)
+    context = RequestContext()
+    for key, value in (("tenant_code", "t1"), ("user_id", "u1"), ("session_id", "s1")):
+        context.set(key, value)
+    RequestContext.set_current(context)
+    yield fake
+    RequestContext.set_current(None)
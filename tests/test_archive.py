@@ -0,0 +1,64 @@
+import mongomock
+import pytest
+
+import database
+from benchmarks.loadtest.fake_mongo import install_merge_stage
+
+
+@pytest.fixture
+def db(monkeypatch):
+    install_merge_stage()
+    client = mongomock.MongoClient()
+    monkeypatch.setattr(database, "get_mongo_client", lambda: client)
+    return database.get_database(client)
+
+
+def archived_orders(db):
+    return database.get_archived_history_collection(db).find_one({"user_id": "u1"})["process_orders_data"]
+
+
+def session_orders(db):
+    return database.get_collection(db).find_one({"user_id": "u1"})["process_orders_data"]
+
+
+def test_retry_after_a_failed_clear_does_not_duplicate_orders(db, monkeypatch):
+    database.get_collection(db).insert_one({"user_id": "u1", "session_id": "s1"})
+    database.update_user_order_mappings("u1", "s1", [{"shipment": "A"}])
+
+    collection = database.get_collection(db)
+    update_one = collection.update_one
+
+    def failing_clear(query, update, *args, **kwargs):
+        if database.ORDERS_BATCH_FIELD in update.get("$unset", {}):
+            raise RuntimeError("connection lost")
+        return update_one(query, update, *args, **kwargs)
+
+    monkeypatch.setattr(database, "get_collection", lambda database_: collection)
+    monkeypatch.setattr(collection, "update_one", failing_clear)
+    with pytest.raises(RuntimeError):
+        database.archive_processed_orders_data("u1", "s1")
+    monkeypatch.setattr(collection, "update_one", update_one)
+    database.archive_processed_orders_data("u1", "s1")
+
+    assert archived_orders(db) == [{"shipment": "A"}]
+    assert session_orders(db) == []
+
+
+def test_orders_stored_during_the_archive_are_kept(db, monkeypatch):
+    database.get_collection(db).insert_one({"user_id": "u1", "session_id": "s1"})
+    database.update_user_order_mappings("u1", "s1", [{"shipment": "A"}])
+
+    collection = database.get_collection(db)
+    aggregate = collection.aggregate
+
+    def aggregate_then_store(pipeline, *args, **kwargs):
+        result = aggregate(pipeline, *args, **kwargs)
+        database.update_user_order_mappings("u1", "s1", [{"shipment": "B"}])
+        return result
+
+    monkeypatch.setattr(database, "get_collection", lambda database_: collection)
+    monkeypatch.setattr(collection, "aggregate", aggregate_then_store)
+    database.archive_processed_orders_data("u1", "s1")
+
+    assert archived_orders(db) == [{"shipment": "A"}]
+    assert session_orders(db) == [{"shipment": "B"}]
@@ -0,0 +1,31 @@
+import mongomock
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+import database
+import main
+
+
+@pytest.fixture
+def client(monkeypatch):
+    mongo = mongomock.MongoClient()
+    monkeypatch.setattr(database, "get_mongo_client", lambda: mongo)
+    database.create_chat_session_auth("sess1", "seller@example.com", "t1", False, "token")
+    return TestClient(main.app)
+
+
+def test_socket_opens_for_the_sessions_user(client):
+    with client.websocket_connect("/ws/chat?tenantCode=t1&sessionId=sess1&userId=seller@example.com_t1"):
+        pass
+
+
+@pytest.mark.parametrize("query", [
+    "tenantCode=t1&sessionId=sess1",
+    "tenantCode=t1&sessionId=sess1&userId=someone@example.com_t1",
+])
+def test_socket_is_refused_without_the_sessions_user(client, query):
+    with pytest.raises(WebSocketDisconnect) as refused:
+        with client.websocket_connect(f"/ws/chat?{query}") as socket:
+            socket.receive_json()
+    assert refused.value.code == 1008
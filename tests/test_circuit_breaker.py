@@ -0,0 +1,55 @@
+import pytest
+
+import circuit_breaker
+import uniwareService
+from circuit_breaker import CircuitBreaker, CircuitOpenError, CIRCUIT_HALF_OPEN
+
+
+def half_open_breaker(host: str) -> CircuitBreaker:
+    breaker = CircuitBreaker(host, failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    assert breaker.state()["state"] == CIRCUIT_HALF_OPEN
+    return breaker
+
+
+def test_release_probe_lets_the_next_probe_through():
+    breaker = half_open_breaker("t1.example")
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.release_probe()
+    breaker.before_call()
+
+
+def test_probe_is_released_when_the_call_fails_without_a_transport_error(monkeypatch):
+    host = "t1.unicommerce.com"
+    breaker = half_open_breaker(host)
+    monkeypatch.setitem(circuit_breaker._breakers, host, breaker)
+    monkeypatch.setattr(uniwareService, "fetch_chat_session_auth",
+                        lambda session_id: {"isJSession": False, "token": "tok"})
+
+    def broken_session():
+        raise ValueError("not a transport error")
+
+    monkeypatch.setattr(uniwareService, "get_http_session", broken_session)
+    with pytest.raises(ValueError):
+        uniwareService.make_unicommerce_request("t1", "/data/user/facilities", "GET", "sess1")
+
+    breaker.before_call()
+
+
+def test_scheduler_timeout_does_not_take_the_probe(monkeypatch):
+    from outbound_scheduler import OutboundScheduler, SchedulerTimeoutError
+
+    host = "t1.unicommerce.com"
+    breaker = half_open_breaker(host)
+    monkeypatch.setitem(circuit_breaker._breakers, host, breaker)
+    monkeypatch.setattr(uniwareService, "fetch_chat_session_auth",
+                        lambda session_id: {"isJSession": False, "token": "tok"})
+    # No slot is ever granted, so the call times out in the queue
+    monkeypatch.setattr(uniwareService, "outbound_scheduler", OutboundScheduler(max_in_flight=0, queue_timeout=0.05))
+
+    with pytest.raises(SchedulerTimeoutError):
+        uniwareService.make_unicommerce_request("t1", "/data/user/facilities", "GET", "sess1")
+
+    breaker.before_call()
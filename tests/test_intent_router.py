@@ -0,0 +1,41 @@
+import pytest
+
+from intent_router import INTENT_ORDER_CODES, route_intent
+
+SESSION_ORDERS = [
+    {"saleOrderNum": "SO-1001", "shipment": "SHIP-0001"},
+    {"saleOrderNum": "SO-1002", "shipment": "SHIP-0002"},
+]
+
+
+def route(message, session_orders=SESSION_ORDERS):
+    return route_intent(message, {}, lambda: session_orders)
+
+
+def test_pasted_sale_order_codes_are_fetched():
+    intent = route("SO-1001, SO-2002")
+    assert intent["intent"] == INTENT_ORDER_CODES
+    assert intent["tool_call"]["args"]["filterOptions"][0]["selectedValues"] == ["SO-1001", "SO-2002"]
+
+
+def test_known_numeric_sale_orders_are_fetched():
+    intent = route("40021 40022", session_orders=[{"saleOrderNum": "40021", "shipment": "90001"},
+                                                  {"saleOrderNum": "40022", "shipment": "90002"}])
+    assert intent["tool_call"]["args"]["filterOptions"][0]["selectedValues"] == ["40021", "40022"]
+
+
+@pytest.mark.parametrize("message", [
+    "SHIP-0001",
+    "SHIP-0042",
+    "SO-1001 PL-20240117",
+    "560001",
+    "98765 43210",
+    "INV12345",
+])
+def test_codes_that_are_not_known_sale_orders_go_to_gemini(message):
+    assert route(message) is None
+
+
+def test_nothing_is_fetched_before_the_session_has_orders():
+    assert route("SO-1001", session_orders=[]) is None
+    assert route("PICK12345", session_orders=[]) is None
@@ -0,0 +1,30 @@
+import os
+import signal
+
+import lifecycle
+
+
+def test_sigterm_starts_draining_before_the_previous_handler(monkeypatch):
+    monkeypatch.setattr(lifecycle, "_draining", False)
+    seen = []
+    original = signal.signal(signal.SIGTERM, lambda sig, frame: seen.append(lifecycle.readiness_report(False)))
+    try:
+        lifecycle.drain_on_signal(signal.SIGTERM)
+        os.kill(os.getpid(), signal.SIGTERM)
+    finally:
+        signal.signal(signal.SIGTERM, original)
+
+    assert [report["draining"] for report in seen] == [True]
+    assert not seen[0]["ready"]
+
+
+def test_lifespan_preloads_and_drains_the_worker(monkeypatch):
+    import main
+    from fastapi.testclient import TestClient
+
+    calls = []
+    monkeypatch.setattr(main, "preload_worker_state", lambda: calls.append("preload"))
+    monkeypatch.setattr(main, "drain_worker", lambda: calls.append("drain"))
+    with TestClient(main.app):
+        assert calls == ["preload"]
+    assert calls == ["preload", "drain"]
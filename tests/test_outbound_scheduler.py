@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+
+from outbound_scheduler import OutboundScheduler, SchedulerTimeoutError
+
+
+def scheduler(**options):
+    return OutboundScheduler(**dict(dict(max_in_flight=1, rate_limit=0, burst=1, max_in_flight_total=0,
+                                         queue_timeout=1.0), **options))
+
+
+def test_async_slot_waits_without_blocking_the_event_loop():
+    outbound = scheduler()
+    order = []
+
+    async def caller(name):
+        async with outbound.async_slot("t1"):
+            order.append(f"{name} in")
+            await asyncio.sleep(0.05)
+            order.append(f"{name} out")
+
+    async def ticker():
+        # Runs while the second caller is queued, which a blocking wait would prevent
+        await asyncio.sleep(0.01)
+        order.append("tick")
+
+    async def main():
+        await asyncio.gather(caller("a"), caller("b"), ticker())
+
+    asyncio.run(main())
+    assert order == ["a in", "tick", "a out", "b in", "b out"]
+    assert outbound.snapshot()["t1"]["inFlight"] == 0
+
+
+def test_async_slot_times_out_and_leaves_the_queue():
+    outbound = scheduler(queue_timeout=0.05)
+
+    async def main():
+        with outbound.slot("t1"):
+            with pytest.raises(SchedulerTimeoutError):
+                async with outbound.async_slot("t1"):
+                    pass
+
+    asyncio.run(main())
+    stats = outbound.snapshot()["t1"]
+    assert (stats["queueDepth"], stats["inFlight"], stats["timedOut"]) == (0, 0, 1)
@@ -0,0 +1,25 @@
+import pytest
+
+import database
+import main
+
+
+@pytest.fixture(autouse=True)
+def prefetch_enabled(monkeypatch):
+    monkeypatch.setattr(main, "FACILITY_PREFETCH_ENABLED", True)
+
+
+def test_prefetch_stores_the_requested_facilitys_orders(uniware):
+    main.prefetch_pending_orders("F2")
+
+    snapshot = database.fetch_pending_order_snapshot("t1", "F2")
+    assert [order["shipment"] for order in snapshot["orders"]] == ["F2-SHIP-0", "F2-SHIP-1", "F2-SHIP-2"]
+    assert all("facility" not in order for order in snapshot["orders"])
+
+
+def test_prefetch_discards_an_export_that_ignored_the_facility_header(uniware):
+    uniware.honour_facility_header = False
+
+    main.prefetch_pending_orders("F2")
+
+    assert database.fetch_pending_order_snapshot("t1", "F2") is None
@@ -0,0 +1,55 @@
+import pytest
+
+import database
+import main
+
+
+@pytest.fixture(autouse=True)
+def live_mode(monkeypatch):
+    monkeypatch.setattr(main, "Play_Mode", False)
+
+
+def invoice_requests(fake):
+    return [body["shippingPackageCode"] for endpoint, body in fake.requests if endpoint == "/data/oms/invoice/create"]
+
+
+def test_status_export_overrides_a_stale_batch_record(uniware):
+    orders = [{"shipment": "SHIP-0"}, {"shipment": "SHIP-1"}]
+    batch_id = main.process_order_batch_id("t1", orders)
+    # An earlier run invoiced SHIP-0, but Uniware now reports it without an invoice (e.g. cancelled and redone)
+    database.record_batch_item(batch_id, "SHIP-0", {"invoiceStatus": "created", "invoiceCode": "INV-OLD",
+                                                    "withLabel": False, "labelStatus": "allocated"})
+
+    main.process_order({"orders": orders})
+
+    assert invoice_requests(uniware) == ["SHIP-0", "SHIP-1"]
+    printed = [body for endpoint, body in uniware.requests if endpoint == "/data/oms/invoice/show/bulk"]
+    assert printed == [{"invoiceCodes": ["INV-SHIP-0", "INV-SHIP-1"]}]
+
+
+def test_batch_record_resumes_shipments_the_status_export_misses(uniware, monkeypatch):
+    orders = [{"shipment": "SHIP-0"}, {"shipment": "SHIP-1"}]
+    batch_id = main.process_order_batch_id("t1", orders)
+    database.record_batch_item(batch_id, "SHIP-0", {"invoiceStatus": "created", "invoiceCode": "INV-SHIP-0",
+                                                    "withLabel": False, "labelStatus": "allocated"})
+    monkeypatch.setattr(main, "partition_shipments_by_status", lambda shipment_codes: {})
+
+    main.process_order({"orders": orders})
+
+    assert invoice_requests(uniware) == ["SHIP-1"]
+
+
+def test_cancelled_shipments_are_skipped(uniware):
+    uniware.cancelled = {"SHIP-1"}
+
+    result, _ = main.process_order({"orders": [{"shipment": "SHIP-0"}, {"shipment": "SHIP-1"}]})
+
+    assert invoice_requests(uniware) == ["SHIP-0"]
+    assert result.endswith("Skipped cancelled shipments: SHIP-1")
+
+
+def test_status_export_that_ignores_the_shipment_filter_is_not_trusted(uniware):
+    uniware.honour_shipment_filter = False
+    uniware.cancelled = {"SHIP-1"}
+
+    assert main.partition_shipments_by_status(["SHIP-1"]) == {}
@@ -0,0 +1,33 @@
+from response_cache import followup_cache_key, followup_names
+
+HISTORY = [{"role": "user", "parts": ["process all orders"]}]
+
+SESSION_FEED = {
+    "channels": [{"channelName": "Amazon"}, {"channelName": "Flipkart"}],
+    "facilities": [{"facilityCode": "F1", "facilityDisplayName": "Gurgaon DC"},
+                   {"facilityCode": "F2", "facilityDisplayName": "Mumbai DC"}],
+    "currentFacilityCode": "F1",
+}
+
+
+def key(tenant_code, session_feed=SESSION_FEED, history=HISTORY):
+    return followup_cache_key("model", "instruction", tenant_code, followup_names(session_feed), "process_order",
+                              "Invoices generated", history)
+
+
+def feed_message(text):
+    return {"role": "user", "parts": [f"[System Feed] {text}"]}
+
+
+def test_sessions_of_a_tenant_and_warehouse_share_a_followup_entry():
+    # Another session, another day and other pending orders: the same names, so the same phrasing
+    first_session = [feed_message("Today's Date is : 2026-10-19"), feed_message("pending orders : [SO-1]")] + HISTORY
+    second_session = [feed_message("Today's Date is : 2026-10-20"), feed_message("pending orders : [SO-7]")] + HISTORY
+
+    assert key("t1", history=first_session) == key("t1", history=second_session)
+
+
+def test_followup_key_is_scoped_to_tenant_and_names():
+    assert key("t1") != key("t2")
+    assert key("t1") != key("t1", dict(SESSION_FEED, currentFacilityCode="F2"))
+    assert key("t1") != key("t1", dict(SESSION_FEED, channels=[{"channelName": "Myntra"}]))
@@ -0,0 +1,57 @@
+import gzip
+
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from response_compression import THREAD_MINIMUM_SIZE, CompressionMiddleware
+
+# Large enough that one chunk goes through the worker-thread path
+BODY = b"".join(b'{"shipment": "SHIP-%06d", "status": "CREATED"},' % i for i in range(8000))
+
+
+async def whole(request):
+    return Response(BODY, media_type="application/json")
+
+
+async def streamed(request):
+    async def chunks():
+        yield BODY[:1000]
+        yield BODY[1000:THREAD_MINIMUM_SIZE + 1000]
+        yield BODY[THREAD_MINIMUM_SIZE + 1000:]
+    return StreamingResponse(chunks(), media_type="application/json")
+
+
+app = Starlette(routes=[Route("/whole", whole), Route("/streamed", streamed)])
+app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+
+def assert_round_trips(coding, decompress):
+    client = TestClient(app)
+    for path in ("/whole", "/streamed"):
+        with client.stream("GET", path, headers={"Accept-Encoding": coding}) as response:
+            assert response.headers["content-encoding"] == coding
+            assert decompress(b"".join(response.iter_raw())) == BODY
+
+
+def test_gzip():
+    assert_round_trips("gzip", gzip.decompress)
+
+
+def test_brotli():
+    brotli = pytest.importorskip("brotli")
+    assert_round_trips("br", brotli.decompress)
+
+
+def test_zstd():
+    zstandard = pytest.importorskip("zstandard")
+    assert_round_trips("zstd", lambda body: zstandard.ZstdDecompressor().decompressobj().decompress(body))
+
+
+def test_unaccepted_encodings_pass_through():
+    client = TestClient(app)
+    with client.stream("GET", "/whole", headers={"Accept-Encoding": "identity"}) as response:
+        assert "content-encoding" not in response.headers
+        assert b"".join(response.iter_raw()) == BODY
@@ -0,0 +1,13 @@
+import warnings
+
+from fastapi.testclient import TestClient
+
+import main
+
+
+def test_error_responses_render_without_deprecated_response_classes():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        response = TestClient(main.app).post("/chat", json={"messages": []})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Tenant code is required"}
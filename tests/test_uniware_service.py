@@ -0,0 +1,45 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import uniwareService
+
+
+@pytest.fixture
+def cookie_server():
+    """Sets a JSESSIONID on the first call and records the Cookie header of every call."""
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            received.append(self.headers.get("Cookie"))
+            self.send_response(200)
+            if len(received) == 1:
+                self.send_header("Set-Cookie", "JSESSIONID=userA-server-session; Path=/")
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", received
+    server.shutdown()
+    server.server_close()
+
+
+def test_pooled_session_does_not_carry_cookies_between_calls(cookie_server):
+    base_url, received = cookie_server
+    uniwareService.close_http_session()
+    session = uniwareService.get_http_session()
+    try:
+        session.get(f"{base_url}/data/user/facilities", headers={"Authorization": "Bearer userA"})
+        session.get(f"{base_url}/data/user/facilities", headers={"Authorization": "Bearer userB"})
+    finally:
+        uniwareService.close_http_session()
+
+    assert received == [None, None]
+    assert len(session.cookies) == 0
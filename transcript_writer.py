@@ -0,0 +1,187 @@
+"""
+Write-behind persistence for the chat transcript.
+
+With TRANSCRIPT_WRITE_BEHIND set, store_message only queues the message in memory and a daemon
+thread writes each session's queued messages as one batch (one seq allocation, one insert_many), so
+a /chat turn no longer waits for its transcript writes. Messages of a session are written in the
+order they were queued: a session is only ever flushed by one thread at a time, holding its lock
+from taking the queued messages until they are stored. Reads through fetch_chat_history see queued
+messages too. When more than TRANSCRIPT_QUEUE_MAX_ENTRIES messages are queued, the caller flushes
+its own session synchronously, and drain_worker flushes everything on shutdown. A RequestContext with
+"transcript_write_behind" set (a /ws/chat connection) queues its messages even when the setting is off.
+
+Seqs are allocated when a batch is flushed, and the queue lives in this worker only. Write-behind
+therefore assumes sticky sessions: another worker serving the same session would neither see the
+queued messages nor keep its own writes ordered after them.
+"""
+import datetime
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import database
+import session_cache
+from RequestContext import RequestContext
+from config import TRANSCRIPT_WRITE_BEHIND, TRANSCRIPT_QUEUE_MAX_ENTRIES, TRANSCRIPT_FLUSH_INTERVAL, \
+    CHAT_HISTORY_MAX_MESSAGES
+from metrics import TRANSCRIPT_QUEUE_DEPTH, TRANSCRIPT_WRITES
+from request_timing import timed
+
+logger = logging.getLogger(__name__)
+
+SESSION_LOCK_STRIPES = 64
+
+SessionKey = Tuple[str, str]
+
+_pending: Dict[SessionKey, List[Dict]] = {}
+_pending_count = 0
+_condition = threading.Condition()
+_session_locks = [threading.RLock() for _ in range(SESSION_LOCK_STRIPES)]
+_flusher: Optional[threading.Thread] = None
+_stopping = False
+
+
+def _session_lock(key: SessionKey) -> threading.RLock:
+    return _session_locks[hash(key) % SESSION_LOCK_STRIPES]
+
+
+@timed("mongo", "store_message")
+def _write(user_id: str, session_id: str, entries: List[Dict]):
+    """Stores the entries and applies them to this worker's cached session state."""
+    first_seq, version = database.append_chat_entries(user_id, session_id, database.KIND_MESSAGE, entries)
+    session_cache.record_append(user_id, session_id, database.KIND_MESSAGE, entries, first_seq, version)
+
+
+def store_message(user_id: str, session_id: str, message: str, role: str, metadata: Optional[dict] = None):
+    """Stores a transcript message, queued for the flusher when write-behind is on."""
+    global _pending_count
+    key = (user_id, session_id)
+    entry = {
+        "role": role,
+        "message": message,
+        "timestamp": datetime.datetime.utcnow(),
+        "metadata": metadata,
+    }
+    context = RequestContext.current_or_none()
+    write_behind = TRANSCRIPT_WRITE_BEHIND or bool(context and context.get("transcript_write_behind"))
+    if not write_behind or _stopping:
+        with _session_lock(key):
+            flush_session(user_id, session_id)
+            _write(user_id, session_id, [entry])
+        TRANSCRIPT_WRITES.labels("sync").inc()
+        return
+
+    with _condition:
+        _pending.setdefault(key, []).append(entry)
+        _pending_count += 1
+        TRANSCRIPT_QUEUE_DEPTH.inc()
+        overloaded = _pending_count > TRANSCRIPT_QUEUE_MAX_ENTRIES
+        _condition.notify()
+    _ensure_flusher()
+
+    if overloaded:
+        # Under pressure the caller pays for its own write, after whatever its session had queued
+        flush_session(user_id, session_id, path="sync")
+    else:
+        TRANSCRIPT_WRITES.labels("buffered").inc()
+
+
+def flush_session(user_id: str, session_id: str, path: str = "buffered"):
+    """Writes the session's queued messages now. Call before anything that moves or reads its transcript."""
+    global _pending_count
+    key = (user_id, session_id)
+    with _session_lock(key):
+        with _condition:
+            entries = _pending.pop(key, [])
+        if not entries:
+            return
+
+        written = 0
+        try:
+            _write(user_id, session_id, entries)
+            written = len(entries)
+        except Exception as e:
+            # insert_many is ordered: whatever it reports as inserted is stored, the rest is retried
+            details = getattr(e, "details", None)
+            written = details.get("nInserted", 0) if isinstance(details, dict) else 0
+            logger.error(f"transcript flush failed for session {session_id}, {len(entries) - written} "
+                         f"messages requeued: {str(e)}")
+            with _condition:
+                _pending[key] = entries[written:] + _pending.get(key, [])
+            TRANSCRIPT_WRITES.labels("retried").inc(len(entries) - written)
+        finally:
+            with _condition:
+                _pending_count -= written
+                TRANSCRIPT_QUEUE_DEPTH.dec(written)
+                _condition.notify_all()
+
+        if path == "sync":
+            TRANSCRIPT_WRITES.labels("sync").inc()
+
+
+def fetch_chat_history(user_id: str, session_id: str, max_messages: int = CHAT_HISTORY_MAX_MESSAGES) -> Dict:
+    """session_cache.fetch_chat_history plus the session's messages still waiting to be written."""
+    key = (user_id, session_id)
+    # Holding the session lock keeps a flush from landing between the read and the queue snapshot
+    with _session_lock(key):
+        history = session_cache.fetch_chat_history(user_id, session_id, max_messages)
+        with _condition:
+            queued = list(_pending.get(key, []))
+    if not queued:
+        return history
+
+    messages = history.get("messages", []) + queued
+    history["messages"] = messages[-max_messages:] if max_messages > 0 else messages
+    return history
+
+
+def flush_all(timeout: float) -> bool:
+    """
+    Stops queueing and writes everything still queued, giving up after `timeout` seconds. Returns
+    True when nothing is left.
+    """
+    global _stopping
+    with _condition:
+        _stopping = True
+        _condition.notify_all()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with _condition:
+            keys = list(_pending)
+        if not keys:
+            return True
+        for user_id, session_id in keys:
+            flush_session(user_id, session_id)
+        time.sleep(min(TRANSCRIPT_FLUSH_INTERVAL, max(0.0, deadline - time.monotonic())))
+
+    with _condition:
+        left = _pending_count
+    if left:
+        logger.error(f"shutdown flush timed out with {left} transcript messages not written")
+    return not left
+
+
+def _ensure_flusher():
+    global _flusher
+    if _flusher is not None and _flusher.is_alive():
+        return
+    with _condition:
+        if _flusher is None or not _flusher.is_alive():
+            _flusher = threading.Thread(target=_flush_loop, name="transcript-writer", daemon=True)
+            _flusher.start()
+
+
+def _flush_loop():
+    while True:
+        with _condition:
+            while not _pending and not _stopping:
+                _condition.wait()
+            if _stopping:
+                return
+        # Let messages of the same turn collect into one batch
+        time.sleep(TRANSCRIPT_FLUSH_INTERVAL)
+        with _condition:
+            keys = list(_pending)
+        for user_id, session_id in keys:
+            flush_session(user_id, session_id)
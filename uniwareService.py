@@ -1,11 +1,72 @@
-import requests
-from typing import Dict, Any
+import os
+import random
+import threading
+import time
+from http.cookiejar import DefaultCookiePolicy
 
-from dns.edns import COOKIE
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Optional
+from urllib3.exceptions import NewConnectionError
 
+from circuit_breaker import get_circuit_breaker
+from config import UNIWARE_BASE_URL, UNIWARE_CONNECT_TIMEOUT, UNIWARE_READ_TIMEOUT, UNIWARE_MAX_RETRIES, \
+    UNIWARE_BACKOFF_BASE, UNIWARE_BACKOFF_MAX, UNIWARE_MAX_IN_FLIGHT, UNIWARE_POOL_HOSTS
 from database import fetch_chat_session_auth
+from json_utils import dumps
+from RequestContext import RequestContext
+from request_timing import span
+from outbound_scheduler import outbound_scheduler
 import logging,traceback
 
+# Endpoints that do not mutate anything on Uniware, safe to retry on any transient failure
+READ_ONLY_ENDPOINTS = {
+    "/data/channel/getChannels",
+    "/data/user/facilities",
+    "/data/tasks/export/data",
+    "/data/oms/packer/packlist/fetch",
+    "/data/oms/invoice/show/bulk",
+    "/data/oms/shipment/show/bulk",
+}
+
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+
+
+
+REJECT_ALL_COOKIES = DefaultCookiePolicy(allowed_domains=[])
+
+_http_session: Optional[requests.Session] = None
+_http_session_pid: Optional[int] = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """
+    Returns the process-wide requests.Session used for Uniware calls, so TCP/TLS connections to
+    tenant hosts are pooled and reused instead of re-established on every call.
+    """
+    global _http_session, _http_session_pid
+    if _http_session is None or _http_session_pid != os.getpid():
+        with _http_session_lock:
+            if _http_session is None or _http_session_pid != os.getpid():
+                session = requests.Session()
+                # The session is shared by every tenant and user: a cookie Uniware sets for one seller
+                # (e.g. JSESSIONID) must never be sent on another seller's call
+                session.cookies.set_policy(REJECT_ALL_COOKIES)
+                adapter = HTTPAdapter(pool_connections=UNIWARE_POOL_HOSTS, pool_maxsize=UNIWARE_MAX_IN_FLIGHT)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _http_session = session
+                _http_session_pid = os.getpid()
+    return _http_session
+
+
+def close_http_session():
+    global _http_session
+    with _http_session_lock:
+        if _http_session is not None:
+            _http_session.close()
+            _http_session = None
 
 
 def make_unicommerce_request(
@@ -31,7 +92,11 @@ def make_unicommerce_request(
         requests.Response object
         :param tenant_code:
     """
-    session_auth = fetch_chat_session_auth(chat_sesion_id)
+    # A /ws/chat connection resolves its session auth once and keeps it on the RequestContext
+    context = RequestContext.current_or_none()
+    session_auth = context.get("session_auth") if context else None
+    if not session_auth or session_auth.get("chat_session_id") != chat_sesion_id:
+        session_auth = fetch_chat_session_auth(chat_sesion_id)
     if session_auth["isJSession"] is True:
         access_token =  session_auth["token"]
         HEADERS = {
@@ -51,33 +116,98 @@ def make_unicommerce_request(
         }
         COOKIES = {}
 
-    url = f"https://{tenant_code}.unicommerce.com/{endpoint}"
+    base_url = UNIWARE_BASE_URL.format(tenant_code=tenant_code)
+    url = f"{base_url}/{endpoint}"
     headers = {**HEADERS, **(custom_headers or {})}
     cookies = {**COOKIES ,**(custom_cookies or {})}
 
-    try:
-        if method.upper() == "GET":
-            response = requests.get(url, headers=headers, cookies=cookies)
-        elif method.upper() in ["POST", "PUT", "PATCH", "DELETE"]:
-            response = requests.request(
-                method,
-                url,
-                headers=headers,
-                cookies=cookies,
-                json=data or {}
-            )
-        else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
+    method = method.upper()
+    if method != "GET" and method not in ["POST", "PUT", "PATCH", "DELETE"]:
+        raise ValueError(f"Unsupported HTTP method: {method}")
 
-        return response
+    body = dumps(data or {}) if method != "GET" else None
+    is_read = is_read_request(endpoint, method)
+    breaker = get_circuit_breaker(base_url.split("://", 1)[-1])
+    timeout = (UNIWARE_CONNECT_TIMEOUT, UNIWARE_READ_TIMEOUT)
+    attempt = 0
 
-    except requests.exceptions.RequestException as e:
-        print(f"Request failed: {str(e)}")
-        raise
+    with span("uniware", endpoint):
+        while True:
+            attempt += 1
+            error = None
+            # The slot is taken first, so a half-open probe is never held while queueing for it
+            with outbound_scheduler.slot(tenant_code):
+                breaker.before_call()
+                try:
+                    http_session = get_http_session()
+                    if method == "GET":
+                        response = http_session.get(url, headers=headers, cookies=cookies, timeout=timeout)
+                    else:
+                        response = http_session.request(
+                            method,
+                            url,
+                            headers=headers,
+                            cookies=cookies,
+                            data=body,
+                            timeout=timeout
+                        )
+                except requests.exceptions.RequestException as e:
+                    breaker.record_failure()
+                    error = e
+                except BaseException:
+                    # Anything else says nothing about the host's health, but must not keep a probe slot
+                    breaker.release_probe()
+                    raise
 
+            if error is not None:
+                retryable = is_read or is_connect_error(error)
+                if not retryable or attempt > UNIWARE_MAX_RETRIES:
+                    print(f"Request failed: {str(error)}")
+                    raise error
+                logging.info(f"Retrying {method} {endpoint} after error ({attempt}/{UNIWARE_MAX_RETRIES}): {str(error)}")
+                time.sleep(backoff_delay(attempt))
+                continue
 
+            if response.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
 
-def simplify_channels(channel_data):
+            if is_read and response.status_code in RETRYABLE_STATUS_CODES and attempt <= UNIWARE_MAX_RETRIES:
+                logging.info(f"Retrying {method} {endpoint} after status {response.status_code} "
+                             f"({attempt}/{UNIWARE_MAX_RETRIES})")
+                time.sleep(backoff_delay(attempt))
+                continue
+
+            return response
+
+
+def is_read_request(endpoint: str, method: str) -> bool:
+    """Reads are safe to retry on any transient failure; mutations are not."""
+    return method == "GET" or endpoint in READ_ONLY_ENDPOINTS
+
+
+def is_connect_error(error: requests.exceptions.RequestException) -> bool:
+    """
+    True only when the request never reached the server (DNS failure, refused, connect timeout),
+    which makes it safe to retry even a non-idempotent call.
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError):
+        reason = error.args[0] if error.args else None
+        reason = getattr(reason, "reason", reason)
+        return isinstance(reason, NewConnectionError)
+    return False
+
+
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter."""
+    return random.uniform(0, min(UNIWARE_BACKOFF_MAX, UNIWARE_BACKOFF_BASE * (2 ** (attempt - 1))))
+
+
+
+def extract_channels(channel_data) -> list:
     """
     Extracts only the essential channel information from the API response
 
@@ -86,6 +216,7 @@ def simplify_channels(channel_data):
 
     Returns:
         List of simplified channel dictionaries with:
+        - channelId
         - channelCode
         - channelName
         - sourceCode
@@ -103,6 +234,18 @@ def simplify_channels(channel_data):
         }
         simplified_channels.append(simplified)
 
+    return simplified_channels
+
+
+def simplify_channels(channel_data):
+    """
+    Renders the essential channel information from the API response as the [System Feed] text
+    given to Gemini.
+    """
+    return format_channels(extract_channels(channel_data))
+
+
+def format_channels(simplified_channels: list) -> str:
     channel_header = "Available channels (format: channelId -> Name(Code) → Source: SourceName(Code)):\n"
     channels_str = channel_header + "\n".join([
         f"• {ch['channelId']} -> {ch['channelName']}({ch['channelCode']}) → Source: {ch['sourceName']}({ch['sourceCode']})"
@@ -112,7 +255,7 @@ def simplify_channels(channel_data):
     return channels_str
 
 
-def simplify_warehouses(warehouse_data):
+def extract_warehouses(warehouse_data) -> list:
     """
     Extracts only the essential warehouse information from the API response
 
@@ -121,12 +264,11 @@ def simplify_warehouses(warehouse_data):
 
     Returns:
         List of simplified warehouse dictionaries with:
-        - code
-        - displayName
+        - facilityCode
+        - facilityDisplayName
     """
     simplified_warehouses = []
 
-    warehouse_header = "Available warehouses, FORMAT FOR NAMING (facilityCOde: facility DisplayName):\n"
     for warehouse in warehouse_data.get('facilityDTOList', []):
         simplified = {
             'facilityCode': warehouse.get('code'),
@@ -134,10 +276,24 @@ def simplify_warehouses(warehouse_data):
         }
         simplified_warehouses.append(simplified)
 
+    return simplified_warehouses
+
+
+def simplify_warehouses(warehouse_data):
+    """
+    Renders the essential warehouse information from the API response as the [System Feed] text
+    given to Gemini.
+    """
+    return format_warehouses(extract_warehouses(warehouse_data))
+
+
+def format_warehouses(simplified_warehouses: list) -> str:
+    warehouse_header = "Available warehouses, FORMAT FOR NAMING (facilityCOde: facility DisplayName):\n"
+
     # Convert to string representation
     warehouses_str = warehouse_header + "\n".join([
         f"{wh['facilityCode']}: {wh['facilityDisplayName']}"
         for wh in simplified_warehouses
     ])
 
-    return warehouses_str
\ No newline at end of file
+    return warehouses_str